@@ -22,7 +22,7 @@ import soundfile as sf
 from tqdm import tqdm
 from tqdm.std import TqdmWarning
 
-from pedalboard import Reverb
+from pedalboard import Reverb, StreamingSession
 
 BUFFER_SIZE_SAMPLES = 1024 * 16
 NOISE_FLOOR = 1e-4
@@ -123,17 +123,19 @@ def main():
                 # TQDM tries to print before we've processed a block
                 delay=1000,
             ) as t:
+                # A StreamingSession allows the reverb tail to continue
+                # from one chunk to the next:
+                session = StreamingSession(reverb, input_file.samplerate)
                 for dry_chunk in input_file.blocks(BUFFER_SIZE_SAMPLES, frames=length):
                     # Actually call Pedalboard here:
-                    # (reset=False is necessary to allow the reverb tail to
-                    # continue from one chunk to the next.)
-                    effected_chunk = reverb.process(
-                        dry_chunk, sample_rate=input_file.samplerate, reset=False
-                    )
+                    effected_chunk = session.feed(dry_chunk)
                     # print(effected_chunk.shape, np.amax(np.abs(effected_chunk)))
                     output_file.write(effected_chunk)
                     t.update(len(dry_chunk) / input_file.samplerate)
                     t.refresh()
+                # Return any audio still buffered inside the plugin, so that
+                # the output is exactly as long as the input:
+                output_file.write(session.flush())
             if not args.cut_reverb_tail:
                 while True:
                     # Pull audio from the effect until there's nothing left:
@@ -76,23 +76,19 @@ detectChannelLayout(const py::array_t<T, py::array::c_style> inputArray,
   }
 }
 
+/**
+ * Copy the contents of an already-requested Python buffer into a new JUCE
+ * AudioBuffer. As this doesn't touch any Python objects, it may be called
+ * without holding the GIL (as long as the buffer_info is kept alive).
+ */
 template <typename T>
-juce::AudioBuffer<T> copyPyArrayIntoJuceBuffer(
-    const py::array_t<T, py::array::c_style> inputArray,
-    std::optional<ChannelLayout> providedChannelLayout = {}) {
+juce::AudioBuffer<T>
+copyBufferInfoIntoJuceBuffer(const py::buffer_info &inputInfo,
+                             ChannelLayout inputChannelLayout) {
   // Numpy/Librosa convention is (num_samples, num_channels)
-  py::buffer_info inputInfo = inputArray.request();
-
   unsigned int numChannels = 0;
   unsigned int numSamples = 0;
 
-  ChannelLayout inputChannelLayout;
-  if (providedChannelLayout) {
-    inputChannelLayout = *providedChannelLayout;
-  } else {
-    inputChannelLayout = detectChannelLayout(inputArray);
-  }
-
   if (inputInfo.ndim == 1) {
     numSamples = inputInfo.shape[0];
     numChannels = 1;
@@ -144,6 +140,21 @@ juce::AudioBuffer<T> copyPyArrayIntoJuceBuffer(
   return ioBuffer;
 }
 
+template <typename T>
+juce::AudioBuffer<T> copyPyArrayIntoJuceBuffer(
+    const py::array_t<T, py::array::c_style> inputArray,
+    std::optional<ChannelLayout> providedChannelLayout = {}) {
+  ChannelLayout inputChannelLayout;
+  if (providedChannelLayout) {
+    inputChannelLayout = *providedChannelLayout;
+  } else {
+    inputChannelLayout = detectChannelLayout(inputArray);
+  }
+
+  return copyBufferInfoIntoJuceBuffer<T>(inputArray.request(),
+                                         inputChannelLayout);
+}
+
 /**
  * Convert a Python array into a const JUCE AudioBuffer, avoiding copying the
  * data if provided in the appropriate format.
@@ -212,7 +223,6 @@ py::array_t<T> copyJuceBufferIntoPyArray(const juce::AudioBuffer<T> &juceBuffer,
   unsigned int outputSampleCount =
       std::max((int)numSamples - (int)offsetSamples, 0);
 
-  // TODO: Avoid the need to copy here if offsetSamples is 0!
   py::array_t<T> outputArray;
   if (ndim == 2) {
     switch (channelLayout) {
@@ -264,4 +274,66 @@ py::array_t<T> copyJuceBufferIntoPyArray(const juce::AudioBuffer<T> &juceBuffer,
 
   return outputArray;
 }
+
+/**
+ * Convert a JUCE AudioBuffer into a Python array, handing the buffer's storage
+ * to the returned array (rather than copying it) whenever the samples are
+ * already laid out as a C-contiguous array of the requested shape. Otherwise,
+ * this falls back to copyJuceBufferIntoPyArray.
+ *
+ * The provided buffer must own its storage (i.e.: must not have been
+ * constructed with pointers to external memory), and is left empty if its
+ * storage was taken.
+ */
+template <typename T>
+py::array_t<T> moveJuceBufferIntoPyArray(juce::AudioBuffer<T> &&juceBuffer,
+                                         ChannelLayout channelLayout,
+                                         int offsetSamples, int ndim = 2) {
+  int numChannels = juceBuffer.getNumChannels();
+  int numSamples = juceBuffer.getNumSamples();
+  int outputSampleCount = std::max(numSamples - offsetSamples, 0);
+
+  // JUCE allocates every channel from one block of memory, one after the
+  // other. The stride between channels may be larger than the number of
+  // samples if the buffer was shrunk without reallocating, in which case
+  // only mono audio can be shared without copying.
+  bool canShareStorage =
+      numChannels > 0 && outputSampleCount > 0 &&
+      (numChannels == 1 ||
+       (channelLayout == ChannelLayout::NotInterleaved && offsetSamples == 0));
+  for (int c = 1; canShareStorage && c < numChannels; c++) {
+    canShareStorage = juceBuffer.getReadPointer(c) ==
+                      juceBuffer.getReadPointer(0) + (c * numSamples);
+  }
+
+  if (!canShareStorage) {
+    return copyJuceBufferIntoPyArray(juceBuffer, channelLayout, offsetSamples,
+                                     ndim);
+  }
+
+  auto *ownedBuffer = new juce::AudioBuffer<T>(std::move(juceBuffer));
+  py::capsule owner(ownedBuffer, [](void *buffer) {
+    delete static_cast<juce::AudioBuffer<T> *>(buffer);
+  });
+  T *data = ownedBuffer->getWritePointer(0, offsetSamples);
+
+  std::vector<py::ssize_t> shape;
+  if (ndim == 2) {
+    switch (channelLayout) {
+    case ChannelLayout::Interleaved:
+      shape = {outputSampleCount, numChannels};
+      break;
+    case ChannelLayout::NotInterleaved:
+      shape = {numChannels, outputSampleCount};
+      break;
+    default:
+      throw std::runtime_error(
+          "Internal error: got unexpected channel layout.");
+    }
+  } else {
+    shape = {outputSampleCount};
+  }
+
+  return py::array_t<T>(shape, data, owner);
+}
 } // namespace Pedalboard
\ No newline at end of file
@@ -1126,9 +1126,7 @@ public:
       return;
     }
 
-    if (lastSpec.sampleRate != spec.sampleRate ||
-        lastSpec.maximumBlockSize < spec.maximumBlockSize ||
-        lastSpec.numChannels != spec.numChannels) {
+    if (specRequiresPrepare(spec)) {
 
       // Changing the number of channels requires releaseResources to be
       // called:
@@ -1140,7 +1138,7 @@ public:
       pluginInstance->setNonRealtime(true);
       pluginInstance->prepareToPlay(spec.sampleRate, spec.maximumBlockSize);
 
-      lastSpec = spec;
+      markPrepared(spec);
     }
   }
 
@@ -1321,6 +1319,19 @@ public:
     pluginInstance->setStateInformation(data, size);
   }
 
+  std::shared_ptr<Plugin> clone() override {
+    // Load a new instance of the same plugin, then copy over all of its state
+    // (including the values of its parameters):
+    std::string path = pathToPluginFile.toStdString();
+    auto plugin = std::make_shared<ExternalPlugin<ExternalPluginType>>(
+        path, foundPluginDescription.name.toStdString(), initializationTimeout);
+
+    juce::MemoryBlock state;
+    getState(state);
+    plugin->setState(state.getData(), state.getSize());
+    return plugin;
+  }
+
   std::vector<juce::AudioProcessorParameter *> getParameters() const {
     std::vector<juce::AudioProcessorParameter *> parameters;
     for (auto *parameter : pluginInstance->getParameters()) {
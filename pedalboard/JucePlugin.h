@@ -50,11 +50,9 @@ public:
   virtual ~JucePlugin(){};
 
   void prepare(const juce::dsp::ProcessSpec &spec) override {
-    if (lastSpec.sampleRate != spec.sampleRate ||
-        lastSpec.maximumBlockSize < spec.maximumBlockSize ||
-        spec.numChannels != lastSpec.numChannels) {
+    if (specRequiresPrepare(spec)) {
       dspBlock.prepare(spec);
-      lastSpec = spec;
+      markPrepared(spec);
     }
   }
 
@@ -87,6 +87,20 @@ public:
    */
   virtual bool acceptsAudioInput() { return true; }
 
+  /**
+   * Create a new instance of this plugin with the same parameters as this
+   * one, but none of its internal state (i.e.: as if it had just been
+   * constructed). Returns nullptr if this plugin cannot be cloned.
+   */
+  virtual std::shared_ptr<Plugin> clone() { return nullptr; }
+
+  /**
+   * Returns the number of times this plugin has actually (re-)allocated its
+   * internal state in response to prepare(). Calls to prepare() with a spec
+   * compatible with the last one are not counted.
+   */
+  int getNumPrepares() const { return numPrepares; }
+
   // A mutex to gate access to this plugin, as its internals may not be
   // thread-safe. Note: use std::lock or std::scoped_lock when locking multiple
   // plugins to avoid deadlocking.
@@ -124,7 +138,46 @@ public:
   }
 
 protected:
+  /**
+   * Returns true iff preparing this plugin with the provided spec requires
+   * (re-)allocating its internal state: i.e.: if the sample rate or number of
+   * channels have changed, or if the maximum block size has grown since the
+   * last call to markPrepared().
+   */
+  bool specRequiresPrepare(const juce::dsp::ProcessSpec &spec) const {
+    return lastSpec.sampleRate != spec.sampleRate ||
+           lastSpec.maximumBlockSize < spec.maximumBlockSize ||
+           lastSpec.numChannels != spec.numChannels;
+  }
+
+  /**
+   * Record that this plugin's internal state has been (re-)allocated for the
+   * provided spec.
+   */
+  void markPrepared(const juce::dsp::ProcessSpec &spec) {
+    lastSpec = spec;
+    numPrepares++;
+  }
+
   juce::dsp::ProcessSpec lastSpec = {0};
+  int numPrepares = 0;
   std::optional<ChannelLayout> lastChannelLayout = {};
 };
+
+/**
+ * Clone the provided plugin (see Plugin::clone), raising a TypeError if it
+ * cannot be cloned. Must be called with the GIL held.
+ */
+inline std::shared_ptr<Plugin> clonePlugin(std::shared_ptr<Plugin> plugin) {
+  if (!plugin) {
+    return nullptr;
+  }
+
+  std::shared_ptr<Plugin> clone = plugin->clone();
+  if (!clone) {
+    throw py::type_error(py::repr(py::cast(plugin)).cast<std::string>() +
+                         " cannot be cloned.");
+  }
+  return clone;
+}
 } // namespace Pedalboard
\ No newline at end of file
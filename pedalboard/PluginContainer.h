@@ -18,12 +18,28 @@
 #pragma once
 
 #include "JuceHeader.h"
+#include <atomic>
 #include <mutex>
 
 #include "Plugin.h"
 
 namespace Pedalboard {
 
+/**
+ * The set of plugins that must be locked before processing audio through a
+ * PluginContainer: the container itself, plus every plugin it contains
+ * (directly or indirectly), sorted by address to give a consistent order in
+ * which to take their locks.
+ */
+struct PluginLockSet {
+  std::vector<Plugin *> sortedPlugins;
+
+  // Keeps the contained plugins alive for as long as this set is in use:
+  std::vector<std::shared_ptr<Plugin>> containedPlugins;
+
+  bool containsDuplicates = false;
+};
+
 /**
  * A class for all Pedalboard plugins that contain one or more other plugins.
  */
@@ -79,8 +95,79 @@ public:
     return flatList;
   }
 
+  /*
+   * Get the set of plugins that must be locked to process audio through this
+   * container. This set is cached, and only rebuilt if any PluginContainer
+   * has been modified since it was last built.
+   */
+  std::shared_ptr<const PluginLockSet> getLockSet() {
+    std::scoped_lock lock(lockSetMutex);
+
+    unsigned long long currentVersion = structureVersion.load();
+    if (!cachedLockSet || cachedLockSetVersion != currentVersion) {
+      auto lockSet = std::make_shared<PluginLockSet>();
+      lockSet->containedPlugins = getAllPlugins();
+
+      lockSet->sortedPlugins.reserve(lockSet->containedPlugins.size() + 1);
+      lockSet->sortedPlugins.push_back(this);
+      for (auto &plugin : lockSet->containedPlugins) {
+        lockSet->sortedPlugins.push_back(plugin.get());
+      }
+      std::sort(lockSet->sortedPlugins.begin(), lockSet->sortedPlugins.end());
+      lockSet->containsDuplicates =
+          std::adjacent_find(lockSet->sortedPlugins.begin(),
+                             lockSet->sortedPlugins.end()) !=
+          lockSet->sortedPlugins.end();
+
+      cachedLockSet = lockSet;
+      cachedLockSetVersion = currentVersion;
+    }
+
+    return cachedLockSet;
+  }
+
+  /*
+   * Mark every cached lock set as stale. Must be called after modifying the
+   * list of plugins in any PluginContainer, as a container's lock set
+   * includes all of its nested plugins.
+   */
+  void invalidateLockSets() {
+    structureVersion++;
+
+    // Don't keep removed plugins alive any longer than necessary:
+    std::scoped_lock lock(lockSetMutex);
+    cachedLockSet.reset();
+  }
+
+  /*
+   * Called (while holding this container's mutex) after a plugin has been
+   * inserted into or removed from the list of plugins at the given index, so
+   * that subclasses can keep any per-plugin state aligned with that list.
+   */
+  virtual void pluginInserted(size_t index) {}
+  virtual void pluginRemoved(size_t index) {}
+
 protected:
+  /*
+   * Clone each of the plugins in this container, raising a TypeError if any
+   * of them cannot be cloned.
+   */
+  std::vector<std::shared_ptr<Plugin>> clonePlugins() {
+    std::vector<std::shared_ptr<Plugin>> clones;
+    for (auto plugin : plugins) {
+      clones.push_back(clonePlugin(plugin));
+    }
+    return clones;
+  }
+
   std::vector<std::shared_ptr<Plugin>> plugins;
+
+private:
+  static inline std::atomic<unsigned long long> structureVersion = 0;
+
+  std::mutex lockSetMutex;
+  std::shared_ptr<const PluginLockSet> cachedLockSet;
+  unsigned long long cachedLockSetVersion = 0;
 };
 
 inline void init_plugin_container(py::module &m) {
@@ -134,6 +221,10 @@ inline void init_plugin_container(py::module &m) {
             }
 
             s.getPlugins()[i] = plugin;
+            // The replacement plugin starts from scratch:
+            s.pluginRemoved(i);
+            s.pluginInserted(i);
+            s.invalidateLockSets();
           },
           py::arg("index"), py::arg("plugin"),
           "Replace a plugin at the specified index. Index may be negative. If "
@@ -150,6 +241,8 @@ inline void init_plugin_container(py::module &m) {
               throw py::index_error("index out of range");
             auto &plugins = s.getPlugins();
             plugins.erase(plugins.begin() + i);
+            s.pluginRemoved(i);
+            s.invalidateLockSets();
           },
           py::arg("index"),
           "Delete a plugin by its index. Index may be negative. If the index "
@@ -181,6 +274,8 @@ inline void init_plugin_container(py::module &m) {
 
             auto &plugins = s.getPlugins();
             plugins.insert(plugins.begin() + i, plugin);
+            s.pluginInserted(i);
+            s.invalidateLockSets();
           },
           py::arg("index"), py::arg("plugin"),
           "Insert a plugin at the specified index.")
@@ -197,6 +292,8 @@ inline void init_plugin_container(py::module &m) {
             }
 
             s.getPlugins().push_back(plugin);
+            s.pluginInserted(s.getPlugins().size() - 1);
+            s.invalidateLockSets();
           },
           py::arg("plugin"), "Append a plugin to the end of this container.")
       .def(
@@ -207,7 +304,10 @@ inline void init_plugin_container(py::module &m) {
             auto position = std::find(plugins.begin(), plugins.end(), plugin);
             if (position == plugins.end())
               throw py::value_error("remove(x): x not in list");
+            size_t index = position - plugins.begin();
             plugins.erase(position);
+            s.pluginRemoved(index);
+            s.invalidateLockSets();
           },
           py::arg("plugin"), "Remove a plugin by its value.")
       .def(
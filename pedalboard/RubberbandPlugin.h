@@ -30,9 +30,7 @@ public:
   virtual ~RubberbandPlugin(){};
 
   virtual void prepare(const juce::dsp::ProcessSpec &spec) override {
-    bool specChanged = lastSpec.sampleRate != spec.sampleRate ||
-                       lastSpec.maximumBlockSize < spec.maximumBlockSize ||
-                       spec.numChannels != lastSpec.numChannels;
+    bool specChanged = specRequiresPrepare(spec);
 
     if (!rbPtr || specChanged) {
       auto stretcherOptions = RubberBandStretcher::OptionProcessRealTime |
@@ -43,7 +41,7 @@ public:
           spec.sampleRate, spec.numChannels, stretcherOptions);
       rbPtr->setMaxProcessSize(spec.maximumBlockSize);
 
-      lastSpec = spec;
+      markPrepared(spec);
       reset();
     }
   }
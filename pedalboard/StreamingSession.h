@@ -0,0 +1,303 @@
+/*
+ * pedalboard
+ * Copyright 2024 Spotify AB
+ *
+ * Licensed under the GNU Public License, Version 3.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    https://www.gnu.org/licenses/gpl-3.0.html
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#pragma once
+
+#include <mutex>
+#include <optional>
+#include <sstream>
+
+#include "JuceHeader.h"
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include "BufferUtils.h"
+#include "Plugin.h"
+#include "process.h"
+
+namespace py = pybind11;
+
+namespace Pedalboard {
+
+/**
+ * Runs a potentially-unbounded stream of audio chunks through a plugin,
+ * keeping track of how many samples the plugin has buffered internally so
+ * that flush() can return exactly the audio that a single call to process()
+ * would have returned at the end of the stream.
+ *
+ * The plugin is only reset and prepared at the start of each stream (or if
+ * the number of channels changes), rather than on every call, so the plugin
+ * must not be used elsewhere while a stream is in progress.
+ */
+class StreamingSession {
+public:
+  StreamingSession(std::shared_ptr<Plugin> plugin, double sampleRate,
+                   unsigned int bufferSize, bool reset)
+      : plugins({plugin}), sampleRate(sampleRate), bufferSize(bufferSize),
+        resetBeforeNextChunk(reset) {
+    if (!plugin) {
+      throw std::domain_error("StreamingSession requires a plugin.");
+    }
+
+    if (sampleRate <= 0) {
+      throw std::range_error("sample_rate must be greater than 0Hz.");
+    }
+
+    if (bufferSize == 0) {
+      throw std::range_error("buffer_size must be greater than 0 samples.");
+    }
+  }
+
+  /**
+   * Process the next chunk of the stream in-place, returning the number of
+   * samples of output (right-aligned in the buffer) that were produced.
+   */
+  int feed(juce::AudioBuffer<float> &ioBuffer) {
+    std::scoped_lock lock(mutex);
+
+    int numChannels = ioBuffer.getNumChannels();
+    if (totalSamplesInput > 0 && spec &&
+        spec->numChannels != (juce::uint32)numChannels) {
+      throw std::domain_error(
+          "StreamingSession was passed " + std::to_string(numChannels) +
+          "-channel audio in the middle of a " +
+          std::to_string(spec->numChannels) +
+          "-channel stream. Call flush() or reset() before passing audio "
+          "with a different number of channels.");
+    }
+
+    PluginLocks pluginLocks(plugins);
+    if (resetBeforeNextChunk || !spec ||
+        spec->numChannels != (juce::uint32)numChannels) {
+      spec = preparePlugins(plugins, sampleRate, bufferSize, numChannels,
+                            resetBeforeNextChunk);
+      resetBeforeNextChunk = false;
+    }
+
+    int samplesReturned = process(ioBuffer, *spec, plugins,
+                                  /* isProbablyLastProcessCall= */ false);
+    totalSamplesInput += ioBuffer.getNumSamples();
+    totalSamplesOutput += samplesReturned;
+    return samplesReturned;
+  }
+
+  /**
+   * Feed silence through the plugin until it has returned as many samples
+   * as were fed in, then return those remaining samples and end the stream.
+   * The next call to feed() will reset the plugin and start a new stream.
+   */
+  juce::AudioBuffer<float> flush() {
+    std::scoped_lock lock(mutex);
+
+    if (!spec) {
+      return {};
+    }
+
+    int numChannels = spec->numChannels;
+    int numTailSamples = (int)(totalSamplesInput - totalSamplesOutput);
+    juce::AudioBuffer<float> tail(numChannels, numTailSamples);
+    juce::AudioBuffer<float> silence(numChannels, numTailSamples);
+
+    {
+      PluginLocks pluginLocks(plugins);
+      int tailSamplesWritten = 0;
+      while (tailSamplesWritten < numTailSamples) {
+        int samplesNeeded = numTailSamples - tailSamplesWritten;
+        silence.setSize(numChannels, samplesNeeded,
+                        /* keepExistingContent= */ false,
+                        /* clearExtraSpace= */ false,
+                        /* avoidReallocating= */ true);
+        silence.clear();
+
+        int samplesReturned = process(silence, *spec, plugins,
+                                      /* isProbablyLastProcessCall= */ false);
+
+        // Output is right-aligned:
+        for (int c = 0; c < numChannels; c++) {
+          tail.copyFrom(c, tailSamplesWritten, silence, c,
+                        samplesNeeded - samplesReturned, samplesReturned);
+        }
+        tailSamplesWritten += samplesReturned;
+      }
+    }
+
+    totalSamplesInput = 0;
+    totalSamplesOutput = 0;
+    resetBeforeNextChunk = true;
+    return tail;
+  }
+
+  /**
+   * Discard any audio buffered in the plugin without returning it. The next
+   * call to feed() will reset the plugin and start a new stream.
+   */
+  void reset() {
+    std::scoped_lock lock(mutex);
+    totalSamplesInput = 0;
+    totalSamplesOutput = 0;
+    resetBeforeNextChunk = true;
+  }
+
+  std::shared_ptr<Plugin> getPlugin() const { return plugins[0]; }
+  double getSampleRate() const { return sampleRate; }
+  unsigned int getBufferSize() const { return bufferSize; }
+
+  long long getPendingSamples() {
+    std::scoped_lock lock(mutex);
+    return totalSamplesInput - totalSamplesOutput;
+  }
+
+  std::optional<ChannelLayout> getLastChannelLayout() const {
+    return lastChannelLayout;
+  }
+
+  int getLastNumDimensions() const { return lastNumDimensions; }
+
+  void setLastInputShape(ChannelLayout channelLayout, int numDimensions) {
+    lastChannelLayout = channelLayout;
+    lastNumDimensions = numDimensions;
+  }
+
+private:
+  const std::vector<std::shared_ptr<Plugin>> plugins;
+  const double sampleRate;
+  const unsigned int bufferSize;
+
+  std::optional<juce::dsp::ProcessSpec> spec;
+  bool resetBeforeNextChunk;
+
+  long long totalSamplesInput = 0;
+  long long totalSamplesOutput = 0;
+
+  // The shape of the last chunk of audio passed in, used to shape the output
+  // of flush():
+  std::optional<ChannelLayout> lastChannelLayout = {};
+  int lastNumDimensions = 2;
+
+  // A mutex to gate access to this session, as its internals may not be
+  // thread-safe.
+  std::mutex mutex;
+};
+
+inline void init_streaming_session(py::module &m) {
+  py::class_<StreamingSession, std::shared_ptr<StreamingSession>>(
+      m, "StreamingSession",
+      "Process a potentially-unbounded stream of audio chunks through a "
+      "plugin (or :class:`pedalboard.Pedalboard`), returning exactly the same "
+      "audio that a single call to :py:meth:`Plugin.process` would return "
+      "if passed the entire stream at once.\n\nEach call to :meth:`feed` "
+      "returns as much processed audio as the plugin has produced so far. "
+      "Plugins that introduce latency may return fewer samples than they "
+      "were passed; once the stream is over, call :meth:`flush` to receive "
+      "the remaining audio. The total number of samples returned will always "
+      "equal the total number of samples passed in.\n\nThe plugin is reset "
+      "and prepared only once per stream rather than on every call, so it "
+      "should not be used elsewhere until the stream has been flushed.")
+      .def(py::init([](std::shared_ptr<Plugin> plugin, double sampleRate,
+                       unsigned int bufferSize, bool reset) {
+             return std::make_shared<StreamingSession>(plugin, sampleRate,
+                                                       bufferSize, reset);
+           }),
+           py::arg("plugin"), py::arg("sample_rate"),
+           py::arg("buffer_size") = DEFAULT_BUFFER_SIZE,
+           py::arg("reset") = true,
+           "Start a new stream through the provided plugin. If ``reset`` is "
+           "``True`` (the default), the plugin is reset before the first "
+           "chunk is processed, clearing any state left over from previous "
+           "calls to :py:meth:`Plugin.process`.")
+      .def("__repr__",
+           [](StreamingSession &session) {
+             std::ostringstream ss;
+             ss << "<pedalboard.StreamingSession";
+             ss << " sample_rate=" << session.getSampleRate();
+             ss << " buffer_size=" << session.getBufferSize();
+             ss << " pending_samples=" << session.getPendingSamples();
+             ss << " at " << &session;
+             ss << ">";
+             return ss.str();
+           })
+      .def(
+          "feed",
+          [](StreamingSession &session, py::array inputArray) {
+            py::array_t<float, py::array::c_style> float32InputArray =
+                ensureFloat32Array(inputArray);
+            ChannelLayout channelLayout =
+                session.getPlugin()->parseAndCacheChannelLayout(
+                    float32InputArray);
+            int ndim = float32InputArray.request().ndim;
+
+            juce::AudioBuffer<float> ioBuffer =
+                copyPyArrayIntoJuceBuffer(float32InputArray, {channelLayout});
+            if (ioBuffer.getNumChannels() == 0) {
+              return createZeroChannelOutputArray(ndim, channelLayout,
+                                                  ioBuffer.getNumSamples());
+            }
+
+            session.setLastInputShape(channelLayout, ndim);
+
+            int samplesReturned;
+            {
+              py::gil_scoped_release release;
+              samplesReturned = session.feed(ioBuffer);
+            }
+
+            int latencySamples = ioBuffer.getNumSamples() - samplesReturned;
+            return moveJuceBufferIntoPyArray(std::move(ioBuffer), channelLayout,
+                                             latencySamples, ndim);
+          },
+          py::arg("input_array"),
+          "Process the next chunk of a 32-bit or 64-bit floating point audio "
+          "stream, returning the processed audio that is ready so far. The "
+          "returned array may contain fewer samples than were provided if the "
+          "plugin has buffered audio internally.")
+      .def(
+          "flush",
+          [](StreamingSession &session) {
+            juce::AudioBuffer<float> tail;
+            {
+              py::gil_scoped_release release;
+              tail = session.flush();
+            }
+
+            std::optional<ChannelLayout> channelLayout =
+                session.getLastChannelLayout();
+            if (!channelLayout) {
+              return py::array_t<float>(0);
+            }
+            return moveJuceBufferIntoPyArray(std::move(tail), *channelLayout, 0,
+                                             session.getLastNumDimensions());
+          },
+          "End the current stream, returning any audio still buffered inside "
+          "the plugin. The next call to :meth:`feed` will start a new stream.")
+      .def("reset", &StreamingSession::reset,
+           "End the current stream without returning any audio still "
+           "buffered inside the plugin. The next call to :meth:`feed` will "
+           "start a new stream.")
+      .def_property_readonly("plugin", &StreamingSession::getPlugin,
+                             "The plugin that audio is processed through.")
+      .def_property_readonly("sample_rate", &StreamingSession::getSampleRate,
+                             "The sample rate of the audio stream.")
+      .def_property_readonly(
+          "buffer_size", &StreamingSession::getBufferSize,
+          "The maximum number of samples passed to the plugin at once.")
+      .def_property_readonly(
+          "pending_samples", &StreamingSession::getPendingSamples,
+          "The number of samples fed into this stream that have not yet been "
+          "returned, and will be returned by :meth:`flush`.");
+}
+
+} // namespace Pedalboard
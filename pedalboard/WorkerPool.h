@@ -0,0 +1,171 @@
+/*
+ * pedalboard
+ * Copyright 2024 Spotify AB
+ *
+ * Licensed under the GNU Public License, Version 3.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    https://www.gnu.org/licenses/gpl-3.0.html
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#pragma once
+
+#include <atomic>
+#include <condition_variable>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace Pedalboard {
+
+/**
+ * A small, persistent pool of native threads that can run a batch of
+ * independent tasks and wait for all of them to complete.
+ *
+ * The thread calling parallelFor() participates in the work, so a pool with
+ * N worker threads can run up to N + 1 tasks at once. Pools with zero workers
+ * run every task serially on the calling thread. None of these methods touch
+ * the GIL; callers are expected to release it before calling parallelFor().
+ */
+class WorkerPool {
+public:
+  explicit WorkerPool(int numWorkers) {
+    for (int i = 0; i < numWorkers; i++) {
+      workers.emplace_back([this]() { workerLoop(); });
+    }
+  }
+
+  ~WorkerPool() {
+    {
+      std::lock_guard<std::mutex> lock(mutex);
+      stopping = true;
+    }
+    workAvailable.notify_all();
+    for (auto &worker : workers) {
+      worker.join();
+    }
+  }
+
+  WorkerPool(const WorkerPool &) = delete;
+  WorkerPool &operator=(const WorkerPool &) = delete;
+
+  int getNumWorkers() const { return workers.size(); }
+
+  /**
+   * Call task(i) for every i in [0, numTasks), spread across the worker
+   * threads and the calling thread. Blocks until every task has returned. If
+   * any task throws, the first exception thrown is re-thrown here once all
+   * of the other tasks have finished.
+   */
+  void parallelFor(int numTasks, const std::function<void(int)> &task) {
+    if (numTasks <= 0) {
+      return;
+    }
+
+    if (workers.empty() || numTasks == 1) {
+      for (int i = 0; i < numTasks; i++) {
+        task(i);
+      }
+      return;
+    }
+
+    // Only one batch may be in flight at once:
+    std::scoped_lock batchLock(batchMutex);
+
+    {
+      std::lock_guard<std::mutex> lock(mutex);
+      currentTask = &task;
+      currentNumTasks = numTasks;
+      nextTaskIndex = 0;
+      workersStillRunning = workers.size();
+      firstError = nullptr;
+      generation++;
+    }
+    workAvailable.notify_all();
+
+    runTasks();
+
+    std::exception_ptr error;
+    {
+      std::unique_lock<std::mutex> lock(mutex);
+      batchFinished.wait(lock, [this]() { return workersStillRunning == 0; });
+      currentTask = nullptr;
+      error = firstError;
+      firstError = nullptr;
+    }
+
+    if (error) {
+      std::rethrow_exception(error);
+    }
+  }
+
+private:
+  void workerLoop() {
+    unsigned long long lastGeneration = 0;
+    while (true) {
+      {
+        std::unique_lock<std::mutex> lock(mutex);
+        workAvailable.wait(lock, [this, lastGeneration]() {
+          return stopping || generation != lastGeneration;
+        });
+        if (stopping) {
+          return;
+        }
+        lastGeneration = generation;
+      }
+
+      runTasks();
+
+      {
+        std::lock_guard<std::mutex> lock(mutex);
+        if (--workersStillRunning == 0) {
+          batchFinished.notify_one();
+        }
+      }
+    }
+  }
+
+  void runTasks() {
+    while (true) {
+      int taskIndex = nextTaskIndex.fetch_add(1);
+      if (taskIndex >= currentNumTasks) {
+        return;
+      }
+
+      try {
+        (*currentTask)(taskIndex);
+      } catch (...) {
+        std::lock_guard<std::mutex> lock(mutex);
+        if (!firstError) {
+          firstError = std::current_exception();
+        }
+      }
+    }
+  }
+
+  std::vector<std::thread> workers;
+
+  std::mutex batchMutex;
+  std::mutex mutex;
+  std::condition_variable workAvailable;
+  std::condition_variable batchFinished;
+
+  bool stopping = false;
+  unsigned long long generation = 0;
+  const std::function<void(int)> *currentTask = nullptr;
+  int currentNumTasks = 0;
+  std::atomic<int> nextTaskIndex = 0;
+  int workersStillRunning = 0;
+  std::exception_ptr firstError;
+};
+
+} // namespace Pedalboard
@@ -14,6 +14,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import os
 import platform
 import re
 import weakref
@@ -21,6 +23,7 @@ from contextlib import contextmanager
 from typing import (
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -31,10 +34,14 @@ from typing import (
     no_type_check,
 )
 
+import numpy as np
+
 from pedalboard_native import (  # type: ignore
     ExternalPlugin,  # type: ignore
     Plugin,
+    StreamingSession,
     _AudioProcessorParameter,
+    _render_many,
 )
 from pedalboard_native.utils import Chain  # type: ignore
 
@@ -69,6 +76,90 @@ class Pedalboard(Chain):
             list(self),
         )
 
+    def __deepcopy__(self, memo: dict) -> "Pedalboard":
+        return type(self)([copy.deepcopy(plugin, memo) for plugin in self])
+
+    def render_many(
+        self,
+        input_arrays: List[np.ndarray],
+        sample_rate: float,
+        workers: Optional[int] = None,
+        buffer_size: int = 8192,
+    ) -> List[np.ndarray]:
+        """
+        Process a list of independent audio buffers through this pedalboard using
+        multiple CPU cores, returning a list of processed buffers in the same order.
+
+        This pedalboard is cloned (once per worker, including all of its plugins
+        and their parameters) and each clone processes a share of the buffers on
+        its own native thread, with the GIL released. Each buffer is processed
+        from a clean state, exactly as if :py:meth:`process` had been called on
+        it with ``reset=True``.
+
+        ``workers`` defaults to the number of CPU cores available.
+
+        .. note::
+            Each clone is created with :py:func:`copy.deepcopy`, which copies the
+            parameters of every plugin (and the entire state of any external VST3®
+            or Audio Unit plugins) but not their internal buffers. If any plugin
+            in this pedalboard cannot be cloned, a :py:exc:`TypeError` will be
+            raised; such pedalboards can only be used with ``workers=1``.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1 (got {workers}).")
+
+        workers = max(1, min(workers, len(input_arrays)))
+        instances = [self] + [_clone_plugin(self) for _ in range(workers - 1)]
+        return _render_many(input_arrays, sample_rate, instances, buffer_size)
+
+    def process_stream(
+        self,
+        chunks: Iterable[np.ndarray],
+        sample_rate: float,
+        buffer_size: int = 8192,
+        reset: bool = True,
+    ) -> Iterator[np.ndarray]:
+        """
+        Process an iterable of consecutive audio chunks through this pedalboard,
+        lazily yielding one processed chunk for each chunk of input, followed by
+        a final chunk containing any audio still buffered inside the plugins.
+
+        Concatenating the yielded chunks produces exactly the same audio as
+        passing the concatenated input to :py:meth:`process` at once, even if
+        this pedalboard contains plugins that introduce latency. (Individual
+        output chunks may be shorter than their corresponding input chunks.)
+        For example::
+
+            def read_chunks(f):
+                while f.tell() < f.frames:
+                    yield f.read(f.samplerate)
+
+            with AudioFile("input.wav") as i:
+                with AudioFile("output.wav", "w", i.samplerate, i.num_channels) as o:
+                    for chunk in board.process_stream(read_chunks(i), i.samplerate):
+                        o.write(chunk)
+
+        This is a thin wrapper around :class:`StreamingSession`, which can be
+        used directly when a push-style interface is more convenient.
+        """
+        session = StreamingSession(self, sample_rate, buffer_size, reset)
+        for chunk in chunks:
+            yield session.feed(chunk)
+        yield session.flush()
+
+
+def _clone_plugin(plugin: Plugin) -> Plugin:
+    """
+    Create an independent copy of the provided plugin (and of any plugins
+    it contains), with the same parameter values but none of its internal state.
+    """
+    try:
+        return copy.deepcopy(plugin)
+    except TypeError as e:
+        raise TypeError(f"{e} Use workers=1 instead.") from e
+
 
 # Stored in a trie to speed up these matches, as they happen millions of times in test:
 FLOAT_SUFFIXES_TO_IGNORE = ["x", "%", "*", ",", ".", "hz", "ms", "db", "sec", "dbtp", "seconds"]
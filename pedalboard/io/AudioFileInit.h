@@ -82,6 +82,27 @@ Opening an audio file on disk, while resampling on-the-fly::
        first_ten_seconds = f.read(int(f.samplerate * 10))
 
 
+Memory-mapping an uncompressed WAV or AIFF file for fast random access::
+
+   with AudioFile("my_file.wav", mmap=True) as f:
+       f.seek(int(f.samplerate * 60))
+       one_second = f.read(int(f.samplerate))
+
+
+Decoding a compressed file on a background thread while processing it::
+
+   with AudioFile("my_file.mp3", prefetch_frames=44_100 * 10) as f:
+       while f.tell() < f.frames:
+           chunk = f.read(f.samplerate)
+           ...  # chunk processing here overlaps with decoding the next chunk
+
+
+Decoding a 44.1kHz MP3 file at 22.05kHz, then resampling the result to 16kHz::
+
+   with AudioFile("my_file.mp3", decimation=2).resampled_to(16_000) as f:
+       audio = f.read(f.frames)
+
+
 Writing an audio file on disk::
 
    with AudioFile("white_noise.wav", "w", samplerate=44100, num_channels=2) as f:
@@ -150,9 +171,11 @@ inline void init_audio_file(
                          // instantiate subclasses via __new__.
       .def_static(
           "__new__",
-          [](const py::object *, std::string filename, std::string mode) {
+          [](const py::object *, std::string filename, std::string mode,
+             bool memoryMap, long long prefetchFrames, int decimation) {
             if (mode == "r") {
-              return std::make_shared<ReadableAudioFile>(filename);
+              return std::make_shared<ReadableAudioFile>(
+                  filename, memoryMap, prefetchFrames, decimation);
             } else if (mode == "w") {
               throw py::type_error("Opening an audio file for writing requires "
                                    "samplerate and num_channels arguments.");
@@ -162,10 +185,20 @@ inline void init_audio_file(
             }
           },
           py::arg("cls"), py::arg("filename"), py::arg("mode") = "r",
-          "Open an audio file for reading.")
+          py::kw_only(), py::arg("mmap") = false,
+          py::arg("prefetch_frames") = 0, py::arg("decimation") = 1,
+          "Open an audio file for reading. If ``mmap`` is ``True``, the file "
+          "will be memory-mapped rather than read through intermediate "
+          "buffers, which is only supported for uncompressed WAV and AIFF "
+          "files. If ``prefetch_frames`` is greater than zero, up to that "
+          "many frames of audio will be decoded ahead of time on a "
+          "background thread. If ``decimation`` is 2 or 4, MP3 files will be "
+          "decoded directly at half or a quarter of their sample rate; other "
+          "formats ignore this argument, so check :py:attr:`samplerate`.")
       .def_static(
           "__new__",
-          [](const py::object *, py::object filelike, std::string mode) {
+          [](const py::object *, py::object filelike, std::string mode,
+             int bufferSize) {
             if (mode == "r") {
               if (!isReadableFileLike(filelike) &&
                   !tryConvertingToBuffer(filelike)) {
@@ -175,6 +208,7 @@ inline void init_audio_file(
                     "but received: " +
                     py::repr(filelike).cast<std::string>());
               }
+              validateFileLikeBufferSize(bufferSize);
 
               if (std::optional<py::buffer> buf =
                       tryConvertingToBuffer(filelike)) {
@@ -183,7 +217,7 @@ inline void init_audio_file(
                                                                   filelike));
               } else {
                 return std::make_shared<ReadableAudioFile>(
-                    std::make_unique<PythonInputStream>(filelike));
+                    std::make_unique<PythonInputStream>(filelike, bufferSize));
               }
             } else if (mode == "w") {
               throw py::type_error(
@@ -195,15 +229,20 @@ inline void init_audio_file(
             }
           },
           py::arg("cls"), py::arg("file_like"), py::arg("mode") = "r",
+          py::kw_only(),
+          py::arg("buffer_size") = DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES,
           "Open a file-like object for reading. The provided object must have "
           "``read``, ``seek``, ``tell``, and ``seekable`` methods, and must "
           "return binary data (i.e.: ``open(..., \"w\")`` or ``io.BytesIO``, "
-          "etc.).")
+          "etc.). Data will be read from the file-like object in chunks of "
+          "``buffer_size`` bytes, or one read at a time if ``buffer_size`` is "
+          "0.")
       .def_static(
           "__new__",
           [](const py::object *, std::string filename, std::string mode,
              std::optional<double> sampleRate, int numChannels, int bitDepth,
-             std::optional<std::variant<std::string, float>> quality) {
+             std::optional<std::variant<std::string, float>> quality,
+             bool asyncEncode) {
             if (mode == "r") {
               throw py::type_error(
                   "Opening an audio file for reading does not require "
@@ -217,8 +256,9 @@ inline void init_audio_file(
                     "argument to be provided.");
               }
 
-              return std::make_shared<WriteableAudioFile>(
-                  filename, *sampleRate, numChannels, bitDepth, quality);
+              return std::make_shared<WriteableAudioFile>(filename, *sampleRate,
+                                                          numChannels, bitDepth,
+                                                          quality, asyncEncode);
             } else {
               throw py::type_error("AudioFile instances can only be opened in "
                                    "read mode (\"r\") or write mode (\"w\").");
@@ -226,13 +266,15 @@ inline void init_audio_file(
           },
           py::arg("cls"), py::arg("filename"), py::arg("mode") = "w",
           py::arg("samplerate") = py::none(), py::arg("num_channels") = 1,
-          py::arg("bit_depth") = 16, py::arg("quality") = py::none())
+          py::arg("bit_depth") = 16, py::arg("quality") = py::none(),
+          py::kw_only(), py::arg("async_encode") = false)
       .def_static(
           "__new__",
           [](const py::object *, py::object filelike, std::string mode,
              std::optional<double> sampleRate, int numChannels, int bitDepth,
              std::optional<std::variant<std::string, float>> quality,
-             std::optional<std::string> format) {
+             std::optional<std::string> format, bool asyncEncode,
+             int bufferSize, std::optional<int> workers) {
             if (mode == "r") {
               throw py::type_error(
                   "Opening a file-like object for reading does not require "
@@ -252,8 +294,11 @@ inline void init_audio_file(
                     "write, seek, seekable, and tell methods), but received: " +
                     filelike.attr("__repr__")().cast<std::string>());
               }
+              validateFileLikeBufferSize(bufferSize);
+              validateNumEncoderThreads(workers);
 
-              auto stream = std::make_unique<PythonOutputStream>(filelike);
+              auto stream =
+                  std::make_unique<PythonOutputStream>(filelike, bufferSize);
               if (!format && !stream->getFilename()) {
                 throw py::type_error(
                     "Unable to infer audio file format for writing. Expected "
@@ -266,7 +311,8 @@ inline void init_audio_file(
 
               return std::make_shared<WriteableAudioFile>(
                   format.value_or(""), std::move(stream), *sampleRate,
-                  numChannels, bitDepth, quality);
+                  numChannels, bitDepth, quality, asyncEncode,
+                  workers.value_or(1));
             } else {
               throw py::type_error("AudioFile instances can only be opened in "
                                    "read mode (\"r\") or write mode (\"w\").");
@@ -275,27 +321,40 @@ inline void init_audio_file(
           py::arg("cls"), py::arg("file_like"), py::arg("mode") = "w",
           py::arg("samplerate") = py::none(), py::arg("num_channels") = 1,
           py::arg("bit_depth") = 16, py::arg("quality") = py::none(),
-          py::arg("format") = py::none())
+          py::arg("format") = py::none(), py::kw_only(),
+          py::arg("async_encode") = false,
+          py::arg("buffer_size") = DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES,
+          py::arg("workers") = py::none())
       .def_static(
           "encode",
           [](const py::array samples, double sampleRate, std::string format,
              int numChannels, int bitDepth,
-             std::optional<std::variant<std::string, float>> quality) {
+             std::optional<std::variant<std::string, float>> quality,
+             std::optional<int> workers) {
+            validateNumEncoderThreads(workers);
+
             juce::MemoryBlock outputBlock;
             auto audioFile = std::make_unique<WriteableAudioFile>(
                 format,
                 std::make_unique<juce::MemoryOutputStream>(outputBlock, false),
-                sampleRate, numChannels, bitDepth, quality);
+                sampleRate, numChannels, bitDepth, quality,
+                /* asyncEncode */ false, workers.value_or(1));
 
             audioFile->write(samples);
-            audioFile->close();
+            {
+              // Some writers (i.e.: parallel FLAC) do most of their work
+              // when closed, and none of them need the GIL to write to memory:
+              py::gil_scoped_release release;
+              audioFile->close();
+            }
 
             return py::bytes((const char *)outputBlock.getData(),
                              outputBlock.getSize());
           },
           py::arg("samples"), py::arg("samplerate"), py::arg("format"),
           py::arg("num_channels") = 1, py::arg("bit_depth") = 16,
-          py::arg("quality") = py::none(),
+          py::arg("quality") = py::none(), py::kw_only(),
+          py::arg("workers") = py::none(),
           R"(
 Encode an audio buffer to a Python :class:`bytes` object.
 
@@ -315,6 +374,12 @@ encoding process. This allows Python's Global Interpreter Lock (GIL) to be
 released, which also makes this method much more performant in multi-threaded
 programs.
 
+If ``workers`` is provided and ``format`` is ``"flac"``, the audio will be split
+into segments that are encoded in parallel on up to ``workers`` native threads,
+then combined into a single FLAC stream. (FLAC frames are encoded independently,
+so the resulting stream decodes identically to one encoded on a single thread.)
+``workers`` has no effect on other formats.
+
 .. warning::
   This function will encode the entire audio buffer at once, and may consume a
   large amount of memory if the input audio buffer is large.
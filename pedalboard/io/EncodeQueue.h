@@ -0,0 +1,193 @@
+/*
+ * pedalboard
+ * Copyright 2024 Spotify AB
+ *
+ * Licensed under the GNU Public License, Version 3.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    https://www.gnu.org/licenses/gpl-3.0.html
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#pragma once
+
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <stdexcept>
+#include <thread>
+
+namespace Pedalboard {
+
+/**
+ * A bounded queue of encoding jobs, run in order on a single background
+ * native thread.
+ *
+ * Each job is tagged with the number of frames of audio it will encode; once
+ * more than capacityInFrames frames are queued, enqueue() blocks until the
+ * background thread catches up. (A single job larger than the capacity is
+ * still accepted if the queue is empty.)
+ *
+ * If a job throws, all jobs queued after it are discarded, and the exception
+ * is re-thrown (once) from the next call to enqueue(), waitUntilIdle(), or
+ * finish(). Subsequent calls to enqueue() will throw a generic error.
+ *
+ * None of these methods touch the GIL, and jobs must not either. All methods
+ * must be called from a single producer thread at a time.
+ */
+class EncodeQueue {
+public:
+  using Job = std::function<void()>;
+
+  explicit EncodeQueue(long long capacityInFrames)
+      : capacityInFrames(capacityInFrames), thread([this]() { workerLoop(); }) {
+  }
+
+  ~EncodeQueue() { finish(); }
+
+  EncodeQueue(const EncodeQueue &) = delete;
+  EncodeQueue &operator=(const EncodeQueue &) = delete;
+
+  /**
+   * Add a job to the end of the queue, waiting for space in the queue if
+   * necessary.
+   */
+  void enqueue(Job job, long long numFrames) {
+    {
+      std::unique_lock<std::mutex> lock(mutex);
+      spaceAvailable.wait(lock, [this, numFrames]() {
+        return error || queuedFrames == 0 ||
+               queuedFrames + numFrames <= capacityInFrames;
+      });
+
+      if (!error) {
+        jobs.push_back({std::move(job), numFrames});
+        queuedFrames += numFrames;
+      }
+    }
+
+    rethrowIfFailed();
+    workAvailable.notify_one();
+  }
+
+  /**
+   * Wait for all queued jobs to complete, re-throwing any error they raised.
+   */
+  void waitUntilIdle() {
+    {
+      std::unique_lock<std::mutex> lock(mutex);
+      idle.wait(lock, [this]() { return queuedFrames == 0; });
+    }
+    rethrowIfFailed();
+  }
+
+  /**
+   * Run all queued jobs, then stop the background thread. Returns the error
+   * raised by a job, if that error has not already been re-thrown.
+   */
+  std::exception_ptr finish() {
+    {
+      std::lock_guard<std::mutex> lock(mutex);
+      stopping = true;
+    }
+    workAvailable.notify_one();
+
+    if (thread.joinable()) {
+      thread.join();
+    }
+
+    std::lock_guard<std::mutex> lock(mutex);
+    if (errorReported) {
+      return nullptr;
+    }
+    errorReported = true;
+    return error;
+  }
+
+  void rethrowIfFailed() {
+    std::lock_guard<std::mutex> lock(mutex);
+    if (!error) {
+      return;
+    }
+
+    if (!errorReported) {
+      errorReported = true;
+      std::rethrow_exception(error);
+    }
+
+    throw std::runtime_error(
+        "Unable to write to this audio file, as a previous write failed.");
+  }
+
+private:
+  struct QueuedJob {
+    Job job;
+    long long numFrames;
+  };
+
+  void workerLoop() {
+    while (true) {
+      QueuedJob next;
+      bool shouldRun;
+      {
+        std::unique_lock<std::mutex> lock(mutex);
+        workAvailable.wait(lock,
+                           [this]() { return stopping || !jobs.empty(); });
+        if (jobs.empty()) {
+          return;
+        }
+        next = std::move(jobs.front());
+        jobs.pop_front();
+
+        // Jobs queued after a failure are discarded without being run:
+        shouldRun = !error;
+      }
+
+      std::exception_ptr jobError;
+      if (shouldRun) {
+        try {
+          next.job();
+        } catch (...) {
+          jobError = std::current_exception();
+        }
+      }
+
+      {
+        std::lock_guard<std::mutex> lock(mutex);
+        if (jobError && !error) {
+          error = jobError;
+        }
+        queuedFrames -= next.numFrames;
+      }
+      spaceAvailable.notify_one();
+      idle.notify_one();
+    }
+  }
+
+  const long long capacityInFrames;
+
+  std::mutex mutex;
+  std::condition_variable workAvailable;
+  std::condition_variable spaceAvailable;
+  std::condition_variable idle;
+
+  std::deque<QueuedJob> jobs;
+  long long queuedFrames = 0;
+  bool stopping = false;
+  std::exception_ptr error;
+  bool errorReported = false;
+
+  // Declared last, so that all other members are initialized before the
+  // background thread starts:
+  std::thread thread;
+};
+
+} // namespace Pedalboard
@@ -20,6 +20,7 @@
 #include <cerrno>
 #include <mutex>
 #include <optional>
+#include <stdexcept>
 
 namespace py = pybind11;
 
@@ -27,6 +28,21 @@ namespace py = pybind11;
 
 namespace Pedalboard {
 
+/**
+ * The default size of the buffers used to batch up reads from (and writes to)
+ * Python file-like objects. Audio codecs tend to make many tiny reads and
+ * writes (i.e.: four-byte header fields), each of which would otherwise
+ * require taking the GIL and calling into Python.
+ */
+static constexpr const int DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES = 64 * 1024;
+
+inline void validateFileLikeBufferSize(int bufferSize) {
+  if (bufferSize < 0) {
+    throw std::range_error(
+        "buffer_size must be greater than or equal to 0 bytes.");
+  }
+}
+
 namespace PythonException {
 // Check if there's a Python exception pending in the interpreter.
 inline bool isPending() {
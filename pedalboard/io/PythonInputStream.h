@@ -19,6 +19,7 @@
 
 #include <mutex>
 #include <optional>
+#include <vector>
 
 namespace py = pybind11;
 
@@ -52,13 +53,52 @@ std::optional<py::buffer> tryConvertingToBuffer(py::object bufferLike) {
   }
 }
 
+/**
+ * Returns true if the provided file-like object's readinto() method can be
+ * used in place of its read() method. This is only the case if readinto()
+ * is defined by the same class as read() (i.e.: io.BytesIO,
+ * io.BufferedReader) or a subclass of it (i.e.: io.RawIOBase subclasses);
+ * if read() has been overridden, it may do something that readinto() doesn't.
+ */
+bool shouldUseReadInto(py::object fileLike) {
+  if (!py::hasattr(fileLike, "readinto")) {
+    return false;
+  }
+
+  if (py::hasattr(fileLike, "__dict__") &&
+      fileLike.attr("__dict__").contains("read")) {
+    return false;
+  }
+
+  for (py::handle cls : py::type::of(fileLike).attr("__mro__")) {
+    py::object classDict = cls.attr("__dict__");
+    if (classDict.contains("readinto")) {
+      return true;
+    }
+    if (classDict.contains("read")) {
+      return false;
+    }
+  }
+
+  return false;
+}
+
 /**
  * A juce::InputStream subclass that fetches its
  * data from a provided Python file-like object.
+ *
+ * Reads smaller than bufferSize bytes are served from an internal read-ahead
+ * buffer, which is refilled with one call to the file-like object's read()
+ * method at a time; this allows most reads, seeks, and calls to getPosition()
+ * to avoid taking the GIL at all. (This assumes that nothing else moves the
+ * file-like object's position while this stream is reading from it.)
  */
 class PythonInputStream : public juce::InputStream, public PythonFileLike {
 public:
-  PythonInputStream(py::object fileLike) : PythonFileLike(fileLike) {}
+  PythonInputStream(py::object fileLike,
+                    int bufferSize = DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES)
+      : PythonFileLike(fileLike), useReadInto(shouldUseReadInto(fileLike)),
+        bufferSize(bufferSize) {}
   virtual ~PythonInputStream() {}
 
   juce::int64 getTotalLength() noexcept override {
@@ -99,66 +139,47 @@ public:
     // The buffer should never be null, and a negative size is probably a
     // sign that something is broken!
     jassert(buffer != nullptr && bytesToRead >= 0);
-    ScopedDowngradeToReadLockWithGIL lock(objectLock);
-    ClearErrnoBeforeReturn clearErrnoBeforeReturn;
-
-    py::gil_scoped_acquire acquire;
-    if (PythonException::isPending())
-      return 0;
-
-    try {
-      auto readResult = fileLike.attr("read")(bytesToRead);
 
-      if (!py::isinstance<py::bytes>(readResult)) {
-        std::string message =
-            "File-like object passed to AudioFile was expected to return "
-            "bytes from its read(...) method, but "
-            "returned " +
-            py::str(readResult.get_type().attr("__name__"))
-                .cast<std::string>() +
-            ".";
-
-        if (py::hasattr(fileLike, "mode") &&
-            py::str(fileLike.attr("mode")).cast<std::string>() == "r") {
-          message += " (Try opening the stream in \"rb\" mode instead of "
-                     "\"r\" mode if possible.)";
-        }
-
-        throw py::type_error(message);
-        return 0;
-      }
+    if (bufferSize == 0) {
+      return readFromFileLike(buffer, bytesToRead);
+    }
 
-      py::bytes bytesObject = readResult.cast<py::bytes>();
-      char *pythonBuffer = nullptr;
-      py::ssize_t pythonLength = 0;
+    int bytesCopied = copyFromReadBuffer(buffer, bytesToRead);
+    if (bytesCopied == bytesToRead) {
+      return bytesCopied;
+    }
 
-      if (PYBIND11_BYTES_AS_STRING_AND_SIZE(bytesObject.ptr(), &pythonBuffer,
-                                            &pythonLength)) {
-        throw py::buffer_error(
-            "Internal error: failed to read bytes from bytes object!");
-      }
+    // The read buffer is now empty, so the file-like object's position
+    // matches our own:
+    char *remainingBuffer = static_cast<char *>(buffer) + bytesCopied;
+    int remainingBytes = bytesToRead - bytesCopied;
 
-      if (!buffer && pythonLength > 0) {
-        throw py::buffer_error("Internal error: bytes pointer is null, but a "
-                               "non-zero number of bytes were returned!");
-      }
+    if (remainingBytes >= bufferSize) {
+      // Large reads gain nothing from being buffered:
+      int bytesRead = readFromFileLike(remainingBuffer, remainingBytes);
 
-      if (buffer && pythonLength) {
-        std::memcpy(buffer, pythonBuffer, pythonLength);
+      // The read buffer no longer contains the bytes just before our position,
+      // so it must not be used to satisfy later seeks:
+      if (readBufferPosition != -1) {
+        readBufferPosition += readBufferLength + bytesRead;
       }
+      readBufferOffset = 0;
+      readBufferLength = 0;
+      return bytesCopied + bytesRead;
+    }
 
-      lastReadWasSmallerThanExpected = bytesToRead > pythonLength;
-      return pythonLength;
-    } catch (py::error_already_set e) {
-      e.restore();
-      return 0;
-    } catch (const py::builtin_exception &e) {
-      e.set_error();
-      return 0;
+    if (!fillReadBuffer()) {
+      return bytesCopied;
     }
+
+    return bytesCopied + copyFromReadBuffer(remainingBuffer, remainingBytes);
   }
 
   bool isExhausted() noexcept override {
+    if (readBufferOffset < readBufferLength) {
+      return false;
+    }
+
     // Read this up front to avoid releasing the object lock recursively:
     juce::int64 totalLength = getTotalLength();
 
@@ -185,6 +206,10 @@ public:
   }
 
   juce::int64 getPosition() noexcept override {
+    if (readBufferPosition != -1) {
+      return readBufferPosition + readBufferOffset;
+    }
+
     ScopedDowngradeToReadLockWithGIL lock(objectLock);
     ClearErrnoBeforeReturn clearErrnoBeforeReturn;
     py::gil_scoped_acquire acquire;
@@ -193,7 +218,11 @@ public:
       return -1;
 
     try {
-      return fileLike.attr("tell")().cast<juce::int64>();
+      juce::int64 position = fileLike.attr("tell")().cast<juce::int64>();
+      if (bufferSize > 0) {
+        readBufferPosition = position;
+      }
+      return position;
     } catch (py::error_already_set e) {
       e.restore();
       return -1;
@@ -204,6 +233,15 @@ public:
   }
 
   bool setPosition(juce::int64 pos) noexcept override {
+    // Seeking within the read buffer doesn't require calling into Python:
+    if (readBufferPosition != -1 && pos >= readBufferPosition &&
+        pos <= readBufferPosition + readBufferLength) {
+      readBufferOffset = pos - readBufferPosition;
+      return true;
+    }
+
+    discardReadBuffer();
+
     ScopedDowngradeToReadLockWithGIL lock(objectLock);
     ClearErrnoBeforeReturn clearErrnoBeforeReturn;
     py::gil_scoped_acquire acquire;
@@ -217,7 +255,11 @@ public:
         lastReadWasSmallerThanExpected = false;
       }
 
-      return fileLike.attr("tell")().cast<juce::int64>() == pos;
+      bool seekSucceeded = fileLike.attr("tell")().cast<juce::int64>() == pos;
+      if (seekSucceeded && bufferSize > 0) {
+        readBufferPosition = pos;
+      }
+      return seekSucceeded;
     } catch (py::error_already_set e) {
       e.restore();
       return false;
@@ -228,8 +270,168 @@ public:
   }
 
 private:
+  /**
+   * Copy as many bytes as possible (up to bytesToRead) out of the read
+   * buffer, without touching the GIL.
+   */
+  int copyFromReadBuffer(void *buffer, int bytesToRead) {
+    int bytesToCopy =
+        std::min(bytesToRead, readBufferLength - readBufferOffset);
+    if (bytesToCopy <= 0) {
+      return 0;
+    }
+
+    std::memcpy(buffer, readBuffer.data() + readBufferOffset, bytesToCopy);
+    readBufferOffset += bytesToCopy;
+    return bytesToCopy;
+  }
+
+  /**
+   * Replace the (fully consumed) contents of the read buffer with the next
+   * bufferSize bytes from the file-like object. Returns false if no bytes
+   * could be read.
+   */
+  bool fillReadBuffer() {
+    if (readBufferPosition != -1) {
+      readBufferPosition += readBufferLength;
+    }
+    readBufferOffset = 0;
+    readBufferLength = 0;
+
+    if (readBufferPosition == -1 && getPosition() == -1) {
+      return false;
+    }
+
+    readBuffer.resize(bufferSize);
+    readBufferLength = readFromFileLike(readBuffer.data(), bufferSize);
+    return readBufferLength > 0;
+  }
+
+  /**
+   * Forget the contents of the read buffer, including our knowledge of the
+   * file-like object's position.
+   */
+  void discardReadBuffer() {
+    readBufferPosition = -1;
+    readBufferOffset = 0;
+    readBufferLength = 0;
+  }
+
+  /**
+   * Read directly from the file-like object, bypassing the read buffer.
+   */
+  int readFromFileLike(void *buffer, int bytesToRead) {
+    ScopedDowngradeToReadLockWithGIL lock(objectLock);
+    ClearErrnoBeforeReturn clearErrnoBeforeReturn;
+
+    py::gil_scoped_acquire acquire;
+    if (PythonException::isPending())
+      return 0;
+
+    try {
+      if (useReadInto) {
+        return readInto(buffer, bytesToRead);
+      }
+
+      auto readResult = fileLike.attr("read")(bytesToRead);
+
+      if (!py::isinstance<py::bytes>(readResult)) {
+        std::string message =
+            "File-like object passed to AudioFile was expected to return "
+            "bytes from its read(...) method, but "
+            "returned " +
+            py::str(readResult.get_type().attr("__name__"))
+                .cast<std::string>() +
+            ".";
+
+        if (py::hasattr(fileLike, "mode") &&
+            py::str(fileLike.attr("mode")).cast<std::string>() == "r") {
+          message += " (Try opening the stream in \"rb\" mode instead of "
+                     "\"r\" mode if possible.)";
+        }
+
+        throw py::type_error(message);
+        return 0;
+      }
+
+      py::bytes bytesObject = readResult.cast<py::bytes>();
+      char *pythonBuffer = nullptr;
+      py::ssize_t pythonLength = 0;
+
+      if (PYBIND11_BYTES_AS_STRING_AND_SIZE(bytesObject.ptr(), &pythonBuffer,
+                                            &pythonLength)) {
+        throw py::buffer_error(
+            "Internal error: failed to read bytes from bytes object!");
+      }
+
+      if (!buffer && pythonLength > 0) {
+        throw py::buffer_error("Internal error: bytes pointer is null, but a "
+                               "non-zero number of bytes were returned!");
+      }
+
+      if (buffer && pythonLength) {
+        std::memcpy(buffer, pythonBuffer, pythonLength);
+      }
+
+      lastReadWasSmallerThanExpected = bytesToRead > pythonLength;
+      return pythonLength;
+    } catch (py::error_already_set e) {
+      e.restore();
+      return 0;
+    } catch (const py::builtin_exception &e) {
+      e.set_error();
+      return 0;
+    }
+  }
+
+  /**
+   * Read directly into the provided buffer by passing a memoryview of it to
+   * the file-like object's readinto() method, avoiding the allocation of a
+   * bytes object (and a copy) on every read. Must be called with the GIL held.
+   */
+  int readInto(void *buffer, int bytesToRead) {
+    py::memoryview view =
+        py::memoryview::from_memory(buffer, bytesToRead, /* readonly */ false);
+
+    py::object readResult;
+    try {
+      readResult = fileLike.attr("readinto")(view);
+    } catch (...) {
+      // Prevent Python code from accessing this memory after we return:
+      view.attr("release")();
+      throw;
+    }
+    view.attr("release")();
+
+    // Non-blocking streams may return None if no data is available yet:
+    py::ssize_t bytesRead =
+        readResult.is_none() ? 0 : readResult.cast<py::ssize_t>();
+
+    if (bytesRead < 0 || bytesRead > bytesToRead) {
+      throw py::value_error(
+          py::repr(fileLike.attr("readinto")).cast<std::string>() +
+          " returned " + std::to_string(bytesRead) +
+          ", but was only asked to read " + std::to_string(bytesToRead) +
+          " bytes.");
+    }
+
+    lastReadWasSmallerThanExpected = bytesToRead > bytesRead;
+    return bytesRead;
+  }
+
   juce::int64 totalLength = -1;
   bool lastReadWasSmallerThanExpected = false;
+  bool useReadInto = false;
+
+  const int bufferSize;
+  std::vector<char> readBuffer;
+
+  // The position in the file-like object of the start of readBuffer, or -1 if
+  // unknown. Whenever this is known, the file-like object's own position is
+  // readBufferPosition + readBufferLength.
+  juce::int64 readBufferPosition = -1;
+  int readBufferLength = 0;
+  int readBufferOffset = 0;
 };
 
 /**
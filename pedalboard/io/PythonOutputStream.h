@@ -19,6 +19,7 @@
 
 #include <mutex>
 #include <optional>
+#include <vector>
 
 namespace py = pybind11;
 
@@ -32,20 +33,59 @@ bool isWriteableFileLike(py::object fileLike) {
          py::hasattr(fileLike, "tell") && py::hasattr(fileLike, "seekable");
 }
 
+/**
+ * Returns true if the provided file-like object's write() method is
+ * implemented natively by Python (i.e.: io.BytesIO, io.BufferedWriter).
+ * Python's native write() methods accept any bytes-like object and copy its
+ * contents before returning, so they can be passed a memoryview of our own
+ * memory rather than a newly-allocated bytes object.
+ */
+bool hasNativeWriteMethod(py::object fileLike) {
+  // Text streams (like io.StringIO) have native write() methods too, but
+  // would raise a less helpful error if passed a memoryview:
+  py::module_ io = py::module_::import("io");
+  if (!py::isinstance(fileLike, io.attr("BufferedIOBase")) &&
+      !py::isinstance(fileLike, io.attr("RawIOBase"))) {
+    return false;
+  }
+
+  if (py::hasattr(fileLike, "__dict__") &&
+      fileLike.attr("__dict__").contains("write")) {
+    return false;
+  }
+
+  py::object typeWrite =
+      py::getattr(py::type::of(fileLike), "write", py::none());
+  return PyObject_TypeCheck(typeWrite.ptr(), &PyMethodDescr_Type);
+}
+
 /**
  * A juce::OutputStream subclass that writes its
  * data to a provided Python file-like object.
+ *
+ * Writes smaller than bufferSize bytes are combined in an internal buffer,
+ * which is passed to the file-like object's write() method only once full
+ * (or before seeking, flushing, or destroying this stream). As a result, an
+ * exception raised by write() may only be reported by a later call.
  */
 class PythonOutputStream : public juce::OutputStream, public PythonFileLike {
 public:
-  PythonOutputStream(py::object fileLike) : PythonFileLike(fileLike) {
+  PythonOutputStream(py::object fileLike,
+                     int bufferSize = DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES)
+      : PythonFileLike(fileLike), bufferSize(bufferSize) {
     if (!isWriteableFileLike(fileLike)) {
       throw py::type_error("Expected a file-like object (with write, seek, "
                            "seekable, and tell methods).");
     }
+    canWriteMemoryViews = hasNativeWriteMethod(fileLike);
   }
 
+  virtual ~PythonOutputStream() { flushWriteBuffer(); }
+
   virtual void flush() noexcept override {
+    if (!flushWriteBuffer())
+      return;
+
     ScopedDowngradeToReadLockWithGIL lock(objectLock);
     py::gil_scoped_acquire acquire;
 
@@ -66,56 +106,64 @@ public:
   }
 
   virtual juce::int64 getPosition() noexcept override {
-    return PythonFileLike::getPosition();
+    // Buffered data hasn't been written yet, so the file-like object's
+    // position is still that of the start of the write buffer:
+    if (writeBufferPosition == -1) {
+      writeBufferPosition = PythonFileLike::getPosition();
+      if (writeBufferPosition == -1) {
+        return -1;
+      }
+    }
+    return writeBufferPosition + writeBuffer.size();
   }
 
   virtual bool setPosition(juce::int64 pos) noexcept override {
-    return PythonFileLike::setPosition(pos);
+    if (!flushWriteBuffer()) {
+      return false;
+    }
+
+    bool seekSucceeded = PythonFileLike::setPosition(pos);
+    writeBufferPosition = seekSucceeded ? pos : -1;
+    return seekSucceeded;
   }
 
   virtual bool write(const void *ptr, size_t numBytes) noexcept override {
-    ScopedDowngradeToReadLockWithGIL lock(objectLock);
-    py::gil_scoped_acquire acquire;
+    if (numBytes < bufferSize - writeBuffer.size()) {
+      const char *bytes = static_cast<const char *>(ptr);
+      writeBuffer.insert(writeBuffer.end(), bytes, bytes + numBytes);
+      return true;
+    }
 
-    if (PythonException::isPending())
+    if (!flushWriteBuffer()) {
       return false;
+    }
 
-    try {
-      py::object writeResponse =
-          fileLike.attr("write")(py::bytes((const char *)ptr, numBytes));
-
-      int bytesWritten;
-      if (writeResponse.is_none()) {
-        // Assume bytesWritten is numBytes if `write` returned None.
-        // This shouldn't happen, but sometimes does if the file-like
-        // object is not fully compliant with io.RawIOBase.
-        bytesWritten = numBytes;
-      } else {
-        try {
-          bytesWritten = writeResponse.cast<int>();
-        } catch (const py::cast_error &e) {
-          throw py::type_error(
-              py::repr(fileLike.attr("write")).cast<std::string>() +
-              " was expected to return an integer, but got " +
-              py::repr(writeResponse).cast<std::string>());
-        }
-      }
-
-      if (bytesWritten < numBytes) {
-        return false;
-      }
-    } catch (py::error_already_set e) {
-      e.restore();
-      return false;
-    } catch (const py::builtin_exception &e) {
-      e.set_error();
-      return false;
+    if (numBytes < bufferSize) {
+      const char *bytes = static_cast<const char *>(ptr);
+      writeBuffer.insert(writeBuffer.end(), bytes, bytes + numBytes);
+      return true;
     }
-    return true;
+
+    // Large writes gain nothing from being buffered:
+    return writeToFileLike(ptr, numBytes);
   }
 
   virtual bool writeRepeatedByte(juce::uint8 byte,
                                  size_t numTimesToRepeat) noexcept override {
+    if (numTimesToRepeat < bufferSize - writeBuffer.size()) {
+      writeBuffer.insert(writeBuffer.end(), numTimesToRepeat, byte);
+      return true;
+    }
+
+    if (!flushWriteBuffer()) {
+      return false;
+    }
+
+    if (numTimesToRepeat < bufferSize) {
+      writeBuffer.insert(writeBuffer.end(), numTimesToRepeat, byte);
+      return true;
+    }
+
     ScopedDowngradeToReadLockWithGIL lock(objectLock);
     py::gil_scoped_acquire acquire;
 
@@ -129,8 +177,7 @@ public:
       for (size_t i = 0; i < numTimesToRepeat; i += buffer.size()) {
         const size_t chunkSize = std::min(numTimesToRepeat - i, buffer.size());
 
-        py::object writeResponse = fileLike.attr("write")(
-            py::bytes((const char *)buffer.data(), chunkSize));
+        py::object writeResponse = callWrite(buffer.data(), chunkSize);
 
         int bytesWritten;
         if (writeResponse.is_none()) {
@@ -150,18 +197,122 @@ public:
         }
 
         if (bytesWritten != chunkSize) {
+          writeBufferPosition = -1;
           return false;
         }
+
+        if (writeBufferPosition != -1) {
+          writeBufferPosition += chunkSize;
+        }
       }
     } catch (py::error_already_set e) {
+      writeBufferPosition = -1;
       e.restore();
       return false;
     } catch (const py::builtin_exception &e) {
+      writeBufferPosition = -1;
       e.set_error();
       return false;
     }
 
     return true;
   }
+
+private:
+  /**
+   * Pass any buffered data to the file-like object. Returns false (and
+   * discards the buffered data) if it could not be written.
+   */
+  bool flushWriteBuffer() {
+    if (writeBuffer.empty()) {
+      return true;
+    }
+
+    bool writeSucceeded =
+        writeToFileLike(writeBuffer.data(), writeBuffer.size());
+    writeBuffer.clear();
+    return writeSucceeded;
+  }
+
+  /**
+   * Write directly to the file-like object, bypassing the write buffer.
+   */
+  bool writeToFileLike(const void *ptr, size_t numBytes) {
+    ScopedDowngradeToReadLockWithGIL lock(objectLock);
+    py::gil_scoped_acquire acquire;
+
+    if (PythonException::isPending())
+      return false;
+
+    try {
+      py::object writeResponse = callWrite(ptr, numBytes);
+
+      int bytesWritten;
+      if (writeResponse.is_none()) {
+        // Assume bytesWritten is numBytes if `write` returned None.
+        // This shouldn't happen, but sometimes does if the file-like
+        // object is not fully compliant with io.RawIOBase.
+        bytesWritten = numBytes;
+      } else {
+        try {
+          bytesWritten = writeResponse.cast<int>();
+        } catch (const py::cast_error &e) {
+          throw py::type_error(
+              py::repr(fileLike.attr("write")).cast<std::string>() +
+              " was expected to return an integer, but got " +
+              py::repr(writeResponse).cast<std::string>());
+        }
+      }
+
+      if (bytesWritten < numBytes) {
+        writeBufferPosition = -1;
+        return false;
+      }
+    } catch (py::error_already_set e) {
+      writeBufferPosition = -1;
+      e.restore();
+      return false;
+    } catch (const py::builtin_exception &e) {
+      writeBufferPosition = -1;
+      e.set_error();
+      return false;
+    }
+
+    if (writeBufferPosition != -1) {
+      writeBufferPosition += numBytes;
+    }
+    return true;
+  }
+
+private:
+  /**
+   * Pass the provided data to the file-like object's write() method, and
+   * return its result. Must be called with the GIL held.
+   */
+  py::object callWrite(const void *ptr, size_t numBytes) {
+    if (!canWriteMemoryViews) {
+      return fileLike.attr("write")(py::bytes((const char *)ptr, numBytes));
+    }
+
+    py::memoryview view = py::memoryview::from_memory(ptr, numBytes);
+    py::object writeResponse;
+    try {
+      writeResponse = fileLike.attr("write")(view);
+    } catch (...) {
+      view.attr("release")();
+      throw;
+    }
+    view.attr("release")();
+    return writeResponse;
+  }
+
+  bool canWriteMemoryViews = false;
+
+  const size_t bufferSize;
+  std::vector<char> writeBuffer;
+
+  // The position in the file-like object at which the contents of writeBuffer
+  // will be written, or -1 if unknown.
+  juce::int64 writeBufferPosition = -1;
 };
 }; // namespace Pedalboard
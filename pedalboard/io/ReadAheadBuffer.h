@@ -0,0 +1,278 @@
+/*
+ * pedalboard
+ * Copyright 2024 Spotify AB
+ *
+ * Licensed under the GNU Public License, Version 3.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    https://www.gnu.org/licenses/gpl-3.0.html
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#pragma once
+
+#include <atomic>
+#include <condition_variable>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+
+#include "../JuceHeader.h"
+#include "AudioFile.h"
+
+namespace Pedalboard {
+
+/**
+ * A single-producer, single-consumer ring buffer of decoded audio, filled
+ * ahead of time by a background native thread.
+ *
+ * The producer thread repeatedly calls the provided decode function to decode
+ * consecutive frames of audio (starting at the position passed to start())
+ * until the ring buffer is full, then waits for the consumer to read() some of
+ * that audio before decoding more. Audio itself is passed between threads
+ * without locking; a mutex is only used to put either thread to sleep when
+ * the buffer is full or empty.
+ *
+ * None of these methods touch the GIL, and the decode function must not
+ * either. All methods other than the decode function must be called from a
+ * single consumer thread at a time.
+ */
+class ReadAheadBuffer {
+public:
+  /**
+   * Decode numFrames frames, starting at the given position, into the given
+   * channel pointers. Returns the number of frames decoded, which may be less
+   * than numFrames only if the end of the stream has been reached.
+   */
+  using DecodeFunction = std::function<long long(
+      long long position, float **channelPointers, long long numFrames)>;
+
+  ReadAheadBuffer(int numChannels, long long capacityInFrames,
+                  DecodeFunction decode)
+      : buffer(numChannels, (int)capacityInFrames), decode(decode) {}
+
+  ~ReadAheadBuffer() { stop(); }
+
+  ReadAheadBuffer(const ReadAheadBuffer &) = delete;
+  ReadAheadBuffer &operator=(const ReadAheadBuffer &) = delete;
+
+  /**
+   * Discard any buffered audio and start decoding from the given position.
+   */
+  void start(long long position) {
+    stop();
+
+    startPosition = position;
+    framesWritten = 0;
+    framesRead = 0;
+    finished = false;
+    stopping = false;
+    error = nullptr;
+    active = true;
+
+    thread = std::thread([this]() { producerLoop(); });
+  }
+
+  /**
+   * Stop the producer thread (waiting for it to finish decoding its current
+   * chunk, if any) and discard any buffered audio.
+   */
+  void stop() {
+    {
+      std::lock_guard<std::mutex> lock(mutex);
+      stopping = true;
+    }
+    spaceAvailable.notify_one();
+
+    if (thread.joinable()) {
+      thread.join();
+    }
+    active = false;
+  }
+
+  bool isActive() const { return active; }
+
+  /**
+   * The position of the next frame that read() would return.
+   */
+  long long getPosition() const { return startPosition + framesRead; }
+
+  /**
+   * If the given position has already been decoded (or is the next position
+   * to be decoded), discard all buffered audio before that position and
+   * return true. Otherwise, return false and leave the buffer untouched.
+   */
+  bool skipTo(long long position) {
+    if (!active) {
+      return false;
+    }
+
+    long long offset = position - startPosition;
+    if (offset < framesRead || offset > framesWritten.load()) {
+      return false;
+    }
+
+    framesRead = offset;
+    notify(spaceAvailable);
+    return true;
+  }
+
+  /**
+   * Copy up to numFrames frames of decoded audio into the given channel
+   * pointers, waiting for the producer thread if necessary. Returns the
+   * number of frames copied, which will be less than numFrames only if the end
+   * of the stream has been reached. If the producer thread failed to decode
+   * audio, its exception will be re-thrown once all audio decoded before the
+   * failure has been read.
+   */
+  long long read(float **channelPointers, int numChannels,
+                 long long numFrames) {
+    long long capacity = buffer.getNumSamples();
+    long long framesCopied = 0;
+
+    while (framesCopied < numFrames) {
+      long long readIndex = framesRead.load();
+      long long framesAvailable = framesWritten.load() - readIndex;
+
+      if (framesAvailable == 0) {
+        if (finished.load()) {
+          // The producer may have written more frames just before finishing:
+          if (framesWritten.load() > readIndex) {
+            continue;
+          }
+          if (error) {
+            std::rethrow_exception(error);
+          }
+          break;
+        }
+
+        std::unique_lock<std::mutex> lock(mutex);
+        dataAvailable.wait(lock, [this, readIndex]() {
+          return finished.load() || framesWritten.load() > readIndex;
+        });
+        continue;
+      }
+
+      long long ringIndex = readIndex % capacity;
+      long long framesToCopy = std::min(
+          {framesAvailable, capacity - ringIndex, numFrames - framesCopied});
+      for (int c = 0; c < numChannels; c++) {
+        std::memcpy(channelPointers[c] + framesCopied,
+                    buffer.getReadPointer(c, (int)ringIndex),
+                    framesToCopy * sizeof(float));
+      }
+
+      framesRead.store(readIndex + framesToCopy);
+      framesCopied += framesToCopy;
+      notify(spaceAvailable);
+    }
+
+    return framesCopied;
+  }
+
+  /**
+   * Returns true iff the producer thread has successfully decoded up to the
+   * end of the stream and all of that audio has been read.
+   */
+  bool reachedEndOfStream() const {
+    return active && finished.load() && !error &&
+           framesRead.load() == framesWritten.load();
+  }
+
+private:
+  void producerLoop() {
+    long long capacity = buffer.getNumSamples();
+    float **channelPointers =
+        (float **)alloca(buffer.getNumChannels() * sizeof(float *));
+
+    while (true) {
+      long long writeIndex = framesWritten.load();
+      long long space = capacity - (writeIndex - framesRead.load());
+
+      if (space == 0) {
+        std::unique_lock<std::mutex> lock(mutex);
+        spaceAvailable.wait(lock, [this, writeIndex, capacity]() {
+          return stopping || writeIndex - framesRead.load() < capacity;
+        });
+        if (stopping) {
+          return;
+        }
+        continue;
+      }
+
+      {
+        std::lock_guard<std::mutex> lock(mutex);
+        if (stopping) {
+          return;
+        }
+      }
+
+      long long ringIndex = writeIndex % capacity;
+      long long framesToDecode =
+          std::min({space, capacity - ringIndex,
+                    (long long)DEFAULT_AUDIO_BUFFER_SIZE_FRAMES});
+      for (int c = 0; c < buffer.getNumChannels(); c++) {
+        channelPointers[c] = buffer.getWritePointer(c, (int)ringIndex);
+      }
+
+      long long framesDecoded = 0;
+      try {
+        framesDecoded =
+            decode(startPosition + writeIndex, channelPointers, framesToDecode);
+      } catch (...) {
+        error = std::current_exception();
+        finished = true;
+        notify(dataAvailable);
+        return;
+      }
+
+      framesWritten.store(writeIndex + framesDecoded);
+      if (framesDecoded < framesToDecode) {
+        finished = true;
+      }
+      notify(dataAvailable);
+
+      if (finished) {
+        return;
+      }
+    }
+  }
+
+  void notify(std::condition_variable &condition) {
+    // Taking the mutex here (even briefly) ensures that the other thread is
+    // either waiting on the condition variable or has not yet checked the
+    // condition, so the notification can't be lost:
+    { std::lock_guard<std::mutex> lock(mutex); }
+    condition.notify_one();
+  }
+
+  juce::AudioBuffer<float> buffer;
+  DecodeFunction decode;
+
+  std::thread thread;
+  std::mutex mutex;
+  std::condition_variable dataAvailable;
+  std::condition_variable spaceAvailable;
+
+  bool active = false;
+  bool stopping = false;
+  long long startPosition = 0;
+
+  // Both of these count frames since startPosition, and only ever increase
+  // until the next call to start(). framesWritten is only written by the
+  // producer thread, and framesRead is only written by the consumer thread.
+  std::atomic<long long> framesWritten = 0;
+  std::atomic<long long> framesRead = 0;
+
+  std::atomic<bool> finished = false;
+  std::exception_ptr error;
+};
+
+} // namespace Pedalboard
@@ -0,0 +1,167 @@
+/*
+ * pedalboard
+ * Copyright 2024 Spotify AB
+ *
+ * Licensed under the GNU Public License, Version 3.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *    https://www.gnu.org/licenses/gpl-3.0.html
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#pragma once
+
+#include <optional>
+#include <thread>
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
+
+#include "../BufferUtils.h"
+#include "../JuceHeader.h"
+#include "../WorkerPool.h"
+#include "ReadableAudioFile.h"
+#include "ResampledReadableAudioFile.h"
+
+namespace py = pybind11;
+
+namespace Pedalboard {
+
+struct DecodedAudioFile {
+  juce::AudioBuffer<float> audio;
+  double sampleRate = 0;
+};
+
+/**
+ * Open, decode, (optionally) resample and (optionally) downmix an entire
+ * audio file on disk. This function does not take or hold the GIL.
+ */
+inline DecodedAudioFile decodeAudioFile(const std::string &filename,
+                                        std::optional<double> targetSampleRate,
+                                        bool mono, ResamplingQuality quality) {
+  auto file = std::make_shared<ReadableAudioFile>(filename);
+  long long numChannels = file->getNumChannels();
+
+  DecodedAudioFile result;
+  if (targetSampleRate && *targetSampleRate != file->getSampleRateAsDouble()) {
+    ResampledReadableAudioFile resampledFile(file, *targetSampleRate, quality);
+    long long numFrames = resampledFile.getLengthInSamplesInternal();
+    if (numFrames > 0) {
+      result.audio = resampledFile.readInternal(numFrames);
+    } else {
+      result.audio.setSize(numChannels, 0);
+    }
+    result.sampleRate = *targetSampleRate;
+  } else {
+    long long numFrames = file->getLengthInSamples();
+
+    // JUCE allocates every channel from one block of memory, one after the
+    // other, so we can read directly into the buffer we return:
+    result.audio.setSize(numChannels, numFrames);
+    long long framesRead = 0;
+    if (numFrames > 0) {
+      framesRead = file->readInternal(numChannels, numFrames,
+                                      result.audio.getWritePointer(0));
+    }
+    if (framesRead < numFrames) {
+      result.audio.setSize(numChannels, framesRead,
+                           /* keepExistingContent */ true,
+                           /* clearExtraSpace */ false,
+                           /* avoidReallocating */ true);
+    }
+    result.sampleRate = file->getSampleRateAsDouble();
+  }
+
+  if (mono && result.audio.getNumChannels() > 1) {
+    int numSamples = result.audio.getNumSamples();
+    for (int c = 1; c < result.audio.getNumChannels(); c++) {
+      result.audio.addFrom(0, 0, result.audio, c, 0, numSamples);
+    }
+    result.audio.applyGain(0, 0, numSamples,
+                           1.0f / result.audio.getNumChannels());
+    result.audio.setSize(1, numSamples,
+                         /* keepExistingContent */ true,
+                         /* clearExtraSpace */ false,
+                         /* avoidReallocating */ true);
+  }
+
+  return result;
+}
+
+inline void init_read_many(py::module &m) {
+  m.def(
+      "read_many",
+      [](std::vector<std::string> filenames, std::optional<int> workers,
+         std::optional<double> resampledTo, bool mono,
+         ResamplingQuality quality) {
+        if (workers && *workers < 1) {
+          throw std::range_error("read_many requires at least one worker.");
+        }
+        if (resampledTo && *resampledTo <= 0) {
+          throw std::range_error("resampled_to must be greater than 0Hz.");
+        }
+
+        int numWorkers =
+            workers ? *workers
+                    : std::max(1, (int)std::thread::hardware_concurrency());
+        numWorkers = std::min(numWorkers, std::max(1, (int)filenames.size()));
+
+        std::vector<DecodedAudioFile> decodedFiles(filenames.size());
+        {
+          py::gil_scoped_release release;
+
+          // The calling thread decodes files too, so one fewer worker is
+          // needed than the number of workers requested:
+          WorkerPool workerPool(numWorkers - 1);
+          workerPool.parallelFor(filenames.size(), [&](int i) {
+            decodedFiles[i] =
+                decodeAudioFile(filenames[i], resampledTo, mono, quality);
+          });
+        }
+
+        py::list results;
+        for (auto &decodedFile : decodedFiles) {
+          double integerPart;
+          py::object sampleRate =
+              std::modf(decodedFile.sampleRate, &integerPart) > 0
+                  ? (py::object)py::float_(decodedFile.sampleRate)
+                  : (py::object)py::int_((long)decodedFile.sampleRate);
+          results.append(py::make_tuple(
+              moveJuceBufferIntoPyArray(std::move(decodedFile.audio),
+                                        ChannelLayout::NotInterleaved, 0),
+              sampleRate));
+        }
+        return results;
+      },
+      R"(
+Read and decode many audio files at once, in parallel, returning a list of
+``(audio, samplerate)`` tuples in the same order as the provided filenames.
+
+Each ``audio`` array is a 32-bit floating-point array of shape
+``(num_channels, num_frames)``, identical to what would be returned by
+calling :meth:`ReadableAudioFile.read` on the entire file.
+
+Files are opened, decoded, and (optionally) resampled and downmixed on a pool
+of ``workers`` native threads, without holding the Python Global Interpreter
+Lock. If ``workers`` is not provided, one thread per CPU core will be used.
+
+If ``resampled_to`` is provided, every file will be resampled to that sample
+rate as if :meth:`ReadableAudioFile.resampled_to` had been called with the
+provided ``quality``. If ``mono`` is ``True``, every file's channels will be
+averaged together into a single channel.
+
+If any file cannot be read, an exception will be raised once all other files
+have been read.
+)",
+      py::arg("filenames"), py::arg("workers") = py::none(),
+      py::arg("resampled_to") = py::none(), py::arg("mono") = false,
+      py::arg("quality") = ResamplingQuality::WindowedSinc32);
+}
+} // namespace Pedalboard
@@ -17,7 +17,9 @@
 
 #pragma once
 
+#include <array>
 #include <mutex>
+#include <numeric>
 #include <optional>
 
 #include <pybind11/numpy.h>
@@ -28,6 +30,7 @@
 #include "../juce_overrides/juce_PatchedMP3AudioFormat.h"
 #include "AudioFile.h"
 #include "PythonInputStream.h"
+#include "ReadAheadBuffer.h"
 
 namespace py = pybind11;
 
@@ -56,11 +59,94 @@ inline long long parseNumSamples(std::variant<double, long long> numSamples) {
   }
 }
 
+/**
+ * A pre-allocated, caller-provided output array that read_into() and its
+ * relatives should write into, starting at a given frame offset.
+ */
+template <typename SampleType> struct ReadIntoTarget {
+  SampleType *data;
+  long long channelStride;
+  long long numFrames;
+
+  /**
+   * Fill the provided array with one pointer per channel.
+   */
+  void getChannelPointers(SampleType **channelPointers,
+                          long long numChannels) const {
+    for (long long c = 0; c < numChannels; c++) {
+      channelPointers[c] = data + (c * channelStride);
+    }
+  }
+};
+
+/**
+ * Validate that the provided Python object is a writeable, C-contiguous
+ * two-dimensional array of SampleType, shaped (numChannels, numFrames), that
+ * can be written to starting at the frame at the given offset.
+ */
+template <typename SampleType>
+ReadIntoTarget<SampleType>
+parseReadIntoTarget(py::array out, long long numChannels, long long offset,
+                    const std::string &methodName) {
+  if (!py::isinstance<py::array_t<SampleType>>(out)) {
+    throw py::type_error(
+        methodName + "() expected an output array with dtype " +
+        py::str(py::dtype::of<SampleType>()).cast<std::string>() +
+        ", but was passed an array with dtype " +
+        py::str(out.dtype()).cast<std::string>() + ".");
+  }
+
+  if (out.ndim() != 2 || out.shape(0) != numChannels) {
+    throw py::value_error(
+        methodName + "() expected an output array of shape (" +
+        std::to_string(numChannels) +
+        ", num_frames) to match this file's number of channels, but was "
+        "passed an array of shape " +
+        py::str(out.attr("shape")).cast<std::string>() + ".");
+  }
+
+  if (!(out.flags() & py::array::c_style)) {
+    throw py::value_error(methodName +
+                          "() requires a C-contiguous output array. (Try "
+                          "passing an array created with np.empty(...) or "
+                          "np.ascontiguousarray(...) instead.)");
+  }
+
+  if (!out.writeable()) {
+    throw py::value_error(methodName + "() requires a writeable output array.");
+  }
+
+  if (offset < 0 || offset > out.shape(1)) {
+    throw py::value_error(methodName + "() was passed an offset of " +
+                          std::to_string(offset) +
+                          ", but the output array only contains " +
+                          std::to_string(out.shape(1)) + " frames.");
+  }
+
+  long long numFrames = out.shape(1);
+  SampleType *data = static_cast<SampleType *>(out.mutable_data()) + offset;
+  return {data, numFrames, numFrames - offset};
+}
+
+/**
+ * JUCE doesn't publicly expose where a memory-mapped reader's audio data
+ * begins within its file, but subclasses of MemoryMappedAudioFormatReader can
+ * access its protected members through a member pointer.
+ */
+struct MemoryMappedReaderLayout : public juce::MemoryMappedAudioFormatReader {
+  static juce::int64
+  getDataChunkStart(const juce::MemoryMappedAudioFormatReader &reader) {
+    return reader.*(&MemoryMappedReaderLayout::dataChunkStart);
+  }
+};
+
 class ReadableAudioFile
     : public AudioFile,
       public std::enable_shared_from_this<ReadableAudioFile> {
 public:
-  ReadableAudioFile(std::string filename) : filename(filename) {
+  ReadableAudioFile(std::string filename, bool memoryMap = false,
+                    long long prefetchFrames = 0, int decimation = 1)
+      : filename(filename) {
     registerPedalboardAudioFormats(formatManager, false);
     // This is kind of silly, as nobody else has a reference
     // to this object yet; but it prevents some juce assertions in debug builds:
@@ -73,19 +159,62 @@ public:
           "Failed to open audio file: file does not exist: " + filename);
     }
 
-    // createReaderFor(juce::File) is fast, as it only looks at file extension:
-    reader.reset(formatManager.createReaderFor(file));
-    if (!reader) {
-      // This is slower but more thorough:
-      reader.reset(formatManager.createReaderFor(file.createInputStream()));
+    if (prefetchFrames < 0) {
+      throw std::range_error("prefetch_frames must be greater than or equal "
+                             "to 0, but was " +
+                             std::to_string(prefetchFrames) + ".");
     }
 
-    if (!reader)
-      throw std::domain_error("Failed to open audio file: file \"" + filename +
-                              "\" does not seem to contain audio data in a "
-                              "known or supported format.");
+    if (prefetchFrames > std::numeric_limits<int>::max()) {
+      throw std::range_error("prefetch_frames must be less than " +
+                             std::to_string(std::numeric_limits<int>::max()) +
+                             ", but was " + std::to_string(prefetchFrames) +
+                             ".");
+    }
+
+    if (decimation != 1 && decimation != 2 && decimation != 4) {
+      throw std::range_error("decimation must be 1, 2, or 4, but was " +
+                             std::to_string(decimation) + ".");
+    }
+
+    if (memoryMap) {
+      openMemoryMapped(file);
+    } else {
+      // createReaderFor(juce::File) is fast, as it only looks at file
+      // extension:
+      reader.reset(formatManager.createReaderFor(file));
+      if (!reader) {
+        // This is slower but more thorough:
+        reader.reset(formatManager.createReaderFor(file.createInputStream()));
+      }
+
+      if (!reader)
+        throw std::domain_error("Failed to open audio file: file \"" +
+                                filename +
+                                "\" does not seem to contain audio data in a "
+                                "known or supported format.");
+    }
+
+    if (decimation > 1) {
+      // Only some decoders (currently, MP3) can synthesise audio at a reduced
+      // sample rate; other formats are decoded at their native sample rate.
+      if (auto *decimatableReader =
+              dynamic_cast<juce::AudioFormatReaderWithPosition *>(
+                  reader.get())) {
+        decimatableReader->setDecimationFactor(decimation);
+      }
+    }
 
     cacheMetadata();
+
+    if (prefetchFrames > 0) {
+      readAheadBuffer = std::make_unique<ReadAheadBuffer>(
+          numChannels, prefetchFrames,
+          [this](long long position, float **channelPointers,
+                 long long numFrames) {
+            return decodeForReadAhead(position, channelPointers, numFrames);
+          });
+    }
   }
 
   ReadableAudioFile(std::unique_ptr<PythonInputStream> inputStream) {
@@ -174,6 +303,50 @@ public:
     cacheMetadata();
   }
 
+  /**
+   * Open the provided file with a reader that maps the entire file into
+   * memory, allowing samples to be read without any intermediate copies.
+   * Only uncompressed formats (i.e.: PCM or floating-point WAV and AIFF)
+   * support this.
+   */
+  void openMemoryMapped(const juce::File &file) {
+    for (int i = 0; i < formatManager.getNumKnownFormats() && !reader; i++) {
+      auto *format = formatManager.getKnownFormat(i);
+      std::unique_ptr<juce::MemoryMappedAudioFormatReader> mappedReader(
+          format->createMemoryMappedReader(file));
+
+      if (!mappedReader || mappedReader->bitsPerSample > 32) {
+        continue;
+      }
+
+      if (!mappedReader->mapEntireFile()) {
+        throw std::domain_error("Failed to memory-map audio file \"" +
+                                filename + "\".");
+      }
+
+      dataChunkStart =
+          MemoryMappedReaderLayout::getDataChunkStart(*mappedReader);
+      mappedFileIsWav = dynamic_cast<juce::WavAudioFormat *>(format) != nullptr;
+      reader = std::move(mappedReader);
+    }
+
+    if (!reader) {
+      throw std::domain_error(
+          "Failed to memory-map audio file \"" + filename +
+          "\": memory mapping is only supported for uncompressed WAV and AIFF "
+          "files. Open this file with mmap=False instead.");
+    }
+
+    // Keep a separate (shared) mapping of the file around for views returned
+    // by read_view(), which must remain valid even after this file is closed:
+    memoryMappedFile = std::make_shared<juce::MemoryMappedFile>(
+        file, juce::MemoryMappedFile::readOnly);
+    if (!memoryMappedFile->getData()) {
+      throw std::domain_error("Failed to memory-map audio file \"" + filename +
+                              "\".");
+    }
+  }
+
   void cacheMetadata() {
     sampleRate = reader->sampleRate;
     numChannels = reader->numChannels;
@@ -336,36 +509,112 @@ public:
         (reader->lengthInSamples + (lengthCorrection ? *lengthCorrection : 0)) -
             currentPosition);
 
-    long long numSamplesToKeep = numSamples;
-
     float **channelPointers = (float **)alloca(numChannels * sizeof(float *));
     for (long long c = 0; c < numChannels; c++) {
       channelPointers[c] = ((float *)outputPointer) + (numSamples * c);
     }
 
+    return readInternal(numChannels, numSamples, channelPointers);
+  }
+
+  /**
+   * Read the given number of frames (samples in each channel) from this audio
+   * file into the given per-channel output pointers, which need not be
+   * contiguous. Like the method above, this method does not take or hold the
+   * GIL.
+   *
+   * @param numChannels The number of channels to read from the file
+   * @param numSamplesToFill The number of frames to read from the file
+   * @param channelPointers One pointer per channel, each of which must point
+   *                        to at least numSamplesToFill floats.
+   *
+   * @return the number of samples that were actually read from the file
+   */
+  long long readInternal(const long long numChannels,
+                         const long long numSamplesToFill,
+                         float **channelPointers) {
+    ScopedTryWriteLock scopedTryWriteLock(objectLock);
+    if (!scopedTryWriteLock.isLocked()) {
+      throw std::runtime_error(
+          "Another thread is currently reading from this AudioFile. Note "
+          "that using multiple concurrent readers on the same AudioFile "
+          "object will produce nondeterministic results.");
+    }
+
+    long long numSamples = std::min(
+        numSamplesToFill,
+        (reader->lengthInSamples + (lengthCorrection ? *lengthCorrection : 0)) -
+            currentPosition);
+
+    for (long long c = 0; c < numChannels; c++) {
+      std::fill_n(channelPointers[c], numSamples, 0);
+    }
+
+    long long numSamplesToKeep = 0;
+    if (readAheadBuffer) {
+      numSamplesToKeep =
+          readFromReadAheadBuffer(numChannels, numSamples, channelPointers);
+    } else {
+      try {
+        numSamplesToKeep = decodeAt(currentPosition, numChannels, numSamples,
+                                    channelPointers, lengthCorrection);
+      } catch (...) {
+        // If the failure was caused by an exception in Python, re-raise that
+        // instead so that the Python exception is visible:
+        PythonException::raise();
+        throw;
+      }
+    }
+
+    currentPosition += numSamplesToKeep;
+    return numSamplesToKeep;
+  }
+
+  /**
+   * Decode the given number of frames from the underlying reader, starting at
+   * the given position, into the given per-channel output pointers. This
+   * method does not take any locks, does not touch the GIL, and does not
+   * modify the current position of this file, so it can be called from the
+   * read-ahead thread.
+   *
+   * @param position The position (in frames) to start decoding from
+   * @param numChannels The number of channels to read from the file
+   * @param numSamples The number of frames to read from the file, which must
+   *                   not extend past the (corrected) end of the file.
+   * @param channelPointers One pointer per channel, each of which must point
+   *                        to at least numSamples zeroed floats.
+   * @param lengthCorrectionToUpdate The length correction to update if the
+   *                                 end of the file is found to be somewhere
+   *                                 unexpected.
+   *
+   * @return the number of samples that were actually read from the file
+   */
+  long long decodeAt(const long long position, const long long numChannels,
+                     const long long numSamples, float **channelPointers,
+                     std::optional<long long> &lengthCorrectionToUpdate) {
+    long long numSamplesToKeep = numSamples;
+
     if (reader->usesFloatingPointData || reader->bitsPerSample == 32) {
-      auto readResult = reader->read(channelPointers, numChannels,
-                                     currentPosition, numSamples);
+      auto readResult =
+          reader->read(channelPointers, numChannels, position, numSamples);
 
       juce::int64 samplesRead = numSamples;
       if (juce::AudioFormatReaderWithPosition *positionAware =
               dynamic_cast<juce::AudioFormatReaderWithPosition *>(
                   reader.get())) {
-        samplesRead = positionAware->getCurrentPosition() - currentPosition;
+        samplesRead = positionAware->getCurrentPosition() - position;
       }
 
-      bool hitEndOfFile =
-          (samplesRead + currentPosition) == reader->lengthInSamples;
+      bool hitEndOfFile = (samplesRead + position) == reader->lengthInSamples;
 
       // We read some data, but not as much as we asked for!
       // This will only happen for lossy, header-optional formats
       // like MP3.
       if (samplesRead < numSamples || hitEndOfFile) {
-        lengthCorrection =
-            (samplesRead + currentPosition) - reader->lengthInSamples;
+        lengthCorrectionToUpdate =
+            (samplesRead + position) - reader->lengthInSamples;
       } else if (!readResult) {
-        PythonException::raise();
-        throwReadError(currentPosition, numSamples, samplesRead);
+        throwReadError(position, numSamples, samplesRead);
       }
       numSamplesToKeep = samplesRead;
     } else {
@@ -373,12 +622,10 @@ public:
       // and do the floating-point conversion ourselves to work around
       // floating-point imprecision in JUCE when reading formats smaller than
       // 32-bit (i.e.: 16-bit audio is off by about 0.003%)
-      auto readResult =
-          reader->readSamples((int **)channelPointers, numChannels, 0,
-                              currentPosition, numSamplesToKeep);
+      auto readResult = reader->readSamples(
+          (int **)channelPointers, numChannels, 0, position, numSamplesToKeep);
       if (!readResult) {
-        PythonException::raise();
-        throwReadError(currentPosition, numSamples);
+        throwReadError(position, numSamples);
       }
 
       // When converting 24-bit, 16-bit, or 8-bit data from int to float,
@@ -412,10 +659,236 @@ public:
       }
     }
 
-    currentPosition += numSamplesToKeep;
     return numSamplesToKeep;
   }
 
+  /**
+   * Read frames from this audio file into a caller-provided, pre-allocated
+   * float32 array of shape (numChannels, numFrames), starting at the given
+   * frame offset within that array. Returns the number of frames written.
+   */
+  long long readInto(py::array out, long long offset) {
+    std::optional<juce::ScopedReadLock> scopedLock =
+        std::optional<juce::ScopedReadLock>(objectLock);
+
+    if (!reader)
+      throw std::runtime_error("I/O operation on a closed file.");
+
+    long long numChannels = reader->numChannels;
+    ReadIntoTarget<float> target =
+        parseReadIntoTarget<float>(out, numChannels, offset, "read_into");
+
+    long long framesRead = 0;
+    if (target.numFrames > 0) {
+      float **channelPointers = (float **)alloca(numChannels * sizeof(float *));
+      target.getChannelPointers(channelPointers, numChannels);
+
+      py::gil_scoped_release release;
+      framesRead = readInternal(numChannels, target.numFrames, channelPointers);
+
+      // As in read(), release the read lock before re-acquiring the GIL:
+      scopedLock.reset();
+    }
+
+    PythonException::raise();
+    return framesRead;
+  }
+
+  py::array_t<float> readRange(long long start, long long stop) {
+    py::list slices = readRanges({{start, stop}}, false);
+    return slices[0].cast<py::array_t<float>>();
+  }
+
+  /**
+   * Read many (possibly overlapping) ranges of frames from this file at once,
+   * without changing the current position of the file. Ranges are read in
+   * order of their start positions, and ranges that overlap or are separated
+   * by only a small gap are decoded together in a single pass.
+   *
+   * Returns either a list of arrays (one per range, in the order provided) or
+   * a tuple of (audio, offsets), where range i is stored in
+   * audio[:, offsets[i]:offsets[i + 1]].
+   */
+  py::object readRanges(std::vector<std::pair<long long, long long>> ranges,
+                        bool concatenate) {
+    // Reading through a gap of this many frames or fewer is usually cheaper
+    // than seeking, which for compressed formats requires re-priming the
+    // decoder:
+    static constexpr long long MAX_GAP_TO_DECODE_THROUGH =
+        DEFAULT_AUDIO_BUFFER_SIZE_FRAMES;
+
+    std::vector<long long> framesRead(ranges.size(), 0);
+    std::vector<long long> offsets(ranges.size() + 1, 0);
+    juce::AudioBuffer<float> concatenatedBuffer;
+    std::vector<juce::AudioBuffer<float>> buffers;
+
+    {
+      py::gil_scoped_release release;
+      const juce::ScopedReadLock scopedReadLock(objectLock);
+      if (!reader)
+        throw std::runtime_error("I/O operation on a closed file.");
+
+      ScopedTryWriteLock scopedTryWriteLock(objectLock);
+      if (!scopedTryWriteLock.isLocked()) {
+        throw std::runtime_error(
+            "Another thread is currently reading from this AudioFile. Note "
+            "that using multiple concurrent readers on the same AudioFile "
+            "object will produce nondeterministic results.");
+      }
+
+      long long endOfFile =
+          reader->lengthInSamples + (lengthCorrection ? *lengthCorrection : 0);
+      for (auto &[start, stop] : ranges) {
+        if (start < 0 || start > endOfFile) {
+          throw std::domain_error(
+              "Cannot read from position " + std::to_string(start) +
+              " frames, which is outside of the file (which contains " +
+              std::to_string(endOfFile) + " frames).");
+        }
+        if (stop < start) {
+          throw std::domain_error("Cannot read a range that ends (at " +
+                                  std::to_string(stop) +
+                                  " frames) before it starts (at " +
+                                  std::to_string(start) + " frames).");
+        }
+        stop = std::min(stop, endOfFile);
+      }
+
+      // Set up the arrays to read into, assuming we'll get as many frames as
+      // we ask for:
+      for (size_t i = 0; i < ranges.size(); i++) {
+        offsets[i + 1] = offsets[i] + (ranges[i].second - ranges[i].first);
+      }
+      if (concatenate) {
+        concatenatedBuffer.setSize(numChannels, offsets.back());
+      } else {
+        buffers.resize(ranges.size());
+        for (size_t i = 0; i < ranges.size(); i++) {
+          buffers[i].setSize(numChannels, ranges[i].second - ranges[i].first);
+        }
+      }
+      auto getWritePointer = [&](size_t rangeIndex, int channel) {
+        return concatenate ? concatenatedBuffer.getWritePointer(
+                                 channel, (int)offsets[rangeIndex])
+                           : buffers[rangeIndex].getWritePointer(channel);
+      };
+
+      // The reader is about to be moved around, so the read-ahead thread
+      // can't also be using it. The next call to read() will restart it:
+      if (readAheadBuffer) {
+        readAheadBuffer->stop();
+      }
+
+      std::vector<size_t> order(ranges.size());
+      std::iota(order.begin(), order.end(), 0);
+      std::stable_sort(order.begin(), order.end(), [&](size_t a, size_t b) {
+        return ranges[a].first < ranges[b].first;
+      });
+
+      float **channelPointers = (float **)alloca(numChannels * sizeof(float *));
+      juce::AudioBuffer<float> clusterBuffer;
+
+      for (size_t i = 0; i < order.size();) {
+        // Group together ranges that overlap or are close enough to each other
+        // that they can be decoded in one pass:
+        long long clusterStart = ranges[order[i]].first;
+        long long clusterEnd = ranges[order[i]].second;
+        size_t j = i + 1;
+        while (j < order.size() && ranges[order[j]].first <=
+                                       clusterEnd + MAX_GAP_TO_DECODE_THROUGH) {
+          clusterEnd = std::max(clusterEnd, ranges[order[j]].second);
+          j++;
+        }
+
+        if (j == i + 1) {
+          // A lone range can be decoded directly into its output:
+          for (int c = 0; c < numChannels; c++) {
+            channelPointers[c] = getWritePointer(order[i], c);
+          }
+          framesRead[order[i]] = decodeRange(
+              clusterStart, clusterEnd - clusterStart, channelPointers);
+        } else {
+          clusterBuffer.setSize(numChannels, clusterEnd - clusterStart,
+                                /* keepExistingContent */ false,
+                                /* clearExtraSpace */ false,
+                                /* avoidReallocating */ true);
+          for (int c = 0; c < numChannels; c++) {
+            channelPointers[c] = clusterBuffer.getWritePointer(c);
+          }
+          long long clusterFramesRead = decodeRange(
+              clusterStart, clusterEnd - clusterStart, channelPointers);
+
+          for (size_t k = i; k < j; k++) {
+            auto [start, stop] = ranges[order[k]];
+            long long offsetInCluster = start - clusterStart;
+            long long framesToCopy =
+                std::max(0LL, std::min(stop - start,
+                                       clusterFramesRead - offsetInCluster));
+            for (int c = 0; c < numChannels; c++) {
+              std::memcpy(getWritePointer(order[k], c),
+                          clusterBuffer.getReadPointer(c) + offsetInCluster,
+                          framesToCopy * sizeof(float));
+            }
+            framesRead[order[k]] = framesToCopy;
+          }
+        }
+
+        i = j;
+      }
+
+      // If we hit the end of the file earlier than expected, some ranges may
+      // have come up short. Trim them (and shift later ranges backwards):
+      if (concatenate) {
+        long long outputOffset = 0;
+        for (size_t i = 0; i < ranges.size(); i++) {
+          if (outputOffset != offsets[i]) {
+            for (int c = 0; c < numChannels; c++) {
+              float *channel = concatenatedBuffer.getWritePointer(c);
+              std::memmove(channel + outputOffset, channel + offsets[i],
+                           framesRead[i] * sizeof(float));
+            }
+          }
+          offsets[i] = outputOffset;
+          outputOffset += framesRead[i];
+        }
+        offsets.back() = outputOffset;
+        if (outputOffset < concatenatedBuffer.getNumSamples()) {
+          concatenatedBuffer.setSize(numChannels, outputOffset,
+                                     /* keepExistingContent */ true,
+                                     /* clearExtraSpace */ false,
+                                     /* avoidReallocating */ true);
+        }
+      } else {
+        for (size_t i = 0; i < ranges.size(); i++) {
+          if (framesRead[i] < buffers[i].getNumSamples()) {
+            buffers[i].setSize(numChannels, framesRead[i],
+                               /* keepExistingContent */ true,
+                               /* clearExtraSpace */ false,
+                               /* avoidReallocating */ true);
+          }
+        }
+      }
+    }
+
+    PythonException::raise();
+
+    if (concatenate) {
+      py::array_t<long long> offsetsArray(offsets.size());
+      std::copy(offsets.begin(), offsets.end(), offsetsArray.mutable_data());
+      return py::make_tuple(
+          moveJuceBufferIntoPyArray(std::move(concatenatedBuffer),
+                                    ChannelLayout::NotInterleaved, 0),
+          offsetsArray);
+    }
+
+    py::list slices;
+    for (auto &buffer : buffers) {
+      slices.append(moveJuceBufferIntoPyArray(
+          std::move(buffer), ChannelLayout::NotInterleaved, 0));
+    }
+    return slices;
+  }
+
   py::array readRaw(std::variant<double, long long> numSamplesVariant) {
     long long numSamples = parseNumSamples(numSamplesVariant);
     if (numSamples == 0)
@@ -453,40 +926,147 @@ public:
     }
   }
 
+  long long readRawInto(py::array out, long long offset) {
+    const juce::ScopedReadLock readLock(objectLock);
+    if (!reader)
+      throw std::runtime_error("I/O operation on a closed file.");
+
+    if (reader->usesFloatingPointData) {
+      if (reader->bitsPerSample > 32) {
+        throw std::runtime_error(
+            "This file contains " + std::to_string(reader->bitsPerSample) +
+            "-bit floating-point audio, which cannot be returned without "
+            "losing precision. Use read_into() instead to get 32-bit float "
+            "data.");
+      }
+      return readInto(out, offset);
+    } else {
+      switch (reader->bitsPerSample) {
+      case 32:
+        return readIntegerInto<int>(out, offset);
+      case 16:
+        return readIntegerInto<short>(out, offset);
+      case 8:
+        return readIntegerInto<char>(out, offset);
+      default:
+        throw std::runtime_error("Not sure how to read " +
+                                 std::to_string(reader->bitsPerSample) +
+                                 "-bit audio data!");
+      }
+    }
+  }
+
   template <typename SampleType>
-  py::array_t<SampleType> readInteger(long long numSamples) {
+  long long readIntegerInto(py::array out, long long offset) {
     const juce::ScopedReadLock readLock(objectLock);
     if (reader->usesFloatingPointData) {
       throw std::runtime_error(
-          "Can't call readInteger with a floating point file!");
+          "Can't call readIntegerInto with a floating point file!");
     }
 
-    // Allocate a buffer to return of up to numSamples:
     long long numChannels = reader->numChannels;
-    numSamples =
-        std::min(numSamples, (reader->lengthInSamples +
-                              (lengthCorrection ? *lengthCorrection : 0)) -
-                                 currentPosition);
-    py::array_t<SampleType> buffer = py::array_t<SampleType>(
-        {(long long)numChannels, (long long)numSamples});
+    ReadIntoTarget<SampleType> target = parseReadIntoTarget<SampleType>(
+        out, numChannels, offset, "read_raw_into");
+    long long numSamples = std::min(
+        target.numFrames,
+        (reader->lengthInSamples + (lengthCorrection ? *lengthCorrection : 0)) -
+            currentPosition);
+    if (numSamples <= 0) {
+      return 0;
+    }
 
-    py::buffer_info outputInfo = buffer.request();
+    SampleType **channelPointers =
+        (SampleType **)alloca(numChannels * sizeof(SampleType *));
+    target.getChannelPointers(channelPointers, numChannels);
 
     {
       py::gil_scoped_release release;
-      if (reader->bitsPerSample > 16) {
-        if (sizeof(SampleType) < 4) {
-          throw std::runtime_error("Output array not wide enough to store " +
-                                   std::to_string(reader->bitsPerSample) +
-                                   "-bit integer data.");
+      readIntegerInternal<SampleType>(numChannels, numSamples, channelPointers);
+    }
+
+    PythonException::raise();
+
+    ScopedTryWriteLock scopedTryWriteLock(objectLock);
+    if (!scopedTryWriteLock.isLocked()) {
+      throw std::runtime_error(
+          "Another thread is currently reading from this AudioFile. "
+          "Note that using multiple concurrent readers on the same "
+          "AudioFile object will produce nondeterministic results.");
+    }
+    currentPosition += numSamples;
+    return numSamples;
+  }
+
+  /**
+   * Read the given number of frames from this (integer-format) audio file
+   * into the given per-channel output pointers, without converting to
+   * floating point and without advancing the file's current position. This
+   * method does not take or hold the GIL.
+   */
+  template <typename SampleType>
+  void readIntegerInternal(const long long numChannels,
+                           const long long numSamples,
+                           SampleType **outputChannelPointers) {
+    if (readAheadBuffer) {
+      ScopedTryWriteLock scopedTryWriteLock(objectLock);
+      if (!scopedTryWriteLock.isLocked()) {
+        throw std::runtime_error(
+            "Another thread is currently reading from this AudioFile. Note "
+            "that using multiple concurrent readers on the same AudioFile "
+            "object will produce nondeterministic results.");
+      }
+
+      // Raw reads bypass the read-ahead buffer, and the reader can't be used
+      // by two threads at once. The next call to read() will restart it:
+      readAheadBuffer->stop();
+    }
+
+    if (reader->bitsPerSample > 16) {
+      if (sizeof(SampleType) < 4) {
+        throw std::runtime_error("Output array not wide enough to store " +
+                                 std::to_string(reader->bitsPerSample) +
+                                 "-bit integer data.");
+      }
+
+      for (long long c = 0; c < numChannels; c++) {
+        std::memset((void *)outputChannelPointers[c], 0,
+                    numSamples * sizeof(SampleType));
+      }
+
+      bool readResult = false;
+      {
+        ScopedTryWriteLock scopedTryWriteLock(objectLock);
+        if (!scopedTryWriteLock.isLocked()) {
+          throw std::runtime_error(
+              "Another thread is currently reading from this AudioFile. Note "
+              "that using multiple concurrent readers on the same AudioFile "
+              "object will produce nondeterministic results.");
         }
+        readResult =
+            reader->readSamples((int **)outputChannelPointers, numChannels, 0,
+                                currentPosition, numSamples);
+      }
 
-        std::memset((void *)outputInfo.ptr, 0,
-                    numChannels * numSamples * sizeof(SampleType));
+      if (!readResult) {
+        PythonException::raise();
+        throwReadError(currentPosition, numSamples);
+      }
+    } else {
+      // Read the file in smaller chunks, converting from int32 to the
+      // appropriate output format as we go:
+      std::vector<std::vector<int>> intBuffers;
+      intBuffers.resize(numChannels);
+
+      int **channelPointers = (int **)alloca(numChannels * sizeof(int *));
+      for (long long startSample = 0; startSample < numSamples;
+           startSample += DEFAULT_AUDIO_BUFFER_SIZE_FRAMES) {
+        long long samplesToRead =
+            std::min(numSamples - startSample,
+                     (long long)DEFAULT_AUDIO_BUFFER_SIZE_FRAMES);
 
-        int **channelPointers = (int **)alloca(numChannels * sizeof(int *));
         for (long long c = 0; c < numChannels; c++) {
-          channelPointers[c] = ((int *)outputInfo.ptr) + (numSamples * c);
+          intBuffers[c].resize(samplesToRead);
+          channelPointers[c] = intBuffers[c].data();
         }
 
         bool readResult = false;
@@ -494,67 +1074,61 @@ public:
           ScopedTryWriteLock scopedTryWriteLock(objectLock);
           if (!scopedTryWriteLock.isLocked()) {
             throw std::runtime_error(
-                "Another thread is currently reading from this AudioFile. Note "
-                "that using multiple concurrent readers on the same AudioFile "
-                "object will produce nondeterministic results.");
+                "Another thread is currently reading from this AudioFile. "
+                "Note that using multiple concurrent readers on the same "
+                "AudioFile object will produce nondeterministic results.");
           }
-          readResult = reader->readSamples(channelPointers, numChannels, 0,
-                                           currentPosition, numSamples);
+
+          readResult =
+              reader->readSamples(channelPointers, numChannels, 0,
+                                  currentPosition + startSample, samplesToRead);
         }
 
         if (!readResult) {
           PythonException::raise();
-          throwReadError(currentPosition, numSamples);
+          throw std::runtime_error("Failed to read from file.");
         }
-      } else {
-        // Read the file in smaller chunks, converting from int32 to the
-        // appropriate output format as we go:
-        std::vector<std::vector<int>> intBuffers;
-        intBuffers.resize(numChannels);
-
-        int **channelPointers = (int **)alloca(numChannels * sizeof(int *));
-        for (long long startSample = 0; startSample < numSamples;
-             startSample += DEFAULT_AUDIO_BUFFER_SIZE_FRAMES) {
-          long long samplesToRead =
-              std::min(numSamples - startSample,
-                       (long long)DEFAULT_AUDIO_BUFFER_SIZE_FRAMES);
-
-          for (long long c = 0; c < numChannels; c++) {
-            intBuffers[c].resize(samplesToRead);
-            channelPointers[c] = intBuffers[c].data();
+
+        // Convert the data in intBuffers to the output format:
+        char shift = 32 - reader->bitsPerSample;
+        for (long long c = 0; c < numChannels; c++) {
+          SampleType *outputChannelPointer = outputChannelPointers[c];
+          for (long long i = 0; i < samplesToRead; i++) {
+            outputChannelPointer[startSample + i] = intBuffers[c][i] >> shift;
           }
+        }
+      }
+    }
+  }
 
-          bool readResult = false;
-          {
-            ScopedTryWriteLock scopedTryWriteLock(objectLock);
-            if (!scopedTryWriteLock.isLocked()) {
-              throw std::runtime_error(
-                  "Another thread is currently reading from this AudioFile. "
-                  "Note that using multiple concurrent readers on the same "
-                  "AudioFile object will produce nondeterministic results.");
-            }
+  template <typename SampleType>
+  py::array_t<SampleType> readInteger(long long numSamples) {
+    const juce::ScopedReadLock readLock(objectLock);
+    if (reader->usesFloatingPointData) {
+      throw std::runtime_error(
+          "Can't call readInteger with a floating point file!");
+    }
 
-            readResult = reader->readSamples(channelPointers, numChannels, 0,
-                                             currentPosition + startSample,
-                                             samplesToRead);
-          }
+    // Allocate a buffer to return of up to numSamples:
+    long long numChannels = reader->numChannels;
+    numSamples =
+        std::min(numSamples, (reader->lengthInSamples +
+                              (lengthCorrection ? *lengthCorrection : 0)) -
+                                 currentPosition);
+    py::array_t<SampleType> buffer = py::array_t<SampleType>(
+        {(long long)numChannels, (long long)numSamples});
 
-          if (!readResult) {
-            PythonException::raise();
-            throw std::runtime_error("Failed to read from file.");
-          }
+    py::buffer_info outputInfo = buffer.request();
 
-          // Convert the data in intBuffers to the output format:
-          char shift = 32 - reader->bitsPerSample;
-          for (long long c = 0; c < numChannels; c++) {
-            SampleType *outputChannelPointer =
-                (((SampleType *)outputInfo.ptr) + (c * numSamples));
-            for (long long i = 0; i < samplesToRead; i++) {
-              outputChannelPointer[startSample + i] = intBuffers[c][i] >> shift;
-            }
-          }
-        }
-      }
+    SampleType **channelPointers =
+        (SampleType **)alloca(numChannels * sizeof(SampleType *));
+    for (long long c = 0; c < numChannels; c++) {
+      channelPointers[c] = ((SampleType *)outputInfo.ptr) + (numSamples * c);
+    }
+
+    {
+      py::gil_scoped_release release;
+      readIntegerInternal<SampleType>(numChannels, numSamples, channelPointers);
     }
 
     PythonException::raise();
@@ -570,6 +1144,74 @@ public:
     return buffer;
   }
 
+  /**
+   * Returns true iff this file's samples are stored in memory in exactly the
+   * format that read_view() returns: as native-endian 32-bit floats.
+   */
+  bool canReadView() const {
+#if JUCE_LITTLE_ENDIAN
+    return memoryMappedFile && mappedFileIsWav && reader &&
+           reader->usesFloatingPointData && reader->bitsPerSample == 32;
+#else
+    return false;
+#endif
+  }
+
+  py::array_t<float>
+  readView(std::variant<double, long long> numSamplesVariant) {
+    long long numSamples = parseNumSamples(numSamplesVariant);
+    if (numSamples == 0)
+      throw std::domain_error(
+          "ReadableAudioFile will not read an entire file at once. Please pass "
+          "a number of frames to read (available from the 'frames' "
+          "attribute).");
+
+    const char *data = nullptr;
+    {
+      py::gil_scoped_release release;
+      const juce::ScopedReadLock scopedReadLock(objectLock);
+      if (!reader)
+        throw std::runtime_error("I/O operation on a closed file.");
+
+      if (!canReadView()) {
+        throw std::runtime_error(
+            "read_view() is only supported for 32-bit floating-point WAV "
+            "files opened with mmap=True. Use read() instead.");
+      }
+
+      numSamples =
+          std::min(numSamples, reader->lengthInSamples - currentPosition);
+      data = (const char *)memoryMappedFile->getData() + dataChunkStart +
+             (currentPosition * numChannels * sizeof(float));
+
+      // Promote to a write lock as we're now modifying the object:
+      ScopedTryWriteLock scopedTryWriteLock(objectLock);
+      if (!scopedTryWriteLock.isLocked()) {
+        throw std::runtime_error(
+            "Another thread is currently reading from this AudioFile. Note "
+            "that using multiple concurrent readers on the same AudioFile "
+            "object will produce nondeterministic results.");
+      }
+      currentPosition += numSamples;
+    }
+
+    // The returned array keeps the mapping alive, even if this file is
+    // closed before the array is deleted:
+    auto *owner = new std::shared_ptr<juce::MemoryMappedFile>(memoryMappedFile);
+    py::capsule ownerCapsule(owner, [](void *mapping) {
+      delete static_cast<std::shared_ptr<juce::MemoryMappedFile> *>(mapping);
+    });
+
+    // Samples are interleaved on disk, so a (channels, samples) view just
+    // needs the right strides:
+    py::array_t<float> view({(py::ssize_t)numChannels, (py::ssize_t)numSamples},
+                            {(py::ssize_t)sizeof(float),
+                             (py::ssize_t)(sizeof(float) * numChannels)},
+                            (const float *)data, ownerCapsule);
+    view.attr("setflags")(py::arg("write") = false);
+    return view;
+  }
+
   void seek(long long targetPosition) {
     py::gil_scoped_release release;
     seekInternal(targetPosition);
@@ -603,6 +1245,52 @@ public:
           "produce nondeterministic results.");
     }
     currentPosition = targetPosition;
+
+    // Start decoding from the new position immediately, unless we've already
+    // decoded that far ahead:
+    if (readAheadBuffer && !readAheadBuffer->skipTo(targetPosition)) {
+      startReadAhead(targetPosition);
+    }
+  }
+
+  void buildSeekIndex(std::optional<std::string> sidecarPath) {
+    py::gil_scoped_release release;
+    const juce::ScopedReadLock scopedReadLock(objectLock);
+    if (!reader)
+      throw std::runtime_error("I/O operation on a closed file.");
+
+    ScopedTryWriteLock scopedTryWriteLock(objectLock);
+    if (!scopedTryWriteLock.isLocked()) {
+      throw std::runtime_error(
+          "Another thread is currently reading from this AudioFile. Note that "
+          "using multiple concurrent readers on the same AudioFile object will "
+          "produce nondeterministic results.");
+    }
+
+    // Other formats (WAV, AIFF, FLAC, Ogg Vorbis) can already seek without
+    // scanning through the file, and don't need an index:
+    auto *indexableReader =
+        dynamic_cast<juce::AudioFormatReaderWithPosition *>(reader.get());
+    if (!indexableReader) {
+      return;
+    }
+
+    // Building or loading the index moves the reader, which can't be used by
+    // two threads at once. The next call to read() will restart read-ahead:
+    if (readAheadBuffer) {
+      readAheadBuffer->stop();
+    }
+
+    if (sidecarPath && loadSeekIndex(*sidecarPath, *indexableReader)) {
+      return;
+    }
+
+    bool indexBuilt = indexableReader->buildSeekIndex();
+    PythonException::raise();
+
+    if (indexBuilt && sidecarPath) {
+      saveSeekIndex(*sidecarPath, indexableReader->getSeekIndex());
+    }
   }
 
   long long tell() const {
@@ -618,6 +1306,9 @@ public:
           "Another thread is currently reading from this AudioFile; it cannot "
           "be closed until the other thread completes its operation.");
     }
+    // The read-ahead thread uses the reader, so must be stopped first:
+    readAheadBuffer.reset();
+
     // Note: This may deallocate a Python object, so must be called with the
     // GIL held:
     reader.reset();
@@ -684,6 +1375,216 @@ public:
   }
 
 private:
+  static constexpr const char *SEEK_INDEX_MAGIC = "PBSI";
+  static constexpr int SEEK_INDEX_VERSION = 2;
+
+  // The number of bytes at the start and the end of the file to hash when
+  // checking if a seek index was written for this file:
+  static constexpr int SEEK_INDEX_HASHED_BYTES = 64 * 1024;
+
+  /**
+   * Identify the contents of this file, so that a seek index written for
+   * another file of the same length (or for this file before it was modified)
+   * is never used. Returns the file's length, its modification time (if it's
+   * a file on disk), and a hash of its first and last bytes.
+   */
+  std::array<juce::int64, 3> getSeekIndexKey() {
+    juce::InputStream &input = *reader->input;
+    juce::int64 length = input.getTotalLength();
+
+    juce::int64 modificationTime = 0;
+    if (!filename.empty()) {
+      modificationTime =
+          juce::File(filename).getLastModificationTime().toMilliseconds();
+    }
+
+    // 64-bit FNV-1a:
+    juce::uint64 hash = 14695981039346656037ULL;
+    std::vector<char> buffer(SEEK_INDEX_HASHED_BYTES);
+    juce::int64 originalPosition = input.getPosition();
+    for (juce::int64 start :
+         {(juce::int64)0,
+          std::max((juce::int64)0, length - SEEK_INDEX_HASHED_BYTES)}) {
+      if (!input.setPosition(start)) {
+        continue;
+      }
+
+      int bytesRead = input.read(buffer.data(), (int)buffer.size());
+      for (int i = 0; i < bytesRead; i++) {
+        hash = (hash ^ (unsigned char)buffer[i]) * 1099511628211ULL;
+      }
+    }
+    input.setPosition(originalPosition);
+
+    return {length, modificationTime, (juce::int64)hash};
+  }
+
+  /**
+   * Try to load a seek index from a sidecar file previously written by
+   * saveSeekIndex(). Returns false if the sidecar file doesn't exist, or if
+   * it was written for a different file or before this file was modified.
+   */
+  bool loadSeekIndex(const std::string &sidecarPath,
+                     juce::AudioFormatReaderWithPosition &indexableReader) {
+    juce::File sidecarFile(sidecarPath);
+    if (!sidecarFile.existsAsFile()) {
+      return false;
+    }
+
+    juce::FileInputStream sidecar(sidecarFile);
+    if (sidecar.failedToOpen()) {
+      return false;
+    }
+
+    char magic[4];
+    if (sidecar.read(magic, sizeof(magic)) != sizeof(magic) ||
+        std::memcmp(magic, SEEK_INDEX_MAGIC, sizeof(magic)) != 0 ||
+        sidecar.readInt() != SEEK_INDEX_VERSION) {
+      return false;
+    }
+
+    for (juce::int64 expected : getSeekIndexKey()) {
+      if (sidecar.readInt64() != expected) {
+        return false;
+      }
+    }
+
+    juce::int64 numPositions = sidecar.readInt64();
+    if (numPositions <= 0 || numPositions * (juce::int64)sizeof(juce::int64) !=
+                                 sidecar.getNumBytesRemaining()) {
+      return false;
+    }
+
+    juce::Array<juce::int64> positions;
+    positions.ensureStorageAllocated((int)numPositions);
+    for (juce::int64 i = 0; i < numPositions; i++) {
+      positions.add(sidecar.readInt64());
+    }
+
+    return indexableReader.setSeekIndex(positions);
+  }
+
+  /**
+   * Write a seek index to a sidecar file, replacing any existing file.
+   */
+  void saveSeekIndex(const std::string &sidecarPath,
+                     const juce::Array<juce::int64> &positions) {
+    juce::File sidecarFile(sidecarPath);
+
+    // Write to a temporary file first, so that a partially-written index is
+    // never left behind at sidecarPath:
+    juce::TemporaryFile temporaryFile(sidecarFile);
+    {
+      juce::FileOutputStream sidecar(temporaryFile.getFile());
+      if (sidecar.failedToOpen()) {
+        throw std::runtime_error(
+            "Failed to write seek index to \"" + sidecarPath +
+            "\": " + sidecar.getStatus().getErrorMessage().toStdString());
+      }
+
+      sidecar.write(SEEK_INDEX_MAGIC, 4);
+      sidecar.writeInt(SEEK_INDEX_VERSION);
+      for (juce::int64 value : getSeekIndexKey()) {
+        sidecar.writeInt64(value);
+      }
+      sidecar.writeInt64(positions.size());
+      for (auto position : positions) {
+        sidecar.writeInt64(position);
+      }
+      sidecar.flush();
+
+      if (sidecar.getStatus().failed()) {
+        throw std::runtime_error(
+            "Failed to write seek index to \"" + sidecarPath +
+            "\": " + sidecar.getStatus().getErrorMessage().toStdString());
+      }
+    }
+
+    if (!temporaryFile.overwriteTargetFileWithTemporary()) {
+      throw std::runtime_error("Failed to write seek index to \"" +
+                               sidecarPath + "\".");
+    }
+  }
+
+  /**
+   * Decode up to numFrames frames starting at the given position, without
+   * using the read-ahead buffer or changing the current position of the file.
+   * The caller must hold the write lock.
+   */
+  long long decodeRange(long long position, long long numFrames,
+                        float **channelPointers) {
+    long long numSamples = std::max(
+        0LL, std::min(numFrames, (reader->lengthInSamples +
+                                  (lengthCorrection ? *lengthCorrection : 0)) -
+                                     position));
+
+    for (long long c = 0; c < numChannels; c++) {
+      std::fill_n(channelPointers[c], numSamples, 0);
+    }
+
+    try {
+      return decodeAt(position, numChannels, numSamples, channelPointers,
+                      lengthCorrection);
+    } catch (...) {
+      PythonException::raise();
+      throw;
+    }
+  }
+
+  /**
+   * Called on the read-ahead thread to decode the next chunk of audio.
+   */
+  long long decodeForReadAhead(long long position, float **channelPointers,
+                               long long numFrames) {
+    long long numSamples =
+        std::max(0LL, std::min(numFrames, (reader->lengthInSamples +
+                                           (readAheadLengthCorrection
+                                                ? *readAheadLengthCorrection
+                                                : 0)) -
+                                              position));
+
+    for (long long c = 0; c < numChannels; c++) {
+      std::fill_n(channelPointers[c], numSamples, 0);
+    }
+
+    return decodeAt(position, numChannels, numSamples, channelPointers,
+                    readAheadLengthCorrection);
+  }
+
+  /**
+   * Discard any audio in the read-ahead buffer and start decoding from the
+   * given position. The caller must hold the write lock.
+   */
+  void startReadAhead(long long position) {
+    readAheadBuffer->stop();
+    readAheadLengthCorrection = lengthCorrection;
+    readAheadBuffer->start(position);
+  }
+
+  /**
+   * Read audio from the read-ahead buffer, (re)starting the read-ahead thread
+   * if it's not already decoding from the current position. The caller must
+   * hold the write lock.
+   */
+  long long readFromReadAheadBuffer(const long long numChannels,
+                                    const long long numSamples,
+                                    float **channelPointers) {
+    if (!readAheadBuffer->skipTo(currentPosition)) {
+      startReadAhead(currentPosition);
+    }
+
+    long long numSamplesRead =
+        readAheadBuffer->read(channelPointers, numChannels, numSamples);
+
+    // Only once we've caught up to the read-ahead thread can we be sure of
+    // where the file ends:
+    if (readAheadBuffer->reachedEndOfStream()) {
+      lengthCorrection = readAheadLengthCorrection;
+    }
+
+    return numSamplesRead;
+  }
+
   void throwReadError(long long currentPosition, long long numSamples,
                       long long samplesRead = -1) {
     std::ostringstream ss;
@@ -725,8 +1626,11 @@ private:
 
     // In case any of the calls above to PythonInputStream cause an exception in
     // Python, this line will re-raise those so that the Python exception is
-    // visible:
-    PythonException::raise();
+    // visible. (Files opened by name never touch Python, and may be read from
+    // the read-ahead thread, which must not try to acquire the GIL.)
+    if (getPythonInputStream()) {
+      PythonException::raise();
+    }
 
     throw std::runtime_error(ss.str());
   }
@@ -736,6 +1640,11 @@ private:
   std::unique_ptr<juce::AudioFormatReader> reader;
   juce::ReadWriteLock objectLock;
 
+  // Only set if this file was opened with memoryMap = true:
+  std::shared_ptr<juce::MemoryMappedFile> memoryMappedFile;
+  juce::int64 dataChunkStart = 0;
+  bool mappedFileIsWav = false;
+
   double sampleRate;
   long numChannels;
   long numFrames;
@@ -750,6 +1659,16 @@ private:
   // will be greater than 0; if fewer are present, `lengthCorrection` will
   // be less than 0.
   std::optional<long long> lengthCorrection = {};
+
+  // The read-ahead thread's own copy of lengthCorrection, which is only
+  // copied into lengthCorrection once read() has caught up to the end of the
+  // file:
+  std::optional<long long> readAheadLengthCorrection = {};
+
+  // Only set if this file was opened with prefetchFrames > 0. This must be
+  // declared last, so that its thread is stopped before the reader is
+  // destroyed:
+  std::unique_ptr<ReadAheadBuffer> readAheadBuffer;
 };
 
 inline py::class_<ReadableAudioFile, AudioFile,
@@ -795,29 +1714,38 @@ inline void init_readable_audio_file(
     py::class_<ReadableAudioFile, AudioFile, std::shared_ptr<ReadableAudioFile>>
         &pyReadableAudioFile) {
   pyReadableAudioFile
-      .def(py::init([](std::string filename) -> ReadableAudioFile * {
+      .def(py::init([](std::string filename, bool memoryMap,
+                       long long prefetchFrames,
+                       int decimation) -> ReadableAudioFile * {
              // This definition is only here to provide nice docstrings.
              throw std::runtime_error(
                  "Internal error: __init__ should never be called, as this "
                  "class implements __new__.");
            }),
-           py::arg("filename"))
-      .def(py::init([](py::object filelike) -> ReadableAudioFile * {
-             // This definition is only here to provide nice docstrings.
-             throw std::runtime_error(
-                 "Internal error: __init__ should never be called, as this "
-                 "class implements __new__.");
-           }),
-           py::arg("file_like"))
+           py::arg("filename"), py::kw_only(), py::arg("mmap") = false,
+           py::arg("prefetch_frames") = 0, py::arg("decimation") = 1)
+      .def(py::init(
+               [](py::object filelike, int bufferSize) -> ReadableAudioFile * {
+                 // This definition is only here to provide nice docstrings.
+                 throw std::runtime_error(
+                     "Internal error: __init__ should never be called, as this "
+                     "class implements __new__.");
+               }),
+           py::arg("file_like"), py::kw_only(),
+           py::arg("buffer_size") = DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES)
       .def_static(
           "__new__",
-          [](const py::object *, std::string filename) {
-            return std::make_shared<ReadableAudioFile>(filename);
+          [](const py::object *, std::string filename, bool memoryMap,
+             long long prefetchFrames, int decimation) {
+            return std::make_shared<ReadableAudioFile>(
+                filename, memoryMap, prefetchFrames, decimation);
           },
-          py::arg("cls"), py::arg("filename"))
+          py::arg("cls"), py::arg("filename"), py::kw_only(),
+          py::arg("mmap") = false, py::arg("prefetch_frames") = 0,
+          py::arg("decimation") = 1)
       .def_static(
           "__new__",
-          [](const py::object *, py::object filelike) {
+          [](const py::object *, py::object filelike, int bufferSize) {
             if (!isReadableFileLike(filelike) &&
                 !tryConvertingToBuffer(filelike)) {
               throw py::type_error(
@@ -826,6 +1754,7 @@ inline void init_readable_audio_file(
                   "but received: " +
                   py::repr(filelike).cast<std::string>());
             }
+            validateFileLikeBufferSize(bufferSize);
 
             if (std::optional<py::buffer> buf =
                     tryConvertingToBuffer(filelike)) {
@@ -834,10 +1763,11 @@ inline void init_readable_audio_file(
                                                                 filelike));
             } else {
               return std::make_shared<ReadableAudioFile>(
-                  std::make_unique<PythonInputStream>(filelike));
+                  std::make_unique<PythonInputStream>(filelike, bufferSize));
             }
           },
-          py::arg("cls"), py::arg("file_like"))
+          py::arg("cls"), py::arg("file_like"), py::kw_only(),
+          py::arg("buffer_size") = DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES)
       .def("read", &ReadableAudioFile::read, py::arg("num_frames") = 0, R"(
 Read the given number of frames (samples in each channel) from this audio file at its current position.
 
@@ -888,6 +1818,107 @@ in which this may occur.)
     For convenience, the ``num_frames`` argument may be a floating-point number. However, if the
     provided number of frames contains a fractional part (i.e.: ``1.01`` instead of ``1.00``) then
     an exception will be thrown, as a fractional number of samples cannot be returned.
+)")
+      .def("read_into", &ReadableAudioFile::readInto, py::arg("out"),
+           py::arg("offset") = 0, R"(
+Read frames from this audio file at its current position into an existing
+:class:`numpy.array`, rather than allocating a new one. Returns the number of
+frames that were written.
+
+``out`` must be a writeable, C-contiguous ``float32`` array with the shape
+``(channels, samples)``, where ``channels`` matches this file's :py:attr:`num_channels`.
+Frames are written starting at frame index ``offset`` within ``out``, and as many
+frames will be read as fit in the remainder of ``out``.
+
+If the file does not contain enough audio data to fill ``out``, only the first
+``offset + <return value>`` frames of ``out`` will be written to, and the rest of
+``out`` will be left untouched.
+
+Reusing the same output array across many calls avoids allocating a new array
+for every chunk of audio read::
+
+   buffer = np.empty((f.num_channels, 8192), dtype=np.float32)
+   while (frames_read := f.read_into(buffer)):
+       process(buffer[:, :frames_read])
+)")
+      .def("read_raw_into", &ReadableAudioFile::readRawInto, py::arg("out"),
+           py::arg("offset") = 0, R"(
+Read frames from this audio file at its current position into an existing
+:class:`numpy.array` in the raw format stored by the underlying file, as
+:meth:`read_raw` would return them. Returns the number of frames that were written.
+
+``out`` must be a writeable, C-contiguous array with the shape ``(channels, samples)``
+and the same datatype that :meth:`read_raw` returns for this file (one of ``int8``,
+``int16``, ``int32``, or ``float32``). Frames are written starting at frame index
+``offset`` within ``out``, as in :meth:`read_into`.
+)")
+      .def("read_range", &ReadableAudioFile::readRange, py::arg("start"),
+           py::arg("stop"), R"(
+Read the frames from ``start`` (inclusive) to ``stop`` (exclusive) of this
+audio file, without changing the file's current position.
+
+This is equivalent to (but faster than) calling :meth:`seek` with ``start``,
+calling :meth:`read` with ``stop - start``, and then seeking back to the
+original position. If ``stop`` is past the end of the file, the returned array
+will contain as many frames as could be read from the file.
+)")
+      .def("read_ranges", &ReadableAudioFile::readRanges, py::arg("ranges"),
+           py::arg("concatenate") = false, R"(
+Read many ``(start, stop)`` ranges of frames from this audio file in a single
+call, without changing the file's current position.
+
+Ranges may be provided in any order and may overlap. They are read in order of
+their start positions, and ranges that overlap (or are separated by only a
+small gap) are decoded together, which avoids repeatedly seeking (and, for
+compressed formats, re-decoding) the same part of the file.
+
+By default, a list of :class:`numpy.array` objects is returned, one per range,
+in the same order as ``ranges``. If ``concatenate`` is ``True``, a tuple of
+``(audio, offsets)`` is returned instead, where ``audio`` is a single
+``float32`` array containing every range one after the other and ``offsets`` is
+an ``int64`` array of length ``len(ranges) + 1``, such that range ``i`` is
+``audio[:, offsets[i]:offsets[i + 1]]``::
+
+   audio, offsets = f.read_ranges([(0, 1000), (44100, 48100)], concatenate=True)
+   first_slice = audio[:, offsets[0]:offsets[1]]
+)")
+      .def("read_view", &ReadableAudioFile::readView, py::arg("num_frames") = 0,
+           R"(
+Return a read-only view of the given number of frames (samples in each channel)
+of this audio file at its current position, without copying or converting any
+audio data.
+
+This method is only available for 32-bit floating-point WAV files opened with
+``mmap=True``. The returned :class:`numpy.array` has the same ``(channels, samples)``
+shape and ``float32`` datatype that :meth:`read` would return, but refers directly
+to the memory-mapped contents of the file on disk. The returned array remains
+valid even after this file is closed.
+
+As audio samples are interleaved on disk, the returned array is not
+C-contiguous. Call :func:`numpy.ascontiguousarray` on the result if a contiguous
+copy is required.
+)")
+      .def("build_seek_index", &ReadableAudioFile::buildSeekIndex,
+           py::arg("sidecar_path") = py::none(), R"(
+Scan this file once to record the position of every frame of compressed audio,
+so that subsequent calls to :meth:`seek` can jump directly to the nearest frame
+rather than decoding forward through the file.
+
+This is only necessary for MP3 files, which otherwise must be scanned from the
+start (or from the furthest position read so far) on every forward seek. For all
+other formats, :meth:`seek` is already fast and this method does nothing.
+
+If ``sidecar_path`` is provided and points to an index previously written for
+this file, that index will be loaded instead of scanning the file. Otherwise,
+the file will be scanned and the resulting index written to ``sidecar_path``.
+Sidecar files that were written for a different file, that were written before
+this file was last modified, or that are corrupted are ignored and replaced::
+
+   with AudioFile("podcast.mp3") as f:
+       f.build_seek_index("podcast.mp3.seekindex")
+       for start in random_start_times:
+           f.seek(int(start * f.samplerate))
+           window = f.read(int(5 * f.samplerate))
 )")
       .def("seekable", &ReadableAudioFile::isSeekable,
            "Returns True if this file is currently open and calls to seek() "
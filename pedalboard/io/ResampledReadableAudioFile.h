@@ -58,6 +58,8 @@ static inline int inputBufferSizeFor(ResamplingQuality quality) {
     return 16 * 4;
   case ResamplingQuality::WindowedSinc8:
     return 8 * 4;
+  case ResamplingQuality::PolyphaseSinc32:
+    return 32 * 4;
   default:
     throw std::runtime_error("Unknown resampling quality (" +
                              std::to_string((int)quality) +
@@ -99,10 +101,18 @@ public:
   }
 
   long getLengthInSamples() const {
+    py::gil_scoped_release release;
+    return getLengthInSamplesInternal();
+  }
+
+  /**
+   * Compute the length of this file in the target sample rate without
+   * touching the GIL.
+   */
+  long getLengthInSamplesInternal() const {
     double underlyingLengthInSamples = (double)audioFile->getLengthInSamples();
     double underlyingSampleRate = audioFile->getSampleRateAsDouble();
 
-    py::gil_scoped_release release;
     const juce::ScopedReadLock scopedReadLock(objectLock);
     double length =
         ((underlyingLengthInSamples * resampler.getTargetSampleRate()) /
@@ -165,6 +175,26 @@ public:
                                      ChannelLayout::NotInterleaved, 0);
   }
 
+  long long readInto(py::array out, long long offset) {
+    long long numChannels = audioFile->getNumChannels();
+    ReadIntoTarget<float> target =
+        parseReadIntoTarget<float>(out, numChannels, offset, "read_into");
+    if (target.numFrames == 0) {
+      return 0;
+    }
+
+    long long framesRead = 0;
+    {
+      py::gil_scoped_release release;
+      std::vector<float *> channelPointers(numChannels);
+      target.getChannelPointers(channelPointers.data(), numChannels);
+      framesRead = readInternal(target.numFrames, channelPointers.data());
+    }
+
+    PythonException::raise();
+    return framesRead;
+  }
+
   /**
    * Read samples from the underlying audio file, resample them, and return a
    * juce::AudioBuffer containing the result without holding the GIL.
@@ -173,6 +203,26 @@ public:
    * @return juce::AudioBuffer<float> The resulting audio.
    */
   juce::AudioBuffer<float> readInternal(long long numSamples) {
+    juce::AudioBuffer<float> resampledBuffer(audioFile->getNumChannels(),
+                                             numSamples);
+    long long samplesRead =
+        readInternal(numSamples, resampledBuffer.getArrayOfWritePointers());
+    if (samplesRead < numSamples) {
+      resampledBuffer.setSize(resampledBuffer.getNumChannels(), samplesRead,
+                              /* keepExistingContent */ true);
+    }
+    return resampledBuffer;
+  }
+
+  /**
+   * Read samples from the underlying audio file and resample them directly
+   * into the provided per-channel output pointers, without holding the GIL.
+   *
+   * @param numSamples The number of samples to read.
+   * @param outputPointers One pointer per channel to write to.
+   * @return The number of samples that were written to each channel.
+   */
+  long long readInternal(long long numSamples, float *const *outputPointers) {
     // Note: We take a "write" lock here as calling readInternal will
     // advance internal state:
     ScopedTryWriteLock scopedTryWriteLock(objectLock);
@@ -183,151 +233,7 @@ public:
           "object will produce nondeterministic results.");
     }
 
-    long long samplesInResampledBuffer = 0;
-    juce::AudioBuffer<float> resampledBuffer(audioFile->getNumChannels(),
-                                             numSamples);
-
-    // Any samples in the existing outputBuffer from last time
-    // should be copied into resampledBuffer:
-    int samplesToPullFromOutputBuffer =
-        std::min(outputBuffer.getNumSamples(), (int)numSamples);
-    if (samplesToPullFromOutputBuffer > 0) {
-      for (int c = 0; c < resampledBuffer.getNumChannels(); c++) {
-        resampledBuffer.copyFrom(c, 0, outputBuffer, c, 0,
-                                 samplesToPullFromOutputBuffer);
-      }
-      samplesInResampledBuffer += samplesToPullFromOutputBuffer;
-
-      // Remove the used samples from outputBuffer:
-      if (outputBuffer.getNumSamples() - samplesToPullFromOutputBuffer) {
-        for (int c = 0; c < resampledBuffer.getNumChannels(); c++) {
-          // Use std::memmove instead of copyFrom here, as copyFrom is not
-          // overlap-safe.
-          std::memmove(
-              outputBuffer.getWritePointer(c),
-              outputBuffer.getReadPointer(c, samplesToPullFromOutputBuffer),
-              (outputBuffer.getNumSamples() - samplesToPullFromOutputBuffer) *
-                  sizeof(float));
-        }
-      }
-      outputBuffer.setSize(outputBuffer.getNumChannels(),
-                           outputBuffer.getNumSamples() -
-                               samplesToPullFromOutputBuffer,
-                           /* keepExistingContent */ true);
-    }
-
-    long long inputSamplesRequired =
-        (long long)(((numSamples - samplesToPullFromOutputBuffer) *
-                     audioFile->getSampleRateAsDouble()) /
-                    resampler.getTargetSampleRate());
-
-    // Make a juce::AudioBuffer that contains contiguous memory,
-    // which we can pass to readInternal:
-    std::vector<float> contiguousSourceSampleBuffer;
-    std::vector<float *> contiguousSourceSampleBufferPointers =
-        std::vector<float *>(audioFile->getNumChannels());
-
-    while (samplesInResampledBuffer < numSamples) {
-      // Cut or expand the contiguousSourceSampleBuffer to the required size:
-      contiguousSourceSampleBuffer.resize(
-          // Note: we need at least one element in this buffer or else we'll
-          // have no channel pointers to pass into the juce::AudioFile
-          // constructor!
-          std::max(1LL, audioFile->getNumChannels() * inputSamplesRequired));
-      std::fill_n(contiguousSourceSampleBuffer.begin(),
-                  contiguousSourceSampleBuffer.size(), 0);
-      for (int c = 0; c < audioFile->getNumChannels(); c++) {
-        contiguousSourceSampleBufferPointers[c] =
-            contiguousSourceSampleBuffer.data() + (c * inputSamplesRequired);
-      }
-
-      juce::AudioBuffer<float> sourceSamples = juce::AudioBuffer<float>(
-          contiguousSourceSampleBufferPointers.data(),
-          audioFile->getNumChannels(), inputSamplesRequired);
-      std::optional<juce::AudioBuffer<float>> resamplerInput;
-
-      if (inputSamplesRequired > 0) {
-        // Read from the underlying audioFile into our contiguous buffer,
-        // which causes the sourceSamples AudioBuffer to be filled:
-        long long samplesRead = audioFile->readInternal(
-            audioFile->getNumChannels(), inputSamplesRequired,
-            contiguousSourceSampleBuffer.data());
-
-        // Resize the sourceSamples buffer to the number of samples read,
-        // without reallocating the memory underneath
-        // (still points at contiguousSourceSampleBuffer):
-        sourceSamples.setSize(audioFile->getNumChannels(), samplesRead,
-                              /* keepExistingContent */ true,
-                              /* clearExtraSpace */ false,
-                              /* avoidReallocating */ true);
-
-        if (samplesRead < inputSamplesRequired) {
-          for (int c = 0; c < audioFile->getNumChannels(); c++) {
-            contiguousSourceSampleBufferPointers[c] =
-                contiguousSourceSampleBuffer.data() + (c * samplesRead);
-          }
-          sourceSamples = juce::AudioBuffer<float>(
-              contiguousSourceSampleBufferPointers.data(),
-              audioFile->getNumChannels(), samplesRead);
-        }
-
-        // If the underlying source ran out of samples, tell the resampler that
-        // we're done by feeding in an empty optional rather than an empty
-        // buffer:
-        if (sourceSamples.getNumSamples() == 0) {
-          resamplerInput = {};
-        } else {
-          resamplerInput = {sourceSamples};
-        }
-      } else {
-        resamplerInput = {sourceSamples};
-      }
-
-      // TODO: Provide an alternative interface to write to the output buffer
-      juce::AudioBuffer<float> newResampledSamples =
-          resampler.process(resamplerInput);
-
-      int offsetInNewResampledSamples = 0;
-      if (newResampledSamples.getNumSamples() >
-          numSamples - samplesInResampledBuffer) {
-        int samplesToCache = newResampledSamples.getNumSamples() -
-                             (numSamples - samplesInResampledBuffer);
-        outputBuffer.setSize(newResampledSamples.getNumChannels(),
-                             samplesToCache);
-        for (int c = 0; c < outputBuffer.getNumChannels(); c++) {
-          outputBuffer.copyFrom(c, 0, newResampledSamples, c,
-                                newResampledSamples.getNumSamples() -
-                                    samplesToCache,
-                                samplesToCache);
-        }
-      }
-
-      if (!resamplerInput && newResampledSamples.getNumSamples() == 0) {
-        resampledBuffer.setSize(resampledBuffer.getNumChannels(),
-                                samplesInResampledBuffer,
-                                /* keepExistingContent */ true);
-        break;
-      }
-
-      int startSample = samplesInResampledBuffer;
-      int samplesToCopy = std::min(
-          newResampledSamples.getNumSamples() - offsetInNewResampledSamples,
-          (int)(numSamples - samplesInResampledBuffer));
-      if (samplesToCopy > 0) {
-        for (int c = 0; c < resampledBuffer.getNumChannels(); c++) {
-          resampledBuffer.copyFrom(c, startSample, newResampledSamples, c,
-                                   offsetInNewResampledSamples, samplesToCopy);
-        }
-      }
-      samplesInResampledBuffer += samplesToCopy;
-
-      // TODO: Tune this carefully to avoid unnecessary calls to read()
-      // Too large, and we buffer too much audio using too much memory
-      // Too short, and we slow down
-      inputSamplesRequired = 1;
-    }
-    positionInTargetSampleRate += resampledBuffer.getNumSamples();
-    return resampledBuffer;
+    return readUnlocked(numSamples, outputPointers);
   }
 
   void seek(long long targetPosition) {
@@ -340,43 +246,57 @@ public:
             "that using multiple concurrent readers on the same AudioFile "
             "object will produce nondeterministic results.");
       }
-      long long positionToSeekToIncludingBuffers = targetPosition;
 
-      long long targetPositionInSourceSampleRate =
-          std::max(0LL, (long long)(((double)positionToSeekToIncludingBuffers *
-                                     resampler.getSourceSampleRate()) /
-                                    resampler.getTargetSampleRate()));
-
-      targetPositionInSourceSampleRate -=
+      long long inputSamplesToPrime =
           inputBufferSizeFor(resampler.getQuality());
-
       long long maximumOverflow = (long long)std::ceil(
           resampler.getSourceSampleRate() / resampler.getTargetSampleRate());
-      targetPositionInSourceSampleRate -= std::max(0LL, maximumOverflow);
-
-      double floatingPositionInTargetSampleRate =
-          std::max(0.0, ((double)targetPositionInSourceSampleRate *
-                         resampler.getTargetSampleRate()) /
-                            resampler.getSourceSampleRate());
 
-      positionInTargetSampleRate =
-          (long long)(floatingPositionInTargetSampleRate);
-
-      resampler.reset();
-
-      long long inputSamplesUsed =
-          resampler.advanceResamplerState(positionInTargetSampleRate);
-      targetPositionInSourceSampleRate = inputSamplesUsed;
-
-      audioFile->seekInternal(std::max(0LL, targetPositionInSourceSampleRate));
-
-      outputBuffer.setSize(0, 0);
+      // Seeking backwards (or far forwards) requires resetting the resampler
+      // and re-priming it with the input samples just before the target
+      // position. If the target position is within that many samples ahead
+      // of the current position, the resampler is already primed, and reading
+      // forward from here produces identical output for less work:
+      long long maximumForwardSkip = (long long)std::ceil(
+          ((double)(inputSamplesToPrime + std::max(0LL, maximumOverflow)) *
+           resampler.getTargetSampleRate()) /
+          resampler.getSourceSampleRate());
+      if (targetPosition < positionInTargetSampleRate ||
+          targetPosition - positionInTargetSampleRate > maximumForwardSkip) {
+        long long positionToSeekToIncludingBuffers = targetPosition;
+
+        long long targetPositionInSourceSampleRate = std::max(
+            0LL, (long long)(((double)positionToSeekToIncludingBuffers *
+                              resampler.getSourceSampleRate()) /
+                             resampler.getTargetSampleRate()));
+
+        targetPositionInSourceSampleRate -= inputSamplesToPrime;
+        targetPositionInSourceSampleRate -= std::max(0LL, maximumOverflow);
+
+        double floatingPositionInTargetSampleRate =
+            std::max(0.0, ((double)targetPositionInSourceSampleRate *
+                           resampler.getTargetSampleRate()) /
+                              resampler.getSourceSampleRate());
+
+        positionInTargetSampleRate =
+            (long long)(floatingPositionInTargetSampleRate);
+
+        resampler.reset();
+
+        long long inputSamplesUsed =
+            resampler.advanceResamplerState(positionInTargetSampleRate);
+        targetPositionInSourceSampleRate = inputSamplesUsed;
+
+        audioFile->seekInternal(
+            std::max(0LL, targetPositionInSourceSampleRate));
+
+        outputBuffer.setSize(0, 0);
+        outputBufferStart = 0;
+      }
 
-      const long long chunkSize = 1024 * 1024;
-      for (long long i = positionInTargetSampleRate; i < targetPosition;
-           i += chunkSize) {
-        long long numSamples = std::min(chunkSize, targetPosition - i);
-        this->readInternal(numSamples);
+      // Discard any samples between here and the target position:
+      if (targetPosition > positionInTargetSampleRate) {
+        readUnlocked(targetPosition - positionInTargetSampleRate, nullptr);
       }
     }
 
@@ -440,9 +360,117 @@ public:
   }
 
 private:
+  /**
+   * Copy up to numSamples samples from the output of the last call to the
+   * resampler that were not yet returned. If outputPointers is nullptr, the
+   * samples are discarded instead. Returns the number of samples consumed.
+   */
+  long long pullFromOutputBuffer(long long numSamples,
+                                 float *const *outputPointers,
+                                 long long outputOffset) {
+    long long samplesToPull =
+        std::min((long long)(outputBuffer.getNumSamples() - outputBufferStart),
+                 numSamples);
+    if (samplesToPull <= 0) {
+      return 0;
+    }
+
+    if (outputPointers) {
+      for (int c = 0; c < outputBuffer.getNumChannels(); c++) {
+        std::memcpy(outputPointers[c] + outputOffset,
+                    outputBuffer.getReadPointer(c, outputBufferStart),
+                    samplesToPull * sizeof(float));
+      }
+    }
+    outputBufferStart += samplesToPull;
+    return samplesToPull;
+  }
+
+  /**
+   * Read and resample numSamples samples into outputPointers (or discard them,
+   * if outputPointers is nullptr). The caller must hold the write lock.
+   *
+   * Samples are decoded into, and resampled into, buffers that are reused
+   * across calls, so that reading in small chunks does not reallocate.
+   */
+  long long readUnlocked(long long numSamples, float *const *outputPointers) {
+    const int numChannels = audioFile->getNumChannels();
+
+    // Any samples left over in outputBuffer from last time should be used
+    // first:
+    long long samplesRead = pullFromOutputBuffer(numSamples, outputPointers, 0);
+
+    long long inputSamplesRequired =
+        (long long)(((numSamples - samplesRead) *
+                     audioFile->getSampleRateAsDouble()) /
+                    resampler.getTargetSampleRate());
+
+    sourceChannelPointers.resize(numChannels);
+    while (samplesRead < numSamples) {
+      // Note: we need at least one sample in this buffer or else we'll have no
+      // channel pointers to pass to readInternal:
+      sourceBuffer.setSize(numChannels, std::max(1LL, inputSamplesRequired),
+                           /* keepExistingContent */ false,
+                           /* clearExtraSpace */ false,
+                           /* avoidReallocating */ true);
+      for (int c = 0; c < numChannels; c++) {
+        sourceChannelPointers[c] = sourceBuffer.getWritePointer(c);
+      }
+
+      bool isFlushing = false;
+      if (inputSamplesRequired > 0) {
+        // Decode from the underlying audioFile directly into sourceBuffer:
+        long long samplesDecoded = audioFile->readInternal(
+            numChannels, inputSamplesRequired, sourceChannelPointers.data());
+
+        // If the underlying source ran out of samples, tell the resampler
+        // that we're done by flushing it rather than passing an empty buffer:
+        isFlushing = samplesDecoded == 0;
+
+        // Shrink the buffer without reallocating the memory underneath:
+        sourceBuffer.setSize(numChannels, samplesDecoded,
+                             /* keepExistingContent */ true,
+                             /* clearExtraSpace */ false,
+                             /* avoidReallocating */ true);
+      } else {
+        sourceBuffer.setSize(numChannels, 0,
+                             /* keepExistingContent */ false,
+                             /* clearExtraSpace */ false,
+                             /* avoidReallocating */ true);
+      }
+
+      resampler.process(isFlushing ? nullptr : &sourceBuffer, outputBuffer);
+      outputBufferStart = 0;
+
+      if (isFlushing && outputBuffer.getNumSamples() == 0) {
+        break;
+      }
+
+      samplesRead += pullFromOutputBuffer(numSamples - samplesRead,
+                                          outputPointers, samplesRead);
+
+      // TODO: Tune this carefully to avoid unnecessary calls to read()
+      // Too large, and we buffer too much audio using too much memory
+      // Too short, and we slow down
+      inputSamplesRequired = 1;
+    }
+
+    positionInTargetSampleRate += samplesRead;
+    return samplesRead;
+  }
+
   const std::shared_ptr<ReadableAudioFile> audioFile;
   StreamResampler<float> resampler;
+
+  // The output of the last call to the resampler, of which the first
+  // outputBufferStart samples have already been returned:
   juce::AudioBuffer<float> outputBuffer;
+  int outputBufferStart = 0;
+
+  // Scratch space for decoded audio, reused across reads:
+  juce::AudioBuffer<float> sourceBuffer;
+  std::vector<float *> sourceChannelPointers;
+
   long long positionInTargetSampleRate = 0;
   juce::ReadWriteLock objectLock;
   bool _isClosed = false;
@@ -541,6 +569,18 @@ maximum sample value will be ``+1.0f``.
       .def("seekable", &ResampledReadableAudioFile::isSeekable,
            "Returns True if this file is currently open and calls to seek() "
            "will work.")
+      .def("read_into", &ResampledReadableAudioFile::readInto, py::arg("out"),
+           py::arg("offset") = 0, R"(
+Read frames (at the target sample rate) from this audio file at its current
+position into an existing :class:`numpy.array`, rather than allocating a new
+one. Returns the number of frames that were written.
+
+``out`` must be a writeable, C-contiguous ``float32`` array with the shape
+``(channels, samples)``, where ``channels`` matches this file's :py:attr:`num_channels`.
+Frames are written starting at frame index ``offset`` within ``out``, and as many
+frames will be read as fit in the remainder of ``out``. If the file does not
+contain enough audio data to fill ``out``, the rest of ``out`` will be left untouched.
+)")
       .def("seek", &ResampledReadableAudioFile::seek, py::arg("position"),
            "Seek this file to the provided location in frames at the target "
            "sample rate. Future reads will start from this position.\n\n.. "
@@ -28,8 +28,8 @@ public:
                   int numChannels, ResamplingQuality quality)
       : sourceSampleRate(sourceSampleRate), targetSampleRate(targetSampleRate),
         numChannels(numChannels), quality(quality) {
-    overflowSamples.resize(numChannels);
     resamplers.resize(numChannels);
+    inputPointers.resize(numChannels);
 
     for (int i = 0; i < numChannels; i++) {
       resamplers[i].setQuality(quality);
@@ -41,109 +41,126 @@ public:
     outputLatency = inputLatency / resamplerRatio;
 
     outputSamplesToSkip = outputLatency;
+
+    // The resamplers only ever leave (at most) a couple of input samples'
+    // worth of overflow unconsumed, and only skip the first outputLatency
+    // samples of output, so these buffers should never need to grow:
+    overflowBuffer.setSize(numChannels, (int)std::ceil(resamplerRatio) + 2);
+    skippedOutputBuffer.setSize(numChannels, (int)std::ceil(outputLatency) + 1);
   }
 
   juce::AudioBuffer<SampleType>
   process(std::optional<juce::AudioBuffer<SampleType>> &_input,
           double maxSamplesToReturn = 1e40) {
-    if (_input && _input->getNumChannels() != numChannels) {
+    juce::AudioBuffer<SampleType> output;
+    process(_input ? &*_input : nullptr, output);
+    return output;
+  }
+
+  /**
+   * Resample the provided input (or flush the resampler, if input is nullptr)
+   * into the provided output buffer, which will be resized to fit. Reusing
+   * the same output buffer across calls avoids reallocating it.
+   */
+  void process(const juce::AudioBuffer<SampleType> *input,
+               juce::AudioBuffer<SampleType> &output) {
+    if (input && input->getNumChannels() != numChannels) {
       throw std::domain_error(
           "Expected " + std::to_string(numChannels) +
           "-channel input, but was provided a buffer with " +
-          std::to_string(_input->getNumChannels()) + " channels and " +
-          std::to_string(_input->getNumSamples()) + " samples.");
+          std::to_string(input->getNumChannels()) + " channels and " +
+          std::to_string(input->getNumSamples()) + " samples.");
     }
 
     std::scoped_lock lock(mutex);
 
-    juce::AudioBuffer<SampleType> input;
-    bool isFlushing = false;
-    int numNewInputSamples = 0;
+    bool isFlushing = !input;
+    int numInputSamples = 0;
 
-    if (_input) {
-      input = prependWith(*_input, overflowSamples);
-      numNewInputSamples = input.getNumSamples();
+    if (input) {
+      numInputSamples = prepareInput(input, input->getNumSamples());
     } else {
-      isFlushing = true;
-      int samplesToFlush = inputLatency;
-
-      input = juce::AudioBuffer<float>(numChannels, samplesToFlush);
       inputSamplesBufferedInResampler = 0;
-      input.clear();
-      input = prependWith(input, overflowSamples);
+      numInputSamples = prepareInput(nullptr, (int)inputLatency);
     }
 
     double expectedResampledSamples =
-        std::max(0.0, ((totalSamplesInput + input.getNumSamples()) *
+        std::max(0.0, ((totalSamplesInput + numInputSamples) *
                        targetSampleRate / sourceSampleRate) -
                           totalSamplesOutput);
+    int numResampledSamples = (int)expectedResampledSamples;
 
-    // TODO: Don't copy the entire input buffer multiple times here!
-    juce::AudioBuffer<SampleType> output(input.getNumChannels(),
-                                         (int)expectedResampledSamples);
+    // Figure out how many of the first _n_ samples to chop off, if necessary:
+    int numSamplesToSkip = 0;
+    if (outputSamplesToSkip > 0) {
+      long long intOutputSamplesToSkip = (int)std::round(outputSamplesToSkip);
+      if (intOutputSamplesToSkip) {
+        numSamplesToSkip = (int)std::min(intOutputSamplesToSkip,
+                                         (long long)numResampledSamples);
+        outputSamplesToSkip -= numSamplesToSkip;
+      }
+    }
 
-    for (size_t c = 0; c < input.getNumChannels(); c++) {
-      if (input.getNumSamples() > 0) {
-        long long inputSamplesConsumed = resamplers[c].process(
-            resamplerRatio, input.getReadPointer(c), output.getWritePointer(c),
-            (int)expectedResampledSamples);
+    output.setSize(numChannels, numResampledSamples - numSamplesToSkip,
+                   /* keepExistingContent */ false,
+                   /* clearExtraSpace */ false,
+                   /* avoidReallocating */ true);
+    skippedOutputBuffer.setSize(numChannels, numSamplesToSkip,
+                                /* keepExistingContent */ false,
+                                /* clearExtraSpace */ false,
+                                /* avoidReallocating */ true);
+
+    for (int c = 0; c < numChannels; c++) {
+      if (numInputSamples > 0) {
+        // Resample the samples to be skipped into a scratch buffer, and the
+        // rest directly into the output buffer:
+        long long inputSamplesConsumed = 0;
+        if (numSamplesToSkip > 0) {
+          inputSamplesConsumed += resamplers[c].process(
+              resamplerRatio, inputPointers[c],
+              skippedOutputBuffer.getWritePointer(c), numSamplesToSkip);
+        }
+        if (output.getNumSamples() > 0) {
+          inputSamplesConsumed += resamplers[c].process(
+              resamplerRatio, inputPointers[c] + inputSamplesConsumed,
+              output.getWritePointer(c), output.getNumSamples());
+        }
+
+        int numOverflowSamplesForChannel =
+            numInputSamples - (int)inputSamplesConsumed;
 
         if (c == 0) {
           if (!isFlushing) {
             totalSamplesInput += inputSamplesConsumed;
           }
-          totalSamplesOutput += (int)expectedResampledSamples;
-        }
+          totalSamplesOutput += numResampledSamples;
+
+          if (!isFlushing) {
+            overflowBuffer.setSize(numChannels, numOverflowSamplesForChannel,
+                                   /* keepExistingContent */ false,
+                                   /* clearExtraSpace */ false,
+                                   /* avoidReallocating */ true);
+            numOverflowSamples = numOverflowSamplesForChannel;
 
-        if (!isFlushing) {
-          for (int i = inputSamplesConsumed; i < input.getNumSamples(); i++) {
-            overflowSamples[c].push_back(input.getReadPointer(c)[i]);
-          }
-          if (c == 0) {
             inputSamplesBufferedInResampler += inputSamplesConsumed;
             if (inputSamplesBufferedInResampler > inputLatency) {
               inputSamplesBufferedInResampler = inputLatency;
             }
           }
         }
-      }
-    }
 
-    // Chop off the first _n_ samples if necessary:
-    if (outputSamplesToSkip > 0) {
-      long long intOutputSamplesToSkip = (int)std::round(outputSamplesToSkip);
-      if (intOutputSamplesToSkip) {
-        outputSamplesToSkip -=
-            std::min(intOutputSamplesToSkip, (long long)output.getNumSamples());
-
-        int newNumOutputSamples =
-            output.getNumSamples() - intOutputSamplesToSkip;
-        if (newNumOutputSamples <= 0) {
-          if (isFlushing) {
-            reset_unlocked();
-          }
-          return juce::AudioBuffer<SampleType>(input.getNumChannels(), 0);
-        }
-
-        juce::AudioBuffer<SampleType> choppedOutput(input.getNumChannels(),
-                                                    newNumOutputSamples);
-        for (int c = 0; c < numChannels; c++) {
-          choppedOutput.copyFrom(c, 0, output, c, intOutputSamplesToSkip,
-                                 newNumOutputSamples);
-        }
-
-        if (isFlushing) {
-          reset_unlocked();
+        if (!isFlushing && numOverflowSamplesForChannel > 0) {
+          // All channels are resampled in lockstep, so each channel leaves
+          // the same number of samples unconsumed:
+          overflowBuffer.copyFrom(c, 0, inputPointers[c] + inputSamplesConsumed,
+                                  numOverflowSamplesForChannel);
         }
-        return choppedOutput;
       }
     }
 
     if (isFlushing) {
       reset_unlocked();
     }
-
-    return output;
   }
 
   void reset() {
@@ -158,9 +175,7 @@ public:
 
     inputSamplesBufferedInResampler = 0;
     outputSamplesToSkip = outputLatency;
-    for (auto &overflowBuffer : overflowSamples) {
-      overflowBuffer.clear();
-    }
+    numOverflowSamples = 0;
 
     totalSamplesInput = 0;
     totalSamplesOutput = 0;
@@ -179,7 +194,7 @@ public:
   }
 
   // TODO: Rename me!
-  int getOverflowSamples() const { return overflowSamples[0].size(); }
+  int getOverflowSamples() const { return numOverflowSamples; }
 
   /**
    * Advance the internal state of this resampler, as if the given
@@ -254,24 +269,41 @@ public:
   }
 
 private:
-  juce::AudioBuffer<SampleType>
-  prependWith(juce::AudioBuffer<SampleType> &input,
-              std::vector<std::vector<SampleType>> &toPrepend) {
-    int prependSize = toPrepend[0].size();
-    juce::AudioBuffer<SampleType> output(input.getNumChannels(),
-                                         input.getNumSamples() + prependSize);
-
-    for (int c = 0; c < input.getNumChannels(); c++) {
-      SampleType *channelPointer = output.getWritePointer(c);
-      for (int i = 0; i < prependSize; i++) {
-        channelPointer[i] = toPrepend[c][i];
+  /**
+   * Point inputPointers at numNewSamples samples of input per channel,
+   * preceded by any overflow samples left over from the previous call.
+   * If source is nullptr, numNewSamples samples of silence are used instead.
+   * Returns the total number of input samples available.
+   */
+  int prepareInput(const juce::AudioBuffer<SampleType> *source,
+                   int numNewSamples) {
+    int numSamples = numOverflowSamples + numNewSamples;
+
+    if (source && numOverflowSamples == 0) {
+      // Nothing to prepend, so resample straight from the caller's buffer:
+      for (int c = 0; c < numChannels; c++) {
+        inputPointers[c] = source->getReadPointer(c);
       }
-      toPrepend[c].clear();
+      return numSamples;
+    }
 
-      output.copyFrom(c, prependSize, input, c, 0, input.getNumSamples());
+    inputBuffer.setSize(numChannels, numSamples,
+                        /* keepExistingContent */ false,
+                        /* clearExtraSpace */ false,
+                        /* avoidReallocating */ true);
+    for (int c = 0; c < numChannels; c++) {
+      inputBuffer.copyFrom(c, 0, overflowBuffer, c, 0, numOverflowSamples);
+      if (source) {
+        inputBuffer.copyFrom(c, numOverflowSamples, *source, c, 0,
+                             numNewSamples);
+      } else {
+        inputBuffer.clear(c, numOverflowSamples, numNewSamples);
+      }
+      inputPointers[c] = inputBuffer.getReadPointer(c);
     }
 
-    return output;
+    numOverflowSamples = 0;
+    return numSamples;
   }
 
   double sourceSampleRate;
@@ -280,7 +312,17 @@ private:
   std::vector<VariableQualityResampler> resamplers;
 
   double resamplerRatio = 1.0;
-  std::vector<std::vector<SampleType>> overflowSamples;
+
+  // Input samples that the resamplers haven't yet consumed, which are
+  // prepended to the input passed to the next call to process():
+  juce::AudioBuffer<SampleType> overflowBuffer;
+  int numOverflowSamples = 0;
+
+  // Scratch buffers, reused across calls to avoid reallocating:
+  juce::AudioBuffer<SampleType> inputBuffer;
+  juce::AudioBuffer<SampleType> skippedOutputBuffer;
+  std::vector<const SampleType *> inputPointers;
+
   double inputLatency = 0;
   double outputLatency = 0;
 
@@ -26,6 +26,7 @@
 #include "../BufferUtils.h"
 #include "../JuceHeader.h"
 #include "AudioFile.h"
+#include "EncodeQueue.h"
 #include "LameMP3AudioFormat.h"
 #include "PythonOutputStream.h"
 
@@ -33,6 +34,17 @@ namespace py = pybind11;
 
 namespace Pedalboard {
 
+// The maximum number of frames of audio that may be waiting to be encoded
+// when writing with async_encode=True, before write() blocks:
+static constexpr const unsigned int ASYNC_ENCODE_QUEUE_SIZE_FRAMES =
+    DEFAULT_AUDIO_BUFFER_SIZE_FRAMES * 32;
+
+inline void validateNumEncoderThreads(std::optional<int> workers) {
+  if (workers && *workers < 1) {
+    throw std::range_error("workers must be at least 1.");
+  }
+}
+
 bool isInteger(double value) {
   double intpart;
   return modf(value, &intpart) == 0.0;
@@ -222,15 +234,17 @@ public:
   WriteableAudioFile(
       std::string filename, double writeSampleRate, int numChannels = 1,
       int bitDepth = 16,
-      std::optional<std::variant<std::string, float>> qualityInput = {})
+      std::optional<std::variant<std::string, float>> qualityInput = {},
+      bool asyncEncode = false)
       : WriteableAudioFile(filename, nullptr, writeSampleRate, numChannels,
-                           bitDepth, qualityInput) {}
+                           bitDepth, qualityInput, asyncEncode) {}
 
   WriteableAudioFile(
       std::string filename,
       std::unique_ptr<juce::OutputStream> providedOutputStream,
       double writeSampleRate, int numChannels = 1, int bitDepth = 16,
-      std::optional<std::variant<std::string, float>> qualityInput = {}) {
+      std::optional<std::variant<std::string, float>> qualityInput = {},
+      bool asyncEncode = false, int numEncoderThreads = 1) {
     pybind11::gil_scoped_release release;
 
     // This is kind of silly, as nobody else has a reference
@@ -302,6 +316,15 @@ public:
         }
       }
 
+      if (asyncEncode) {
+        // The encoder thread would need to take the GIL to write to a Python
+        // file-like object, which would remove most of the benefit of
+        // encoding asynchronously:
+        throw std::domain_error(
+            "async_encode=True is only supported when writing to a filename, "
+            "not to a file-like object.");
+      }
+
       unsafeOutputStream = pythonOutputStream;
       pythonOutputStream->setObjectLock(&objectLock);
       outputStream = std::move(providedOutputStream);
@@ -356,9 +379,18 @@ public:
     }
 
     juce::StringPairArray emptyMetadata;
-    writer.reset(format->createWriterFor(outputStream.get(), writeSampleRate,
-                                         numChannels, bitDepth, emptyMetadata,
-                                         qualityOptionIndex));
+    auto *flacFormat = dynamic_cast<juce::PatchedFlacAudioFormat *>(format);
+    if (flacFormat && numEncoderThreads > 1) {
+      // FLAC frames are independent, so FLAC audio can be encoded in parallel
+      // (but only once all of it has been written):
+      writer.reset(flacFormat->createParallelWriterFor(
+          outputStream.get(), writeSampleRate, numChannels, bitDepth,
+          qualityOptionIndex, numEncoderThreads));
+    } else {
+      writer.reset(format->createWriterFor(outputStream.get(), writeSampleRate,
+                                           numChannels, bitDepth, emptyMetadata,
+                                           qualityOptionIndex));
+    }
     if (!writer) {
       PythonException::raise();
 
@@ -433,6 +465,12 @@ public:
         writer.reset();
         throw;
       }
+
+      if (asyncEncode) {
+        encodeQueue =
+            std::make_unique<EncodeQueue>(ASYNC_ENCODE_QUEUE_SIZE_FRAMES);
+        usesEncodeQueue = true;
+      }
     }
   }
 
@@ -440,6 +478,7 @@ public:
     // We need to release the writer here, as it may call .write() in its
     // destructor, and we need to hold the ScopedWriteLock if it does:
     juce::ScopedWriteLock writeLock(objectLock);
+    encodeQueue.reset();
     writer.reset();
   }
 
@@ -539,11 +578,35 @@ public:
           std::to_string(numChannels) + "-channel audio!");
     }
 
+    if (usesEncodeQueue) {
+      enqueueEncode(static_cast<const SampleType *>(inputInfo.ptr),
+                    *lastChannelLayout, numChannels, numSamples);
+    } else {
+      writeSynchronously(static_cast<const SampleType *>(inputInfo.ptr),
+                         *lastChannelLayout, numChannels, numSamples);
+    }
+
+    {
+      ScopedTryWriteLock scopedTryWriteLock(objectLock);
+      if (!scopedTryWriteLock.isLocked()) {
+        throw std::runtime_error(
+            "Another thread is currently writing to this AudioFile. Note "
+            "that using multiple concurrent writers on the same AudioFile "
+            "object will produce nondeterministic results.");
+      }
+
+      framesWritten += numSamples;
+    }
+  }
+
+  template <typename SampleType>
+  void writeSynchronously(const SampleType *input, ChannelLayout channelLayout,
+                          unsigned int numChannels, unsigned int numSamples) {
     // Depending on the input channel layout, we need to copy data
     // differently. This loop is duplicated here to move the if statement
     // outside of the tight loop, as we don't need to re-check that the input
     // channel is still the same on every iteration of the loop.
-    switch (*lastChannelLayout) {
+    switch (channelLayout) {
     case ChannelLayout::Interleaved: {
       std::vector<std::vector<SampleType>> deinterleaveBuffers;
 
@@ -566,8 +629,7 @@ public:
           // We're de-interleaving the data here, so we can't use copyFrom.
           for (unsigned int i = 0; i < samplesToWrite; i++) {
             deinterleaveBuffers[c][i] =
-                ((SampleType
-                      *)(inputInfo.ptr))[((i + startSample) * numChannels) + c];
+                input[((i + startSample) * numChannels) + c];
           }
         }
 
@@ -587,7 +649,7 @@ public:
       const SampleType **channelPointers =
           (const SampleType **)alloca(numChannels * sizeof(SampleType *));
       for (int c = 0; c < numChannels; c++) {
-        channelPointers[c] = ((SampleType *)inputInfo.ptr) + (numSamples * c);
+        channelPointers[c] = input + (numSamples * c);
       }
 
       bool writeSuccessful = write(channelPointers, numChannels, numSamples);
@@ -602,18 +664,67 @@ public:
       throw std::runtime_error(
           "Internal error: got unexpected channel layout.");
     }
+  }
 
-    {
-      ScopedTryWriteLock scopedTryWriteLock(objectLock);
-      if (!scopedTryWriteLock.isLocked()) {
-        throw std::runtime_error(
-            "Another thread is currently writing to this AudioFile. Note "
-            "that using multiple concurrent writers on the same AudioFile "
-            "object will produce nondeterministic results.");
-      }
+  /**
+   * Copy the provided audio into a new (non-interleaved) buffer, and queue it
+   * to be encoded on this file's encoder thread. Blocks if the encoder thread
+   * has too much audio queued already.
+   */
+  template <typename SampleType>
+  void enqueueEncode(const SampleType *input, ChannelLayout channelLayout,
+                     unsigned int numChannels, unsigned int numSamples) {
+    // Hold objectLock for writing while queueing, so that close() can't
+    // destroy the queue out from under us:
+    ScopedTryWriteLock scopedTryWriteLock(objectLock);
+    if (!scopedTryWriteLock.isLocked()) {
+      throw std::runtime_error(
+          "Another thread is currently writing to this AudioFile. Note "
+          "that using multiple concurrent writers on the same AudioFile "
+          "object will produce nondeterministic results.");
+    }
 
-      framesWritten += numSamples;
+    if (!encodeQueue)
+      throw std::runtime_error("I/O operation on a closed file.");
+
+    if (numSamples == 0) {
+      encodeQueue->rethrowIfFailed();
+      return;
     }
+
+    std::vector<SampleType> samples((size_t)numChannels * numSamples);
+    switch (channelLayout) {
+    case ChannelLayout::Interleaved:
+      for (unsigned int c = 0; c < numChannels; c++) {
+        SampleType *channel = samples.data() + ((size_t)numSamples * c);
+        for (unsigned int i = 0; i < numSamples; i++) {
+          channel[i] = input[((size_t)i * numChannels) + c];
+        }
+      }
+      break;
+    case ChannelLayout::NotInterleaved:
+      std::memcpy(samples.data(), input, samples.size() * sizeof(SampleType));
+      break;
+    default:
+      throw std::runtime_error(
+          "Internal error: got unexpected channel layout.");
+    }
+
+    // The encoder thread doesn't take objectLock: all other operations that
+    // touch the writer wait for the queue to drain first.
+    encodeQueue->enqueue(
+        [this, samples = std::move(samples), numChannels, numSamples]() {
+          const SampleType **channelPointers =
+              (const SampleType **)alloca(numChannels * sizeof(SampleType *));
+          for (unsigned int c = 0; c < numChannels; c++) {
+            channelPointers[c] = samples.data() + ((size_t)numSamples * c);
+          }
+
+          if (!encode(channelPointers, numChannels, numSamples)) {
+            throw std::runtime_error("Unable to write data to audio file.");
+          }
+        },
+        numSamples);
   }
 
   template <typename TargetType, typename InputType,
@@ -671,7 +782,7 @@ public:
         }
       }
 
-      if (!write(channelPointers, numChannels, samplesToWrite)) {
+      if (!encode(channelPointers, numChannels, samplesToWrite)) {
         return false;
       }
     }
@@ -682,18 +793,29 @@ public:
   template <typename SampleType>
   bool write(const SampleType **channels, int numChannels,
              unsigned int numSamples) {
+    ScopedTryWriteLock scopedTryWriteLock(objectLock);
+    if (!scopedTryWriteLock.isLocked()) {
+      throw std::runtime_error(
+          "Another thread is currently writing to this AudioFile. Note "
+          "that using multiple concurrent writers on the same AudioFile "
+          "object will produce nondeterministic results.");
+    }
+    return encode(channels, numChannels, numSamples);
+  }
+
+  /**
+   * Pass audio to the underlying writer, converting it to the writer's
+   * preferred sample type if necessary. The caller must hold objectLock for
+   * writing (or must be the encoder thread).
+   */
+  template <typename SampleType>
+  bool encode(const SampleType **channels, int numChannels,
+              unsigned int numSamples) {
     if constexpr (std::is_integral<SampleType>::value) {
       if constexpr (std::is_same<SampleType, int>::value) {
         if (writer->isFloatingPoint()) {
           return writeConvertingTo<float>(channels, numChannels, numSamples);
         } else {
-          ScopedTryWriteLock scopedTryWriteLock(objectLock);
-          if (!scopedTryWriteLock.isLocked()) {
-            throw std::runtime_error(
-                "Another thread is currently writing to this AudioFile. Note "
-                "that using multiple concurrent writers on the same AudioFile "
-                "object will produce nondeterministic results.");
-          }
           return writer->write(channels, numSamples);
         }
       } else {
@@ -704,23 +826,9 @@ public:
         // Just pass the floating point data into the writer as if it were
         // integer data. If the writer requires floating-point input data, this
         // works (and is documented!)
-        ScopedTryWriteLock scopedTryWriteLock(objectLock);
-        if (!scopedTryWriteLock.isLocked()) {
-          throw std::runtime_error(
-              "Another thread is currently writing to this AudioFile. Note "
-              "that using multiple concurrent writers on the same AudioFile "
-              "object will produce nondeterministic results.");
-        }
         return writer->write((const int **)channels, numSamples);
       } else {
         // Convert floating-point to fixed point, but let JUCE do that for us:
-        ScopedTryWriteLock scopedTryWriteLock(objectLock);
-        if (!scopedTryWriteLock.isLocked()) {
-          throw std::runtime_error(
-              "Another thread is currently writing to this AudioFile. Note "
-              "that using multiple concurrent writers on the same AudioFile "
-              "object will produce nondeterministic results.");
-        }
         return writer->writeFromFloatArrays(channels, numChannels, numSamples);
       }
     } else {
@@ -738,6 +846,10 @@ public:
     {
       pybind11::gil_scoped_release release;
 
+      if (encodeQueue) {
+        encodeQueue->waitUntilIdle();
+      }
+
       ScopedTryWriteLock scopedTryWriteLock(objectLock);
       if (!scopedTryWriteLock.isLocked()) {
         throw std::runtime_error(
@@ -760,13 +872,47 @@ public:
     if (!writer)
       throw std::runtime_error("Cannot close closed file.");
 
+    // Finish encoding any queued audio before closing the file. Any error
+    // raised while doing so is re-thrown only after the file is closed.
+    std::exception_ptr encodeError;
+    if (encodeQueue) {
+      pybind11::gil_scoped_release release;
+      encodeError = encodeQueue->finish();
+    }
+
     ScopedTryWriteLock scopedTryWriteLock(objectLock);
     if (!scopedTryWriteLock.isLocked()) {
       throw std::runtime_error(
           "Another thread is currently writing to this AudioFile; it cannot "
           "be closed until the other thread completes its operation.");
     }
+    encodeQueue.reset();
+
+    // Some writers (i.e.: parallel FLAC) only encode and write their audio
+    // once all of it has been provided, which may fail:
+    bool finishSucceeded = true;
+    if (auto *deferredWriter =
+            dynamic_cast<juce::DeferredAudioFormatWriter *>(writer.get())) {
+      std::optional<pybind11::gil_scoped_release> release;
+      if (PyGILState_Check()) {
+        release.emplace();
+      }
+      finishSucceeded = deferredWriter->finish();
+    }
     writer.reset();
+
+    // Closing the writer flushes any data buffered by a PythonOutputStream,
+    // which may fail:
+    PythonException::raise();
+
+    if (encodeError) {
+      std::rethrow_exception(encodeError);
+    }
+
+    if (!finishSucceeded) {
+      throw std::runtime_error(
+          "Unable to write encoded audio to the output stream.");
+    }
   }
 
   bool isClosed() const {
@@ -877,6 +1023,13 @@ private:
   juce::ReadWriteLock objectLock;
   int framesWritten = 0;
   std::optional<ChannelLayout> lastChannelLayout = {};
+
+  // Only present if this file was opened with async_encode=True. Declared
+  // after the writer, so that it's destroyed (and drained) first. As
+  // close() resets it while holding objectLock for writing, it must only be
+  // accessed while holding objectLock.
+  std::unique_ptr<EncodeQueue> encodeQueue;
+  bool usesEncodeQueue = false;
 };
 
 inline py::class_<WriteableAudioFile, AudioFile,
@@ -923,6 +1076,28 @@ Args:
         may be passed as a string. The strings ``"best"``, ``"worst"``,
         ``"fastest"``, and ``"slowest"`` will also work for any codec.
 
+    async_encode:
+        If ``True``, audio passed to :meth:`write` will be copied into a
+        bounded queue and encoded on a background thread, allowing
+        :meth:`write` to return before encoding is complete. Any errors
+        raised while encoding will be raised from the next call to
+        :meth:`write`, :meth:`flush`, or :meth:`close`. Only supported
+        when writing to a filename, not to a file-like object.
+
+    buffer_size:
+        When writing to a file-like object, writes smaller than this many
+        bytes will be combined before being passed to the file-like object's
+        ``write`` method, reducing the number of calls into Python. As a
+        result, errors raised by ``write`` may only be reported by a later
+        call to :meth:`write`, :meth:`flush`, or :meth:`close`. Pass ``0``
+        to disable buffering.
+
+    workers:
+        When writing FLAC to a file-like object, the audio will be buffered in
+        memory and encoded in parallel on up to this many native threads when
+        the file is closed. Any errors raised while encoding or writing will be
+        raised from :meth:`close`. Has no effect on other formats.
+
 .. note::
     You probably don't want to use this class directly: all of the parameters
     accepted by the :class:`WriteableAudioFile` constructor will be accepted by
@@ -939,8 +1114,8 @@ inline void init_writeable_audio_file(
   pyWriteableAudioFile
       .def(py::init([](std::string filename, double sampleRate, int numChannels,
                        int bitDepth,
-                       std::optional<std::variant<std::string, float>> quality)
-                        -> WriteableAudioFile * {
+                       std::optional<std::variant<std::string, float>> quality,
+                       bool asyncEncode) -> WriteableAudioFile * {
              // This definition is only here to provide nice docstrings.
              throw std::runtime_error(
                  "Internal error: __init__ should never be called, as this "
@@ -948,42 +1123,51 @@ inline void init_writeable_audio_file(
            }),
            py::arg("filename"), py::arg("samplerate"),
            py::arg("num_channels") = 1, py::arg("bit_depth") = 16,
-           py::arg("quality") = py::none())
-      .def(py::init(
-               [](py::object filelike, double sampleRate, int numChannels,
-                  int bitDepth,
-                  std::optional<std::variant<std::string, float>> quality,
-                  std::optional<std::string> format) -> WriteableAudioFile * {
-                 // This definition is only here to provide nice docstrings.
-                 throw std::runtime_error(
-                     "Internal error: __init__ should never be called, as this "
-                     "class implements __new__.");
-               }),
+           py::arg("quality") = py::none(), py::kw_only(),
+           py::arg("async_encode") = false)
+      .def(py::init([](py::object filelike, double sampleRate, int numChannels,
+                       int bitDepth,
+                       std::optional<std::variant<std::string, float>> quality,
+                       std::optional<std::string> format, bool asyncEncode,
+                       int bufferSize,
+                       std::optional<int> workers) -> WriteableAudioFile * {
+             // This definition is only here to provide nice docstrings.
+             throw std::runtime_error(
+                 "Internal error: __init__ should never be called, as this "
+                 "class implements __new__.");
+           }),
            py::arg("file_like"), py::arg("samplerate"),
            py::arg("num_channels") = 1, py::arg("bit_depth") = 16,
-           py::arg("quality") = py::none(), py::arg("format") = py::none())
+           py::arg("quality") = py::none(), py::arg("format") = py::none(),
+           py::kw_only(), py::arg("async_encode") = false,
+           py::arg("buffer_size") = DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES,
+           py::arg("workers") = py::none())
       .def_static(
           "__new__",
           [](const py::object *, std::string filename,
              std::optional<double> sampleRate, int numChannels, int bitDepth,
-             std::optional<std::variant<std::string, float>> quality) {
+             std::optional<std::variant<std::string, float>> quality,
+             bool asyncEncode) {
             if (!sampleRate) {
               throw py::type_error(
                   "Opening an audio file for writing requires a samplerate "
                   "argument to be provided.");
             }
-            return std::make_shared<WriteableAudioFile>(
-                filename, *sampleRate, numChannels, bitDepth, quality);
+            return std::make_shared<WriteableAudioFile>(filename, *sampleRate,
+                                                        numChannels, bitDepth,
+                                                        quality, asyncEncode);
           },
           py::arg("cls"), py::arg("filename"),
           py::arg("samplerate") = py::none(), py::arg("num_channels") = 1,
-          py::arg("bit_depth") = 16, py::arg("quality") = py::none())
+          py::arg("bit_depth") = 16, py::arg("quality") = py::none(),
+          py::kw_only(), py::arg("async_encode") = false)
       .def_static(
           "__new__",
           [](const py::object *, py::object filelike,
              std::optional<double> sampleRate, int numChannels, int bitDepth,
              std::optional<std::variant<std::string, float>> quality,
-             std::optional<std::string> format) {
+             std::optional<std::string> format, bool asyncEncode,
+             int bufferSize, std::optional<int> workers) {
             if (!sampleRate) {
               throw py::type_error(
                   "Opening an audio file for writing requires a samplerate "
@@ -995,8 +1179,11 @@ inline void init_writeable_audio_file(
                   "write, seek, seekable, and tell methods), but received: " +
                   py::repr(filelike).cast<std::string>());
             }
+            validateFileLikeBufferSize(bufferSize);
+            validateNumEncoderThreads(workers);
 
-            auto stream = std::make_unique<PythonOutputStream>(filelike);
+            auto stream =
+                std::make_unique<PythonOutputStream>(filelike, bufferSize);
             if (!format && !stream->getFilename()) {
               throw py::type_error(
                   "Unable to infer audio file format for writing. Expected "
@@ -1009,12 +1196,16 @@ inline void init_writeable_audio_file(
 
             return std::make_shared<WriteableAudioFile>(
                 format.value_or(""), std::move(stream), *sampleRate,
-                numChannels, bitDepth, quality);
+                numChannels, bitDepth, quality, asyncEncode,
+                workers.value_or(1));
           },
           py::arg("cls"), py::arg("file_like"),
           py::arg("samplerate") = py::none(), py::arg("num_channels") = 1,
           py::arg("bit_depth") = 16, py::arg("quality") = py::none(),
-          py::arg("format") = py::none())
+          py::arg("format") = py::none(), py::kw_only(),
+          py::arg("async_encode") = false,
+          py::arg("buffer_size") = DEFAULT_FILE_LIKE_BUFFER_SIZE_BYTES,
+          py::arg("workers") = py::none())
       .def(
           "write",
           [](WriteableAudioFile &file, py::array samples) {
@@ -1,3 +1,10 @@
+#include <map>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <utility>
+#include <vector>
+
 #include "../JuceHeader.h"
 
 inline double sinc(const double x) {
@@ -332,6 +339,317 @@ private:
   JUCE_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(FastWindowedSincInterpolator)
 };
 
+/**
+   A windowed-sinc interpolator that produces output numerically close to
+   that of FastWindowedSincInterpolator, but which precomputes a bank of filters
+   (one per output phase) when the speed ratio can be expressed as a fraction
+   with a small denominator (i.e.: 44100/48000 = 147/160). The sub-sample
+   position is then tracked as an integer numerator over that denominator, so
+   every output sample is a single dot product against a precomputed filter,
+   with no floating-point drift.
+
+   Speed ratios that can't be expressed this way fall back to computing each
+   filter on the fly, just like FastWindowedSincInterpolator does.
+*/
+template <class InterpolatorTraits> class PolyphaseWindowedSincInterpolator {
+public:
+  static constexpr int BufferSize = InterpolatorTraits::BufferSize;
+
+  // The largest denominator (i.e.: number of filters) to precompute a filter
+  // bank for. 2,560 covers every ratio between common sample rates from 8kHz
+  // to 192kHz; the largest of these is 11.025kHz to 192kHz (441/2560), which
+  // needs a filter bank of 2,560 x BufferSize floats.
+  static constexpr int MaxNumPhases = 2560;
+
+  static_assert(BufferSize % 8 == 0,
+                "dotProduct() requires a multiple of 8 coefficients.");
+
+  PolyphaseWindowedSincInterpolator() noexcept {
+    lookupTable = &getSincTable<InterpolatorTraits::NumCrossings,
+                                InterpolatorTraits::DistanceBetweenCrossings>();
+    reset();
+  }
+
+  PolyphaseWindowedSincInterpolator(
+      PolyphaseWindowedSincInterpolator &&) noexcept = default;
+  PolyphaseWindowedSincInterpolator &
+  operator=(PolyphaseWindowedSincInterpolator &&) noexcept = default;
+
+  static constexpr float getBaseLatency() noexcept {
+    return InterpolatorTraits::algorithmicLatency;
+  }
+
+  void reset() noexcept {
+    indexBuffer = 0;
+    subSamplePos = 1.0;
+    phase = 0;
+    numPhases = 0;
+    currentSpeedRatio = 0;
+    numOutputsAtCurrentSpeedRatio = 0;
+    std::fill(std::begin(lastInputSamples), std::end(lastInputSamples), 0.0f);
+  }
+
+  int process(double speedRatio, const float *inputSamples,
+              float *outputSamples, int numOutputSamplesToProduce) noexcept {
+    if (speedRatio != currentSpeedRatio) {
+      setSpeedRatio(speedRatio);
+    }
+
+    if (numPhases == 0) {
+      return interpolate(inputSamples, outputSamples,
+                         numOutputSamplesToProduce);
+    }
+
+    numOutputsAtCurrentSpeedRatio += numOutputSamplesToProduce;
+    if (filterBankSpeedRatio != speedRatio) {
+      // Only build a filter bank once it'll be used at least as many times
+      // as it has filters; short calls (i.e.: those used to set the sub-sample
+      // position after seeking) are cheaper to compute directly:
+      if (numOutputsAtCurrentSpeedRatio < numPhases) {
+        return interpolatePhases<false>(inputSamples, outputSamples,
+                                        numOutputSamplesToProduce);
+      }
+
+      buildFilterBank();
+    }
+
+    return interpolatePhases<true>(inputSamples, outputSamples,
+                                   numOutputSamplesToProduce);
+  }
+
+  /**
+   * If the provided ratio is (within floating-point error) equal to a fraction
+   * with a denominator of at most maxDenominator, return that fraction's
+   * numerator and denominator.
+   */
+  static std::optional<std::pair<long long, long long>>
+  asFraction(double ratio, long long maxDenominator) noexcept {
+    if (!(ratio > 0) || !std::isfinite(ratio)) {
+      return {};
+    }
+
+    // Walk the continued fraction expansion of the ratio, stopping at the
+    // first convergent that matches:
+    long long previousNumerator = 1, numerator = (long long)std::floor(ratio);
+    long long previousDenominator = 0, denominator = 1;
+    double remainder = ratio - std::floor(ratio);
+
+    while (true) {
+      if (std::abs((double)numerator / (double)denominator - ratio) <=
+          ratio * 1e-12) {
+        return {{numerator, denominator}};
+      }
+
+      if (remainder < 1e-12) {
+        return {};
+      }
+
+      double reciprocal = 1.0 / remainder;
+      long long term = (long long)std::floor(reciprocal);
+      remainder = reciprocal - term;
+
+      long long nextDenominator = term * denominator + previousDenominator;
+      if (nextDenominator > maxDenominator) {
+        return {};
+      }
+
+      long long nextNumerator = term * numerator + previousNumerator;
+      previousNumerator = numerator;
+      previousDenominator = denominator;
+      numerator = nextNumerator;
+      denominator = nextDenominator;
+    }
+  }
+
+private:
+  void setSpeedRatio(double speedRatio) noexcept {
+    double pos = numPhases > 0 ? (double)phase / numPhases : subSamplePos;
+    currentSpeedRatio = speedRatio;
+    numOutputsAtCurrentSpeedRatio = 0;
+
+    if (auto fraction = asFraction(speedRatio, MaxNumPhases)) {
+      phaseIncrement = fraction->first;
+      numPhases = fraction->second;
+      phase = std::llround(pos * numPhases);
+    } else {
+      numPhases = 0;
+      subSamplePos = pos;
+    }
+  }
+
+  /**
+   * Compute the filter for the sub-sample position (phaseIndex / numPhases)
+   * at the given speed ratio.
+   */
+  static void computeFilter(const std::vector<float> &lookupTable,
+                            double speedRatio, long long phaseIndex,
+                            long long numPhases, float *filter) noexcept {
+    // Bake the gain correction applied by valueAtOffset into the filter:
+    const float gain = 1.0f / (float)std::max(speedRatio, 1.0);
+
+    auto sincValues = InterpolatorTraits::subsampleSincFilter(
+        lookupTable.data(), (float)((double)phaseIndex / numPhases),
+        speedRatio);
+    for (int i = 0; i < BufferSize; i++) {
+      filter[i] = sincValues[i] * gain;
+    }
+  }
+
+  /**
+   * Get the filter bank for the speed ratio (phaseIncrement / numPhases).
+   * Filter banks are immutable once built, so a single bank is shared between
+   * every interpolator (i.e.: one per channel) using the same ratio, and is
+   * freed once none of them use it any longer.
+   */
+  static std::shared_ptr<const std::vector<float>>
+  getFilterBank(const std::vector<float> &lookupTable, long long phaseIncrement,
+                long long numPhases) {
+    static std::mutex mutex;
+    static std::map<std::pair<long long, long long>,
+                    std::weak_ptr<const std::vector<float>>>
+        filterBanks;
+
+    std::scoped_lock lock(mutex);
+    std::weak_ptr<const std::vector<float>> &cached =
+        filterBanks[{phaseIncrement, numPhases}];
+    if (auto filterBank = cached.lock()) {
+      return filterBank;
+    }
+
+    double speedRatio = (double)phaseIncrement / (double)numPhases;
+    auto filterBank =
+        std::make_shared<std::vector<float>>(numPhases * BufferSize);
+    for (long long i = 0; i < numPhases; i++) {
+      computeFilter(lookupTable, speedRatio, i, numPhases,
+                    filterBank->data() + i * BufferSize);
+    }
+    cached = filterBank;
+
+    // Don't let banks for ratios that are no longer used pile up:
+    for (auto it = filterBanks.begin(); it != filterBanks.end();) {
+      it = it->second.expired() ? filterBanks.erase(it) : std::next(it);
+    }
+    return filterBank;
+  }
+
+  void buildFilterBank() {
+    filterBank = getFilterBank(*lookupTable, phaseIncrement, numPhases);
+    filterBankSpeedRatio = currentSpeedRatio;
+  }
+
+  forcedinline void pushInterpolationSample(float newValue) noexcept {
+    // Each sample is stored twice, so that the most recent BufferSize samples
+    // are always contiguous in memory, starting at indexBuffer:
+    lastInputSamples[indexBuffer] = newValue;
+    lastInputSamples[indexBuffer + BufferSize] = newValue;
+
+    if (++indexBuffer == BufferSize)
+      indexBuffer = 0;
+  }
+
+  /**
+   * Compute the dot product of two arrays of BufferSize floats. Keeping eight
+   * independent partial sums allows the compiler to vectorize this loop
+   * without needing to reorder floating-point additions itself.
+   */
+  static forcedinline float dotProduct(const float *__restrict a,
+                                       const float *__restrict b) noexcept {
+    float sums[8] = {0, 0, 0, 0, 0, 0, 0, 0};
+    for (int i = 0; i < BufferSize; i += 8) {
+#pragma clang loop vectorize(enable) interleave(enable)
+#pragma unroll
+      for (int j = 0; j < 8; j++) {
+        sums[j] += a[i + j] * b[i + j];
+      }
+    }
+    return ((sums[0] + sums[4]) + (sums[1] + sums[5])) +
+           ((sums[2] + sums[6]) + (sums[3] + sums[7]));
+  }
+
+  /**
+   * Resample using the filter for each phase, either looked up from the
+   * filter bank or computed on the fly.
+   */
+  template <bool UseFilterBank>
+  int interpolatePhases(const float *input, float *output,
+                        int numOutputSamplesToProduce) noexcept {
+    long long currentPhase = phase;
+    int numUsed = 0;
+
+    float filter[BufferSize];
+    while (numOutputSamplesToProduce > 0) {
+      while (currentPhase >= numPhases) {
+        pushInterpolationSample(input[numUsed++]);
+        currentPhase -= numPhases;
+      }
+
+      if constexpr (UseFilterBank) {
+        *output++ = dotProduct(lastInputSamples + indexBuffer,
+                               filterBank->data() + currentPhase * BufferSize);
+      } else {
+        computeFilter(*lookupTable, currentSpeedRatio, currentPhase, numPhases,
+                      filter);
+        *output++ = dotProduct(lastInputSamples + indexBuffer, filter);
+      }
+      currentPhase += phaseIncrement;
+      --numOutputSamplesToProduce;
+    }
+
+    phase = currentPhase;
+    return numUsed;
+  }
+
+  int interpolate(const float *input, float *output,
+                  int numOutputSamplesToProduce) noexcept {
+    auto pos = subSamplePos;
+    int numUsed = 0;
+
+    const float effectiveSpeedRatio = (float)std::max(currentSpeedRatio, 1.0);
+    while (numOutputSamplesToProduce > 0) {
+      while (pos >= 1.0) {
+        pushInterpolationSample(input[numUsed++]);
+        pos -= 1.0;
+      }
+
+      auto sincValues = InterpolatorTraits::subsampleSincFilter(
+          lookupTable->data(), (float)pos, currentSpeedRatio);
+      *output++ =
+          dotProduct(lastInputSamples + indexBuffer, sincValues.data()) /
+          effectiveSpeedRatio;
+      pos += currentSpeedRatio;
+      --numOutputSamplesToProduce;
+    }
+
+    subSamplePos = pos;
+    return numUsed;
+  }
+
+  float lastInputSamples[(size_t)BufferSize * 2];
+  int indexBuffer = 0;
+
+  double currentSpeedRatio = 0;
+  long long numOutputsAtCurrentSpeedRatio = 0;
+
+  // Used if the current speed ratio is not a small fraction:
+  double subSamplePos = 1.0;
+
+  // Used if the current speed ratio is a small fraction, in which case the
+  // sub-sample position is phase / numPhases:
+  long long phase = 0;
+  long long numPhases = 0;
+  long long phaseIncrement = 0;
+
+  // numPhases filters of BufferSize coefficients each, for
+  // filterBankSpeedRatio, shared with other interpolators at the same ratio:
+  std::shared_ptr<const std::vector<float>> filterBank;
+  double filterBankSpeedRatio = 0;
+
+  const std::vector<float> *lookupTable;
+
+  JUCE_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(
+      PolyphaseWindowedSincInterpolator)
+};
+
 class FastInterpolators {
 public:
 #define WINDOWEDSINC(numCrossings, precision)                                  \
@@ -342,6 +660,8 @@ public:
   using WindowedSinc32 = WINDOWEDSINC(32, 512);
   using WindowedSinc16 = WINDOWEDSINC(16, 512);
   using WindowedSinc8 = WINDOWEDSINC(8, 512);
+  using PolyphaseSinc32 =
+      PolyphaseWindowedSincInterpolator<FastWindowedSincTraits<32, 512>>;
 };
 
 }; // namespace juce
\ No newline at end of file
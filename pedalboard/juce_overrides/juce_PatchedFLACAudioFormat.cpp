@@ -81,6 +81,9 @@
 #include <stdio.h>
 #include <stdlib.h>
 
+#include <thread>
+#include <vector>
+
 namespace juce {
 
 namespace PatchedFlacNamespace {
@@ -374,6 +377,46 @@ private:
   JUCE_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(PatchedFlacReader)
 };
 
+//==============================================================================
+static void
+configureFlacEncoder(PatchedFlacNamespace::FLAC__StreamEncoder *encoder,
+                     uint32 numChannels, uint32 bitsPerSample,
+                     double sampleRate, int qualityOptionIndex) {
+  if (qualityOptionIndex > 0)
+    FLAC__stream_encoder_set_compression_level(
+        encoder, (uint32)jmin(8, qualityOptionIndex));
+
+  FLAC__stream_encoder_set_do_mid_side_stereo(encoder, numChannels == 2);
+  FLAC__stream_encoder_set_loose_mid_side_stereo(encoder, numChannels == 2);
+  FLAC__stream_encoder_set_channels(encoder, numChannels);
+  FLAC__stream_encoder_set_bits_per_sample(
+      encoder, jmin((unsigned int)24, bitsPerSample));
+  FLAC__stream_encoder_set_sample_rate(encoder, (unsigned int)sampleRate);
+  FLAC__stream_encoder_set_blocksize(encoder, 0);
+  FLAC__stream_encoder_set_do_escape_coding(encoder, true);
+}
+
+/** Returns a seek table containing a single placeholder, or nullptr. */
+static PatchedFlacNamespace::FLAC__StreamMetadata *createFlacSeekTable() {
+  // Create a seek table, which is empty by default:
+  auto *seektable = PatchedFlacNamespace::FLAC__metadata_object_new(
+      PatchedFlacNamespace::FLAC__METADATA_TYPE_SEEKTABLE);
+  if (!seektable)
+    return nullptr;
+
+  // Write a single placeholder to the seek table.
+  if (!PatchedFlacNamespace::
+          FLAC__metadata_object_seektable_template_append_placeholders(
+              seektable, /* number of placeholder elements */ 1) ||
+      !PatchedFlacNamespace::FLAC__metadata_object_seektable_template_sort(
+          seektable, /*compact=*/true)) {
+    PatchedFlacNamespace::FLAC__metadata_object_delete(seektable);
+    return nullptr;
+  }
+
+  return seektable;
+}
+
 //==============================================================================
 class PatchedFlacWriter : public AudioFormatWriter {
 public:
@@ -383,36 +426,13 @@ public:
         streamStartPos(output != nullptr ? jmax(output->getPosition(), 0ll)
                                          : 0ll) {
     encoder = PatchedFlacNamespace::FLAC__stream_encoder_new();
+    configureFlacEncoder(encoder, numChannels, bitsPerSample, sampleRate,
+                         qualityOptionIndex);
 
-    if (qualityOptionIndex > 0)
-      FLAC__stream_encoder_set_compression_level(
-          encoder, (uint32)jmin(8, qualityOptionIndex));
-
-    FLAC__stream_encoder_set_do_mid_side_stereo(encoder, numChannels == 2);
-    FLAC__stream_encoder_set_loose_mid_side_stereo(encoder, numChannels == 2);
-    FLAC__stream_encoder_set_channels(encoder, numChannels);
-    FLAC__stream_encoder_set_bits_per_sample(
-        encoder, jmin((unsigned int)24, bitsPerSample));
-    FLAC__stream_encoder_set_sample_rate(encoder, (unsigned int)sampleRate);
-    FLAC__stream_encoder_set_blocksize(encoder, 0);
-    FLAC__stream_encoder_set_do_escape_coding(encoder, true);
-
-    // Create a seek table, which is empty by default:
-    seektable = PatchedFlacNamespace::FLAC__metadata_object_new(
-        PatchedFlacNamespace::FLAC__METADATA_TYPE_SEEKTABLE);
+    seektable = createFlacSeekTable();
     if (!seektable)
       return;
 
-    // Write a single placeholder to the seek table.
-    if (!PatchedFlacNamespace::
-            FLAC__metadata_object_seektable_template_append_placeholders(
-                seektable, /* number of placeholder elements */ 1))
-      return;
-
-    if (!PatchedFlacNamespace::FLAC__metadata_object_seektable_template_sort(
-            seektable, /*compact=*/true))
-      return;
-
     if (!PatchedFlacNamespace::FLAC__stream_encoder_set_metadata(
             encoder, &seektable, 1)) {
       return;
@@ -536,6 +556,402 @@ private:
   JUCE_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(PatchedFlacWriter)
 };
 
+//==============================================================================
+/**
+    A FLAC writer that buffers all of the audio written to it, then (when
+    finished) splits that audio into frame-aligned segments, encodes each
+    segment on its own thread, and stitches the resulting frames together
+    into a single FLAC stream.
+
+    FLAC frames are encoded independently of one another, so the only parts
+    of the output that depend on more than one segment are the STREAMINFO
+    block (whose length, frame size and MD5 fields are filled in here) and
+    the frame number stored in each frame's header (which is rewritten here).
+*/
+class PatchedParallelFlacWriter : public DeferredAudioFormatWriter {
+public:
+  PatchedParallelFlacWriter(OutputStream *out, double rate, uint32 numChans,
+                            uint32 bits, int qualityOptionIndex, int numThreads)
+      : DeferredAudioFormatWriter(out, flacFormatName, rate, numChans, bits),
+        qualityOptionIndex(qualityOptionIndex), numThreads(jmax(1, numThreads)),
+        samples(numChans) {
+    // Make sure that these parameters are valid before accepting any audio,
+    // and find out which block size the encoder will use for them:
+    auto *encoder = PatchedFlacNamespace::FLAC__stream_encoder_new();
+    if (!encoder)
+      return;
+
+    configureFlacEncoder(encoder, numChannels, bitsPerSample, sampleRate,
+                         qualityOptionIndex);
+    EncodedSegment probe;
+    ok = FLAC__stream_encoder_init_stream(encoder, segmentWriteCallback,
+                                          nullptr, nullptr, nullptr, &probe) ==
+         PatchedFlacNamespace::FLAC__STREAM_ENCODER_INIT_STATUS_OK;
+    if (ok) {
+      blockSize =
+          PatchedFlacNamespace::FLAC__stream_encoder_get_blocksize(encoder);
+      PatchedFlacNamespace::FLAC__stream_encoder_finish(encoder);
+    }
+    PatchedFlacNamespace::FLAC__stream_encoder_delete(encoder);
+  }
+
+  ~PatchedParallelFlacWriter() override {
+    if (ok) {
+      finish();
+    } else {
+      output = nullptr; // to stop the base class deleting this, as it needs to
+                        // be returned to the caller of createWriter()
+    }
+  }
+
+  //==============================================================================
+  bool write(const int **samplesToWrite, int numSamples) override {
+    if (!ok)
+      return false;
+
+    auto bitsToShift = 32 - (int)bitsPerSample;
+    auto start = (size_t)getNumSamples();
+
+    for (auto &channel : samples)
+      channel.resize(start + (size_t)numSamples, 0);
+
+    for (unsigned int i = 0; i < numChannels; ++i) {
+      if (samplesToWrite[i] == nullptr)
+        break;
+
+      for (int j = 0; j < numSamples; ++j)
+        samples[i][start + (size_t)j] = samplesToWrite[i][j] >> bitsToShift;
+    }
+
+    return true;
+  }
+
+  bool finish() override {
+    if (!ok)
+      return false;
+
+    if (!finished) {
+      finished = true;
+      try {
+        finishedSuccessfully = encodeAndWrite();
+      } catch (...) {
+        finishedSuccessfully = false;
+      }
+      output->flush();
+    }
+
+    return finishedSuccessfully;
+  }
+
+  bool ok = false;
+
+private:
+  struct EncodedSegment {
+    MemoryBlock data;
+    size_t metadataSize = 0;
+    std::vector<size_t> frameEnds;
+    bool ok = false;
+  };
+
+  static PatchedFlacNamespace::FLAC__StreamEncoderWriteStatus
+  segmentWriteCallback(const PatchedFlacNamespace::FLAC__StreamEncoder *,
+                       const PatchedFlacNamespace::FLAC__byte buffer[],
+                       size_t bytes, unsigned int samples,
+                       unsigned int /*current_frame*/, void *client_data) {
+    auto *segment = static_cast<EncodedSegment *>(client_data);
+    segment->data.append(buffer, bytes);
+
+    // libFLAC passes each frame to this callback in a single call:
+    if (samples > 0 || !segment->frameEnds.empty())
+      segment->frameEnds.push_back(segment->data.getSize());
+    else
+      segment->metadataSize = segment->data.getSize();
+
+    return PatchedFlacNamespace::FLAC__STREAM_ENCODER_WRITE_STATUS_OK;
+  }
+
+  int64 getNumSamples() const {
+    return samples.empty() ? 0 : (int64)samples[0].size();
+  }
+
+  bool encodeSegment(EncodedSegment &segment, int64 startSample,
+                     int64 numSamples, bool includeMetadata) {
+    auto *encoder = PatchedFlacNamespace::FLAC__stream_encoder_new();
+    if (!encoder)
+      return false;
+
+    configureFlacEncoder(encoder, numChannels, bitsPerSample, sampleRate,
+                         qualityOptionIndex);
+    FLAC__stream_encoder_set_blocksize(encoder, blockSize);
+
+    // The MD5 signature covers the entire stream, so it's computed separately:
+    FLAC__stream_encoder_set_do_md5(encoder, false);
+
+    PatchedFlacNamespace::FLAC__StreamMetadata *seektable = nullptr;
+    if (includeMetadata) {
+      seektable = createFlacSeekTable();
+      if (seektable)
+        PatchedFlacNamespace::FLAC__stream_encoder_set_metadata(encoder,
+                                                                &seektable, 1);
+    }
+
+    bool succeeded =
+        FLAC__stream_encoder_init_stream(encoder, segmentWriteCallback, nullptr,
+                                         nullptr, nullptr, &segment) ==
+        PatchedFlacNamespace::FLAC__STREAM_ENCODER_INIT_STATUS_OK;
+
+    HeapBlock<const PatchedFlacNamespace::FLAC__int32 *> channels(numChannels);
+    for (int64 offset = 0; succeeded && offset < numSamples;
+         offset += blockSize) {
+      auto samplesToEncode =
+          (unsigned)jmin((int64)blockSize, numSamples - offset);
+      for (unsigned int i = 0; i < numChannels; ++i)
+        channels[i] = samples[i].data() + startSample + offset;
+
+      succeeded = FLAC__stream_encoder_process(encoder, channels.get(),
+                                               samplesToEncode) != 0;
+    }
+
+    succeeded =
+        PatchedFlacNamespace::FLAC__stream_encoder_finish(encoder) && succeeded;
+    PatchedFlacNamespace::FLAC__stream_encoder_delete(encoder);
+    if (seektable)
+      PatchedFlacNamespace::FLAC__metadata_object_delete(seektable);
+
+    return succeeded;
+  }
+
+  void computeMD5(PatchedFlacNamespace::FLAC__byte digest[16]) {
+    PatchedFlacNamespace::FLAC__MD5Context context;
+    PatchedFlacNamespace::FLAC__MD5Init(&context);
+
+    const int64 numSamples = getNumSamples();
+    HeapBlock<const PatchedFlacNamespace::FLAC__int32 *> channels(numChannels);
+    for (int64 offset = 0; offset < numSamples; offset += blockSize) {
+      auto samplesToAdd = (unsigned)jmin((int64)blockSize, numSamples - offset);
+      for (unsigned int i = 0; i < numChannels; ++i)
+        channels[i] = samples[i].data() + offset;
+
+      PatchedFlacNamespace::FLAC__MD5Accumulate(&context, channels.get(),
+                                                numChannels, samplesToAdd,
+                                                (bitsPerSample + 7) / 8);
+    }
+
+    PatchedFlacNamespace::FLAC__MD5Final(digest, &context);
+  }
+
+  /** The number of bytes used to store the given frame number in a header. */
+  static size_t getCodedNumberLength(uint32 value) {
+    if (value < 0x80)
+      return 1;
+    if (value < 0x800)
+      return 2;
+    if (value < 0x10000)
+      return 3;
+    if (value < 0x200000)
+      return 4;
+    if (value < 0x4000000)
+      return 5;
+    return 6;
+  }
+
+  /** Returns the length of the coded number starting with the given byte. */
+  static size_t getCodedNumberLengthFromFirstByte(uint8 firstByte) {
+    size_t length = 0;
+    while (length < 8 && (firstByte & (0x80 >> length)))
+      length++;
+    return length == 0 ? 1 : length;
+  }
+
+  static void writeCodedNumber(uint32 value, uint8 *dest) {
+    auto length = getCodedNumberLength(value);
+    if (length == 1) {
+      dest[0] = (uint8)value;
+      return;
+    }
+
+    for (size_t i = length - 1; i > 0; --i) {
+      dest[i] = (uint8)(0x80 | (value & 0x3f));
+      value >>= 6;
+    }
+    dest[0] = (uint8)((0xff00 >> length) | value);
+  }
+
+  /**
+      Returns the offset of the frame number within a frame's header, the
+      length of the coded frame number, and the length of the header
+      (excluding its CRC-8), or false if the header is malformed.
+  */
+  static bool parseFrameHeader(const uint8 *frame, size_t frameSize,
+                               size_t &numberLength, size_t &headerLength) {
+    // Every frame starts with a 14-bit sync code and the fixed-blocksize bit:
+    if (frameSize < 6 || frame[0] != 0xff || frame[1] != 0xf8)
+      return false;
+
+    numberLength = getCodedNumberLengthFromFirstByte(frame[4]);
+    headerLength = 4 + numberLength;
+
+    auto blockSizeCode = frame[2] >> 4;
+    if (blockSizeCode == 6)
+      headerLength += 1;
+    else if (blockSizeCode == 7)
+      headerLength += 2;
+
+    auto sampleRateCode = frame[2] & 0x0f;
+    if (sampleRateCode == 12)
+      headerLength += 1;
+    else if (sampleRateCode == 13 || sampleRateCode == 14)
+      headerLength += 2;
+
+    // The header, its CRC-8 and the frame's CRC-16 must all fit:
+    return headerLength + 3 <= frameSize;
+  }
+
+  /** Write a copy of the given frame with a new frame number. */
+  bool writeRenumberedFrame(const uint8 *frame, size_t frameSize,
+                            uint32 frameNumber, MemoryBlock &scratch) {
+    size_t numberLength, headerLength;
+    if (!parseFrameHeader(frame, frameSize, numberLength, headerLength))
+      return false;
+
+    auto newNumberLength = getCodedNumberLength(frameNumber);
+    auto newFrameSize = frameSize - numberLength + newNumberLength;
+    scratch.ensureSize(newFrameSize);
+    auto *dest = static_cast<uint8 *>(scratch.getData());
+
+    memcpy(dest, frame, 4);
+    writeCodedNumber(frameNumber, dest + 4);
+    memcpy(dest + 4 + newNumberLength, frame + 4 + numberLength,
+           headerLength - 4 - numberLength);
+
+    auto newHeaderLength = headerLength - numberLength + newNumberLength;
+    dest[newHeaderLength] =
+        PatchedFlacNamespace::FLAC__crc8(dest, (unsigned)newHeaderLength);
+
+    // Copy the subframes, then recompute the CRC-16 over the whole frame:
+    memcpy(dest + newHeaderLength + 1, frame + headerLength + 1,
+           frameSize - headerLength - 1 - 2);
+    auto crc =
+        PatchedFlacNamespace::FLAC__crc16(dest, (unsigned)(newFrameSize - 2));
+    dest[newFrameSize - 2] = (uint8)(crc >> 8);
+    dest[newFrameSize - 1] = (uint8)(crc & 0xff);
+
+    return output->write(dest, newFrameSize);
+  }
+
+  bool encodeAndWrite() {
+    const int64 numSamples = getNumSamples();
+    const int64 numBlocks =
+        jmax((int64)1, (numSamples + blockSize - 1) / blockSize);
+    const int64 blocksPerSegment =
+        (numBlocks + numThreads - 1) / (int64)numThreads;
+    const int numSegments =
+        (int)((numBlocks + blocksPerSegment - 1) / blocksPerSegment);
+
+    std::vector<EncodedSegment> segments((size_t)numSegments);
+    auto encode = [&](int i) {
+      int64 start = i * blocksPerSegment * blockSize;
+      int64 end = jmin(numSamples, start + blocksPerSegment * blockSize);
+      try {
+        segments[(size_t)i].ok =
+            encodeSegment(segments[(size_t)i], jmin(start, numSamples),
+                          jmax((int64)0, end - start), i == 0);
+      } catch (...) {
+        segments[(size_t)i].ok = false;
+      }
+    };
+
+    // The calling thread computes the MD5 signature of the entire stream
+    // while the segments are being encoded:
+    std::vector<std::thread> threads;
+    int numSegmentsStarted = 0;
+    try {
+      threads.reserve((size_t)numSegments);
+      for (; numSegmentsStarted < numSegments; ++numSegmentsStarted)
+        threads.emplace_back(encode, numSegmentsStarted);
+    } catch (const std::exception &) {
+      // If no (more) threads can be started, encode the remaining segments
+      // on this thread instead.
+    }
+
+    PatchedFlacNamespace::FLAC__byte md5[16];
+    computeMD5(md5);
+
+    for (int i = numSegmentsStarted; i < numSegments; ++i)
+      encode(i);
+
+    for (auto &thread : threads)
+      thread.join();
+
+    for (auto &segment : segments)
+      if (!segment.ok ||
+          (&segment == &segments[0] && segment.metadataSize < 4 + 4 + 34))
+        return false;
+
+    // Frame numbers are stored with a variable number of bytes, so
+    // renumbering frames may change their sizes:
+    uint32 minFrameSize = 0, maxFrameSize = 0;
+    uint32 frameNumber = 0;
+    for (auto &segment : segments) {
+      size_t frameStart = segment.metadataSize;
+      for (auto frameEnd : segment.frameEnds) {
+        size_t numberLength, headerLength;
+        if (!parseFrameHeader(
+                static_cast<const uint8 *>(segment.data.getData()) + frameStart,
+                frameEnd - frameStart, numberLength, headerLength))
+          return false;
+
+        auto frameSize = (uint32)(frameEnd - frameStart - numberLength +
+                                  getCodedNumberLength(frameNumber));
+        minFrameSize =
+            minFrameSize == 0 ? frameSize : jmin(minFrameSize, frameSize);
+        maxFrameSize = jmax(maxFrameSize, frameSize);
+
+        frameStart = frameEnd;
+        frameNumber++;
+      }
+    }
+
+    // Copy the "fLaC" marker and metadata blocks from the first segment, and
+    // fill in the STREAMINFO block (which always comes first):
+    MemoryBlock header(segments[0].data.getData(), segments[0].metadataSize);
+    auto *streamInfo = static_cast<uint8 *>(header.getData()) + 4 + 4;
+    PatchedFlacWriter::packUint32(minFrameSize, streamInfo + 4, 3);
+    PatchedFlacWriter::packUint32(maxFrameSize, streamInfo + 7, 3);
+    streamInfo[13] =
+        (uint8)((streamInfo[13] & 0xf0) | (((uint64)numSamples >> 32) & 0x0f));
+    PatchedFlacWriter::packUint32((uint32)numSamples, streamInfo + 14, 4);
+    memcpy(streamInfo + 18, md5, 16);
+
+    if (!output->write(header.getData(), header.getSize()))
+      return false;
+
+    MemoryBlock scratch;
+    frameNumber = 0;
+    for (auto &segment : segments) {
+      auto *data = static_cast<const uint8 *>(segment.data.getData());
+      size_t frameStart = segment.metadataSize;
+      for (auto frameEnd : segment.frameEnds) {
+        if (!writeRenumberedFrame(data + frameStart, frameEnd - frameStart,
+                                  frameNumber, scratch))
+          return false;
+        frameStart = frameEnd;
+        frameNumber++;
+      }
+    }
+
+    return true;
+  }
+
+  int qualityOptionIndex;
+  int numThreads;
+  uint32 blockSize = 0;
+  bool finished = false, finishedSuccessfully = false;
+  std::vector<std::vector<PatchedFlacNamespace::FLAC__int32>> samples;
+
+  JUCE_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(PatchedParallelFlacWriter)
+};
+
 //==============================================================================
 PatchedFlacAudioFormat::PatchedFlacAudioFormat()
     : AudioFormat(flacFormatName, ".flac") {}
@@ -581,6 +997,20 @@ AudioFormatWriter *PatchedFlacAudioFormat::createWriterFor(
   return nullptr;
 }
 
+AudioFormatWriter *PatchedFlacAudioFormat::createParallelWriterFor(
+    OutputStream *out, double sampleRate, unsigned int numberOfChannels,
+    int bitsPerSample, int qualityOptionIndex, int numThreads) {
+  if (out != nullptr && getPossibleBitDepths().contains(bitsPerSample)) {
+    std::unique_ptr<PatchedParallelFlacWriter> w(new PatchedParallelFlacWriter(
+        out, sampleRate, numberOfChannels, (uint32)bitsPerSample,
+        qualityOptionIndex, numThreads));
+    if (w->ok)
+      return w.release();
+  }
+
+  return nullptr;
+}
+
 StringArray PatchedFlacAudioFormat::getQualityOptions() {
   return {"0 (Fastest)",        "1", "2", "3", "4", "5 (Default)", "6", "7",
           "8 (Highest quality)"};
@@ -27,6 +27,24 @@
 
 namespace juce {
 
+//==============================================================================
+/**
+    An AudioFormatWriter that defers some of its work (i.e.: encoding or
+    writing) until all of its audio has been written. Call finish() before
+    deleting the writer to find out whether that work succeeded.
+*/
+class DeferredAudioFormatWriter : public AudioFormatWriter {
+public:
+  using AudioFormatWriter::AudioFormatWriter;
+
+  /**
+      Complete any deferred work, returning false if it failed. Only the first
+      call does any work; later calls return the same result. If this is not
+      called, the writer will call it when deleted and ignore the result.
+  */
+  virtual bool finish() = 0;
+};
+
 //==============================================================================
 /**
     Reads and writes the lossless-compression FLAC audio format.
@@ -63,6 +81,17 @@ public:
                                      int qualityOptionIndex) override;
   using AudioFormat::createWriterFor;
 
+  /**
+      Creates a writer that produces the same audio as createWriterFor(), but
+      which buffers all of the audio written to it and encodes it on up to
+      numThreads threads when finished. The returned writer is a
+      DeferredAudioFormatWriter.
+  */
+  AudioFormatWriter *
+  createParallelWriterFor(OutputStream *streamToWriteTo, double sampleRateToUse,
+                          unsigned int numberOfChannels, int bitsPerSample,
+                          int qualityOptionIndex, int numThreads);
+
 private:
   JUCE_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(PatchedFlacAudioFormat)
 };
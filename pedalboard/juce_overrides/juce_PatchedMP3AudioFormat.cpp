@@ -2001,12 +2001,70 @@ struct PatchedMP3Stream {
     return true;
   }
 
+  /**
+   * Scan forward from the last frame whose position we know to the end of the
+   * stream, recording the position of every frame along the way. This leaves
+   * the stream positioned at its end; callers must seek() before decoding.
+   */
+  void indexAllFrames() {
+    if (frameStreamPositions.isEmpty())
+      return;
+
+    seek((frameStreamPositions.size() - 1) * storedStartPosInterval);
+
+    int64 lastPosition = -1;
+    while (!stream.isExhausted()) {
+      int dummy = 0;
+      auto result = decodeNextBlock(nullptr, nullptr, dummy);
+
+      if (result < 0)
+        break;
+
+      // Avoid looping forever on streams that stop making progress:
+      auto position = stream.getPosition();
+      if (result > 0 && position == lastPosition)
+        break;
+      lastPosition = position;
+    }
+  }
+
+  const Array<int64> &getFrameStreamPositions() const {
+    return frameStreamPositions;
+  }
+
+  bool setFrameStreamPositions(const Array<int64> &positions) {
+    // The position of the first frame is found when the stream is opened, so
+    // if that doesn't match, this index must be for a different stream:
+    if (positions.isEmpty() || frameStreamPositions.isEmpty() ||
+        positions.getFirst() != frameStreamPositions.getFirst())
+      return false;
+
+    for (int i = 1; i < positions.size(); i++)
+      if (positions.getUnchecked(i) <= positions.getUnchecked(i - 1))
+        return false;
+
+    auto totalLength = stream.getTotalLength();
+    if (totalLength >= 0 && positions.getLast() >= totalLength)
+      return false;
+
+    if (positions.size() > frameStreamPositions.size())
+      frameStreamPositions = positions;
+
+    return true;
+  }
+
   MP3Frame frame;
   VBRTagData vbrTagData;
   BufferedInputStream stream;
   int numFrames = 0, currentFrameIndex = 0;
   bool vbrHeaderFound = false;
 
+  // If greater than 1, the synthesis filterbank only produces every
+  // decimationFactor-th output sample (after discarding the subbands above the
+  // new Nyquist frequency), reducing the decoded sample rate by this factor.
+  // Must be 1, 2, or 4.
+  int decimationFactor = 1;
+
 private:
   bool headerParsed, sideParsed, dataParsed, needToSyncBitStream;
   bool isFreeFormat, wasFreeFormat;
@@ -3214,6 +3272,11 @@ private:
 
   void synthesise(const float *bandPtr, int channel, float *out,
                   int &samplesDone) {
+    if (decimationFactor > 1) {
+      synthesiseDecimated(bandPtr, channel, out, samplesDone);
+      return;
+    }
+
     out += samplesDone;
     const int bo = channel == 0 ? ((synthBo - 1) & 15) : synthBo;
     float(*buf)[0x110] = synthBuffers[channel];
@@ -3290,6 +3353,99 @@ private:
     samplesDone += 32;
   }
 
+  /**
+   * Equivalent to synthesise(), but only outputs 32 / decimationFactor
+   * samples. The subbands above the decimated Nyquist frequency are zeroed
+   * (acting as the anti-aliasing filter) and only every decimationFactor-th
+   * output of the windowing stage is computed, which is considerably cheaper
+   * than decoding at the full rate and resampling afterwards.
+   */
+  void synthesiseDecimated(const float *bandPtr, int channel, float *out,
+                           int &samplesDone) {
+    out += samplesDone;
+    const int step = decimationFactor;
+    const int numBandsToKeep = 32 / step;
+
+    float bands[32];
+    std::copy(bandPtr, bandPtr + numBandsToKeep, bands);
+    std::fill(bands + numBandsToKeep, bands + 32, 0.0f);
+
+    const int bo = channel == 0 ? ((synthBo - 1) & 15) : synthBo;
+    float(*buf)[0x110] = synthBuffers[channel];
+    float *b0;
+    auto bo1 = bo;
+
+    if (bo & 1) {
+      b0 = buf[0];
+      DCT::dct64(buf[1] + ((bo + 1) & 15), buf[0] + bo, bands);
+    } else {
+      ++bo1;
+      b0 = buf[1];
+      DCT::dct64(buf[0] + bo, buf[1] + bo1, bands);
+    }
+
+    synthBo = bo;
+    const float *window = constants.decodeWin + 16 - bo1;
+
+    for (int j = 16 / step; j != 0; --j, b0 += 16 * step, window += 32 * step) {
+      auto sum = window[0] * b0[0];
+      sum -= window[1] * b0[1];
+      sum += window[2] * b0[2];
+      sum -= window[3] * b0[3];
+      sum += window[4] * b0[4];
+      sum -= window[5] * b0[5];
+      sum += window[6] * b0[6];
+      sum -= window[7] * b0[7];
+      sum += window[8] * b0[8];
+      sum -= window[9] * b0[9];
+      sum += window[10] * b0[10];
+      sum -= window[11] * b0[11];
+      sum += window[12] * b0[12];
+      sum -= window[13] * b0[13];
+      sum += window[14] * b0[14];
+      sum -= window[15] * b0[15];
+      *out++ = sum;
+    }
+
+    {
+      auto sum = window[0] * b0[0];
+      sum += window[2] * b0[2];
+      sum += window[4] * b0[4];
+      sum += window[6] * b0[6];
+      sum += window[8] * b0[8];
+      sum += window[10] * b0[10];
+      sum += window[12] * b0[12];
+      sum += window[14] * b0[14];
+      *out++ = sum;
+      b0 -= 16 * step;
+      window -= 32 * step;
+      window += (ptrdiff_t)bo1 << 1;
+    }
+
+    for (int j = 16 / step - 1; j != 0;
+         --j, b0 -= 16 * step, window -= 32 * step) {
+      auto sum = -window[-1] * b0[0];
+      sum -= window[-2] * b0[1];
+      sum -= window[-3] * b0[2];
+      sum -= window[-4] * b0[3];
+      sum -= window[-5] * b0[4];
+      sum -= window[-6] * b0[5];
+      sum -= window[-7] * b0[6];
+      sum -= window[-8] * b0[7];
+      sum -= window[-9] * b0[8];
+      sum -= window[-10] * b0[9];
+      sum -= window[-11] * b0[10];
+      sum -= window[-12] * b0[11];
+      sum -= window[-13] * b0[12];
+      sum -= window[-14] * b0[13];
+      sum -= window[-15] * b0[14];
+      sum -= window[0] * b0[15];
+      *out++ = sum;
+    }
+
+    samplesDone += 32 / step;
+  }
+
   JUCE_DECLARE_NON_COPYABLE_WITH_LEAK_DETECTOR(PatchedMP3Stream)
 };
 
@@ -3394,6 +3550,45 @@ public:
     return stream.numFrames <= 0;
   }
 
+  bool buildSeekIndex() override {
+    stream.indexAllFrames();
+
+    // The stream is no longer positioned after the audio we've decoded, so
+    // force the next call to readSamples to seek:
+    currentPosition = -1;
+    return true;
+  }
+
+  Array<int64> getSeekIndex() const override {
+    return stream.getFrameStreamPositions();
+  }
+
+  bool setSeekIndex(const Array<int64> &seekIndex) override {
+    return stream.setFrameStreamPositions(seekIndex);
+  }
+
+  bool setDecimationFactor(int factor) override {
+    if (factor != 1 && factor != 2 && factor != 4)
+      return false;
+
+    if (factor == stream.decimationFactor)
+      return true;
+
+    const int fullRateSamplesPerFrame =
+        samplesPerFrame * stream.decimationFactor;
+    const int64 numFrames = lengthInSamples / samplesPerFrame;
+
+    stream.decimationFactor = factor;
+    sampleRate = (double)stream.frame.getFrequency() / factor;
+    samplesPerFrame = fullRateSamplesPerFrame / factor;
+    lengthInSamples = numFrames * samplesPerFrame;
+
+    // Any audio we've already decoded was synthesised at the old rate, so
+    // force the next call to readSamples to seek (and re-decode):
+    currentPosition = -1;
+    return true;
+  }
+
 private:
   PatchedMP3Stream stream;
   int64 currentPosition;
@@ -3406,7 +3601,7 @@ private:
     zeromem(decoded0, sizeof(decoded0));
     zeromem(decoded1, sizeof(decoded1));
     decodedStart = 0;
-    decodedEnd = decodedDataSize;
+    decodedEnd = decodedDataSize / stream.decimationFactor;
   }
 
   bool readNextBlock() {
@@ -77,6 +77,36 @@ public:
       : AudioFormatReader(sourceStream, formatName) {}
   virtual int64 getCurrentPosition() const = 0;
   virtual bool lengthIsApproximate() const { return false; };
+
+  /**
+   * Scan the entire stream once, recording where each frame starts, so that
+   * later seeks can jump directly to the nearest frame instead of scanning
+   * forward through the stream. Returns false if this reader does not support
+   * seek indices.
+   */
+  virtual bool buildSeekIndex() { return false; }
+
+  /**
+   * Returns the byte offsets of the frames recorded so far, which can be
+   * persisted and passed to setSeekIndex() on a reader of the same stream.
+   */
+  virtual Array<int64> getSeekIndex() const { return {}; }
+
+  /**
+   * Restore a seek index previously returned by getSeekIndex(). Returns false
+   * (and leaves this reader untouched) if the index does not appear to match
+   * this stream.
+   */
+  virtual bool setSeekIndex(const Array<int64> &) { return false; }
+
+  /**
+   * Ask the decoder to produce audio at 1/factor of the stream's native
+   * sample rate, if it can do so more cheaply than decoding at full rate.
+   * On success, sampleRate and lengthInSamples are updated and the next read
+   * starts from the beginning of the stream. Returns false (and leaves this
+   * reader untouched) if the factor is not supported.
+   */
+  virtual bool setDecimationFactor(int) { return false; }
 };
 
 } // namespace juce
@@ -54,7 +54,7 @@ public:
         // block:
         inStreamLatency = blockSize;
       }
-      lastSpec = spec;
+      markPrepared(spec);
     }
 
     // Tell the delegate plugin that its maximum block
@@ -219,11 +219,17 @@ public:
     inputBufferSamples = 0;
     outputBufferSamples = 0;
 
-    inStreamLatency = 0;
     samplesProcessed = 0;
-    lastSpec = {0};
     plugin.reset();
 
+    // Keep our buffers (and lastSpec) around so that the next call to
+    // prepare() with the same spec doesn't need to reallocate them:
+    if (blockSize == 0 || lastSpec.maximumBlockSize % blockSize == 0) {
+      inStreamLatency = 0;
+    } else {
+      inStreamLatency = blockSize;
+    }
+
     inputBuffer.clear();
     outputBuffer.clear();
   }
@@ -232,6 +238,8 @@ public:
 
   void setFixedBlockSize(int newBlockSize) {
     blockSize = newBlockSize;
+    // Our buffer sizes depend on the block size, so force a re-prepare:
+    lastSpec = {0};
     reset();
   }
 
@@ -299,6 +307,12 @@ public:
 
   int getExpectedBlockSize() const { return getFixedBlockSize(); }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<FixedSizeBlockTestPlugin>();
+    plugin->setExpectedBlockSize(getExpectedBlockSize());
+    return plugin;
+  }
+
 private:
   int expectedBlockSize = 0;
 };
@@ -106,7 +106,12 @@ public:
   }
 };
 
-using ForceMonoTestPlugin = ForceMono<ExpectsMono>;
+class ForceMonoTestPlugin : public ForceMono<ExpectsMono> {
+public:
+  std::shared_ptr<Plugin> clone() override {
+    return std::make_shared<ForceMonoTestPlugin>();
+  }
+};
 
 inline void init_force_mono_test_plugin(py::module &m) {
   py::class_<ForceMonoTestPlugin, Plugin, std::shared_ptr<ForceMonoTestPlugin>>(
@@ -37,11 +37,14 @@ public:
   virtual ~PrimeWithSilence(){};
 
   virtual void prepare(const juce::dsp::ProcessSpec &spec) {
-    JucePlugin<juce::dsp::DelayLine<
-        SampleType,
-        juce::dsp::DelayLineInterpolationTypes::None>>::prepare(spec);
-    this->getDSP().setMaximumDelayInSamples(silenceLengthSamples);
-    this->getDSP().setDelay(silenceLengthSamples);
+    // Resizing the delay line clears it, so only do so if necessary:
+    if (this->specRequiresPrepare(spec)) {
+      JucePlugin<juce::dsp::DelayLine<
+          SampleType,
+          juce::dsp::DelayLineInterpolationTypes::None>>::prepare(spec);
+      this->getDSP().setMaximumDelayInSamples(silenceLengthSamples);
+      this->getDSP().setDelay(silenceLengthSamples);
+    }
     plugin.prepare(spec);
   }
 
@@ -160,6 +163,12 @@ public:
 
   int getExpectedSilentSamples() const { return getSilenceLengthSamples(); }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<PrimeWithSilenceTestPlugin>();
+    plugin->setExpectedSilentSamples(getExpectedSilentSamples());
+    return plugin;
+  }
+
 private:
   int expectedBlockSize = 0;
 };
@@ -48,6 +48,10 @@ enum class ResamplingQuality {
   WindowedSinc32 = 8, // This is the new default as of Pedalboard v0.9.15
   WindowedSinc16 = 9,
   WindowedSinc8 = 10,
+  // Produces output numerically close to WindowedSinc32, but uses a
+  // precomputed polyphase filter bank when the speed ratio is a fraction with
+  // a small denominator (i.e.: 44.1kHz <-> 48kHz).
+  PolyphaseSinc32 = 11,
 };
 
 /**
@@ -91,6 +95,9 @@ public:
     case ResamplingQuality::WindowedSinc8:
       interpolator = juce::FastInterpolators::WindowedSinc8();
       break;
+    case ResamplingQuality::PolyphaseSinc32:
+      interpolator = juce::FastInterpolators::PolyphaseSinc32();
+      break;
     default:
       throw std::domain_error("Unknown resampler quality received!");
     }
@@ -136,6 +143,9 @@ public:
     } else if (auto *i = std::get_if<juce::FastInterpolators::WindowedSinc8>(
                    &interpolator)) {
       return i->getBaseLatency();
+    } else if (auto *i = std::get_if<juce::FastInterpolators::PolyphaseSinc32>(
+                   &interpolator)) {
+      return i->getBaseLatency();
     } else {
       throw std::runtime_error("Unknown resampler quality!");
     }
@@ -177,6 +187,9 @@ public:
     } else if (auto *i = std::get_if<juce::FastInterpolators::WindowedSinc8>(
                    &interpolator)) {
       i->reset();
+    } else if (auto *i = std::get_if<juce::FastInterpolators::PolyphaseSinc32>(
+                   &interpolator)) {
+      i->reset();
     } else {
       throw std::runtime_error("Unknown resampler quality!");
     }
@@ -230,6 +243,10 @@ public:
                    &interpolator)) {
       return i->process(speedRatio, inputSamples, outputSamples,
                         numOutputSamplesToProduce);
+    } else if (auto *i = std::get_if<juce::FastInterpolators::PolyphaseSinc32>(
+                   &interpolator)) {
+      return i->process(speedRatio, inputSamples, outputSamples,
+                        numOutputSamplesToProduce);
     } else {
       throw std::runtime_error("Unknown resampler quality!");
     }
@@ -244,7 +261,8 @@ private:
                juce::FastInterpolators::WindowedSinc64,
                juce::FastInterpolators::WindowedSinc32,
                juce::FastInterpolators::WindowedSinc16,
-               juce::FastInterpolators::WindowedSinc8>
+               juce::FastInterpolators::WindowedSinc8,
+               juce::FastInterpolators::PolyphaseSinc32>
       interpolator;
 };
 
@@ -278,9 +296,7 @@ public:
   virtual ~Resample(){};
 
   virtual void prepare(const juce::dsp::ProcessSpec &spec) {
-    bool specChanged = lastSpec.sampleRate != spec.sampleRate ||
-                       lastSpec.maximumBlockSize < spec.maximumBlockSize ||
-                       lastSpec.numChannels != spec.numChannels;
+    bool specChanged = specRequiresPrepare(spec);
     if (specChanged || nativeToTargetResamplers.empty()) {
       reset();
 
@@ -322,7 +338,7 @@ public:
           (int)std::ceil(resampledBuffer.getNumSamples() * resamplerRatio) +
               spec.maximumBlockSize);
 
-      lastSpec = spec;
+      markPrepared(spec);
     }
 
     juce::dsp::ProcessSpec subSpec;
@@ -525,6 +541,19 @@ public:
 
   T &getNestedPlugin() { return plugin; }
 
+  std::shared_ptr<Plugin> clone() override {
+    // Only this plugin's own parameters can be copied, so only resamplers
+    // that don't wrap another plugin can be cloned directly:
+    if constexpr (std::is_same_v<T, Passthrough<SampleType>>) {
+      auto resampler = std::make_shared<Resample>();
+      resampler->setTargetSampleRate(targetSampleRate);
+      resampler->setQuality(quality);
+      return resampler;
+    } else {
+      return nullptr;
+    }
+  }
+
   virtual void reset() override final {
     plugin.reset();
 
@@ -608,8 +637,8 @@ Aliasing algorithms include :py:class:`ZeroOrderHold`, :py:class:`Linear`,
 :py:class:`CatmullRom`, :py:class:`Lagrange`, and :py:class:`WindowedSinc`.
 
 Non-aliasing algorithms include :py:class:`WindowedSinc256`, :py:class:`WindowedSinc128`,
-:py:class:`WindowedSinc64`, :py:class:`WindowedSinc32`, :py:class:`WindowedSinc16`, and
-:py:class:`WindowedSinc8`.
+:py:class:`WindowedSinc64`, :py:class:`WindowedSinc32`, :py:class:`WindowedSinc16`,
+:py:class:`WindowedSinc8`, and :py:class:`PolyphaseSinc32`.
 
 Choosing an algorithm to use depends on the signal being resampled, the relationship
 between the source and target sample rates, and the application of the resampled signal.
@@ -622,6 +651,9 @@ between the source and target sample rates, and the application of the resampled
    (i.e.: :py:class:`WindowedSinc256`, :py:class:`WindowedSinc64`) will produce
    a clean signal with no artifacts. Higher numbers will produce a cleaner signal with less
    roll-off of high frequency content near the Nyquist frequency of the new sample rate.
+ - If converting between common sample rates (i.e.: from 44.1kHz to 48kHz, or 48kHz to 16kHz),
+   :py:class:`PolyphaseSinc32` will produce output numerically close to that of
+   :py:class:`WindowedSinc32`, but faster.
 
 However, depending on your application, the artifacts introduced by each resampling method
 may be acceptable. Test each method to determine which is the best tradeoff between speed
@@ -721,6 +753,17 @@ default from Pedalboard v0.9.15 onwards. (Previously, :py:class:`WindowedSinc` w
              "downsampling.\n\nThis method can be more than 10x faster than "
              "Resampy's ``kaiser_fast`` method, and is useful for applications "
              "that are tolerant of some resampling artifacts.")
+      .value(
+          "PolyphaseSinc32", ResamplingQuality::PolyphaseSinc32,
+          "A reasonably high quality resampling algorithm that produces "
+          "output numerically close to that of :py:class:`WindowedSinc32`, "
+          "optimized for converting between common sample rates.\n\nWhen "
+          "the ratio between the source and target sample rates is a "
+          "fraction with a denominator of 2,560 or less (i.e.: 44.1kHz to "
+          "48kHz is 147/160), this resampler precomputes one windowed sinc "
+          "filter per output phase up front, turning each output sample into "
+          "a single dot product. Other ratios are resampled just like "
+          ":py:class:`WindowedSinc32`, without any speedup.")
       .export_values();
 
   resample
@@ -773,6 +816,9 @@ default from Pedalboard v0.9.15 onwards. (Previously, :py:class:`WindowedSinc` w
              case ResamplingQuality::WindowedSinc8:
                ss << "WindowedSinc8";
                break;
+             case ResamplingQuality::PolyphaseSinc32:
+               ss << "PolyphaseSinc32";
+               break;
              default:
                ss << "unknown";
                break;
@@ -799,13 +845,26 @@ default from Pedalboard v0.9.15 onwards. (Previously, :py:class:`WindowedSinc` w
  * An internal test plugin that does nothing but add latency to the resampled
  * signal.
  */
+class ResampleWithLatency : public Resample<AddLatency, float> {
+public:
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<ResampleWithLatency>();
+    plugin->setTargetSampleRate(getTargetSampleRate());
+    plugin->getNestedPlugin().getDSP().setMaximumDelayInSamples(
+        getNestedPlugin().getDSP().getDelay());
+    plugin->getNestedPlugin().getDSP().setDelay(
+        getNestedPlugin().getDSP().getDelay());
+    plugin->setQuality(getQuality());
+    return plugin;
+  }
+};
+
 inline void init_resample_with_latency(py::module &m) {
-  py::class_<Resample<AddLatency, float>, Plugin,
-             std::shared_ptr<Resample<AddLatency, float>>>(
+  py::class_<ResampleWithLatency, Plugin, std::shared_ptr<ResampleWithLatency>>(
       m, "ResampleWithLatency")
       .def(py::init([](float targetSampleRate, int internalLatency,
                        ResamplingQuality quality) {
-             auto plugin = std::make_unique<Resample<AddLatency, float>>();
+             auto plugin = std::make_unique<ResampleWithLatency>();
              plugin->setTargetSampleRate(targetSampleRate);
              plugin->getNestedPlugin().getDSP().setMaximumDelayInSamples(
                  internalLatency);
@@ -817,7 +876,7 @@ inline void init_resample_with_latency(py::module &m) {
            py::arg("internal_latency") = 1024,
            py::arg("quality") = ResamplingQuality::WindowedSinc32)
       .def("__repr__",
-           [](Resample<AddLatency, float> &plugin) {
+           [](ResampleWithLatency &plugin) {
              std::ostringstream ss;
              ss << "<pedalboard.ResampleWithLatency";
              ss << " target_sample_rate=" << plugin.getTargetSampleRate();
@@ -858,6 +917,9 @@ inline void init_resample_with_latency(py::module &m) {
              case ResamplingQuality::WindowedSinc8:
                ss << "WindowedSinc8";
                break;
+             case ResamplingQuality::PolyphaseSinc32:
+               ss << "PolyphaseSinc32";
+               break;
              default:
                ss << "unknown";
                break;
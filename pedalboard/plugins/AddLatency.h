@@ -50,6 +50,13 @@ public:
 
   virtual int getLatencyHint() override { return getDSP().getDelay(); }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<AddLatency>();
+    plugin->getDSP().setMaximumDelayInSamples(getDSP().getDelay());
+    plugin->getDSP().setDelay(getDSP().getDelay());
+    return plugin;
+  }
+
 private:
   int samplesProvided = 0;
 };
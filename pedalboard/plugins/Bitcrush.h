@@ -72,6 +72,12 @@ public:
     return block.getNumSamples();
   }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Bitcrush>();
+    plugin->setBitDepth(bitDepth);
+    return plugin;
+  }
+
 private:
   SampleType bitDepth = 8.0f;
 
@@ -39,7 +39,10 @@ public:
         plugin->prepare(spec);
       }
     }
-    lastSpec = spec;
+
+    if (specRequiresPrepare(spec)) {
+      markPrepared(spec);
+    }
   }
 
   virtual int
@@ -75,6 +78,10 @@ public:
     }
     return hint;
   }
+
+  std::shared_ptr<Plugin> clone() override {
+    return std::make_shared<Chain>(clonePlugins());
+  }
 };
 
 inline void init_chain(py::module &m) {
@@ -45,6 +45,16 @@ class Chorus : public JucePlugin<juce::dsp::Chorus<SampleType>> {
       throw std::range_error("Mix must be between 0.0 and 1.0.");
     }
   });
+
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Chorus>();
+    plugin->setRate(getRate());
+    plugin->setDepth(getDepth());
+    plugin->setCentreDelay(getCentreDelay());
+    plugin->setFeedback(getFeedback());
+    plugin->setMix(getMix());
+    return plugin;
+  }
 };
 
 inline void init_chorus(py::module &m) {
@@ -53,6 +53,12 @@ public:
 
   virtual void reset() {}
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Clipping>();
+    plugin->setThresholdDecibels(thresholdDecibels);
+    return plugin;
+  }
+
 private:
   SampleType thresholdDecibels;
 
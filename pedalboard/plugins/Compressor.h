@@ -33,6 +33,15 @@ class Compressor : public JucePlugin<juce::dsp::Compressor<SampleType>> {
   });
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Attack, {});
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Release, {});
+
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Compressor>();
+    plugin->setThreshold(getThreshold());
+    plugin->setRatio(getRatio());
+    plugin->setAttack(getAttack());
+    plugin->setRelease(getRelease());
+    return plugin;
+  }
 };
 
 inline void init_compressor(py::module &m) {
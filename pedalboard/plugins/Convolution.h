@@ -56,7 +56,7 @@ public:
   }
 
   const std::optional<juce::AudioBuffer<float>> &getImpulseResponse() const {
-    return {impulseResponse};
+    return impulseResponse;
   }
 
   void setSampleRate(double sr) { sampleRate = {sr}; }
@@ -91,9 +91,38 @@ private:
   std::optional<double> sampleRate;
 };
 
+/**
+ * The plugin exposed to Python as `Convolution`, which copies its impulse
+ * response (whether loaded from a file or from an array) when cloned.
+ */
+class Convolution : public JucePlugin<ConvolutionWithMix> {
+public:
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Convolution>();
+    auto &dsp = plugin->getDSP();
+
+    if (auto filename = getDSP().getImpulseResponseFilename()) {
+      dsp.getConvolution().loadImpulseResponse(
+          juce::File(*filename), juce::dsp::Convolution::Stereo::yes,
+          juce::dsp::Convolution::Trim::no, 0);
+      dsp.setImpulseResponseFilename(*filename);
+    } else if (getDSP().getImpulseResponse()) {
+      juce::AudioBuffer<float> impulseResponse(*getDSP().getImpulseResponse());
+      dsp.getConvolution().loadImpulseResponse(
+          juce::AudioBuffer<float>(impulseResponse), *getDSP().getSampleRate(),
+          juce::dsp::Convolution::Stereo::yes, juce::dsp::Convolution::Trim::no,
+          juce::dsp::Convolution::Normalise::yes);
+      dsp.setImpulseResponse(std::move(impulseResponse));
+      dsp.setSampleRate(*getDSP().getSampleRate());
+    }
+
+    dsp.setMix(getDSP().getMix());
+    return plugin;
+  }
+};
+
 inline void init_convolution(py::module &m) {
-  py::class_<JucePlugin<ConvolutionWithMix>, Plugin,
-             std::shared_ptr<JucePlugin<ConvolutionWithMix>>>(
+  py::class_<Convolution, Plugin, std::shared_ptr<Convolution>>(
       m, "Convolution",
       "An audio convolution, suitable for things like speaker simulation or "
       "reverb modeling.\n\n"
@@ -106,7 +135,7 @@ inline void init_convolution(py::module &m) {
                                     py::array_t<float, py::array::c_style>>
                            impulseResponse,
                        float mix, std::optional<double> sampleRate) {
-             auto plugin = std::make_unique<JucePlugin<ConvolutionWithMix>>();
+             auto plugin = std::make_unique<Convolution>();
 
              if (auto *impulseResponseFilename =
                      std::get_if<std::string>(&impulseResponse)) {
@@ -153,7 +182,7 @@ inline void init_convolution(py::module &m) {
            py::arg("impulse_response_filename"), py::arg("mix") = 1.0,
            py::arg("sample_rate") = py::none())
       .def("__repr__",
-           [](JucePlugin<ConvolutionWithMix> &plugin) {
+           [](Convolution &plugin) {
              std::ostringstream ss;
              ss << "<pedalboard.Convolution";
              if (plugin.getDSP().getImpulseResponseFilename()) {
@@ -175,12 +204,12 @@ inline void init_convolution(py::module &m) {
            })
       .def_property_readonly(
           "impulse_response_filename",
-          [](JucePlugin<ConvolutionWithMix> &plugin) {
+          [](Convolution &plugin) {
             return plugin.getDSP().getImpulseResponseFilename();
           })
       .def_property_readonly(
           "impulse_response",
-          [](JucePlugin<ConvolutionWithMix> &plugin)
+          [](Convolution &plugin)
               -> std::optional<py::array_t<float, py::array::c_style>> {
             if (plugin.getDSP().getImpulseResponse()) {
               return {copyJuceBufferIntoPyArray(
@@ -191,11 +220,8 @@ inline void init_convolution(py::module &m) {
             }
           })
       .def_property(
-          "mix",
-          [](JucePlugin<ConvolutionWithMix> &plugin) {
-            return plugin.getDSP().getMix();
-          },
-          [](JucePlugin<ConvolutionWithMix> &plugin, double newMix) {
+          "mix", [](Convolution &plugin) { return plugin.getDSP().getMix(); },
+          [](Convolution &plugin, double newMix) {
             return plugin.getDSP().setMix(newMix);
           });
 }
@@ -46,13 +46,11 @@ public:
   };
 
   virtual void prepare(const juce::dsp::ProcessSpec &spec) override {
-    if (this->lastSpec.sampleRate != spec.sampleRate ||
-        this->lastSpec.maximumBlockSize < spec.maximumBlockSize ||
-        spec.numChannels != this->lastSpec.numChannels) {
+    if (this->specRequiresPrepare(spec)) {
       this->getDSP().setMaximumDelayInSamples(
           (int)(MAXIMUM_DELAY_TIME_SECONDS * spec.sampleRate));
       this->getDSP().prepare(spec);
-      this->lastSpec = spec;
+      this->markPrepared(spec);
     }
 
     this->getDSP().setDelay((int)(delaySeconds * spec.sampleRate));
@@ -96,6 +94,14 @@ public:
     return context.getInputBlock().getNumSamples();
   }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Delay>();
+    plugin->setDelaySeconds(delaySeconds);
+    plugin->setFeedback(feedback);
+    plugin->setMix(mix);
+    return plugin;
+  }
+
 private:
   SampleType delaySeconds = 1.0f;
   SampleType feedback = 0.0f;
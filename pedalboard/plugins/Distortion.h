@@ -41,6 +41,12 @@ public:
         [](SampleType x) { return std::tanh(x); };
   }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Distortion>();
+    plugin->setDriveDecibels(driveDecibels);
+    return plugin;
+  }
+
 private:
   SampleType driveDecibels;
 
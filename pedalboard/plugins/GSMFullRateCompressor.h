@@ -58,9 +58,7 @@ public:
   virtual ~GSMFullRateCompressorInternal(){};
 
   virtual void prepare(const juce::dsp::ProcessSpec &spec) override {
-    bool specChanged = lastSpec.sampleRate != spec.sampleRate ||
-                       lastSpec.maximumBlockSize < spec.maximumBlockSize ||
-                       lastSpec.numChannels != spec.numChannels;
+    bool specChanged = specRequiresPrepare(spec);
     if (!encoder || specChanged) {
       reset();
 
@@ -76,7 +74,7 @@ public:
         throw std::runtime_error("Failed to initialize GSM decoder.");
       }
 
-      lastSpec = spec;
+      markPrepared(spec);
     }
   }
 
@@ -138,12 +136,21 @@ private:
  *  - only provide mono input to the plugin, and copy the mono signal
  *    back to stereo if necessary
  */
-using GSMFullRateCompressor = ForceMono<Resample<
-    PrimeWithSilence<
-        FixedBlockSize<GSMFullRateCompressorInternal,
-                       GSMFullRateCompressorInternal::GSM_FRAME_SIZE_SAMPLES>,
-        float, GSMFullRateCompressorInternal::GSM_FRAME_SIZE_SAMPLES>,
-    float, GSMFullRateCompressorInternal::GSM_SAMPLE_RATE>>;
+class GSMFullRateCompressor
+    : public ForceMono<Resample<
+          PrimeWithSilence<
+              FixedBlockSize<
+                  GSMFullRateCompressorInternal,
+                  GSMFullRateCompressorInternal::GSM_FRAME_SIZE_SAMPLES>,
+              float, GSMFullRateCompressorInternal::GSM_FRAME_SIZE_SAMPLES>,
+          float, GSMFullRateCompressorInternal::GSM_SAMPLE_RATE>> {
+public:
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<GSMFullRateCompressor>();
+    plugin->getNestedPlugin().setQuality(getNestedPlugin().getQuality());
+    return plugin;
+  }
+};
 
 inline void init_gsm_full_rate_compressor(py::module &m) {
   py::class_<GSMFullRateCompressor, Plugin,
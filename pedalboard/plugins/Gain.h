@@ -26,6 +26,12 @@ namespace Pedalboard {
 template <typename SampleType>
 class Gain : public JucePlugin<juce::dsp::Gain<SampleType>> {
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, GainDecibels, {});
+
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Gain>();
+    plugin->setGainDecibels(getGainDecibels());
+    return plugin;
+  }
 };
 
 inline void init_gain(py::module &m) {
@@ -40,6 +40,12 @@ public:
         juce::dsp::IIR::Coefficients<SampleType>>>::prepare(spec);
   }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<HighpassFilter>();
+    plugin->setCutoffFrequencyHz(cutoffFrequencyHz);
+    return plugin;
+  }
+
 private:
   float cutoffFrequencyHz;
 };
@@ -63,17 +63,27 @@ public:
   }
 
   virtual void prepare(const juce::dsp::ProcessSpec &spec) override {
-    if (this->lastSpec.sampleRate != spec.sampleRate ||
-        this->lastSpec.maximumBlockSize < spec.maximumBlockSize ||
-        spec.numChannels != this->lastSpec.numChannels) {
+    if (this->specRequiresPrepare(spec)) {
       JucePlugin<juce::dsp::ProcessorDuplicator<
           juce::dsp::IIR::Filter<SampleType>,
           juce::dsp::IIR::Coefficients<SampleType>>>::prepare(spec);
-      this->lastSpec = spec;
     }
   }
 
 protected:
+  /**
+   * Create a new filter of the given type with the same parameters as this
+   * one, for use in implementations of clone().
+   */
+  template <typename FilterType> std::shared_ptr<Plugin> cloneAs() {
+    auto plugin = std::make_shared<FilterType>();
+    IIRFilter &clone = *plugin;
+    clone.cutoffFrequencyHz = cutoffFrequencyHz;
+    clone.Q = Q;
+    clone.gainFactor = gainFactor;
+    return plugin;
+  }
+
   float cutoffFrequencyHz;
   float Q;
   float gainFactor;
@@ -82,6 +92,10 @@ protected:
 template <typename SampleType>
 class HighShelfFilter : public IIRFilter<SampleType> {
 public:
+  std::shared_ptr<Plugin> clone() override {
+    return this->template cloneAs<HighShelfFilter>();
+  }
+
   virtual void prepare(const juce::dsp::ProcessSpec &spec) override {
     *this->getDSP().state =
         *juce::dsp::IIR::Coefficients<SampleType>::makeHighShelf(
@@ -96,6 +110,10 @@ public:
 template <typename SampleType>
 class LowShelfFilter : public IIRFilter<SampleType> {
 public:
+  std::shared_ptr<Plugin> clone() override {
+    return this->template cloneAs<LowShelfFilter>();
+  }
+
   virtual void prepare(const juce::dsp::ProcessSpec &spec) override {
     *this->getDSP().state =
         *juce::dsp::IIR::Coefficients<SampleType>::makeLowShelf(
@@ -109,6 +127,10 @@ public:
 
 template <typename SampleType> class PeakFilter : public IIRFilter<SampleType> {
 public:
+  std::shared_ptr<Plugin> clone() override {
+    return this->template cloneAs<PeakFilter>();
+  }
+
   virtual void prepare(const juce::dsp::ProcessSpec &spec) override {
     *this->getDSP().state =
         *juce::dsp::IIR::Coefficients<SampleType>::makePeakFilter(
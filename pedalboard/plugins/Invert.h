@@ -31,6 +31,11 @@ template <typename SampleType> class Invert : public Plugin {
     return context.getOutputBlock().getNumSamples();
   }
   void reset() noexcept override {}
+
+public:
+  std::shared_ptr<Plugin> clone() override {
+    return std::make_shared<Invert>();
+  }
 };
 
 inline void init_invert(py::module &m) {
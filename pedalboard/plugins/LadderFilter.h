@@ -55,6 +55,15 @@ class LadderFilter : public JucePlugin<juce::dsp::LadderFilter<SampleType>> {
                              "BPF12, LPF24, HPF24, or BPF24.");
     }
   });
+
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<LadderFilter>();
+    plugin->setMode(getMode());
+    plugin->setCutoffFrequencyHz(getCutoffFrequencyHz());
+    plugin->setResonance(getResonance());
+    plugin->setDrive(getDrive());
+    return plugin;
+  }
 };
 
 inline void init_ladderfilter(py::module &m) {
@@ -27,6 +27,13 @@ template <typename SampleType>
 class Limiter : public JucePlugin<juce::dsp::Limiter<SampleType>> {
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Threshold, {});
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Release, {});
+
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Limiter>();
+    plugin->setThreshold(getThreshold());
+    plugin->setRelease(getRelease());
+    return plugin;
+  }
 };
 
 inline void init_limiter(py::module &m) {
@@ -166,10 +166,14 @@ public:
 
   float getVBRQuality() const { return vbrLevel; }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<MP3Compressor>();
+    plugin->setVBRQuality(vbrLevel);
+    return plugin;
+  }
+
   virtual void prepare(const juce::dsp::ProcessSpec &spec) override {
-    bool specChanged = lastSpec.sampleRate != spec.sampleRate ||
-                       lastSpec.maximumBlockSize < spec.maximumBlockSize ||
-                       lastSpec.numChannels != spec.numChannels;
+    bool specChanged = specRequiresPrepare(spec);
     if (!encoder || specChanged) {
       reset();
 
@@ -249,7 +253,7 @@ public:
       // between the output of LAME and data returned back to Pedalboard.
       outputBuffer.setSize(encoderInStreamLatency + spec.maximumBlockSize);
 
-      lastSpec = spec;
+      markPrepared(spec);
     }
   }
 
@@ -21,6 +21,7 @@
 #include <mutex>
 
 #include "../PluginContainer.h"
+#include "../WorkerPool.h"
 
 namespace Pedalboard {
 /**
@@ -29,11 +30,34 @@ namespace Pedalboard {
  */
 class Mix : public PluginContainer {
 public:
-  Mix(std::vector<std::shared_ptr<Plugin>> plugins)
+  Mix(std::vector<std::shared_ptr<Plugin>> plugins, int numThreads = 1)
       : PluginContainer(plugins), pluginBuffers(plugins.size()),
-        samplesAvailablePerPlugin(plugins.size()) {}
+        scratchBuffers(plugins.size()),
+        samplesAvailablePerPlugin(plugins.size()),
+        readIndexPerPlugin(plugins.size()) {
+    setNumThreads(numThreads);
+  }
   virtual ~Mix(){};
 
+  std::shared_ptr<Plugin> clone() override {
+    return std::make_shared<Mix>(clonePlugins(), numThreads);
+  }
+
+  int getNumThreads() const { return numThreads; }
+
+  void setNumThreads(int newNumThreads) {
+    if (newNumThreads < 1) {
+      throw std::range_error("Number of threads must be at least 1.");
+    }
+
+    if (newNumThreads != numThreads || !workerPool) {
+      // The calling thread renders branches too, so one fewer worker is
+      // needed than the number of threads requested:
+      workerPool = std::make_unique<WorkerPool>(newNumThreads - 1);
+      numThreads = newNumThreads;
+    }
+  }
+
   virtual void prepare(const juce::dsp::ProcessSpec &spec) {
     for (auto plugin : plugins) {
       if (plugin) {
@@ -41,101 +65,93 @@ public:
       }
     }
 
+    // Only touch our buffers if the spec has changed, if plugins have been
+    // added or removed, or if our plugins' latency has grown; otherwise, any
+    // samples buffered from the previous call are kept for the next one.
     int maximumBufferSize = getLatencyHint() + spec.maximumBlockSize;
+    bool specChanged = specRequiresPrepare(spec);
+    bool buffersTooSmall = pluginBuffers.size() != plugins.size();
     for (auto &buffer : pluginBuffers)
-      buffer.setSize(spec.numChannels, maximumBufferSize);
-    for (int i = 0; i < samplesAvailablePerPlugin.size(); i++)
-      samplesAvailablePerPlugin[i] = 0;
-    lastSpec = spec;
+      buffersTooSmall |= buffer.getNumSamples() < maximumBufferSize;
+
+    if (specChanged || buffersTooSmall) {
+      pluginBuffers.resize(plugins.size());
+      scratchBuffers.resize(plugins.size());
+      samplesAvailablePerPlugin.resize(plugins.size());
+      readIndexPerPlugin.resize(plugins.size());
+
+      for (int i = 0; i < plugins.size(); i++) {
+        if (specChanged) {
+          pluginBuffers[i].setSize(spec.numChannels, maximumBufferSize);
+          samplesAvailablePerPlugin[i] = 0;
+          readIndexPerPlugin[i] = 0;
+        } else {
+          growRingBuffer(i, maximumBufferSize);
+        }
+        scratchBuffers[i].setSize(spec.numChannels, spec.maximumBlockSize);
+      }
+      markPrepared(spec);
+    }
   }
 
   virtual int
   process(const juce::dsp::ProcessContextReplacing<float> &context) {
     auto ioBlock = context.getOutputBlock();
+    int numSamples = ioBlock.getNumSamples();
 
-    for (int i = 0; i < plugins.size(); i++) {
+    // Each branch only touches its own plugin and buffers until the final
+    // sum, so branches can be rendered concurrently if we have threads to
+    // spare:
+    workerPool->parallelFor(plugins.size(), [&](int i) {
       std::shared_ptr<Plugin> plugin = plugins[i];
-      juce::AudioBuffer<float> &buffer = pluginBuffers[i];
+      juce::AudioBuffer<float> &scratch = scratchBuffers[i];
 
-      int startInBuffer = samplesAvailablePerPlugin[i];
-      int endInBuffer = startInBuffer + ioBlock.getNumSamples();
       // If we don't have enough space, reallocate. (Reluctantly. This is the
       // "audio thread!")
-      if (endInBuffer > buffer.getNumSamples()) {
-        buffer.setSize(buffer.getNumChannels(), endInBuffer);
+      if (scratch.getNumSamples() < numSamples) {
+        scratch.setSize(ioBlock.getNumChannels(), numSamples);
       }
 
-      // Copy the audio input into each of these buffers:
-      context.getInputBlock().copyTo(buffer, 0, samplesAvailablePerPlugin[i]);
-
-      float **channelPointers =
-          (float **)alloca(ioBlock.getNumChannels() * sizeof(float *));
-      for (int c = 0; c < buffer.getNumChannels(); c++) {
-        channelPointers[c] = buffer.getWritePointer(c, startInBuffer);
-      }
-
-      auto subBlock = juce::dsp::AudioBlock<float>(
-          channelPointers, buffer.getNumChannels(), ioBlock.getNumSamples());
+      // Render this branch into its own scratch space:
+      auto subBlock =
+          juce::dsp::AudioBlock<float>(scratch).getSubBlock(0, numSamples);
+      subBlock.copyFrom(context.getInputBlock());
 
       juce::dsp::ProcessContextReplacing<float> subContext(subBlock);
 
-      int samplesRendered = subBlock.getNumSamples();
-
+      int samplesRendered = numSamples;
       if (plugin) {
         samplesRendered = plugin->process(subContext);
       }
-      samplesAvailablePerPlugin[i] += samplesRendered;
-
-      if (samplesRendered < subBlock.getNumSamples()) {
-        // Left-align the results in the buffer, as we'll need all
-        // of the plugins' outputs to be aligned:
-        for (int c = 0; c < pluginBuffers[i].getNumChannels(); c++) {
-          std::memmove(channelPointers[c],
-                       channelPointers[c] +
-                           (subBlock.getNumSamples() - samplesRendered),
-                       sizeof(float) * samplesRendered);
-        }
+
+      // ...then append its (right-aligned) output to this branch's ring
+      // buffer, which holds output not yet returned from this plugin:
+      if (samplesAvailablePerPlugin[i] + samplesRendered >
+          pluginBuffers[i].getNumSamples()) {
+        growRingBuffer(i, samplesAvailablePerPlugin[i] + samplesRendered);
       }
-    }
+      writeToRingBuffer(i, subBlock.getSubBlock(numSamples - samplesRendered,
+                                                samplesRendered));
+    });
 
     // Figure out the maximum number of samples we can return,
     // which is the min across all buffers:
-    int maxSamplesAvailable = ioBlock.getNumSamples();
+    int maxSamplesAvailable = numSamples;
     for (int i = 0; i < plugins.size(); i++) {
       maxSamplesAvailable =
           std::min(samplesAvailablePerPlugin[i], maxSamplesAvailable);
     }
 
-    // Now that each plugin has rendered into its own buffer, mix the output:
+    // Now that each plugin has rendered into its own buffer, mix the output,
+    // right-aligned, and consume exactly `maxSamplesAvailable` samples from
+    // each ring buffer:
     ioBlock.clear();
     if (maxSamplesAvailable) {
-      int leftEdge = ioBlock.getNumSamples() - maxSamplesAvailable;
-      auto subBlock = ioBlock.getSubBlock(leftEdge, maxSamplesAvailable);
-
-      for (auto &pluginBuffer : pluginBuffers) {
-        // Right-align exactly `maxSamplesAvailable` samples from each buffer:
-        juce::dsp::AudioBlock<float> pluginBufferAsBlock(pluginBuffer);
-
-        // Add as many samples as we can (which is maxSamplesAvailable,
-        // because subBlock is only that size):
-        subBlock.add(pluginBufferAsBlock);
-      }
-    }
+      auto subBlock = ioBlock.getSubBlock(numSamples - maxSamplesAvailable,
+                                          maxSamplesAvailable);
 
-    // Delete the samples we just returned from each buffer and shift the
-    // remaining content left:
-    int samplesToDelete = maxSamplesAvailable;
-    if (samplesToDelete) {
       for (int i = 0; i < plugins.size(); i++) {
-        int samplesRemaining = samplesAvailablePerPlugin[i] - samplesToDelete;
-        for (int c = 0; c < pluginBuffers[i].getNumChannels(); c++) {
-          float *channelBuffer = pluginBuffers[i].getWritePointer(c);
-
-          // Shift the remaining samples to the start of the buffer:
-          std::memmove(channelBuffer, channelBuffer + samplesToDelete,
-                       sizeof(float) * samplesRemaining);
-        }
-        samplesAvailablePerPlugin[i] -= samplesToDelete;
+        addFromRingBuffer(i, subBlock);
       }
     }
 
@@ -149,8 +165,28 @@ public:
       }
     }
 
-    for (auto buffer : pluginBuffers)
+    for (auto &buffer : pluginBuffers)
       buffer.clear();
+    for (int i = 0; i < samplesAvailablePerPlugin.size(); i++)
+      samplesAvailablePerPlugin[i] = 0;
+    for (int i = 0; i < readIndexPerPlugin.size(); i++)
+      readIndexPerPlugin[i] = 0;
+  }
+
+  void pluginInserted(size_t index) override {
+    // The new branch's buffers are allocated on the next call to prepare():
+    pluginBuffers.emplace(pluginBuffers.begin() + index);
+    scratchBuffers.emplace(scratchBuffers.begin() + index);
+    samplesAvailablePerPlugin.insert(samplesAvailablePerPlugin.begin() + index,
+                                     0);
+    readIndexPerPlugin.insert(readIndexPerPlugin.begin() + index, 0);
+  }
+
+  void pluginRemoved(size_t index) override {
+    pluginBuffers.erase(pluginBuffers.begin() + index);
+    scratchBuffers.erase(scratchBuffers.begin() + index);
+    samplesAvailablePerPlugin.erase(samplesAvailablePerPlugin.begin() + index);
+    readIndexPerPlugin.erase(readIndexPerPlugin.begin() + index);
   }
 
   virtual int getLatencyHint() {
@@ -163,9 +199,98 @@ public:
     return maxHint;
   }
 
+private:
+  /**
+   * Append the contents of the provided block to the end of the given
+   * plugin's ring buffer, which must have enough free space to hold it.
+   */
+  void writeToRingBuffer(int pluginIndex,
+                         const juce::dsp::AudioBlock<float> &block) {
+    juce::AudioBuffer<float> &buffer = pluginBuffers[pluginIndex];
+    int capacity = buffer.getNumSamples();
+    int numSamples = block.getNumSamples();
+    if (numSamples == 0) {
+      return;
+    }
+
+    int writeIndex = (readIndexPerPlugin[pluginIndex] +
+                      samplesAvailablePerPlugin[pluginIndex]) %
+                     capacity;
+
+    int firstPart = std::min(numSamples, capacity - writeIndex);
+    for (int c = 0; c < buffer.getNumChannels(); c++) {
+      const float *source = block.getChannelPointer(c);
+      buffer.copyFrom(c, writeIndex, source, firstPart);
+      if (firstPart < numSamples) {
+        buffer.copyFrom(c, 0, source + firstPart, numSamples - firstPart);
+      }
+    }
+
+    samplesAvailablePerPlugin[pluginIndex] += numSamples;
+  }
+
+  /**
+   * Add the oldest samples in the given plugin's ring buffer into the
+   * provided block (which must be no longer than the number of samples
+   * available), then remove them from the ring buffer.
+   */
+  void addFromRingBuffer(int pluginIndex, juce::dsp::AudioBlock<float> &block) {
+    juce::AudioBuffer<float> &buffer = pluginBuffers[pluginIndex];
+    int capacity = buffer.getNumSamples();
+    int numSamples = block.getNumSamples();
+    int readIndex = readIndexPerPlugin[pluginIndex];
+
+    int firstPart = std::min(numSamples, capacity - readIndex);
+    juce::dsp::AudioBlock<float> bufferAsBlock(buffer);
+    block.getSubBlock(0, firstPart)
+        .add(bufferAsBlock.getSubBlock(readIndex, firstPart));
+    if (firstPart < numSamples) {
+      block.getSubBlock(firstPart, numSamples - firstPart)
+          .add(bufferAsBlock.getSubBlock(0, numSamples - firstPart));
+    }
+
+    readIndexPerPlugin[pluginIndex] = (readIndex + numSamples) % capacity;
+    samplesAvailablePerPlugin[pluginIndex] -= numSamples;
+  }
+
+  /**
+   * Reallocate the given plugin's ring buffer to hold at least
+   * `minimumCapacity` samples, preserving (and unwrapping) its contents.
+   */
+  void growRingBuffer(int pluginIndex, int minimumCapacity) {
+    juce::AudioBuffer<float> &buffer = pluginBuffers[pluginIndex];
+    if (buffer.getNumSamples() >= minimumCapacity) {
+      return;
+    }
+
+    int numChannels = buffer.getNumChannels() ? buffer.getNumChannels()
+                                              : (int)lastSpec.numChannels;
+    juce::AudioBuffer<float> newBuffer(numChannels, minimumCapacity);
+    int samplesAvailable = samplesAvailablePerPlugin[pluginIndex];
+    if (samplesAvailable) {
+      auto contents = juce::dsp::AudioBlock<float>(newBuffer).getSubBlock(
+          0, samplesAvailable);
+      contents.clear();
+      addFromRingBuffer(pluginIndex, contents);
+    }
+
+    buffer = std::move(newBuffer);
+    readIndexPerPlugin[pluginIndex] = 0;
+    samplesAvailablePerPlugin[pluginIndex] = samplesAvailable;
+  }
+
 protected:
+  // Per-plugin ring buffers of rendered output that has not yet been
+  // returned, as each plugin may have a different latency:
   std::vector<juce::AudioBuffer<float>> pluginBuffers;
+  // Per-plugin scratch space for rendering a single block:
+  std::vector<juce::AudioBuffer<float>> scratchBuffers;
   std::vector<int> samplesAvailablePerPlugin;
+  std::vector<int> readIndexPerPlugin;
+
+private:
+  int numThreads = 0;
+  std::unique_ptr<WorkerPool> workerPool;
 };
 
 inline void init_mix(py::module &m) {
@@ -173,11 +298,25 @@ inline void init_mix(py::module &m) {
       m, "Mix",
       "A utility plugin that allows running other plugins in parallel. All "
       "plugins provided will be mixed equally.")
-      .def(py::init([](std::vector<std::shared_ptr<Plugin>> plugins) {
-             return new Mix(plugins);
-           }),
-           py::arg("plugins"))
+      .def(
+          py::init([](std::vector<std::shared_ptr<Plugin>> plugins,
+                      int numThreads) { return new Mix(plugins, numThreads); }),
+          py::arg("plugins"), py::arg("num_threads") = 1)
       .def(py::init([]() { return new Mix({}); }))
+      .def_property(
+          "num_threads",
+          [](Mix &plugin) {
+            std::scoped_lock lock(plugin.mutex);
+            return plugin.getNumThreads();
+          },
+          [](Mix &plugin, int numThreads) {
+            std::scoped_lock lock(plugin.mutex);
+            plugin.setNumThreads(numThreads);
+          },
+          "The number of threads used to render this plugin's branches. If "
+          "greater than 1, branches are rendered concurrently on a pool of "
+          "native threads before being summed. The output is identical "
+          "regardless of this setting.")
       .def("__repr__", [](Mix &plugin) {
         std::ostringstream ss;
         ss << "<pedalboard.Mix with " << plugin.getPlugins().size()
@@ -29,6 +29,15 @@ class NoiseGate : public JucePlugin<juce::dsp::NoiseGate<SampleType>> {
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Ratio, {});
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Attack, {});
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Release, {});
+
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<NoiseGate>();
+    plugin->setThreshold(getThreshold());
+    plugin->setRatio(getRatio());
+    plugin->setAttack(getAttack());
+    plugin->setRelease(getRelease());
+    return plugin;
+  }
 };
 
 inline void init_noisegate(py::module &m) {
@@ -30,6 +30,16 @@ class Phaser : public JucePlugin<juce::dsp::Phaser<SampleType>> {
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, CentreFrequency, {});
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Feedback, {});
   DEFINE_DSP_SETTER_AND_GETTER(SampleType, Mix, {});
+
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Phaser>();
+    plugin->setRate(getRate());
+    plugin->setDepth(getDepth());
+    plugin->setCentreFrequency(getCentreFrequency());
+    plugin->setFeedback(getFeedback());
+    plugin->setMix(getMix());
+    return plugin;
+  }
 };
 
 inline void init_phaser(py::module &m) {
@@ -51,6 +51,12 @@ public:
 
   double getSemitones() const { return _semitones; }
 
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<PitchShift>();
+    plugin->setSemitones(_semitones);
+    return plugin;
+  }
+
   void prepare(const juce::dsp::ProcessSpec &spec) override final {
     setSilenceLengthSamples(spec.sampleRate);
     PrimeWithSilence<RubberbandPlugin>::prepare(spec);
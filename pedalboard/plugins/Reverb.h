@@ -74,6 +74,12 @@ public:
     parameters.freezeMode = value;
     this->getDSP().setParameters(parameters);
   }
+
+  std::shared_ptr<Plugin> clone() override {
+    auto plugin = std::make_shared<Reverb>();
+    plugin->getDSP().setParameters(getDSP().getParameters());
+    return plugin;
+  }
 };
 
 inline void init_reverb(py::module &m) {
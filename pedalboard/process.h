@@ -18,12 +18,15 @@
 #pragma once
 #include "JuceHeader.h"
 
+#include <atomic>
+#include <numeric>
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 
 #include "BufferUtils.h"
 #include "Plugin.h"
 #include "PluginContainer.h"
+#include "WorkerPool.h"
 
 namespace py = pybind11;
 
@@ -56,7 +59,6 @@ inline int process(juce::AudioBuffer<float> &ioBuffer,
   // Actually run the plugins over the ioBuffer, in small chunks, to minimize
   // memory usage:
   int startOfOutputInBuffer = 0;
-  int lastSampleInBuffer = 0;
 
   for (auto plugin : plugins) {
     if (!plugin)
@@ -64,6 +66,11 @@ inline int process(juce::AudioBuffer<float> &ioBuffer,
 
     int pluginSamplesReceived = 0;
 
+    // The index just past the last sample of contiguous output produced by
+    // this plugin so far, if any. New output is written here directly, so that
+    // gaps never need to be consolidated by moving all previous output.
+    int outputCursor = -1;
+
     unsigned int blockSize = spec.maximumBlockSize;
     for (unsigned int blockStart = startOfOutputInBuffer;
          blockStart < (unsigned int)intendedOutputBufferSize;
@@ -93,38 +100,32 @@ inline int process(juce::AudioBuffer<float> &ioBuffer,
             "This is an internal Pedalboard error and should be reported.");
       }
 
-      if (missingSamples > 0 && pluginSamplesReceived > 0) {
-        // This can only happen if the plugin we're using is returning us more
-        // than one chunk of audio that's not completely full, which can
-        // happen sometimes. In this case, we would end up with gaps in the
-        // audio output:
-        //               empty  empty  full   part
-        //              [______|______|AAAAAA|__BBBB]
-        //   end of most recently rendered block-->-^
-        // We need to consolidate those gaps by moving them forward in time.
-        // To do so, we take the section from the earliest known output to the
-        // start of this block, and right-align it to the left side of the
-        // current block's content:
-        //               empty  empty  part   full
-        //              [______|______|__AAAA|AABBBB]
-        //   end of most recently rendered block-->-^
-        for (int c = 0; c < ioBuffer.getNumChannels(); c++) {
-          // Only move the samples received before this latest block was
-          // rendered, as audio is right-aligned within blocks by convention.
-          int samplesToMove = pluginSamplesReceived - outputSamples;
-          float *outputStart =
-              ioBuffer.getWritePointer(c) + totalOutputLatencySamples;
-          float *expectedOutputEnd =
-              ioBuffer.getWritePointer(c) + blockEnd - outputSamples;
-          float *expectedOutputStart = expectedOutputEnd - samplesToMove;
-
-          std::memmove((char *)expectedOutputStart, (char *)outputStart,
-                       sizeof(float) * samplesToMove);
+      if (outputSamples > 0) {
+        int startOfBlockOutput = blockEnd - outputSamples;
+        if (outputCursor == -1) {
+          outputCursor = startOfBlockOutput;
+        } else if (outputCursor != startOfBlockOutput) {
+          // This can only happen if the plugin we're using has returned us
+          // more than one chunk of audio that's not completely full, which
+          // would leave gaps in the audio output:
+          //               empty  empty  full   part
+          //              [______|______|AAAAAA|__BBBB]
+          //          output cursor-->-^        ^-<--block output
+          // Rather than moving all previous output forward in time to close
+          // the gap, move only this block's output back to the cursor:
+          //               empty  empty  full   part
+          //              [______|______|AAAAAA|BBBB__]
+          //                       output cursor-->-^
+          for (int c = 0; c < ioBuffer.getNumChannels(); c++) {
+            float *channel = ioBuffer.getWritePointer(c);
+            std::memmove((char *)(channel + outputCursor),
+                         (char *)(channel + startOfBlockOutput),
+                         sizeof(float) * outputSamples);
+          }
         }
+        outputCursor += outputSamples;
       }
 
-      lastSampleInBuffer =
-          std::max(lastSampleInBuffer, (int)(blockStart + outputSamples));
       startOfOutputInBuffer += missingSamples;
       totalOutputLatencySamples += missingSamples;
 
@@ -142,6 +143,18 @@ inline int process(juce::AudioBuffer<float> &ioBuffer,
         }
       }
     }
+
+    // Output is right-aligned by convention, so if any gaps were closed
+    // above, move this plugin's output (once) to the end of the buffer:
+    if (outputCursor != -1 && outputCursor != intendedOutputBufferSize) {
+      for (int c = 0; c < ioBuffer.getNumChannels(); c++) {
+        float *channel = ioBuffer.getWritePointer(c);
+        std::memmove((char *)(channel + intendedOutputBufferSize -
+                              pluginSamplesReceived),
+                     (char *)(channel + outputCursor - pluginSamplesReceived),
+                     sizeof(float) * pluginSamplesReceived);
+      }
+    }
   }
 
   // Trim the output buffer down to size; this operation should be
@@ -154,6 +167,222 @@ inline int process(juce::AudioBuffer<float> &ioBuffer,
   return intendedOutputBufferSize - totalOutputLatencySamples;
 }
 
+/**
+ * The order in which a list of plugins is run over a buffer of audio.
+ */
+enum class RenderOrder {
+  // Run each plugin over the entire buffer before running the next plugin.
+  PluginByPlugin,
+
+  // Run each block of the buffer through every plugin before moving on to the
+  // next block, which keeps the working set small enough to stay in cache.
+  BlockByBlock,
+};
+
+inline RenderOrder parseRenderOrder(const std::string &renderOrder) {
+  if (renderOrder == "plugin") {
+    return RenderOrder::PluginByPlugin;
+  } else if (renderOrder == "block") {
+    return RenderOrder::BlockByBlock;
+  } else {
+    throw std::domain_error("process got an unknown value for render_order; "
+                            "expected one of \"plugin\" or \"block\", but "
+                            "was passed: \"" +
+                            renderOrder + "\"");
+  }
+}
+
+/**
+ * A non-owning view over a list of plugins that renders every block it is
+ * passed through each of those plugins in turn. Passing a single instance of
+ * this class to process() renders the list depth-first (block by block) while
+ * reusing the same latency compensation logic that process() applies to any
+ * other plugin.
+ *
+ * The plugins themselves must already be prepared and locked by the caller.
+ */
+class BlockInterleavedRenderer : public Plugin {
+public:
+  BlockInterleavedRenderer(const std::vector<std::shared_ptr<Plugin>> &plugins,
+                           const juce::dsp::ProcessSpec &spec)
+      : plugins(plugins) {
+    lastSpec = spec;
+  }
+  virtual ~BlockInterleavedRenderer(){};
+
+  virtual void prepare(const juce::dsp::ProcessSpec &spec) { lastSpec = spec; }
+
+  virtual int
+  process(const juce::dsp::ProcessContextReplacing<float> &context) {
+    auto ioBlock = context.getOutputBlock();
+
+    float **channels =
+        (float **)alloca(ioBlock.getNumChannels() * sizeof(float *));
+    for (int i = 0; i < ioBlock.getNumChannels(); i++) {
+      channels[i] = ioBlock.getChannelPointer(i);
+    }
+
+    juce::AudioBuffer<float> ioBuffer(channels, ioBlock.getNumChannels(),
+                                      ioBlock.getNumSamples());
+    return ::Pedalboard::process(ioBuffer, lastSpec, plugins, false);
+  }
+
+  virtual void reset() {}
+
+  virtual int getLatencyHint() {
+    int hint = 0;
+    for (auto plugin : plugins) {
+      if (plugin) {
+        hint += plugin->getLatencyHint();
+      }
+    }
+    return hint;
+  }
+
+private:
+  const std::vector<std::shared_ptr<Plugin>> &plugins;
+};
+
+/**
+ * Holds the locks of every plugin in a list, including those nested inside
+ * of PluginContainers, for as long as this object is in scope. Throws if the
+ * same plugin instance appears more than once.
+ *
+ * We'd pass multiple arguments to scoped_lock here, but we don't know how
+ * many plugins have been passed at compile time - so instead, we do our own
+ * deadlock-avoiding multiple-lock algorithm here. By locking each plugin
+ * only in order of its pointers, we're guaranteed to avoid deadlocks with
+ * other threads that may be running this same code on the same plugins.
+ *
+ * In the common case of processing a single plugin (or a single container of
+ * plugins), no memory is allocated; containers cache their sorted lock sets.
+ */
+class PluginLocks {
+public:
+  explicit PluginLocks(const std::vector<std::shared_ptr<Plugin>> &plugins) {
+    if (plugins.size() == 1 && plugins[0]) {
+      if (auto *pluginContainer =
+              dynamic_cast<PluginContainer *>(plugins[0].get())) {
+        lockSet = pluginContainer->getLockSet();
+      } else {
+        singlePlugin = plugins[0].get();
+        singlePlugin->mutex.lock();
+        return;
+      }
+    } else {
+      auto newLockSet = std::make_shared<PluginLockSet>();
+      for (auto plugin : plugins) {
+        if (!plugin)
+          continue;
+        newLockSet->containedPlugins.push_back(plugin);
+        if (auto pluginContainer =
+                dynamic_cast<PluginContainer *>(plugin.get())) {
+          auto children = pluginContainer->getAllPlugins();
+          newLockSet->containedPlugins.insert(
+              newLockSet->containedPlugins.end(), children.begin(),
+              children.end());
+        }
+      }
+
+      for (auto &plugin : newLockSet->containedPlugins) {
+        newLockSet->sortedPlugins.push_back(plugin.get());
+      }
+      std::sort(newLockSet->sortedPlugins.begin(),
+                newLockSet->sortedPlugins.end());
+      newLockSet->containsDuplicates =
+          std::adjacent_find(newLockSet->sortedPlugins.begin(),
+                             newLockSet->sortedPlugins.end()) !=
+          newLockSet->sortedPlugins.end();
+      lockSet = newLockSet;
+    }
+
+    if (lockSet->containsDuplicates) {
+      throw std::runtime_error(
+          "The same plugin instance is being used multiple times in the same "
+          "chain of plugins, which would cause undefined results. Please "
+          "ensure that no duplicate plugins are present before calling.");
+    }
+
+    for (Plugin *plugin : lockSet->sortedPlugins) {
+      plugin->mutex.lock();
+    }
+  }
+
+  ~PluginLocks() {
+    if (singlePlugin) {
+      singlePlugin->mutex.unlock();
+    } else if (lockSet) {
+      for (auto it = lockSet->sortedPlugins.rbegin();
+           it != lockSet->sortedPlugins.rend(); it++) {
+        (*it)->mutex.unlock();
+      }
+    }
+  }
+
+  PluginLocks(const PluginLocks &) = delete;
+  PluginLocks &operator=(const PluginLocks &) = delete;
+
+private:
+  Plugin *singlePlugin = nullptr;
+  std::shared_ptr<const PluginLockSet> lockSet;
+};
+
+/**
+ * Optionally reset, then prepare each of the provided (already locked)
+ * plugins for processing, returning the spec they were prepared with.
+ */
+inline juce::dsp::ProcessSpec
+preparePlugins(const std::vector<std::shared_ptr<Plugin>> &plugins,
+               double sampleRate, unsigned int bufferSize, int numChannels,
+               bool reset) {
+  if (reset) {
+    for (auto plugin : plugins) {
+      if (!plugin)
+        continue;
+      plugin->reset();
+    }
+  }
+
+  juce::dsp::ProcessSpec spec;
+  spec.sampleRate = sampleRate;
+  spec.maximumBlockSize = static_cast<juce::uint32>(bufferSize);
+  spec.numChannels = static_cast<juce::uint32>(numChannels);
+
+  for (auto plugin : plugins) {
+    if (!plugin)
+      continue;
+    plugin->prepare(spec);
+  }
+  return spec;
+}
+
+/**
+ * Create an empty output array with the same shape as an input array that
+ * contains zero channels of audio.
+ */
+inline py::array_t<float>
+createZeroChannelOutputArray(int ndim, ChannelLayout inputChannelLayout,
+                             unsigned int numSamples) {
+  unsigned int numChannels = 0;
+  py::array_t<float> outputArray;
+  if (ndim == 2) {
+    switch (inputChannelLayout) {
+    case ChannelLayout::Interleaved:
+      outputArray = py::array_t<float>({numSamples, numChannels});
+      break;
+    case ChannelLayout::NotInterleaved:
+      outputArray = py::array_t<float>({numChannels, numSamples});
+      break;
+    default:
+      throw std::runtime_error(
+          "Internal error: got unexpected channel layout.");
+    }
+  } else {
+    outputArray = py::array_t<float>(0);
+  }
+  return outputArray;
+}
+
 /**
  * Process a given audio buffer through a list of
  * Pedalboard plugins at a given sample rate.
@@ -162,7 +391,8 @@ inline int process(juce::AudioBuffer<float> &ioBuffer,
 py::array_t<float>
 processFloat32(const py::array_t<float, py::array::c_style> inputArray,
                double sampleRate, std::vector<std::shared_ptr<Plugin>> plugins,
-               unsigned int bufferSize, bool reset) {
+               unsigned int bufferSize, bool reset,
+               RenderOrder renderOrder = RenderOrder::PluginByPlugin) {
 
   ChannelLayout inputChannelLayout;
   if (!plugins.empty()) {
@@ -175,28 +405,12 @@ processFloat32(const py::array_t<float, py::array::c_style> inputArray,
       copyPyArrayIntoJuceBuffer(inputArray, {inputChannelLayout});
 
   if (ioBuffer.getNumChannels() == 0) {
-    unsigned int numChannels = 0;
-    unsigned int numSamples = ioBuffer.getNumSamples();
     // We have no channels to process; just return an empty output array with
     // the same shape. Passing zero channels into JUCE breaks some assumptions
     // all over the place.
-    py::array_t<float> outputArray;
-    if (inputArray.request().ndim == 2) {
-      switch (inputChannelLayout) {
-      case ChannelLayout::Interleaved:
-        outputArray = py::array_t<float>({numSamples, numChannels});
-        break;
-      case ChannelLayout::NotInterleaved:
-        outputArray = py::array_t<float>({numChannels, numSamples});
-        break;
-      default:
-        throw std::runtime_error(
-            "Internal error: got unexpected channel layout.");
-      }
-    } else {
-      outputArray = py::array_t<float>(0);
-    }
-    return outputArray;
+    return createZeroChannelOutputArray(inputArray.request().ndim,
+                                        inputChannelLayout,
+                                        ioBuffer.getNumSamples());
   }
 
   int totalOutputLatencySamples;
@@ -206,93 +420,392 @@ processFloat32(const py::array_t<float, py::array::c_style> inputArray,
 
     bufferSize = std::min(bufferSize, (unsigned int)ioBuffer.getNumSamples());
 
-    // We'd pass multiple arguments to scoped_lock here, but we don't know how
-    // many plugins have been passed at compile time - so instead, we do our own
-    // deadlock-avoiding multiple-lock algorithm here. By locking each plugin
-    // only in order of its pointers, we're guaranteed to avoid deadlocks with
-    // other threads that may be running this same code on the same plugins.
-    std::vector<std::shared_ptr<Plugin>> allPlugins;
-    for (auto plugin : plugins) {
-      if (!plugin)
-        continue;
-      allPlugins.push_back(plugin);
-      if (auto pluginContainer =
-              dynamic_cast<PluginContainer *>(plugin.get())) {
-        auto children = pluginContainer->getAllPlugins();
-        allPlugins.insert(allPlugins.end(), children.begin(), children.end());
+    PluginLocks pluginLocks(plugins);
+    auto spec = preparePlugins(plugins, sampleRate, bufferSize,
+                               ioBuffer.getNumChannels(), reset);
+
+    // Actually run the process method of all plugins.
+    int samplesReturned;
+    if (renderOrder == RenderOrder::BlockByBlock && plugins.size() > 1) {
+      std::vector<std::shared_ptr<Plugin>> renderer = {
+          std::make_shared<BlockInterleavedRenderer>(plugins, spec)};
+      samplesReturned = process(ioBuffer, spec, renderer, reset);
+    } else {
+      samplesReturned = process(ioBuffer, spec, plugins, reset);
+    }
+    totalOutputLatencySamples = ioBuffer.getNumSamples() - samplesReturned;
+  }
+
+  // ioBuffer is no longer needed, so let the output array take ownership of
+  // its storage (if possible) instead of copying it:
+  return moveJuceBufferIntoPyArray(std::move(ioBuffer), inputChannelLayout,
+                                   totalOutputLatencySamples,
+                                   inputArray.request().ndim);
+}
+
+/**
+ * Process a list of independent audio buffers through a list of Pedalboard
+ * plugins at a given sample rate, as if process() was called on each buffer
+ * in turn. The plugins are only locked once for the whole batch, and the GIL
+ * is released while the audio is copied and processed.
+ */
+inline std::vector<py::array_t<float>> processBatchFloat32(
+    const std::vector<py::array_t<float, py::array::c_style>> &inputArrays,
+    double sampleRate, std::vector<std::shared_ptr<Plugin>> plugins,
+    unsigned int bufferSize, bool reset) {
+  size_t numInputs = inputArrays.size();
+
+  std::vector<ChannelLayout> inputChannelLayouts;
+  std::vector<py::buffer_info> inputInfos;
+  std::vector<unsigned int> inputChannelCounts;
+  std::vector<unsigned int> inputBlockSizes;
+  inputChannelLayouts.reserve(numInputs);
+  inputInfos.reserve(numInputs);
+  inputChannelCounts.reserve(numInputs);
+  inputBlockSizes.reserve(numInputs);
+
+  for (const auto &inputArray : inputArrays) {
+    ChannelLayout inputChannelLayout;
+    if (!plugins.empty() && plugins[0]) {
+      inputChannelLayout = plugins[0]->parseAndCacheChannelLayout(inputArray);
+    } else {
+      inputChannelLayout = detectChannelLayout(inputArray);
+    }
+
+    py::buffer_info inputInfo = inputArray.request();
+    unsigned int numChannels = 1;
+    unsigned int numSamples = inputInfo.shape[0];
+    if (inputInfo.ndim == 2) {
+      if (inputChannelLayout == ChannelLayout::NotInterleaved) {
+        numChannels = inputInfo.shape[0];
+        numSamples = inputInfo.shape[1];
+      } else {
+        numChannels = inputInfo.shape[1];
       }
     }
 
-    std::sort(allPlugins.begin(), allPlugins.end(),
-              [](const std::shared_ptr<Plugin> lhs,
-                 const std::shared_ptr<Plugin> rhs) {
-                return lhs.get() < rhs.get();
-              });
+    inputChannelLayouts.push_back(inputChannelLayout);
+    inputInfos.push_back(std::move(inputInfo));
+    inputChannelCounts.push_back(numChannels);
+    // As in processFloat32, each buffer is processed with a block size no
+    // larger than the buffer itself:
+    inputBlockSizes.push_back(std::min(bufferSize, numSamples));
+  }
 
-    bool containsDuplicates =
-        std::adjacent_find(allPlugins.begin(), allPlugins.end()) !=
-        allPlugins.end();
+  // If each buffer is processed from a clean state, we're free to process
+  // the buffers with the same number of channels together, longest first, so
+  // that the plugins' buffers only need to be allocated once per group:
+  std::vector<size_t> processingOrder(numInputs);
+  std::iota(processingOrder.begin(), processingOrder.end(), 0);
+  if (reset) {
+    std::stable_sort(processingOrder.begin(), processingOrder.end(),
+                     [&](size_t lhs, size_t rhs) {
+                       if (inputChannelCounts[lhs] != inputChannelCounts[rhs])
+                         return inputChannelCounts[lhs] <
+                                inputChannelCounts[rhs];
+                       return inputBlockSizes[lhs] > inputBlockSizes[rhs];
+                     });
+  }
 
-    if (containsDuplicates) {
-      throw std::runtime_error(
-          "The same plugin instance is being used multiple times in the same "
-          "chain of plugins, which would cause undefined results. Please "
-          "ensure that no duplicate plugins are present before calling.");
+  std::vector<juce::AudioBuffer<float>> ioBuffers(numInputs);
+  std::vector<int> totalOutputLatencySamples(numInputs);
+
+  {
+    py::gil_scoped_release release;
+
+    PluginLocks pluginLocks(plugins);
+
+    std::optional<juce::dsp::ProcessSpec> spec;
+    for (size_t i : processingOrder) {
+      juce::AudioBuffer<float> &ioBuffer = ioBuffers[i];
+      ioBuffer = copyBufferInfoIntoJuceBuffer<float>(inputInfos[i],
+                                                     inputChannelLayouts[i]);
+      unsigned int numChannels = ioBuffer.getNumChannels();
+      if (numChannels == 0) {
+        continue;
+      }
+
+      // Plugins must be prepared after every reset, but most plugins skip
+      // any reallocation when re-prepared with the same number of channels
+      // and an equal or smaller block size:
+      if (reset || !spec || spec->numChannels != numChannels ||
+          spec->maximumBlockSize != inputBlockSizes[i]) {
+        spec = preparePlugins(plugins, sampleRate, inputBlockSizes[i],
+                              numChannels, reset);
+      }
+
+      int samplesReturned = process(ioBuffer, *spec, plugins, reset);
+      totalOutputLatencySamples[i] = ioBuffer.getNumSamples() - samplesReturned;
     }
+  }
 
-    std::vector<std::unique_ptr<std::scoped_lock<std::mutex>>> pluginLocks;
-    for (auto plugin : allPlugins) {
-      pluginLocks.push_back(
-          std::make_unique<std::scoped_lock<std::mutex>>(plugin->mutex));
+  std::vector<py::array_t<float>> outputArrays;
+  outputArrays.reserve(numInputs);
+  for (size_t i = 0; i < numInputs; i++) {
+    if (ioBuffers[i].getNumChannels() == 0) {
+      outputArrays.push_back(createZeroChannelOutputArray(
+          inputInfos[i].ndim, inputChannelLayouts[i],
+          ioBuffers[i].getNumSamples()));
+    } else {
+      outputArrays.push_back(moveJuceBufferIntoPyArray(
+          std::move(ioBuffers[i]), inputChannelLayouts[i],
+          totalOutputLatencySamples[i], inputInfos[i].ndim));
     }
+  }
+  return outputArrays;
+}
 
-    if (reset) {
-      for (auto plugin : plugins) {
-        if (!plugin)
+/**
+ * Process a list of independent audio buffers across multiple native threads,
+ * returning the processed buffers in the same order. Each entry in
+ * pluginInstances must be an independent copy of the same plugin, sharing no
+ * plugin instances with the others; each copy is used by one thread at a time.
+ * Every buffer is processed from a clean (reset) state.
+ */
+inline std::vector<py::array_t<float>> renderManyFloat32(
+    const std::vector<py::array_t<float, py::array::c_style>> &inputArrays,
+    double sampleRate,
+    const std::vector<std::shared_ptr<Plugin>> &pluginInstances,
+    unsigned int bufferSize) {
+  if (pluginInstances.empty()) {
+    throw std::domain_error("At least one plugin instance must be provided.");
+  }
+
+  size_t numInputs = inputArrays.size();
+
+  std::vector<ChannelLayout> inputChannelLayouts;
+  std::vector<py::buffer_info> inputInfos;
+  inputChannelLayouts.reserve(numInputs);
+  inputInfos.reserve(numInputs);
+  for (const auto &inputArray : inputArrays) {
+    if (pluginInstances[0]) {
+      inputChannelLayouts.push_back(
+          pluginInstances[0]->parseAndCacheChannelLayout(inputArray));
+    } else {
+      inputChannelLayouts.push_back(detectChannelLayout(inputArray));
+    }
+    inputInfos.push_back(inputArray.request());
+  }
+
+  std::vector<juce::AudioBuffer<float>> ioBuffers(numInputs);
+  std::vector<int> totalOutputLatencySamples(numInputs);
+
+  {
+    py::gil_scoped_release release;
+
+    int numWorkers =
+        (int)std::min(pluginInstances.size(), std::max(numInputs, (size_t)1));
+    WorkerPool workerPool(numWorkers - 1);
+    std::atomic<size_t> nextInput = 0;
+
+    workerPool.parallelFor(numWorkers, [&](int workerIndex) {
+      std::vector<std::shared_ptr<Plugin>> plugins = {
+          pluginInstances[workerIndex]};
+      PluginLocks pluginLocks(plugins);
+
+      for (size_t i = nextInput++; i < numInputs; i = nextInput++) {
+        juce::AudioBuffer<float> &ioBuffer = ioBuffers[i];
+        ioBuffer = copyBufferInfoIntoJuceBuffer<float>(inputInfos[i],
+                                                       inputChannelLayouts[i]);
+        if (ioBuffer.getNumChannels() == 0) {
           continue;
-        plugin->reset();
+        }
+
+        auto spec = preparePlugins(
+            plugins, sampleRate,
+            std::min(bufferSize, (unsigned int)ioBuffer.getNumSamples()),
+            ioBuffer.getNumChannels(), /* reset= */ true);
+        int samplesReturned = process(ioBuffer, spec, plugins, true);
+        totalOutputLatencySamples[i] =
+            ioBuffer.getNumSamples() - samplesReturned;
       }
+    });
+  }
+
+  std::vector<py::array_t<float>> outputArrays;
+  outputArrays.reserve(numInputs);
+  for (size_t i = 0; i < numInputs; i++) {
+    if (ioBuffers[i].getNumChannels() == 0) {
+      outputArrays.push_back(createZeroChannelOutputArray(
+          inputInfos[i].ndim, inputChannelLayouts[i],
+          ioBuffers[i].getNumSamples()));
+    } else {
+      outputArrays.push_back(moveJuceBufferIntoPyArray(
+          std::move(ioBuffers[i]), inputChannelLayouts[i],
+          totalOutputLatencySamples[i], inputInfos[i].ndim));
     }
+  }
+  return outputArrays;
+}
 
-    juce::dsp::ProcessSpec spec;
-    spec.sampleRate = sampleRate;
-    spec.maximumBlockSize = static_cast<juce::uint32>(bufferSize);
-    spec.numChannels = static_cast<juce::uint32>(ioBuffer.getNumChannels());
+/**
+ * Process a writable, C-contiguous, channels-first buffer of float32 audio
+ * in-place through a list of Pedalboard plugins, without copying it into a
+ * separate JUCE buffer. As the audio can't change length, this is only
+ * possible if none of the plugins introduce any latency.
+ */
+inline void
+processFloat32InPlace(py::array_t<float, py::array::c_style> inputArray,
+                      double sampleRate,
+                      std::vector<std::shared_ptr<Plugin>> plugins,
+                      unsigned int bufferSize, bool reset) {
+  ChannelLayout inputChannelLayout;
+  if (!plugins.empty() && plugins[0]) {
+    inputChannelLayout = plugins[0]->parseAndCacheChannelLayout(inputArray);
+  } else {
+    inputChannelLayout = detectChannelLayout(inputArray);
+  }
+
+  py::buffer_info inputInfo = inputArray.request(/* writable= */ true);
+
+  unsigned int numChannels = 0;
+  unsigned int numSamples = 0;
+  if (inputInfo.ndim == 1) {
+    numChannels = 1;
+    numSamples = inputInfo.shape[0];
+  } else if (inputChannelLayout == ChannelLayout::NotInterleaved) {
+    numChannels = inputInfo.shape[0];
+    numSamples = inputInfo.shape[1];
+  } else if (inputInfo.shape[1] == 1) {
+    // Interleaved mono audio has the same memory layout as channels-first:
+    numChannels = 1;
+    numSamples = inputInfo.shape[0];
+  } else {
+    throw std::domain_error(
+        "process_inplace requires channels-first audio (with shape "
+        "(num_channels, num_samples)), but was passed audio with shape (" +
+        std::to_string(inputInfo.shape[0]) + ", " +
+        std::to_string(inputInfo.shape[1]) +
+        "). Use np.ascontiguousarray(audio.T) to convert interleaved audio "
+        "to channels-first audio.");
+  }
+
+  if (numChannels == 0 || numSamples == 0) {
+    return;
+  }
+
+  float **channelPointers = (float **)alloca(numChannels * sizeof(float *));
+  for (unsigned int c = 0; c < numChannels; c++) {
+    channelPointers[c] = static_cast<float *>(inputInfo.ptr) + (c * numSamples);
+  }
+  juce::AudioBuffer<float> ioBuffer(channelPointers, numChannels, numSamples);
+
+  {
+    py::gil_scoped_release release;
+
+    bufferSize = std::min(bufferSize, numSamples);
+    PluginLocks pluginLocks(plugins);
+    auto spec =
+        preparePlugins(plugins, sampleRate, bufferSize, numChannels, reset);
 
+    int expectedOutputLatency = 0;
     for (auto plugin : plugins) {
-      if (!plugin)
-        continue;
-      plugin->prepare(spec);
+      if (plugin) {
+        expectedOutputLatency += plugin->getLatencyHint();
+      }
     }
 
-    // Actually run the process method of all plugins.
-    int samplesReturned = process(ioBuffer, spec, plugins, reset);
-    totalOutputLatencySamples = ioBuffer.getNumSamples() - samplesReturned;
+    if (expectedOutputLatency > 0) {
+      throw std::runtime_error(
+          "process_inplace cannot be used with plugins that introduce latency "
+          "(as the output would be " +
+          std::to_string(expectedOutputLatency) +
+          " samples longer than the input). Use process instead.");
+    }
+
+    // Never allow process() to resize the buffer here, as it points directly
+    // at the memory of the provided array:
+    int samplesReturned =
+        process(ioBuffer, spec, plugins, /* isProbablyLastProcessCall= */
+                false);
+    if (samplesReturned != (int)numSamples) {
+      throw std::runtime_error(
+          "process_inplace was passed " + std::to_string(numSamples) +
+          " samples, but the plugins returned " +
+          std::to_string(samplesReturned) +
+          " samples, so the provided array now contains partial output. Use "
+          "process instead for plugins that change the length of audio.");
+    }
   }
+}
 
-  return copyJuceBufferIntoPyArray(ioBuffer, inputChannelLayout,
-                                   totalOutputLatencySamples,
-                                   inputArray.request().ndim);
+void processInPlace(py::array inputArray, double sampleRate,
+                    const std::vector<std::shared_ptr<Plugin>> plugins,
+                    unsigned int bufferSize, bool reset) {
+  if (inputArray.dtype().char_() != 'f') {
+    throw py::type_error("process_inplace only supports 32-bit floating point "
+                         "audio; use process for other data types.");
+  }
+
+  if (!inputArray.writeable()) {
+    throw py::value_error(
+        "process_inplace requires a writable array, but the provided array "
+        "is read-only.");
+  }
+
+  if (!(inputArray.flags() & py::array::c_style)) {
+    throw py::value_error("process_inplace requires a C-contiguous array; use "
+                          "np.ascontiguousarray to convert it first.");
+  }
+
+  processFloat32InPlace(
+      py::reinterpret_borrow<py::array_t<float, py::array::c_style>>(
+          inputArray),
+      sampleRate, plugins, bufferSize, reset);
 }
 
-py::array_t<float> process(py::array inputArray, double sampleRate,
-                           const std::vector<std::shared_ptr<Plugin>> plugins,
-                           unsigned int bufferSize, bool reset) {
-  py::array_t<float, py::array::c_style> float32InputArray;
+/**
+ * Convert a Python array of 32-bit or 64-bit floating point audio into a
+ * C-contiguous 32-bit floating point array, copying only if necessary.
+ */
+inline py::array_t<float, py::array::c_style>
+ensureFloat32Array(py::array inputArray) {
   switch (inputArray.dtype().char_()) {
   case 'f':
-    float32InputArray = inputArray;
-    break;
+    return inputArray;
   case 'd':
-    float32InputArray = inputArray.attr("astype")("float32");
-    break;
+    return inputArray.attr("astype")("float32");
   default:
     throw py::type_error("Pedalboard only supports 32-bit and 64-bit floating "
                          "point audio for processing.");
   }
+}
+
+std::vector<py::array_t<float>>
+processBatch(const std::vector<py::array> inputArrays, double sampleRate,
+             const std::vector<std::shared_ptr<Plugin>> plugins,
+             unsigned int bufferSize, bool reset) {
+  std::vector<py::array_t<float, py::array::c_style>> float32InputArrays;
+  float32InputArrays.reserve(inputArrays.size());
+  for (const auto &inputArray : inputArrays) {
+    float32InputArrays.push_back(ensureFloat32Array(inputArray));
+  }
+
+  return processBatchFloat32(float32InputArrays, sampleRate, plugins,
+                             bufferSize, reset);
+}
+
+std::vector<py::array_t<float>>
+renderMany(const std::vector<py::array> inputArrays, double sampleRate,
+           const std::vector<std::shared_ptr<Plugin>> pluginInstances,
+           unsigned int bufferSize) {
+  std::vector<py::array_t<float, py::array::c_style>> float32InputArrays;
+  float32InputArrays.reserve(inputArrays.size());
+  for (const auto &inputArray : inputArrays) {
+    float32InputArrays.push_back(ensureFloat32Array(inputArray));
+  }
 
-  return processFloat32(float32InputArray, sampleRate, plugins, bufferSize,
-                        reset);
+  return renderManyFloat32(float32InputArrays, sampleRate, pluginInstances,
+                           bufferSize);
+}
+
+py::array_t<float>
+process(py::array inputArray, double sampleRate,
+        const std::vector<std::shared_ptr<Plugin>> plugins,
+        unsigned int bufferSize, bool reset,
+        RenderOrder renderOrder = RenderOrder::PluginByPlugin) {
+  return processFloat32(ensureFloat32Array(inputArray), sampleRate, plugins,
+                        bufferSize, reset, renderOrder);
 }
 
 } // namespace Pedalboard
\ No newline at end of file
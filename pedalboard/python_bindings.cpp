@@ -31,6 +31,7 @@ namespace py = pybind11;
 #include "JucePlugin.h"
 #include "Plugin.h"
 #include "PluginContainer.h"
+#include "StreamingSession.h"
 #include "TimeStretch.h"
 #include "process.h"
 
@@ -65,6 +66,7 @@ namespace py = pybind11;
 
 #include "io/AudioFileInit.h"
 #include "io/AudioStream.h"
+#include "io/ReadMany.h"
 #include "io/ReadableAudioFile.h"
 #include "io/ResampledReadableAudioFile.h"
 #include "io/StreamResampler.h"
@@ -89,8 +91,9 @@ PYBIND11_MODULE(pedalboard_native, m, py::mod_gil_not_used()) {
       "process",
       [](const py::array inputArray, double sampleRate,
          const std::vector<std::shared_ptr<Plugin>> plugins,
-         unsigned int bufferSize, bool reset) {
-        return process(inputArray, sampleRate, plugins, bufferSize, reset);
+         unsigned int bufferSize, bool reset, std::string renderOrder) {
+        return process(inputArray, sampleRate, plugins, bufferSize, reset,
+                       parseRenderOrder(renderOrder));
       },
       R"(
 Run a 32-bit or 64-bit floating point audio buffer through a
@@ -106,10 +109,38 @@ processing begins, clearing any state from previous calls to ``process``.
 If calling ``process`` multiple times while processing the same audio file
 or buffer, set ``reset`` to ``False``.
 
+The ``render_order`` argument controls how the plugins are scheduled. With
+``"plugin"`` (the default), each plugin is run over the entire buffer before
+the next plugin starts. With ``"block"``, each chunk of ``buffer_size``
+samples is run through every plugin before moving on to the next chunk,
+which keeps the working set in cache and is usually faster for long buffers
+processed by many plugins. (:class:`pedalboard.Pedalboard` and
+:class:`pedalboard.Chain` objects always render block by block.) Both
+orders apply the same latency compensation.
+
 :meta private:
 )",
       py::arg("input_array"), py::arg("sample_rate"), py::arg("plugins"),
-      py::arg("buffer_size") = DEFAULT_BUFFER_SIZE, py::arg("reset") = true);
+      py::arg("buffer_size") = DEFAULT_BUFFER_SIZE, py::arg("reset") = true,
+      py::arg("render_order") = "plugin");
+
+  m.def(
+      "_render_many",
+      [](const std::vector<py::array> inputArrays, double sampleRate,
+         const std::vector<std::shared_ptr<Plugin>> pluginInstances,
+         unsigned int bufferSize) {
+        return renderMany(inputArrays, sampleRate, pluginInstances, bufferSize);
+      },
+      R"(
+Run a list of 32-bit or 64-bit floating point audio buffers through a plugin,
+spreading the buffers across one native thread per provided plugin instance.
+Each plugin instance must be an independent copy of the same plugin.
+
+:meta private:
+)",
+      py::arg("input_arrays"), py::arg("sample_rate"),
+      py::arg("plugin_instances"),
+      py::arg("buffer_size") = DEFAULT_BUFFER_SIZE);
 
   plugin
       .def(py::init([]() {
@@ -132,6 +163,17 @@ or buffer, set ``reset`` to ``False``.
           "Clear any internal state stored by this plugin (e.g.: reverb "
           "tails, delay lines, LFO state, etc). The values of plugin "
           "parameters will remain unchanged. ")
+      .def(
+          "__deepcopy__",
+          [](std::shared_ptr<Plugin> self, py::dict memo) {
+            return clonePlugin(self);
+          },
+          py::arg("memo"),
+          "Create a new instance of this plugin (and of any plugins it "
+          "contains) with the same parameter values, but without any of its "
+          "internal state (e.g.: reverb tails, delay lines, etc). Called by "
+          ":py:func:`copy.deepcopy`. Raises a :py:exc:`TypeError` if this "
+          "plugin cannot be copied.")
       .def(
           "process",
           [](std::shared_ptr<Plugin> self, const py::array inputArray,
@@ -184,6 +226,54 @@ If the number of samples and the number of channels are the same, each
           ":py:meth:`process`.",
           py::arg("input_array"), py::arg("sample_rate"),
           py::arg("buffer_size") = DEFAULT_BUFFER_SIZE, py::arg("reset") = true)
+      .def(
+          "process_batch",
+          [](std::shared_ptr<Plugin> self,
+             const std::vector<py::array> inputArrays, double sampleRate,
+             unsigned int bufferSize, bool reset) {
+            return processBatch(inputArrays, sampleRate, {self}, bufferSize,
+                                reset);
+          },
+          R"(
+Run a list of 32-bit or 64-bit floating point audio buffers through this
+plugin, returning a list of processed buffers in the same order.
+
+This produces the same results as calling :py:meth:`process` on each buffer
+in turn, but is much faster for large numbers of short buffers: the plugin
+is only locked once, only needs to reallocate its internal buffers when
+the number of channels or the buffer size grows, and the GIL is released
+for the entire batch.
+
+If ``reset`` is ``True`` (the default), the plugin is reset before each
+buffer, so each buffer is processed independently. If ``reset`` is
+``False``, the buffers are processed in order as one continuous stream.
+)",
+          py::arg("input_arrays"), py::arg("sample_rate"),
+          py::arg("buffer_size") = DEFAULT_BUFFER_SIZE, py::arg("reset") = true)
+      .def(
+          "process_inplace",
+          [](std::shared_ptr<Plugin> self, py::array inputArray,
+             double sampleRate, unsigned int bufferSize, bool reset) {
+            processInPlace(inputArray, sampleRate, {self}, bufferSize, reset);
+          },
+          R"(
+Run a 32-bit floating point audio buffer through this plugin, overwriting
+the provided buffer with the processed audio instead of allocating a new one.
+
+The provided ``input_array`` must be a writable, C-contiguous ``float32``
+array, either one-dimensional or of shape ``(num_channels, num_samples)``.
+Its memory is processed directly, which avoids copying the audio and halves
+peak memory usage when processing large buffers.
+
+As the length of the audio cannot change, this method raises an exception if
+this plugin (or any plugin it contains) introduces latency. Use
+:py:meth:`process` for such plugins.
+
+The ``buffer_size`` and ``reset`` arguments behave the same as they do for
+:py:meth:`process`.
+)",
+          py::arg("input_array"), py::arg("sample_rate"),
+          py::arg("buffer_size") = DEFAULT_BUFFER_SIZE, py::arg("reset") = true)
       .def_property_readonly(
           "is_effect",
           [](std::shared_ptr<Plugin> self) {
@@ -197,9 +287,17 @@ If the number of samples and the number of channels are the same, each
             return !self->acceptsAudioInput();
           },
           "True iff this plugin is not an audio effect and accepts only "
-          "MIDI input, not audio.\n\n*Introduced in v0.7.4.*");
+          "MIDI input, not audio.\n\n*Introduced in v0.7.4.*")
+      .def_property_readonly(
+          "prepare_count",
+          [](std::shared_ptr<Plugin> self) { return self->getNumPrepares(); },
+          "The number of times this plugin has (re-)allocated its internal "
+          "state in preparation for processing audio. Processing audio "
+          "repeatedly with the same sample rate, number of channels, and "
+          "buffer size will not increase this count.");
 
   init_plugin_container(m);
+  init_streaming_session(m);
 
   // Publicly accessible plugins:
   init_bitcrush(m);
@@ -260,4 +358,5 @@ If the number of samples and the number of channels are the same, each
 
   init_stream_resampler(io);
   init_audio_stream(io);
+  init_read_many(io);
 };
@@ -64,6 +64,7 @@ __all__ = [
     "PluginContainer",
     "Resample",
     "Reverb",
+    "StreamingSession",
     "VST3Plugin",
     "io",
     "process",
@@ -128,11 +129,62 @@ class Plugin:
             automatically invoke :py:meth:`process` with the same arguments.
         """
 
+    def process_batch(
+        self,
+        input_arrays: typing.List[NDArray[float32]],
+        sample_rate: float,
+        buffer_size: int = 8192,
+        reset: bool = True,
+    ) -> typing.List[NDArray[float32]]:
+        """
+        Run a list of 32-bit or 64-bit floating point audio buffers through this
+        plugin, returning a list of processed buffers in the same order.
+
+        This produces the same results as calling :py:meth:`process` on each buffer
+        in turn, but is much faster for large numbers of short buffers: the plugin
+        is only locked once, only needs to reallocate its internal buffers when
+        the number of channels or the buffer size grows, and the GIL is released
+        for the entire batch.
+
+        If ``reset`` is ``True`` (the default), the plugin is reset before each
+        buffer, so each buffer is processed independently. If ``reset`` is
+        ``False``, the buffers are processed in order as one continuous stream.
+        """
+
+    def process_inplace(
+        self,
+        input_array: NDArray[float32],
+        sample_rate: float,
+        buffer_size: int = 8192,
+        reset: bool = True,
+    ) -> None:
+        """
+        Run a 32-bit floating point audio buffer through this plugin, overwriting
+        the provided buffer with the processed audio instead of allocating a new one.
+
+        The provided ``input_array`` must be a writable, C-contiguous ``float32``
+        array, either one-dimensional or of shape ``(num_channels, num_samples)``.
+        Its memory is processed directly, which avoids copying the audio and halves
+        peak memory usage when processing large buffers.
+
+        As the length of the audio cannot change, this method raises an exception if
+        this plugin (or any plugin it contains) introduces latency. Use
+        :py:meth:`process` for such plugins.
+
+        The ``buffer_size`` and ``reset`` arguments behave the same as they do for
+        :py:meth:`process`.
+        """
+
     def reset(self) -> None:
         """
         Clear any internal state stored by this plugin (e.g.: reverb tails, delay lines, LFO state, etc). The values of plugin parameters will remain unchanged.
         """
 
+    def __deepcopy__(self, memo: dict) -> Plugin:
+        """
+        Create a new instance of this plugin (and of any plugins it contains) with the same parameter values, but without any of its internal state (e.g.: reverb tails, delay lines, etc). Called by :py:func:`copy.deepcopy`. Raises a :py:exc:`TypeError` if this plugin cannot be copied.
+        """
+
     @property
     def is_effect(self) -> bool:
         """
@@ -151,6 +203,14 @@ class Plugin:
         *Introduced in v0.7.4.*
 
 
+        """
+
+    @property
+    def prepare_count(self) -> int:
+        """
+        The number of times this plugin has (re-)allocated its internal state in preparation for processing audio. Processing audio repeatedly with the same sample rate, number of channels, and buffer size will not increase this count.
+
+
         """
     pass
 
@@ -1554,8 +1614,8 @@ class Resample(Plugin):
         :py:class:`CatmullRom`, :py:class:`Lagrange`, and :py:class:`WindowedSinc`.
 
         Non-aliasing algorithms include :py:class:`WindowedSinc256`, :py:class:`WindowedSinc128`,
-        :py:class:`WindowedSinc64`, :py:class:`WindowedSinc32`, :py:class:`WindowedSinc16`, and
-        :py:class:`WindowedSinc8`.
+        :py:class:`WindowedSinc64`, :py:class:`WindowedSinc32`, :py:class:`WindowedSinc16`,
+        :py:class:`WindowedSinc8`, and :py:class:`PolyphaseSinc32`.
 
         Choosing an algorithm to use depends on the signal being resampled, the relationship
         between the source and target sample rates, and the application of the resampled signal.
@@ -1568,6 +1628,9 @@ class Resample(Plugin):
            (i.e.: :py:class:`WindowedSinc256`, :py:class:`WindowedSinc64`) will produce
            a clean signal with no artifacts. Higher numbers will produce a cleaner signal with less
            roll-off of high frequency content near the Nyquist frequency of the new sample rate.
+         - If converting between common sample rates (i.e.: from 44.1kHz to 48kHz, or 48kHz to 16kHz),
+           :py:class:`PolyphaseSinc32` will produce output numerically close to that of
+           :py:class:`WindowedSinc32`, but faster.
 
         However, depending on your application, the artifacts introduced by each resampling method
         may be acceptable. Test each method to determine which is the best tradeoff between speed
@@ -1679,6 +1742,12 @@ class Resample(Plugin):
 
         This method can be more than 10x faster than Resampy's ``kaiser_fast`` method, and is useful for applications that are tolerant of some resampling artifacts.
         """
+        PolyphaseSinc32 = 11  # fmt: skip
+        """
+        A reasonably high quality resampling algorithm that produces output numerically close to that of :py:class:`WindowedSinc32`, optimized for converting between common sample rates.
+
+        When the ratio between the source and target sample rates is a fraction with a denominator of 2,560 or less (i.e.: 44.1kHz to 48kHz is 147/160), this resampler precomputes one windowed sinc filter per output phase up front, turning each output sample into a single dot product. Other ratios are resampled just like :py:class:`WindowedSinc32`, without any speedup.
+        """
 
     def __init__(
         self, target_sample_rate: float = 8000.0, quality: Quality = Quality.WindowedSinc32
@@ -1714,6 +1783,7 @@ class Resample(Plugin):
     CatmullRom: pedalboard_native.Resample.Quality  # value = <Quality.CatmullRom: 2>
     Lagrange: pedalboard_native.Resample.Quality  # value = <Quality.Lagrange: 3>
     Linear: pedalboard_native.Resample.Quality  # value = <Quality.Linear: 1>
+    PolyphaseSinc32: pedalboard_native.Resample.Quality  # value = <Quality.PolyphaseSinc32: 11>
     WindowedSinc: pedalboard_native.Resample.Quality  # value = <Quality.WindowedSinc: 4>
     WindowedSinc128: pedalboard_native.Resample.Quality  # value = <Quality.WindowedSinc128: 6>
     WindowedSinc16: pedalboard_native.Resample.Quality  # value = <Quality.WindowedSinc16: 9>
@@ -1788,6 +1858,75 @@ class Reverb(Plugin):
         pass
     pass
 
+class StreamingSession:
+    """
+    Process a potentially-unbounded stream of audio chunks through a plugin (or :class:`pedalboard.Pedalboard`), returning exactly the same audio that a single call to :py:meth:`Plugin.process` would return if passed the entire stream at once.
+
+    Each call to :meth:`feed` returns as much processed audio as the plugin has produced so far. Plugins that introduce latency may return fewer samples than they were passed; once the stream is over, call :meth:`flush` to receive the remaining audio. The total number of samples returned will always equal the total number of samples passed in.
+
+    The plugin is reset and prepared only once per stream rather than on every call, so it should not be used elsewhere until the stream has been flushed.
+    """
+
+    def __init__(
+        self,
+        plugin: Plugin,
+        sample_rate: float,
+        buffer_size: int = 8192,
+        reset: bool = True,
+    ) -> None:
+        """
+        Start a new stream through the provided plugin. If ``reset`` is ``True`` (the default), the plugin is reset before the first chunk is processed, clearing any state left over from previous calls to :py:meth:`Plugin.process`.
+        """
+
+    def __repr__(self) -> str: ...
+    def feed(self, input_array: ndarray) -> NDArray[float32]:
+        """
+        Process the next chunk of a 32-bit or 64-bit floating point audio stream, returning the processed audio that is ready so far. The returned array may contain fewer samples than were provided if the plugin has buffered audio internally.
+        """
+
+    def flush(self) -> NDArray[float32]:
+        """
+        End the current stream, returning any audio still buffered inside the plugin. The next call to :meth:`feed` will start a new stream.
+        """
+
+    def reset(self) -> None:
+        """
+        End the current stream without returning any audio still buffered inside the plugin. The next call to :meth:`feed` will start a new stream.
+        """
+
+    @property
+    def buffer_size(self) -> int:
+        """
+        The maximum number of samples passed to the plugin at once.
+
+
+        """
+
+    @property
+    def pending_samples(self) -> int:
+        """
+        The number of samples fed into this stream that have not yet been returned, and will be returned by :meth:`flush`.
+
+
+        """
+
+    @property
+    def plugin(self) -> Plugin:
+        """
+        The plugin that audio is processed through.
+
+
+        """
+
+    @property
+    def sample_rate(self) -> float:
+        """
+        The sample rate of the audio stream.
+
+
+        """
+    pass
+
 class VST3Plugin(ExternalPlugin):
     """
     A wrapper around third-party, audio effect or instrument plugins in
@@ -2333,6 +2472,7 @@ def process(
     plugins: typing.List[Plugin],
     buffer_size: int = 8192,
     reset: bool = True,
+    render_order: str = "plugin",
 ) -> NDArray[float32]:
     """
     Run a 32-bit or 64-bit floating point audio buffer through a
@@ -2348,6 +2488,29 @@ def process(
     If calling ``process`` multiple times while processing the same audio file
     or buffer, set ``reset`` to ``False``.
 
+    The ``render_order`` argument controls how the plugins are scheduled. With
+    ``"plugin"`` (the default), each plugin is run over the entire buffer before
+    the next plugin starts. With ``"block"``, each chunk of ``buffer_size``
+    samples is run through every plugin before moving on to the next chunk,
+    which keeps the working set in cache and is usually faster for long buffers
+    processed by many plugins. (:class:`pedalboard.Pedalboard` and
+    :class:`pedalboard.Chain` objects always render block by block.) Both
+    orders apply the same latency compensation.
+
+    :meta private:
+    """
+
+def _render_many(
+    input_arrays: typing.List[ndarray],
+    sample_rate: float,
+    plugin_instances: typing.List[Plugin],
+    buffer_size: int = 8192,
+) -> typing.List[NDArray[float32]]:
+    """
+    Run a list of 32-bit or 64-bit floating point audio buffers through a plugin,
+    spreading the buffers across one native thread per provided plugin instance.
+    Each plugin instance must be an independent copy of the same plugin.
+
     :meta private:
     """
 
@@ -24,6 +24,7 @@ __all__ = [
     "WriteableAudioFile",
     "get_supported_read_formats",
     "get_supported_write_formats",
+    "read_many",
 ]
 
 class AudioFile:
@@ -68,6 +69,27 @@ class AudioFile:
            first_ten_seconds = f.read(int(f.samplerate * 10))
 
 
+    Memory-mapping an uncompressed WAV or AIFF file for fast random access::
+
+       with AudioFile("my_file.wav", mmap=True) as f:
+           f.seek(int(f.samplerate * 60))
+           one_second = f.read(int(f.samplerate))
+
+
+    Decoding a compressed file on a background thread while processing it::
+
+       with AudioFile("my_file.mp3", prefetch_frames=44_100 * 10) as f:
+           while f.tell() < f.frames:
+               chunk = f.read(f.samplerate)
+               ...  # chunk processing here overlaps with decoding the next chunk
+
+
+    Decoding a 44.1kHz MP3 file at 22.05kHz, then resampling the result to 16kHz::
+
+       with AudioFile("my_file.mp3", decimation=2).resampled_to(16_000) as f:
+           audio = f.read(f.frames)
+
+
     Writing an audio file on disk::
 
        with AudioFile("white_noise.wav", "w", samplerate=44100, num_channels=2) as f:
@@ -124,20 +146,39 @@ class AudioFile:
 
     @classmethod
     @typing.overload
-    def __new__(cls, filename: str) -> ReadableAudioFile:
+    def __new__(
+        cls,
+        filename: str,
+        *,
+        mmap: bool = False,
+        prefetch_frames: int = 0,
+        decimation: int = 1,
+    ) -> ReadableAudioFile:
         """Open an audio file for reading (mode 'r' is implied)."""
         ...
 
     @classmethod
     @typing.overload
-    def __new__(cls, filename: str, mode: Literal["r"]) -> ReadableAudioFile:
+    def __new__(
+        cls,
+        filename: str,
+        mode: Literal["r"],
+        *,
+        mmap: bool = False,
+        prefetch_frames: int = 0,
+        decimation: int = 1,
+    ) -> ReadableAudioFile:
         """Open an audio file for reading with an explicit mode 'r'."""
         ...
 
     @classmethod
     @typing.overload
     def __new__(
-        cls, file_like: typing.Union[typing.BinaryIO, memoryview], mode: Literal["r"] = "r"
+        cls,
+        file_like: typing.Union[typing.BinaryIO, memoryview],
+        mode: Literal["r"] = "r",
+        *,
+        buffer_size: int = 65536,
     ) -> ReadableAudioFile: ...
 
     @classmethod
@@ -150,6 +191,8 @@ class AudioFile:
         num_channels: int = 1,
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
+        *,
+        async_encode: bool = False,
     ) -> WriteableAudioFile: ...
 
     @classmethod
@@ -163,6 +206,10 @@ class AudioFile:
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
         format: typing.Optional[str] = None,
+        *,
+        async_encode: bool = False,
+        buffer_size: int = 65536,
+        workers: typing.Optional[int] = None,
     ) -> WriteableAudioFile: ...
     
     @staticmethod
@@ -173,6 +220,8 @@ class AudioFile:
         num_channels: int = 1,
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
+        *,
+        workers: typing.Optional[int] = None,
     ) -> bytes:
         """
         Encode an audio buffer to a Python :class:`bytes` object.
@@ -193,6 +242,12 @@ class AudioFile:
         released, which also makes this method much more performant in multi-threaded
         programs.
 
+        If ``workers`` is provided and ``format`` is ``"flac"``, the audio will be split
+        into segments that are encoded in parallel on up to ``workers`` native threads,
+        then combined into a single FLAC stream. (FLAC frames are encoded independently,
+        so the resulting stream decodes identically to one encoded on a single thread.)
+        ``workers`` has no effect on other formats.
+
         .. warning::
           This function will encode the entire audio buffer at once, and may consume a
           large amount of memory if the input audio buffer is large.
@@ -461,22 +516,54 @@ class ReadableAudioFile(AudioFile):
         """
 
     @typing.overload
-    def __init__(self, filename: str) -> None: ...
+    def __init__(
+        self,
+        filename: str,
+        *,
+        mmap: bool = False,
+        prefetch_frames: int = 0,
+        decimation: int = 1,
+    ) -> None: ...
     @typing.overload
-    def __init__(self, file_like: typing.Union[typing.BinaryIO, memoryview]) -> None: ...
+    def __init__(
+        self, file_like: typing.Union[typing.BinaryIO, memoryview], *, buffer_size: int = 65536
+    ) -> None: ...
 
     # These don't exist, but Pyright assumes they do:
     @typing.overload
-    def __init__(self, filename: str, mode: Literal["r"]) -> None: ...
+    def __init__(
+        self,
+        filename: str,
+        mode: Literal["r"],
+        *,
+        mmap: bool = False,
+        prefetch_frames: int = 0,
+        decimation: int = 1,
+    ) -> None: ...
     @typing.overload
-    def __init__(self, file_like: typing.Union[typing.BinaryIO, memoryview], mode: Literal["r"]) -> None: ...
+    def __init__(
+        self,
+        file_like: typing.Union[typing.BinaryIO, memoryview],
+        mode: Literal["r"],
+        *,
+        buffer_size: int = 65536,
+    ) -> None: ...
 
     @classmethod
     @typing.overload
-    def __new__(cls, filename: str) -> ReadableAudioFile: ...
+    def __new__(
+        cls,
+        filename: str,
+        *,
+        mmap: bool = False,
+        prefetch_frames: int = 0,
+        decimation: int = 1,
+    ) -> ReadableAudioFile: ...
     @classmethod
     @typing.overload
-    def __new__(cls, file_like: typing.Union[typing.BinaryIO, memoryview]) -> ReadableAudioFile: ...
+    def __new__(
+        cls, file_like: typing.Union[typing.BinaryIO, memoryview], *, buffer_size: int = 65536
+    ) -> ReadableAudioFile: ...
     def __repr__(self) -> str: ...
     def close(self) -> None:
         """
@@ -541,6 +628,45 @@ class ReadableAudioFile(AudioFile):
             an exception will be thrown, as a fractional number of samples cannot be returned.
         """
 
+    def read_into(self, out: NDArray[float32], offset: int = 0) -> int:
+        """
+        Read frames from this audio file at its current position into an existing
+        :class:`numpy.array`, rather than allocating a new one. Returns the number of
+        frames that were written.
+
+        ``out`` must be a writeable, C-contiguous ``float32`` array with the shape
+        ``(channels, samples)``, where ``channels`` matches this file's :py:attr:`num_channels`.
+        Frames are written starting at frame index ``offset`` within ``out``, and as many
+        frames will be read as fit in the remainder of ``out``.
+
+        If the file does not contain enough audio data to fill ``out``, only the first
+        ``offset + <return value>`` frames of ``out`` will be written to, and the rest of
+        ``out`` will be left untouched.
+
+        Reusing the same output array across many calls avoids allocating a new array
+        for every chunk of audio read::
+
+           buffer = np.empty((f.num_channels, 8192), dtype=np.float32)
+           while (frames_read := f.read_into(buffer)):
+               process(buffer[:, :frames_read])
+        """
+
+    def read_raw_into(
+        self,
+        out: NDArray[typing.Union[np.int8, np.int16, np.int32, np.float32]],
+        offset: int = 0,
+    ) -> int:
+        """
+        Read frames from this audio file at its current position into an existing
+        :class:`numpy.array` in the raw format stored by the underlying file, as
+        :meth:`read_raw` would return them. Returns the number of frames that were written.
+
+        ``out`` must be a writeable, C-contiguous array with the shape ``(channels, samples)``
+        and the same datatype that :meth:`read_raw` returns for this file (one of ``int8``,
+        ``int16``, ``int32``, or ``float32``). Frames are written starting at frame index
+        ``offset`` within ``out``, as in :meth:`read_into`.
+        """
+
     def resampled_to(
         self,
         target_sample_rate: float,
@@ -554,11 +680,93 @@ class ReadableAudioFile(AudioFile):
         *Introduced in v0.6.0.*
         """
 
+    def build_seek_index(self, sidecar_path: typing.Optional[str] = None) -> None:
+        """
+        Scan this file once to record the position of every frame of compressed audio,
+        so that subsequent calls to :meth:`seek` can jump directly to the nearest frame
+        rather than decoding forward through the file.
+
+        This is only necessary for MP3 files, which otherwise must be scanned from the
+        start (or from the furthest position read so far) on every forward seek. For all
+        other formats, :meth:`seek` is already fast and this method does nothing.
+
+        If ``sidecar_path`` is provided and points to an index previously written for
+        this file, that index will be loaded instead of scanning the file. Otherwise,
+        the file will be scanned and the resulting index written to ``sidecar_path``.
+        Sidecar files that were written for a different file, that were written before
+        this file was last modified, or that are corrupted are ignored and replaced::
+
+           with AudioFile("podcast.mp3") as f:
+               f.build_seek_index("podcast.mp3.seekindex")
+               for start in random_start_times:
+                   f.seek(int(start * f.samplerate))
+                   window = f.read(int(5 * f.samplerate))
+        """
+
     def seek(self, position: int) -> None:
         """
         Seek this file to the provided location in frames. Future reads will start from this position.
         """
 
+    def read_range(self, start: int, stop: int) -> NDArray[float32]:
+        """
+        Read the frames from ``start`` (inclusive) to ``stop`` (exclusive) of this
+        audio file, without changing the file's current position.
+
+        This is equivalent to (but faster than) calling :meth:`seek` with ``start``,
+        calling :meth:`read` with ``stop - start``, and then seeking back to the
+        original position. If ``stop`` is past the end of the file, the returned array
+        will contain as many frames as could be read from the file.
+        """
+
+    @typing.overload
+    def read_ranges(
+        self, ranges: typing.Sequence[typing.Tuple[int, int]], concatenate: Literal[False] = False
+    ) -> typing.List[NDArray[float32]]:
+        """
+        Read many ``(start, stop)`` ranges of frames from this audio file in a single
+        call, without changing the file's current position.
+
+        Ranges may be provided in any order and may overlap. They are read in order of
+        their start positions, and ranges that overlap (or are separated by only a
+        small gap) are decoded together, which avoids repeatedly seeking (and, for
+        compressed formats, re-decoding) the same part of the file.
+
+        By default, a list of :class:`numpy.array` objects is returned, one per range,
+        in the same order as ``ranges``. If ``concatenate`` is ``True``, a tuple of
+        ``(audio, offsets)`` is returned instead, where ``audio`` is a single
+        ``float32`` array containing every range one after the other and ``offsets`` is
+        an ``int64`` array of length ``len(ranges) + 1``, such that range ``i`` is
+        ``audio[:, offsets[i]:offsets[i + 1]]``::
+
+           audio, offsets = f.read_ranges([(0, 1000), (44100, 48100)], concatenate=True)
+           first_slice = audio[:, offsets[0]:offsets[1]]
+        """
+
+    @typing.overload
+    def read_ranges(
+        self, ranges: typing.Sequence[typing.Tuple[int, int]], concatenate: Literal[True]
+    ) -> typing.Tuple[NDArray[float32], NDArray[np.int64]]: ...
+
+    def read_view(
+        self, num_frames: typing.Union[float, int] = 0
+    ) -> NDArray[float32]:
+        """
+        Return a read-only view of the given number of frames (samples in each channel)
+        of this audio file at its current position, without copying or converting any
+        audio data.
+
+        This method is only available for 32-bit floating-point WAV files opened with
+        ``mmap=True``. The returned :class:`numpy.array` has the same ``(channels, samples)``
+        shape and ``float32`` datatype that :meth:`read` would return, but refers directly
+        to the memory-mapped contents of the file on disk. The returned array remains
+        valid even after this file is closed.
+
+        As audio samples are interleaved on disk, the returned array is not
+        C-contiguous. Call :func:`numpy.ascontiguousarray` on the result if a contiguous
+        copy is required.
+        """
+
     def seekable(self) -> bool:
         """
         Returns True if this file is currently open and calls to seek() will work.
@@ -788,6 +996,19 @@ class ResampledReadableAudioFile(AudioFile):
             an exception will be thrown, as a fractional number of samples cannot be returned.
         """
 
+    def read_into(self, out: NDArray[float32], offset: int = 0) -> int:
+        """
+        Read frames (at the target sample rate) from this audio file at its current
+        position into an existing :class:`numpy.array`, rather than allocating a new
+        one. Returns the number of frames that were written.
+
+        ``out`` must be a writeable, C-contiguous ``float32`` array with the shape
+        ``(channels, samples)``, where ``channels`` matches this file's :py:attr:`num_channels`.
+        Frames are written starting at frame index ``offset`` within ``out``, and as many
+        frames will be read as fit in the remainder of ``out``. If the file does not
+        contain enough audio data to fill ``out``, the rest of ``out`` will be left untouched.
+        """
+
     def seek(self, position: int) -> None:
         """
         Seek this file to the provided location in frames at the target sample rate. Future reads will start from this position.
@@ -1021,6 +1242,28 @@ class WriteableAudioFile(AudioFile):
             may be passed as a string. The strings ``"best"``, ``"worst"``,
             ``"fastest"``, and ``"slowest"`` will also work for any codec.
 
+        async_encode:
+            If ``True``, audio passed to :meth:`write` will be copied into a
+            bounded queue and encoded on a background thread, allowing
+            :meth:`write` to return before encoding is complete. Any errors
+            raised while encoding will be raised from the next call to
+            :meth:`write`, :meth:`flush`, or :meth:`close`. Only supported
+            when writing to a filename, not to a file-like object.
+
+        buffer_size:
+            When writing to a file-like object, writes smaller than this many
+            bytes will be combined before being passed to the file-like object's
+            ``write`` method, reducing the number of calls into Python. As a
+            result, errors raised by ``write`` may only be reported by a later
+            call to :meth:`write`, :meth:`flush`, or :meth:`close`. Pass ``0``
+            to disable buffering.
+
+        workers:
+            When writing FLAC to a file-like object, the audio will be buffered in
+            memory and encoded in parallel on up to this many native threads when
+            the file is closed. Any errors raised while encoding or writing will be
+            raised from :meth:`close`. Has no effect on other formats.
+
     .. note::
         You probably don't want to use this class directly: all of the parameters
         accepted by the :class:`WriteableAudioFile` constructor will be accepted by
@@ -1038,6 +1281,8 @@ class WriteableAudioFile(AudioFile):
         num_channels: int = 1,
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
+        *,
+        async_encode: bool = False,
     ) -> None: ...
     @typing.overload
     def __init__(
@@ -1048,6 +1293,10 @@ class WriteableAudioFile(AudioFile):
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
         format: typing.Optional[str] = None,
+        *,
+        async_encode: bool = False,
+        buffer_size: int = 65536,
+        workers: typing.Optional[int] = None,
     ) -> None: ...
     @classmethod
     @typing.overload
@@ -1058,6 +1307,8 @@ class WriteableAudioFile(AudioFile):
         num_channels: int = 1,
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
+        *,
+        async_encode: bool = False,
     ) -> WriteableAudioFile: ...
     @classmethod
     @typing.overload
@@ -1069,6 +1320,10 @@ class WriteableAudioFile(AudioFile):
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
         format: typing.Optional[str] = None,
+        *,
+        async_encode: bool = False,
+        buffer_size: int = 65536,
+        workers: typing.Optional[int] = None,
     ) -> WriteableAudioFile: ...
 
     # This overload does not actually exist; just makes Pyright happy as
@@ -1082,6 +1337,8 @@ class WriteableAudioFile(AudioFile):
         num_channels: int = 1,
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
+        *,
+        async_encode: bool = False,
     ) -> None: ...
 
     # This overload does not actually exist; just makes Pyright happy as
@@ -1096,6 +1353,10 @@ class WriteableAudioFile(AudioFile):
         bit_depth: int = 16,
         quality: typing.Optional[typing.Union[str, float]] = None,
         format: typing.Optional[str] = None,
+        *,
+        async_encode: bool = False,
+        buffer_size: int = 65536,
+        workers: typing.Optional[int] = None,
     ) -> None: ...
 
     def __repr__(self) -> str: ...
@@ -1202,3 +1463,31 @@ def get_supported_read_formats() -> typing.List[str]:
 
 def get_supported_write_formats() -> typing.List[str]:
     pass
+
+def read_many(
+    filenames: typing.List[str],
+    workers: typing.Optional[int] = None,
+    resampled_to: typing.Optional[float] = None,
+    mono: bool = False,
+    quality: pedalboard_native.Resample.Quality = pedalboard_native.Resample.Quality.WindowedSinc32,
+) -> typing.List[typing.Tuple[NDArray[float32], float]]:
+    """
+    Read and decode many audio files at once, in parallel, returning a list of
+    ``(audio, samplerate)`` tuples in the same order as the provided filenames.
+
+    Each ``audio`` array is a 32-bit floating-point array of shape
+    ``(num_channels, num_frames)``, identical to what would be returned by
+    calling :meth:`ReadableAudioFile.read` on the entire file.
+
+    Files are opened, decoded, and (optionally) resampled and downmixed on a pool
+    of ``workers`` native threads, without holding the Python Global Interpreter
+    Lock. If ``workers`` is not provided, one thread per CPU core will be used.
+
+    If ``resampled_to`` is provided, every file will be resampled to that sample
+    rate as if :meth:`ReadableAudioFile.resampled_to` had been called with the
+    provided ``quality``. If ``mono`` is ``True``, every file's channels will be
+    averaged together into a single channel.
+
+    If any file cannot be read, an exception will be raised once all other files
+    have been read.
+    """
@@ -49,9 +49,22 @@ class Mix(pedalboard_native.PluginContainer, pedalboard_native.Plugin):
     """
 
     @typing.overload
-    def __init__(self, plugins: typing.List[pedalboard_native.Plugin]) -> None: ...
+    def __init__(
+        self, plugins: typing.List[pedalboard_native.Plugin], num_threads: int = 1
+    ) -> None: ...
     @typing.overload
     def __repr__(self) -> str: ...
+    @property
+    def num_threads(self) -> int:
+        """
+        The number of threads used to render this plugin's branches. If greater than 1, branches are rendered concurrently on a pool of native threads before being summed. The output is identical regardless of this setting.
+
+
+        """
+
+    @num_threads.setter
+    def num_threads(self, arg1: int) -> None:
+        pass
     pass
 
 def time_stretch(
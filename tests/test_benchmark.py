@@ -72,3 +72,102 @@ def test_pysox_performance_difference():
     # This test ensures we're at least 100x faster to account for
     # variations across test run environments.
     assert average_pysox_time / average_pedalboard_time > 100
+
+
+def test_block_render_order_performance():
+    sr = 44100
+    # Long enough that the whole buffer (~7MB) doesn't fit in most CPU caches:
+    noise = np.random.rand(2, sr * 20).astype(np.float32) - 0.5
+    plugins = [
+        pedalboard.HighpassFilter(80),
+        pedalboard.PeakFilter(3000, 3, 1.0),
+        pedalboard.Compressor(threshold_db=-22, ratio=3),
+        pedalboard.Distortion(2),
+        pedalboard.LowpassFilter(12000),
+        pedalboard.Chorus(),
+        pedalboard.Limiter(),
+        pedalboard.Gain(2),
+    ]
+
+    measurements = {}
+    outputs = {}
+    for render_order in ("plugin", "block"):
+        timings = []
+        for _ in range(3):
+            with timer() as time_taken:
+                outputs[render_order] = pedalboard.process(
+                    noise, sr, plugins, render_order=render_order
+                )
+            timings.append(float(time_taken))
+        measurements[render_order] = min(timings)
+
+    np.testing.assert_allclose(outputs["plugin"], outputs["block"], atol=1e-6)
+    # Rendering block-by-block should be at least as fast as rendering
+    # plugin-by-plugin (with some headroom for noisy test environments):
+    assert measurements["block"] < measurements["plugin"] * 1.2
+
+
+def test_latent_plugin_chain_scales_linearly():
+    from pedalboard_native._internal import FixedSizeBlockTestPlugin  # type: ignore
+
+    sr = 44100
+    # These plugins all introduce latency, and some repeatedly return partial
+    # blocks, which must not require moving all previously-rendered audio:
+    plugins = [
+        pedalboard.Resample(target_sample_rate=8000),
+        pedalboard.GSMFullRateCompressor(),
+        FixedSizeBlockTestPlugin(expected_block_size=1000),
+        pedalboard.MP3Compressor(),
+    ]
+
+    measurements = {}
+    for minutes, runs in ((1, 3), (10, 1)):
+        # The gaps left by these plugins only become expensive to close when
+        # the buffer is long, so this needs minutes of audio, not seconds:
+        noise = np.random.rand(sr * 60 * minutes).astype(np.float32) - 0.5
+        timings = []
+        for _ in range(runs):
+            with timer() as time_taken:
+                output = pedalboard.process(noise, sr, plugins, buffer_size=1024)
+            timings.append(float(time_taken))
+            assert output.shape == noise.shape
+        measurements[minutes] = min(timings)
+
+    # Rendering time should grow linearly with the length of the buffer; ten
+    # times as much audio should take no more than 25 times as long:
+    assert measurements[10] / measurements[1] < 25
+
+
+def test_polyphase_resampling_performance():
+    from pedalboard.io import StreamResampler
+
+    # Integer ratios (i.e.: 48kHz to 16kHz) already only need a single phase
+    # with WindowedSinc32, so only benchmark a ratio that needs many phases:
+    sample_rate, target_sample_rate = 44100, 48000
+
+    noise = np.random.rand(2, sample_rate * 30).astype(np.float32) - 0.5
+
+    measurements = {}
+    outputs = {}
+    for quality in (
+        pedalboard.Resample.Quality.WindowedSinc32,
+        pedalboard.Resample.Quality.PolyphaseSinc32,
+    ):
+        timings = []
+        for _ in range(3):
+            resampler = StreamResampler(sample_rate, target_sample_rate, 2, quality)
+            with timer() as time_taken:
+                outputs[quality] = np.concatenate(
+                    [resampler.process(noise), resampler.process(None)], axis=1
+                )
+            timings.append(float(time_taken))
+        measurements[quality] = min(timings)
+
+    windowed_sinc_time = measurements[pedalboard.Resample.Quality.WindowedSinc32]
+    polyphase_time = measurements[pedalboard.Resample.Quality.PolyphaseSinc32]
+    np.testing.assert_allclose(
+        outputs[pedalboard.Resample.Quality.WindowedSinc32],
+        outputs[pedalboard.Resample.Quality.PolyphaseSinc32],
+        atol=1e-5,
+    )
+    assert polyphase_time < windowed_sinc_time * 0.8
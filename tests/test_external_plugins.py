@@ -27,6 +27,7 @@
 
 
 import atexit
+import copy
 import math
 import os
 import platform
@@ -861,6 +862,22 @@ def test_get_and_set_plugin_state(plugin_filename: str):
     assert plugin.raw_state == state
 
 
+@pytest.mark.parametrize("plugin_filename", sample(AVAILABLE_EFFECT_PLUGINS_IN_TEST_ENVIRONMENT, 1))
+def test_deepcopy_copies_plugin_state(plugin_filename: str):
+    plugin = load_test_plugin(plugin_filename, disable_caching=True)
+    for name, parameter in plugin.parameters.items():
+        if parameter.type is bool and "bypass" not in name.lower():
+            setattr(plugin, name, not getattr(plugin, name))
+
+    clone = copy.deepcopy(plugin)
+    assert clone is not plugin
+    assert type(clone) is type(plugin)
+    assert clone.name == plugin.name
+    assert clone.raw_state == plugin.raw_state
+    for name in plugin.parameters.keys():
+        assert getattr(clone, name) == getattr(plugin, name)
+
+
 @pytest.mark.parametrize("plugin_filename", sample(AVAILABLE_EFFECT_PLUGINS_IN_TEST_ENVIRONMENT, 1))
 def test_plugin_state_cleared_between_invocations_by_default(plugin_filename: str):
     plugin = load_test_plugin(plugin_filename, disable_caching=True)
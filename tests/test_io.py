@@ -219,6 +219,322 @@ def test_basic_read(audio_filename: str, samplerate: float):
         af.read(1)
 
 
+@pytest.mark.parametrize("workers", [1, 4, None])
+def test_read_many_matches_read(workers: Optional[int]):
+    filenames = [filename for filename, _ in FILENAMES_AND_SAMPLERATES]
+    results = pedalboard.io.read_many(filenames, workers=workers)
+    assert len(results) == len(filenames)
+    for filename, (audio, samplerate) in zip(filenames, results):
+        with pedalboard.io.AudioFile(filename) as af:
+            assert samplerate == af.samplerate
+            expected = af.read(af.frames)
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, expected)
+
+
+def test_read_many_resampled_to_mono(tmp_path: pathlib.Path):
+    filename = str(tmp_path / "stereo.wav")
+    original = np.random.rand(2, 44100).astype(np.float32) - 0.5
+    with pedalboard.io.AudioFile(filename, "w", 44100, 2, bit_depth=32) as f:
+        f.write(original)
+
+    [(audio, samplerate)] = pedalboard.io.read_many([filename], resampled_to=22050, mono=True)
+    assert samplerate == 22050
+    with pedalboard.io.AudioFile(filename).resampled_to(22050) as f:
+        expected = np.mean(f.read(f.frames), axis=0, keepdims=True)
+    np.testing.assert_allclose(audio, expected, atol=1e-6)
+
+
+def test_read_many_raises_on_missing_file(tmp_path: pathlib.Path):
+    filenames = [FILENAMES_AND_SAMPLERATES[0][0], str(tmp_path / "missing.wav")]
+    with pytest.raises(ValueError, match="missing.wav"):
+        pedalboard.io.read_many(filenames)
+
+
+@pytest.mark.parametrize(
+    "audio_filename",
+    [
+        filename
+        for filename, _ in FILENAMES_AND_SAMPLERATES
+        if filename.endswith(".wav") or filename.endswith(".aiff")
+    ],
+)
+def test_mmap_read_matches_read(audio_filename: str):
+    with pedalboard.io.AudioFile(audio_filename) as af:
+        expected = af.read(af.frames)
+
+    with pedalboard.io.AudioFile(audio_filename, mmap=True) as af:
+        np.testing.assert_array_equal(af.read(af.frames), expected)
+
+        af.seek(af.frames // 2)
+        np.testing.assert_array_equal(af.read(100), expected[:, af.frames // 2 :][:, :100])
+
+
+@pytest.mark.parametrize("num_channels", [1, 2])
+def test_mmap_read_view(tmp_path: pathlib.Path, num_channels: int):
+    filename = str(tmp_path / "float.wav")
+    original = np.random.rand(num_channels, 44100).astype(np.float32) - 0.5
+    with pedalboard.io.AudioFile(filename, "w", 44100, num_channels, bit_depth=32) as f:
+        f.write(original)
+
+    with pedalboard.io.AudioFile(filename, mmap=True) as af:
+        assert af.file_dtype == "float32"
+        af.seek(1000)
+        view = af.read_view(2000)
+        assert af.tell() == 3000
+    assert view.shape == (num_channels, 2000)
+    assert not view.flags.writeable
+    # The view remains valid after the file is closed:
+    np.testing.assert_array_equal(view, original[:, 1000:3000])
+
+
+def test_read_view_requires_mmap(tmp_path: pathlib.Path):
+    filename = str(tmp_path / "int16.wav")
+    with pedalboard.io.AudioFile(filename, "w", 44100, 1, bit_depth=16) as f:
+        f.write(np.zeros((1, 100), dtype=np.float32))
+
+    with pedalboard.io.AudioFile(filename) as af:
+        with pytest.raises(RuntimeError):
+            af.read_view(10)
+    with pedalboard.io.AudioFile(filename, mmap=True) as af:
+        with pytest.raises(RuntimeError):
+            af.read_view(10)
+
+
+@pytest.mark.parametrize(
+    "audio_filename",
+    [
+        filename
+        for filename, _ in FILENAMES_AND_SAMPLERATES
+        if not (filename.endswith(".wav") or filename.endswith(".aiff"))
+    ]
+    + [
+        os.path.join(os.path.dirname(__file__), "audio", "correct", filename)
+        for filename in (
+            "adpcm_ms.wav",
+            "adpcm_ima.wav",
+            "alaw.wav",
+            "mulaw.wav",
+            "float64.wav",
+            "mp3_in_wav.wav",
+        )
+    ],
+)
+def test_mmap_rejects_unsupported_codecs(audio_filename: str):
+    with pytest.raises(ValueError, match="mmap=False"):
+        pedalboard.io.AudioFile(audio_filename, mmap=True)
+
+
+@pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
+@pytest.mark.parametrize("prefetch_frames", [100, 100_000])
+def test_prefetch_matches_read(audio_filename: str, samplerate: float, prefetch_frames: int):
+    with pedalboard.io.AudioFile(audio_filename) as af:
+        expected = af.read(af.frames)
+        expected_frames = af.frames
+        expected_exact_duration_known = af.exact_duration_known
+
+    with pedalboard.io.AudioFile(audio_filename, prefetch_frames=prefetch_frames) as af:
+        chunks = []
+        while (chunk := af.read(777)).size:
+            chunks.append(chunk)
+        np.testing.assert_array_equal(np.concatenate(chunks, axis=1), expected)
+        assert af.frames == expected_frames
+        assert af.exact_duration_known == expected_exact_duration_known
+
+        # Seeking forwards, backwards, and to the current position should all work:
+        for position in [100, 5000, 5000, 10, 0]:
+            af.seek(position)
+            np.testing.assert_array_equal(af.read(500), expected[:, position : position + 500])
+            assert af.tell() == position + expected[:, position : position + 500].shape[1]
+
+        # Raw reads can be mixed with prefetched reads:
+        af.seek(0)
+        af.read_raw(100)
+        np.testing.assert_array_equal(af.read(100), expected[:, 100:200])
+
+
+def test_prefetch_frames_must_not_be_negative():
+    filename, _ = FILENAMES_AND_SAMPLERATES[0]
+    with pytest.raises(ValueError):
+        pedalboard.io.AudioFile(filename, prefetch_frames=-1)
+
+
+@pytest.mark.parametrize("decimation", [2, 4])
+@pytest.mark.parametrize("num_channels", [1, 2])
+def test_decimated_mp3_matches_full_rate_decode(
+    tmp_path: pathlib.Path, decimation: int, num_channels: int
+):
+    samplerate = 44100
+    filename = str(tmp_path / "sine.mp3")
+    sine = generate_sine_at(samplerate, 440, num_seconds=2, num_channels=num_channels)
+    with pedalboard.io.AudioFile(filename, "w", samplerate, num_channels, quality=320) as f:
+        f.write(sine.astype(np.float32))
+
+    with pedalboard.io.AudioFile(filename) as af:
+        full_rate = af.read(af.frames)
+
+    with pedalboard.io.AudioFile(filename, decimation=decimation) as af:
+        assert af.samplerate == samplerate / decimation
+        assert af.num_channels == num_channels
+        decimated = af.read(af.frames)
+
+        # Seeking should produce the same samples as reading linearly:
+        af.seek(1000)
+        np.testing.assert_array_equal(af.read(500), decimated[:, 1000:1500])
+
+    # The decimated output is every N-th sample of the full-rate output,
+    # minus any content above the new Nyquist frequency:
+    expected = full_rate[:, ::decimation]
+    assert abs(decimated.shape[1] - expected.shape[1]) <= MP3_FRAME_LENGTH_SAMPLES
+    num_frames = min(decimated.shape[1], expected.shape[1])
+    np.testing.assert_allclose(decimated[:, :num_frames], expected[:, :num_frames], atol=0.01)
+
+
+@pytest.mark.parametrize("decimation", [0, 3, 8, -1])
+def test_decimation_must_be_supported(decimation: int):
+    filename, _ = FILENAMES_AND_SAMPLERATES[0]
+    with pytest.raises(ValueError, match="decimation"):
+        pedalboard.io.AudioFile(filename, decimation=decimation)
+
+
+def test_decimation_is_ignored_for_other_formats(tmp_path: pathlib.Path):
+    filename = str(tmp_path / "noise.wav")
+    with pedalboard.io.AudioFile(filename, "w", 44100, 1) as f:
+        f.write(cached_rand(44100))
+
+    with pedalboard.io.AudioFile(filename, decimation=2) as af:
+        assert af.samplerate == 44100
+        assert af.frames == 44100
+
+
+@pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
+def test_seek_index_does_not_change_seek_results(
+    tmp_path: pathlib.Path, audio_filename: str, samplerate: float
+):
+    positions = [int(samplerate * 3), 1000, int(samplerate * 4.5), 0, int(samplerate * 2)]
+
+    expected = []
+    with pedalboard.io.AudioFile(audio_filename) as af:
+        for position in positions:
+            af.seek(position)
+            expected.append(af.read(1000))
+
+    sidecar_path = str(tmp_path / "seek_index")
+    for _ in range(2):
+        # The second time around, the index will be loaded from the sidecar file:
+        with pedalboard.io.AudioFile(audio_filename) as af:
+            af.build_seek_index(sidecar_path)
+            for position, expected_chunk in zip(positions, expected):
+                af.seek(position)
+                np.testing.assert_array_equal(af.read(1000), expected_chunk)
+
+    if audio_filename.endswith(".mp3"):
+        assert os.path.getsize(sidecar_path) > 0
+    else:
+        assert not os.path.exists(sidecar_path)
+
+
+def test_seek_index_ignores_invalid_sidecar(tmp_path: pathlib.Path):
+    mp3_filename = [f for f, _ in FILENAMES_AND_SAMPLERATES if f.endswith(".mp3")][0]
+    sidecar_path = str(tmp_path / "seek_index")
+    with open(sidecar_path, "wb") as f:
+        f.write(b"not a seek index")
+
+    with pedalboard.io.AudioFile(mp3_filename) as af:
+        af.seek(af.frames // 2)
+        expected = af.read(1000)
+
+    with pedalboard.io.AudioFile(mp3_filename) as af:
+        af.build_seek_index(sidecar_path)
+        af.seek(af.frames // 2)
+        np.testing.assert_array_equal(af.read(1000), expected)
+
+    with open(sidecar_path, "rb") as f:
+        assert f.read(4) == b"PBSI"
+
+
+def test_seek_index_is_rebuilt_if_file_changes_without_changing_length(tmp_path: pathlib.Path):
+    filename = str(tmp_path / "audio.mp3")
+    sidecar_path = str(tmp_path / "seek_index")
+
+    contents = []
+    for audio in (generate_sine_at(44100, 440, 3), np.random.rand(44100 * 3) - 0.5):
+        buf = io.BytesIO()
+        with pedalboard.io.AudioFile(buf, "w", 44100, 1, format="mp3", quality=320) as f:
+            f.write(audio.astype(np.float32))
+        contents.append(buf.getvalue())
+    assert len(contents[0]) == len(contents[1])
+
+    with open(filename, "wb") as f:
+        f.write(contents[0])
+    with pedalboard.io.AudioFile(filename) as af:
+        af.build_seek_index(sidecar_path)
+    with open(sidecar_path, "rb") as f:
+        original_index = f.read()
+
+    # Replace the file with different audio of exactly the same length:
+    with open(filename, "wb") as f:
+        f.write(contents[1])
+    with pedalboard.io.AudioFile(filename) as af:
+        af.seek(af.frames // 2)
+        expected = af.read(1000)
+
+    with pedalboard.io.AudioFile(filename) as af:
+        af.build_seek_index(sidecar_path)
+        af.seek(af.frames // 2)
+        np.testing.assert_array_equal(af.read(1000), expected)
+
+    with open(sidecar_path, "rb") as f:
+        assert f.read() != original_index
+
+
+@pytest.mark.parametrize("extension", [".wav", ".flac"])
+@pytest.mark.parametrize("concatenate", [False, True])
+def test_read_ranges(tmp_path: pathlib.Path, extension: str, concatenate: bool):
+    filename = str(tmp_path / f"test{extension}")
+    original = np.random.rand(2, 44100).astype(np.float32) - 0.5
+    with pedalboard.io.AudioFile(filename, "w", 44100, 2, bit_depth=16) as f:
+        f.write(original)
+
+    with pedalboard.io.AudioFile(filename) as af:
+        expected = af.read(af.frames)
+
+    # Out of order, overlapping, adjacent, empty, distant, and past-the-end ranges:
+    ranges = [(30000, 31000), (100, 200), (150, 1150), (1150, 1200), (5, 5), (44000, 50000)]
+    with pedalboard.io.AudioFile(filename) as af:
+        af.seek(123)
+        result = af.read_ranges(ranges, concatenate=concatenate)
+        assert af.tell() == 123
+        np.testing.assert_array_equal(af.read(10), expected[:, 123:133])
+
+        np.testing.assert_array_equal(af.read_range(100, 200), expected[:, 100:200])
+
+    if concatenate:
+        audio, offsets = result
+        assert offsets.dtype == np.int64
+        assert len(offsets) == len(ranges) + 1
+        assert audio.shape == (2, offsets[-1])
+        slices = [audio[:, offsets[i] : offsets[i + 1]] for i in range(len(ranges))]
+    else:
+        slices = result
+        assert len(slices) == len(ranges)
+
+    for (start, stop), audio_slice in zip(ranges, slices):
+        np.testing.assert_array_equal(audio_slice, expected[:, start:stop])
+
+
+def test_read_ranges_rejects_invalid_ranges():
+    filename, _ = FILENAMES_AND_SAMPLERATES[0]
+    with pedalboard.io.AudioFile(filename) as af:
+        with pytest.raises(ValueError):
+            af.read_ranges([(100, 50)])
+        with pytest.raises(ValueError):
+            af.read_ranges([(-1, 50)])
+        with pytest.raises(ValueError):
+            af.read_range(af.frames + 1, af.frames + 2)
+        assert af.read_ranges([]) == []
+
+
 @pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
 def test_read_raw(audio_filename: str, samplerate: float):
     with pedalboard.io.AudioFile(audio_filename) as af:
@@ -228,6 +544,53 @@ def test_read_raw(audio_filename: str, samplerate: float):
         assert af.file_dtype in str(raw_samples.dtype)
 
 
+@pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
+def test_read_into_matches_read(audio_filename: str, samplerate: float):
+    with pedalboard.io.AudioFile(audio_filename) as af:
+        expected = af.read(af.frames)
+
+    with pedalboard.io.AudioFile(audio_filename) as af:
+        chunks = []
+        chunk = np.empty((af.num_channels, 1000), dtype=np.float32)
+        while frames_read := af.read_into(chunk):
+            chunks.append(chunk[:, :frames_read].copy())
+        np.testing.assert_array_equal(np.concatenate(chunks, axis=1), expected)
+
+        af.seek(0)
+        out = np.full((af.num_channels, expected.shape[1] + 100), 2.0, dtype=np.float32)
+        assert af.read_into(out, offset=50) == expected.shape[1]
+    np.testing.assert_array_equal(out[:, :50], 2.0)
+    np.testing.assert_array_equal(out[:, 50 : 50 + expected.shape[1]], expected)
+    # Frames past the end of the file are left untouched:
+    np.testing.assert_array_equal(out[:, 50 + expected.shape[1] :], 2.0)
+
+
+@pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
+def test_read_raw_into_matches_read_raw(audio_filename: str, samplerate: float):
+    with pedalboard.io.AudioFile(audio_filename) as af:
+        expected = af.read_raw(1000)
+
+    with pedalboard.io.AudioFile(audio_filename) as af:
+        out = np.zeros((af.num_channels, 1010), dtype=expected.dtype)
+        assert af.read_raw_into(out, offset=10) == 1000
+        assert af.tell() == 1000
+    np.testing.assert_array_equal(out[:, 10:], expected)
+
+
+def test_read_into_rejects_invalid_arrays():
+    filename, _ = FILENAMES_AND_SAMPLERATES[0]
+    with pedalboard.io.AudioFile(filename) as af:
+        with pytest.raises(TypeError):
+            af.read_into(np.zeros((af.num_channels, 100), dtype=np.float64))
+        with pytest.raises(ValueError):
+            af.read_into(np.zeros((af.num_channels + 1, 100), dtype=np.float32))
+        with pytest.raises(ValueError):
+            af.read_into(np.zeros((100, af.num_channels), dtype=np.float32).T)
+        with pytest.raises(ValueError):
+            af.read_into(np.zeros((af.num_channels, 100), dtype=np.float32), offset=101)
+        assert af.tell() == 0
+
+
 @pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
 def test_use_reader_as_context_manager(audio_filename: str, samplerate: float):
     num_frames_when_open = None
@@ -350,6 +713,160 @@ def test_read_from_seekable_stream(audio_filename: str, samplerate: float):
         af.read(1)
 
 
+class ReadIntoStream(io.RawIOBase):
+    """A stream that only supports reading via readinto()."""
+
+    def __init__(self, data: bytes):
+        self._buf = io.BytesIO(data)
+        self.readinto_calls = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, *args):
+        return self._buf.seek(*args)
+
+    def tell(self):
+        return self._buf.tell()
+
+    def read(self, *args):
+        raise AssertionError("read() should not be called when readinto() is available")
+
+    def readinto(self, b):
+        self.readinto_calls += 1
+        return self._buf.readinto(b)
+
+
+@pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
+def test_read_from_stream_with_readinto(audio_filename: str, samplerate: float):
+    with open(audio_filename, "rb") as f:
+        stream = ReadIntoStream(f.read())
+
+    with pedalboard.io.AudioFile(audio_filename) as af:
+        expected = af.read(af.frames)
+
+    with pedalboard.io.AudioFile(stream) as af:
+        assert af.samplerate == samplerate
+        np.testing.assert_allclose(af.read(af.frames), expected)
+    assert stream.readinto_calls > 0
+
+
+class CountingStream:
+    """A file-like object that counts calls to its read() and write() methods."""
+
+    def __init__(self, data: bytes = b""):
+        self._buf = io.BytesIO(data)
+        self.read_calls = 0
+        self.write_calls = 0
+
+    def seekable(self):
+        return True
+
+    def seek(self, *args):
+        return self._buf.seek(*args)
+
+    def tell(self):
+        return self._buf.tell()
+
+    def read(self, *args):
+        self.read_calls += 1
+        return self._buf.read(*args)
+
+    def write(self, data):
+        self.write_calls += 1
+        return self._buf.write(data)
+
+    def getvalue(self) -> bytes:
+        return self._buf.getvalue()
+
+
+@pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
+@pytest.mark.parametrize("buffer_size", [0, 1, 4096, 1024 * 1024])
+def test_read_from_stream_with_buffer_size(
+    audio_filename: str, samplerate: float, buffer_size: int
+):
+    with open(audio_filename, "rb") as f:
+        stream = CountingStream(f.read())
+
+    with pedalboard.io.AudioFile(audio_filename) as expected:
+        with pedalboard.io.AudioFile(stream, buffer_size=buffer_size) as af:
+            assert af.samplerate == samplerate
+            np.testing.assert_allclose(af.read(af.frames), expected.read(expected.frames))
+
+            # Seeking backwards should still work, whether or not the target
+            # position is still buffered:
+            for position in (af.frames // 2, af.frames // 2 + 1, 0):
+                af.seek(position)
+                expected.seek(position)
+                np.testing.assert_allclose(af.read(100), expected.read(100))
+
+
+@pytest.mark.parametrize("audio_filename,samplerate", FILENAMES_AND_SAMPLERATES)
+def test_seek_backwards_after_large_buffered_read(audio_filename: str, samplerate: float):
+    with open(audio_filename, "rb") as f:
+        data = f.read()
+
+    buffer_size = 4096
+    with pedalboard.io.AudioFile(CountingStream(data), buffer_size=0) as expected:
+        with pedalboard.io.AudioFile(CountingStream(data), buffer_size=buffer_size) as af:
+            # A small read fills the read buffer, after which a read larger
+            # than the buffer bypasses it entirely:
+            for f in (af, expected):
+                f.read(10)
+                f.read(buffer_size * 4)
+
+            for offset in (1, 3, 100):
+                position = af.tell() - offset
+                af.seek(position)
+                expected.seek(position)
+                np.testing.assert_array_equal(af.read(offset), expected.read(offset))
+
+
+def test_buffered_read_calls_python_less_often():
+    with open(FILENAMES_AND_SAMPLERATES[0][0], "rb") as f:
+        data = f.read()
+
+    unbuffered = CountingStream(data)
+    with pedalboard.io.AudioFile(unbuffered, buffer_size=0) as af:
+        af.read(af.frames)
+
+    buffered = CountingStream(data)
+    with pedalboard.io.AudioFile(buffered) as af:
+        af.read(af.frames)
+
+    assert buffered.read_calls < unbuffered.read_calls
+
+
+@pytest.mark.parametrize("extension", [".wav", ".flac", ".mp3"])
+def test_buffered_write_calls_python_less_often(extension: str):
+    audio = cached_rand(2, 44100)
+
+    unbuffered = CountingStream()
+    with pedalboard.io.AudioFile(unbuffered, "w", 44100, 2, format=extension, buffer_size=0) as af:
+        for chunk in np.split(audio, 100, axis=1):
+            af.write(chunk)
+
+    buffered = CountingStream()
+    with pedalboard.io.AudioFile(buffered, "w", 44100, 2, format=extension) as af:
+        for chunk in np.split(audio, 100, axis=1):
+            af.write(chunk)
+
+    assert buffered.getvalue() == unbuffered.getvalue()
+    assert buffered.write_calls < unbuffered.write_calls
+
+
+def test_buffer_size_must_not_be_negative():
+    with pytest.raises(ValueError):
+        pedalboard.io.AudioFile(io.BytesIO(), "w", 44100, 1, format="wav", buffer_size=-1)
+
+    with open(FILENAMES_AND_SAMPLERATES[0][0], "rb") as f:
+        with pytest.raises(ValueError):
+            pedalboard.io.ReadableAudioFile(f, buffer_size=-1)
+
+
 def test_read_from_bytes_io_memoryview():
     """
     Reading from a `memoryview` should be possible; and should be faster
@@ -952,6 +1469,127 @@ def test_write_matches_encode(
             )
 
 
+@pytest.mark.parametrize("extension", [".wav", ".flac", ".ogg", ".mp3"])
+@pytest.mark.parametrize("chunk_size", [1, 1000, 100_000])
+def test_async_encode_matches_sync_encode(tmp_path: pathlib.Path, extension: str, chunk_size: int):
+    samplerate = 44100
+    num_channels = 2
+    audio = generate_sine_at(samplerate, num_channels=num_channels)
+
+    for async_encode in (False, True):
+        filename = str(tmp_path / f"{'async' if async_encode else 'sync'}{extension}")
+        with pedalboard.io.AudioFile(
+            filename, "w", samplerate, num_channels, async_encode=async_encode
+        ) as af:
+            for i in range(0, audio.shape[1], chunk_size):
+                # Alternate between channel layouts to test both copy paths:
+                chunk = audio[:, i : i + chunk_size]
+                af.write(chunk.T.copy() if (i // chunk_size) % 2 and chunk.shape[1] > 2 else chunk)
+            assert af.frames == audio.shape[1]
+
+    with (
+        pedalboard.io.AudioFile(str(tmp_path / f"sync{extension}")) as sync_f,
+        pedalboard.io.AudioFile(str(tmp_path / f"async{extension}")) as async_f,
+    ):
+        assert sync_f.frames == async_f.frames
+        # Ogg files contain some randomness when encoded:
+        np.testing.assert_allclose(
+            sync_f.read(sync_f.frames),
+            async_f.read(async_f.frames),
+            atol=(1e-3 if extension == ".ogg" else 0),
+        )
+
+
+def test_async_encode_flush_and_close(tmp_path: pathlib.Path):
+    filename = str(tmp_path / "test.wav")
+    af = pedalboard.io.AudioFile(filename, "w", 44100, 1, async_encode=True)
+    af.write(np.zeros(44100, dtype=np.float32))
+    af.flush()
+    af.write(np.zeros(44100, dtype=np.float32))
+    af.close()
+    assert af.closed
+
+    with pedalboard.io.AudioFile(filename) as f:
+        assert f.frames == 88200
+
+    with pytest.raises(RuntimeError):
+        af.write(np.zeros(10, dtype=np.float32))
+
+
+def test_async_encode_requires_filename():
+    with pytest.raises(ValueError):
+        pedalboard.io.AudioFile(io.BytesIO(), "w", 44100, 1, format="wav", async_encode=True)
+
+
+@pytest.mark.parametrize("num_channels", [1, 2])
+@pytest.mark.parametrize("num_frames", [0, 100, 4096 * 3, 44100 * 3 + 17])
+@pytest.mark.parametrize("quality", [None, 1])
+@pytest.mark.parametrize("workers", [2, 7])
+def test_parallel_flac_encode_matches_encode(
+    num_channels: int, num_frames: int, quality: Optional[int], workers: int
+):
+    audio = np.random.default_rng(42).uniform(-1, 1, (num_channels, num_frames)).astype(np.float32)
+
+    serial = pedalboard.io.AudioFile.encode(audio, 44100, "flac", num_channels, quality=quality)
+    parallel = pedalboard.io.AudioFile.encode(
+        audio, 44100, "flac", num_channels, quality=quality, workers=workers
+    )
+
+    with (
+        pedalboard.io.AudioFile(io.BytesIO(serial)) as serial_f,
+        pedalboard.io.AudioFile(io.BytesIO(parallel)) as parallel_f,
+    ):
+        assert parallel_f.frames == serial_f.frames == num_frames
+        np.testing.assert_array_equal(
+            parallel_f.read(parallel_f.frames), serial_f.read(serial_f.frames)
+        )
+
+    serial_info = mutagen.File(io.BytesIO(serial)).info  # type: ignore
+    parallel_info = mutagen.File(io.BytesIO(parallel)).info  # type: ignore
+    assert parallel_info.total_samples == num_frames
+    assert parallel_info.md5_signature == serial_info.md5_signature
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_parallel_flac_write_to_file_like_matches_encode(workers: int):
+    audio = np.random.default_rng(42).uniform(-1, 1, (2, 44100)).astype(np.float32)
+
+    buf = io.BytesIO()
+    with pedalboard.io.AudioFile(buf, "w", 44100, 2, format="flac", workers=workers) as f:
+        f.write(audio)
+
+    assert buf.getvalue() == pedalboard.io.AudioFile.encode(audio, 44100, "flac", 2)
+
+
+@pytest.mark.parametrize("buffer_size", [0, 65536])
+def test_parallel_flac_write_raises_if_output_fails(buffer_size: int):
+    class FailingStream(io.BytesIO):
+        fail = False
+
+        def write(self, data):
+            if self.fail:
+                raise OSError("Output stream is full!")
+            return super().write(data)
+
+    audio = np.random.default_rng(42).uniform(-1, 1, (2, 44100)).astype(np.float32)
+    stream = FailingStream()
+    f = pedalboard.io.AudioFile(
+        stream, "w", 44100, 2, format="flac", buffer_size=buffer_size, workers=4
+    )
+    f.write(audio)
+
+    # The parallel writer only encodes and writes its output when closed:
+    stream.fail = True
+    with pytest.raises(OSError, match="Output stream is full!"):
+        f.close()
+    assert f.closed
+
+
+def test_parallel_encode_requires_a_worker():
+    with pytest.raises(ValueError):
+        pedalboard.io.AudioFile.encode(np.zeros(100, dtype=np.float32), 44100, "flac", workers=0)
+
+
 @pytest.mark.parametrize("extension", pedalboard.io.get_supported_write_formats())
 @pytest.mark.parametrize("samplerate", [1234.5, 23.0000000001])
 def test_fractional_sample_rates(tmp_path: pathlib.Path, extension: str, samplerate):
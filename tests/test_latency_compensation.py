@@ -18,6 +18,7 @@
 import numpy as np
 import pytest
 
+from pedalboard import process
 from pedalboard_native._internal import AddLatency  # type: ignore
 
 MAX_SAMPLE_RATE = 96000
@@ -33,3 +34,24 @@ def test_latency_compensation(sample_rate, buffer_size, latency_seconds):
     plugin = AddLatency(int(latency_seconds * sample_rate))
     output = plugin.process(noise, sample_rate, buffer_size=buffer_size)
     np.testing.assert_allclose(output, noise)
+
+
+@pytest.mark.parametrize("sample_rate", [22050, 44100])
+@pytest.mark.parametrize("buffer_size", [128, 8192, 65536])
+@pytest.mark.parametrize("latency_a_seconds", [0.25, 1])
+@pytest.mark.parametrize("latency_b_seconds", [0.25, 1])
+def test_latency_compensation_with_block_render_order(
+    sample_rate, buffer_size, latency_a_seconds, latency_b_seconds
+):
+    noise = NOISE[: int(sample_rate * NUM_SECONDS)]
+    plugins = [
+        AddLatency(int(latency_a_seconds * sample_rate)),
+        AddLatency(int(latency_b_seconds * sample_rate)),
+    ]
+    output = process(noise, sample_rate, plugins, buffer_size=buffer_size, render_order="block")
+    np.testing.assert_allclose(output, noise)
+
+
+def test_invalid_render_order_raises():
+    with pytest.raises(ValueError):
+        process(NOISE[:1024], 44100, [AddLatency(10)], render_order="sideways")
@@ -64,3 +64,28 @@ def test_multiple_threads_using_same_plugin_instances(
     first_result = processed[0]
     for other_result in processed[1:]:
         assert np.allclose(first_result, other_result)
+
+
+def test_duplicate_detection_follows_modifications_to_nested_containers():
+    sr = 48000
+    noise = np.random.rand(1, sr).astype(np.float32)
+
+    gain = pedalboard.Gain(-6)
+    nested = pedalboard.Chain([pedalboard.Gain(3)])
+    pb = pedalboard.Pedalboard([gain, nested])
+    pb.process(noise, sr)
+
+    # Modifying a nested container must be noticed by its parent:
+    nested.append(gain)
+    with pytest.raises(RuntimeError):
+        pb.process(noise, sr)
+
+    nested.remove(gain)
+    pb.process(noise, sr)
+
+    nested[0] = gain
+    with pytest.raises(RuntimeError):
+        pb.process(noise, sr)
+
+    del nested[0]
+    np.testing.assert_allclose(pb.process(noise, sr), gain.process(noise, sr), rtol=1e-5)
@@ -30,6 +30,7 @@ from pedalboard import (
     Pedalboard,
     PitchShift,
     Reverb,
+    StreamingSession,
 )
 from pedalboard_native._internal import AddLatency  # type: ignore
 
@@ -173,6 +174,67 @@ def test_mix_latency_compensation(sample_rate, buffer_size, latency_a_seconds, l
     np.testing.assert_allclose(output, noise * 2, rtol=0.01)
 
 
+@pytest.mark.parametrize("buffer_size", [100, 777, 4096])
+@pytest.mark.parametrize("latency", [1, 999, 10000])
+def test_mix_with_dry_and_latent_branches(buffer_size, latency):
+    sr = 44100
+    noise = NOISE[: int(NUM_SECONDS * sr)]
+    pb = Pedalboard([Mix([Gain(0), AddLatency(latency), Gain(0)])])
+    output = pb(noise, sr, buffer_size=buffer_size)
+    np.testing.assert_allclose(output, noise * 3, rtol=0.01)
+
+
+@pytest.mark.parametrize("buffer_size", [128, 8192])
+@pytest.mark.parametrize("num_threads", [2, 4])
+def test_threaded_mix_matches_serial_mix(buffer_size, num_threads):
+    sr = 44100
+    _input = NOISE[: int(NUM_SECONDS * sr)]
+
+    def make_branches():
+        return [
+            Pedalboard([Reverb(room_size=0.8), Gain(-3)]),
+            Pedalboard([Delay(delay_seconds=0.1, feedback=0.5), Compressor()]),
+            Pedalboard([Distortion(10), AddLatency(1000)]),
+            Gain(-6),
+        ]
+
+    serial = Pedalboard([Mix(make_branches())])(_input, sr, buffer_size=buffer_size)
+    threaded_mix = Mix(make_branches(), num_threads=num_threads)
+    assert threaded_mix.num_threads == num_threads
+    threaded = Pedalboard([threaded_mix])(_input, sr, buffer_size=buffer_size)
+    np.testing.assert_array_equal(serial, threaded)
+
+
+@pytest.mark.parametrize("chunk_size", [100, 512, 4096])
+def test_removing_branch_from_latent_mix_mid_stream(chunk_size):
+    sr = 44100
+    noise = NOISE[:sr]
+    middle_branch = AddLatency(1000)
+    mix = Mix([AddLatency(100), middle_branch, AddLatency(500)])
+    session = StreamingSession(mix, sr, buffer_size=chunk_size)
+
+    chunks = [noise[i : i + chunk_size] for i in range(0, len(noise), chunk_size)]
+    halfway = len(chunks) // 2
+    outputs = [session.feed(chunk) for chunk in chunks[:halfway]]
+    samples_returned_with_three_branches = sum(len(output) for output in outputs)
+
+    # The remaining branches must keep their own buffered audio:
+    mix.remove(middle_branch)
+    outputs += [session.feed(chunk) for chunk in chunks[halfway:]]
+    outputs.append(session.flush())
+
+    output = np.concatenate(outputs)
+    assert output.shape == noise.shape
+    split = samples_returned_with_three_branches
+    np.testing.assert_allclose(output[:split], noise[:split] * 3, rtol=0.0001, atol=1e-6)
+    np.testing.assert_allclose(output[split:], noise[split:] * 2, rtol=0.0001, atol=1e-6)
+
+
+def test_mix_rejects_invalid_num_threads():
+    with pytest.raises(ValueError):
+        Mix([Gain()], num_threads=0)
+
+
 @pytest.mark.parametrize("sample_rate", [22050, 44100, 48000])
 @pytest.mark.parametrize("buffer_size", [128, 8192, 65536])
 @pytest.mark.parametrize("latency_a_seconds", [0.25, 1, 2, 10])
@@ -19,6 +19,7 @@ import numpy as np
 import pytest
 
 from pedalboard import Gain, Pedalboard, Reverb
+from pedalboard_native._internal import AddLatency  # type: ignore
 
 
 @pytest.mark.parametrize("shape", [(44100,), (44100, 1), (44100, 2), (1, 4), (2, 4)])
@@ -35,6 +36,121 @@ def test_no_transforms(shape, sr=44100):
     assert np.allclose(_input, output, rtol=0.0001)
 
 
+@pytest.mark.parametrize("shape", [(44100,), (1, 44100), (2, 44100), (44100, 1), (44100, 2)])
+@pytest.mark.parametrize("latency", [0, 100])
+def test_output_is_independent_contiguous_array(shape, latency, sr=44100):
+    _input = np.random.rand(*shape).astype(np.float32)
+    output = Pedalboard([Gain(0), AddLatency(latency)]).process(_input, sr)
+
+    assert output.shape == _input.shape
+    assert output.flags.c_contiguous
+    assert output.flags.writeable
+    assert not np.shares_memory(output, _input)
+    np.testing.assert_allclose(output, _input, rtol=0.0001)
+
+    # Mono output (and non-interleaved output without any latency to trim) is
+    # handed off without a copy, so the array is backed by the rendered buffer:
+    is_mono = len(shape) == 1 or 1 in shape
+    if is_mono or (shape[0] == 2 and latency == 0):
+        assert type(output.base).__name__ == "PyCapsule"
+
+    # Writing to the output must not affect the input (or vice versa):
+    output[...] = 0
+    assert np.any(_input)
+
+
+@pytest.mark.parametrize("shape", [(44100,), (1, 44100), (2, 44100), (44100, 1)])
+def test_process_inplace_matches_process(shape, sr=44100):
+    _input = np.random.rand(*shape).astype(np.float32)
+    board = Pedalboard([Gain(-6), Reverb()])
+
+    expected = board.process(_input, sr)
+    board.process_inplace(_input, sr)
+    np.testing.assert_allclose(_input, expected, rtol=0.0001)
+
+
+def test_process_inplace_rejects_unsupported_arrays(sr=44100):
+    board = Pedalboard([Gain(-6)])
+    with pytest.raises(TypeError):
+        board.process_inplace(np.zeros((2, 1024), dtype=np.float64), sr)
+    with pytest.raises(ValueError):
+        board.process_inplace(np.zeros((1024, 2), dtype=np.float32), sr)
+    with pytest.raises(ValueError):
+        board.process_inplace(np.zeros((2, 2048), dtype=np.float32)[:, ::2], sr)
+
+    read_only = np.zeros((2, 1024), dtype=np.float32)
+    read_only.flags.writeable = False
+    with pytest.raises(ValueError):
+        board.process_inplace(read_only, sr)
+
+
+def test_process_inplace_rejects_latency(sr=44100):
+    with pytest.raises(RuntimeError):
+        Pedalboard([AddLatency(100)]).process_inplace(np.zeros((2, 1024), dtype=np.float32), sr)
+
+
+def test_process_batch_matches_process(sr=44100):
+    inputs = [
+        np.random.rand(sr).astype(np.float32),
+        np.random.rand(2, sr // 2).astype(np.float32),
+        np.random.rand(sr // 3, 2),
+        np.random.rand(1, sr // 4).astype(np.float32),
+    ]
+    board = Pedalboard([Gain(-6), Reverb()])
+
+    expected = [board.process(_input, sr) for _input in inputs]
+    outputs = board.process_batch(inputs, sr)
+
+    assert len(outputs) == len(inputs)
+    for output, _expected in zip(outputs, expected):
+        assert output.shape == _expected.shape
+        np.testing.assert_allclose(output, _expected, rtol=0.0001, atol=1e-6)
+
+
+@pytest.mark.parametrize("reset", [True, False])
+def test_process_batch_with_mixed_lengths_matches_process(reset: bool, sr=44100, buffer_size=512):
+    lengths = [100, 10_000, 511, 3, 2048, 512, 1]
+    inputs = [np.random.rand(2, length).astype(np.float32) for length in lengths]
+    board = Pedalboard([Gain(-6), AddLatency(300), Reverb()])
+
+    expected = [
+        board.process(_input, sr, buffer_size=buffer_size, reset=reset) for _input in inputs
+    ]
+    board.reset()
+    outputs = board.process_batch(inputs, sr, buffer_size=buffer_size, reset=reset)
+
+    assert len(outputs) == len(inputs)
+    for output, _expected in zip(outputs, expected):
+        assert output.shape == _expected.shape
+        np.testing.assert_allclose(output, _expected, rtol=0.0001, atol=1e-6)
+
+
+def test_process_batch_without_reset_is_continuous(sr=44100):
+    _input = np.random.rand(2, sr).astype(np.float32)
+    board = Pedalboard([Reverb()])
+
+    expected = board.process(_input, sr)
+    board.reset()
+    chunks = board.process_batch(np.array_split(_input, 4, axis=1), sr, reset=False)
+    np.testing.assert_allclose(np.concatenate(chunks, axis=1), expected, rtol=0.0001, atol=1e-6)
+
+
+def test_repeated_processing_does_not_reprepare(sr=44100):
+    _input = np.random.rand(2, sr).astype(np.float32)
+    reverb = Reverb()
+    board = Pedalboard([Gain(), reverb])
+
+    for _ in range(3):
+        board.process(_input, sr)
+        board.process(_input, sr, reset=False)
+    assert board.prepare_count == 1
+    assert reverb.prepare_count == 1
+
+    board.process(_input, sr * 2)
+    assert board.prepare_count == 2
+    assert reverb.prepare_count == 2
+
+
 def test_fail_on_invalid_plugin():
     with pytest.raises(TypeError):
         Pedalboard(["I want a reverb please"])  # type: ignore
@@ -19,6 +19,7 @@ import numpy as np
 import pytest
 
 from pedalboard import Resample
+from pedalboard.io import StreamResampler
 from pedalboard_native._internal import ResampleWithLatency  # type: ignore
 
 from .utils import generate_sine_at
@@ -35,6 +36,7 @@ TOLERANCE_PER_QUALITY = {
     Resample.Quality.WindowedSinc32: 0.163,
     Resample.Quality.WindowedSinc16: 0.153,
     Resample.Quality.WindowedSinc8: 0.153,
+    Resample.Quality.PolyphaseSinc32: 0.163,
 }
 
 QUALITIES_THAT_SUPPORT_EXTREME_RESAMPLING = [
@@ -115,6 +117,64 @@ def test_resample_invariant_to_buffer_size(
         np.testing.assert_allclose(a, b)
 
 
+@pytest.mark.parametrize(
+    "sample_rate,target_sample_rate",
+    [
+        (44100, 48000),
+        (48000, 44100),
+        (44100, 16000),
+        (16000, 24000),
+        (11025, 32000),
+        (8000, 12345.67),
+    ],
+)
+@pytest.mark.parametrize("buffer_size", [1, 32, 8192])
+@pytest.mark.parametrize("plugin_class", [Resample, ResampleWithLatency])
+def test_polyphase_matches_windowed_sinc(
+    sample_rate: float, target_sample_rate: float, buffer_size: int, plugin_class
+):
+    noise = np.random.rand(2, int(sample_rate * 0.5)).astype(np.float32) - 0.5
+    expected = plugin_class(target_sample_rate, quality=Resample.Quality.WindowedSinc32).process(
+        noise, sample_rate, buffer_size=buffer_size
+    )
+    actual = plugin_class(target_sample_rate, quality=Resample.Quality.PolyphaseSinc32).process(
+        noise, sample_rate, buffer_size=buffer_size
+    )
+    np.testing.assert_allclose(expected, actual, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "sample_rate,target_sample_rate",
+    [
+        (44100, 48000),
+        (48000, 44100),
+        (44100, 16000),
+        (16000, 24000),
+        (11025, 32000),
+        (8000, 12345.67),
+    ],
+)
+@pytest.mark.parametrize("buffer_size", [4, 8192])
+def test_polyphase_stream_resampler_matches_windowed_sinc(
+    sample_rate: float, target_sample_rate: float, buffer_size: int
+):
+    noise = np.random.rand(2, int(sample_rate * 0.5)).astype(np.float32) - 0.5
+
+    outputs = []
+    for quality in (Resample.Quality.WindowedSinc32, Resample.Quality.PolyphaseSinc32):
+        resampler = StreamResampler(sample_rate, target_sample_rate, 2, quality)
+        chunks = [
+            resampler.process(noise[:, i : i + buffer_size])
+            for i in range(0, noise.shape[1], buffer_size)
+        ]
+        chunks.append(resampler.process(None))
+        outputs.append(np.concatenate(chunks, axis=1))
+
+    expected, actual = outputs
+    assert expected.shape == actual.shape
+    np.testing.assert_allclose(expected, actual, atol=1e-5)
+
+
 @pytest.mark.parametrize("sample_rate_multiple", [1, 2, 3, 4, 20])
 @pytest.mark.parametrize("sample_rate", [8000, 44100, 48000])
 @pytest.mark.parametrize("buffer_size", [1, 32, 128, 8192, 1_000_000])
@@ -136,6 +136,33 @@ def test_tell_resampled(sample_rate: int, target_sample_rate: float, chunk_size:
                 break
 
 
+@pytest.mark.parametrize("sample_rate", [8000, 44100])
+@pytest.mark.parametrize("target_sample_rate", [11025, 12345.67, 48000])
+@pytest.mark.parametrize("quality", QUALITIES, ids=[q.name for q in QUALITIES])
+def test_read_into_resampled(sample_rate: int, target_sample_rate: float, quality):
+    signal = np.sin(np.linspace(0, 440 * 2 * np.pi, sample_rate)).astype(np.float32)
+
+    read_buffer = BytesIO()
+    read_buffer.name = "test.wav"
+    with AudioFile(read_buffer, "w", sample_rate, 1, bit_depth=32) as f:
+        f.write(signal)
+
+    with AudioFile(BytesIO(read_buffer.getvalue())).resampled_to(target_sample_rate, quality) as f:
+        expected = f.read(f.frames)
+
+    with AudioFile(BytesIO(read_buffer.getvalue())).resampled_to(target_sample_rate, quality) as f:
+        out = np.zeros((1, expected.shape[1] + 10), dtype=np.float32)
+        frames_written = 0
+        chunk = np.empty((1, 1000), dtype=np.float32)
+        while frames_read := f.read_into(chunk):
+            out[:, frames_written : frames_written + frames_read] = chunk[:, :frames_read]
+            frames_written += frames_read
+        assert f.tell() == frames_written
+
+    assert frames_written == expected.shape[1]
+    np.testing.assert_array_equal(out[:, :frames_written], expected)
+
+
 @pytest.mark.parametrize("sample_rate", [8000, 11025, 22050, 44100, 48000])
 @pytest.mark.parametrize("target_sample_rate", [8000, 11025, 12345.67, 22050, 44100, 48000])
 @pytest.mark.parametrize("offset", [2, 10, 100, -10, -1000])
@@ -160,6 +187,29 @@ def test_seek_resampled(
         np.testing.assert_allclose(expected, actual)
 
 
+@pytest.mark.parametrize("sample_rate", [8000, 44100])
+@pytest.mark.parametrize("target_sample_rate", [12345.67, 16000, 48000])
+@pytest.mark.parametrize("quality", QUALITIES, ids=[q.name for q in QUALITIES])
+def test_seek_forward_resampled(sample_rate: int, target_sample_rate: float, quality):
+    signal = np.random.rand(sample_rate * 2).astype(np.float32)
+
+    read_buffer = BytesIO()
+    read_buffer.name = "test.wav"
+    with AudioFile(read_buffer, "w", sample_rate, 1, bit_depth=32) as f:
+        f.write(signal)
+
+    with AudioFile(BytesIO(read_buffer.getvalue())).resampled_to(target_sample_rate, quality) as f:
+        expected = f.read(f.frames)
+
+    with AudioFile(BytesIO(read_buffer.getvalue())).resampled_to(target_sample_rate, quality) as f:
+        # Seek forward by distances both shorter and longer than the resampler's window:
+        for distance in [0, 1, 10, 100, 1000, 10000]:
+            f.seek(f.tell() + distance)
+            position = f.tell()
+            actual = f.read(100)
+            np.testing.assert_allclose(expected[:, position : position + 100], actual)
+
+
 @pytest.mark.parametrize("sample_rate", [8000, 11025])
 @pytest.mark.parametrize("target_sample_rate", [8000, 11025, 12345.67])
 def test_seek_resampled_is_constant_time(sample_rate: int, target_sample_rate: float):
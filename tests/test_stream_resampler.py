@@ -137,6 +137,36 @@ def test_reset(
     np.testing.assert_allclose(original_output, output_with_reset)
 
 
+@pytest.mark.parametrize("sample_rate", [8000, 44100, 48000])
+@pytest.mark.parametrize("target_sample_rate", [12345.67, 22050, 48000])
+@pytest.mark.parametrize("chunk_size", [37, 100, 8192])
+@pytest.mark.parametrize(
+    "quality",
+    [Resample.Quality.WindowedSinc, Resample.Quality.WindowedSinc32],
+    ids=["WindowedSinc", "WindowedSinc32"],
+)
+def test_multichannel_matches_individual_channels(
+    sample_rate: float, target_sample_rate: float, chunk_size: int, quality
+):
+    num_channels = 32
+    input_signal = np.random.rand(num_channels, int(sample_rate // 4)).astype(np.float32)
+
+    resampler = StreamResampler(sample_rate, target_sample_rate, num_channels, quality)
+    outputs = [
+        resampler.process(input_signal[:, i : i + chunk_size])
+        for i in range(0, input_signal.shape[1], chunk_size)
+    ]
+    outputs.append(resampler.process(None))
+    output = np.concatenate(outputs, axis=1)
+
+    for c in (0, num_channels // 2, num_channels - 1):
+        resampler = StreamResampler(sample_rate, target_sample_rate, 1, quality)
+        expected = np.concatenate(
+            [resampler.process(input_signal[c : c + 1]), resampler.process(None)], axis=1
+        )
+        np.testing.assert_array_equal(expected[0], output[c])
+
+
 @pytest.mark.parametrize("sample_rate", [123.45, 8000, 11025, 22050, 44100, 48000])
 @pytest.mark.parametrize("target_sample_rate", [123.45, 8000, 11025, 12345.67, 22050, 44100, 48000])
 @pytest.mark.parametrize(
@@ -0,0 +1,108 @@
+#! /usr/bin/env python
+#
+# Copyright 2024 Spotify AB
+#
+# Licensed under the GNU Public License, Version 3.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    https://www.gnu.org/licenses/gpl-3.0.html
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pytest
+
+from pedalboard import Gain, Pedalboard, Reverb, StreamingSession
+from pedalboard_native._internal import AddLatency  # type: ignore
+
+SAMPLE_RATE = 44100
+NOISE = np.random.default_rng(1234).random((2, SAMPLE_RATE * 2)).astype(np.float32) - 0.5
+
+
+def split_into_chunks(audio: np.ndarray, chunk_size: int):
+    return [audio[..., i : i + chunk_size] for i in range(0, audio.shape[-1], chunk_size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 4096, 100_000])
+@pytest.mark.parametrize("latency", [1, 1000, 50_000])
+def test_streaming_matches_one_shot(chunk_size: int, latency: int):
+    board = Pedalboard([AddLatency(latency), Gain(6), Reverb(), AddLatency(latency // 2 + 1)])
+    expected = board(NOISE[0], SAMPLE_RATE)
+
+    session = StreamingSession(board, SAMPLE_RATE)
+    outputs = [session.feed(chunk) for chunk in split_into_chunks(NOISE[0], chunk_size)]
+    assert session.pending_samples == min(latency + latency // 2 + 1, NOISE.shape[-1])
+    outputs.append(session.flush())
+    assert session.pending_samples == 0
+
+    np.testing.assert_allclose(np.concatenate(outputs), expected, atol=1e-6)
+
+
+@pytest.mark.parametrize("interleaved", [False, True])
+def test_streaming_preserves_channel_layout(interleaved: bool):
+    audio = np.ascontiguousarray(NOISE.T) if interleaved else NOISE
+    axis = 0 if interleaved else 1
+    board = Pedalboard([AddLatency(300)])
+
+    session = StreamingSession(board, SAMPLE_RATE)
+    outputs = []
+    for i in range(0, audio.shape[axis], 1000):
+        chunk = audio[i : i + 1000] if interleaved else audio[:, i : i + 1000]
+        outputs.append(session.feed(chunk))
+    outputs.append(session.flush())
+
+    for output in outputs:
+        assert output.ndim == 2
+        assert output.shape[1 - axis] == 2
+    np.testing.assert_allclose(np.concatenate(outputs, axis=axis), audio)
+
+
+def test_process_stream_yields_one_chunk_per_input_plus_tail():
+    board = Pedalboard([AddLatency(1500)])
+    chunks = split_into_chunks(NOISE, 1000)
+
+    outputs = list(board.process_stream(iter(chunks), SAMPLE_RATE))
+    assert len(outputs) == len(chunks) + 1
+    assert outputs[0].shape == (2, 0)
+    assert outputs[1].shape == (2, 500)
+    np.testing.assert_allclose(np.concatenate(outputs, axis=1), NOISE)
+
+
+def test_session_can_be_reused_after_flush():
+    board = Pedalboard([Reverb(), AddLatency(100)])
+    session = StreamingSession(board, SAMPLE_RATE)
+
+    results = []
+    for _ in range(2):
+        outputs = [session.feed(chunk) for chunk in split_into_chunks(NOISE, 512)]
+        outputs.append(session.flush())
+        results.append(np.concatenate(outputs, axis=1))
+    np.testing.assert_allclose(results[0], results[1])
+
+
+def test_flush_without_feed_returns_nothing():
+    session = StreamingSession(Gain(), SAMPLE_RATE)
+    assert session.flush().size == 0
+
+
+def test_changing_channel_count_mid_stream_raises():
+    session = StreamingSession(Pedalboard([AddLatency(10)]), SAMPLE_RATE)
+    session.feed(NOISE[:, :100])
+    with pytest.raises(ValueError):
+        session.feed(NOISE[:1, :100])
+
+    # After a reset, a new stream can use a different number of channels:
+    session.reset()
+    assert session.feed(NOISE[0, :100]).shape == (90,)
+
+
+@pytest.mark.parametrize("sample_rate,buffer_size", [(0, 8192), (-1, 8192), (44100, 0)])
+def test_invalid_arguments_raise(sample_rate: float, buffer_size: int):
+    with pytest.raises(ValueError):
+        StreamingSession(Gain(), sample_rate, buffer_size)
@@ -15,12 +15,14 @@
 # limitations under the License.
 
 
+import copy
 from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pytest
 
 import pedalboard
+from pedalboard_native._internal import AddLatency, ResampleWithLatency  # type: ignore
 
 TESTABLE_PLUGINS = []
 for plugin_class in pedalboard.Plugin.__subclasses__():
@@ -54,3 +56,93 @@ def test_concurrent_processing_produces_identical_audio(plugin_class):
 
     for result in processed:
         np.testing.assert_allclose(expected_output, result)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_render_many_matches_serial_processing(workers):
+    sr = 48000
+    board = pedalboard.Pedalboard(
+        [
+            pedalboard.HighpassFilter(90),
+            pedalboard.PeakFilter(2800, 4, 0.9),
+            pedalboard.Compressor(threshold_db=-18, ratio=4),
+            pedalboard.Mix([pedalboard.Reverb(room_size=0.35), pedalboard.Delay(0.05)]),
+            pedalboard.Gain(3),
+        ]
+    )
+    inputs = [np.random.rand(2, sr // (i + 1)).astype(np.float32) for i in range(8)]
+
+    expected = [board.process(_input, sr) for _input in inputs]
+    outputs = board.render_many(inputs, sr, workers=workers)
+
+    assert len(outputs) == len(expected)
+    for output, _expected in zip(outputs, expected):
+        np.testing.assert_allclose(output, _expected, rtol=0.0001, atol=1e-6)
+
+
+@pytest.mark.parametrize("plugin_class", TESTABLE_PLUGINS)
+def test_cloned_plugins_have_identical_parameters(plugin_class):
+    from pedalboard._pedalboard import _clone_plugin
+
+    plugin = plugin_class()
+    clone = _clone_plugin(plugin)
+    assert clone is not plugin
+    assert type(clone) is type(plugin)
+    assert repr(clone).split(" at ")[0] == repr(plugin).split(" at ")[0]
+
+
+@pytest.mark.parametrize(
+    "plugin",
+    [
+        # The values of these parameters constrain or depend on each other:
+        pedalboard.LadderFilter(
+            pedalboard.LadderFilter.Mode.HPF24, cutoff_hz=1234, resonance=0.9, drive=4
+        ),
+        pedalboard.PeakFilter(cutoff_frequency_hz=2800, gain_db=-9, q=4),
+        pedalboard.Reverb(room_size=0.9, damping=0.1, wet_level=0.7, dry_level=0.2, width=0.3),
+        pedalboard.Resample(8000, quality=pedalboard.Resample.Quality.Linear),
+        pedalboard.GSMFullRateCompressor(quality=pedalboard.Resample.Quality.Linear),
+        # These plugins have state that isn't exposed as a property:
+        AddLatency(123),
+        ResampleWithLatency(22050, internal_latency=37),
+        pedalboard.Mix([pedalboard.Gain(-3), AddLatency(10)], num_threads=2),
+    ],
+    ids=lambda plugin: repr(plugin).split(" at ")[0],
+)
+def test_cloned_plugins_produce_identical_audio(plugin):
+    sr = 44100
+    noise = np.random.default_rng(1234).random((2, sr)).astype(np.float32) - 0.5
+
+    clone = copy.deepcopy(plugin)
+    assert clone is not plugin
+    assert type(clone) is type(plugin)
+    np.testing.assert_allclose(clone(noise, sr), plugin(noise, sr))
+
+
+def test_convolution_from_array_can_be_cloned():
+    sr = 44100
+    impulse_response = np.random.default_rng(1234).random((2, 1000)).astype(np.float32) - 0.5
+    plugin = pedalboard.Convolution(impulse_response, mix=0.5, sample_rate=sr)
+
+    clone = copy.deepcopy(plugin)
+    assert clone is not plugin
+    assert clone.impulse_response_filename is None
+    np.testing.assert_array_equal(clone.impulse_response, plugin.impulse_response)
+    assert clone.mix == plugin.mix
+
+    noise = np.random.default_rng(5678).random((2, sr)).astype(np.float32) - 0.5
+    np.testing.assert_allclose(clone(noise, sr), plugin(noise, sr), atol=1e-6)
+
+
+def test_cloned_pedalboard_contains_clones():
+    board = pedalboard.Pedalboard([pedalboard.Gain(3), pedalboard.Chain([pedalboard.Delay(0.1)])])
+
+    clone = copy.deepcopy(board)
+    assert type(clone) is pedalboard.Pedalboard
+    assert len(clone) == len(board)
+    for cloned_plugin, plugin in zip(clone, board):
+        assert cloned_plugin is not plugin
+        assert repr(cloned_plugin).split(" at ")[0] == repr(plugin).split(" at ")[0]
+
+    clone[0].gain_db = -3
+    assert board[0].gain_db == 3